@@ -159,6 +159,9 @@ def initialize_socketio(app, cache_control, config):
     else:
         logger.info("SocketIO: No Redis URL configured, using in-memory message queue")
 
+    # Optional binary serializer; clients must use the matching parser
+    serializer = config.get('SOCKETIO_SERIALIZER', 'default')
+
     # Create SocketIO instance
     socketio = SocketIO(
         app,
@@ -167,9 +170,14 @@ def initialize_socketio(app, cache_control, config):
         ping_timeout=60,
         ping_interval=10,
         max_http_buffer_size=5*1024*1024,
-        message_queue=redis_url if use_redis else None
+        message_queue=redis_url if use_redis else None,
+        serializer=serializer,
+        compression_threshold=config.get('SOCKETIO_COMPRESSION_THRESHOLD', 1024)
     )
 
-    logger.info("SocketIO initialized with %s message queue", "Redis" if use_redis else "in-memory")
+    logger.info(
+        "SocketIO initialized with %s message queue (serializer: %s)",
+        "Redis" if use_redis else "in-memory", serializer
+    )
 
     return socketio
@@ -5,7 +5,12 @@ Sprint 72: Database Integration
 """
 
 from src.analysis.data.ohlcv_data_service import OHLCVDataService
+from src.analysis.data.ohlcv_panel import OHLCVPanel
+from src.analysis.data.ohlcv_window_store import OHLCVWindowStore, get_ohlcv_window_store
 
 __all__ = [
     'OHLCVDataService',
+    'OHLCVPanel',
+    'OHLCVWindowStore',
+    'get_ohlcv_window_store',
 ]
@@ -9,9 +9,11 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import text
 
+from src.analysis.data.ohlcv_panel import OHLCV_COLUMNS, OHLCVPanel
 from src.infrastructure.database.tickstock_db import TickStockDatabase
 from src.core.services.config_manager import get_config
 
@@ -47,10 +49,13 @@ class OHLCVDataService:
     Provides centralized access to stock price data with connection pooling.
     """
 
+    # Rows fetched per server-side cursor round trip by get_ohlcv_panel()
+    PANEL_FETCH_ROWS = 10000
+
     def __init__(self):
         """Initialize OHLCV data service with database connection."""
         config = get_config()
-        self.db = TickStockDatabase(config)
+        self.db = TickStockDatabase(config, role='analysis')
 
     def get_ohlcv_data(
         self,
@@ -344,6 +349,107 @@ class OHLCVDataService:
             logger.error(f"Batch query failed: {e}")
             raise RuntimeError(f"Failed to fetch universe OHLCV data: {str(e)}") from e
 
+    def get_ohlcv_panel(
+        self,
+        symbols: list[str],
+        timeframe: str = 'daily',
+        limit: int = 200,
+    ) -> OHLCVPanel:
+        """
+        Fetch the last `limit` bars of many symbols as a columnar panel.
+
+        Runs one windowed query (ROW_NUMBER() per symbol) and streams the
+        rows through a server-side cursor in blocks of PANEL_FETCH_ROWS,
+        converting each block straight into NumPy arrays, so no per-symbol
+        DataFrames are built.
+
+        Args:
+            symbols: List of stock symbols
+            timeframe: Data timeframe
+            limit: Maximum bars per symbol
+
+        Returns:
+            OHLCVPanel with one row per requested symbol (in request order,
+            upper-cased, duplicates removed); symbols without data have
+            length 0
+
+        Raises:
+            ValueError: If timeframe is invalid
+            RuntimeError: If database query fails
+
+        Examples:
+            >>> service = OHLCVDataService()
+            >>> panel = service.get_ohlcv_panel(['AAPL', 'MSFT'], 'daily', limit=250)
+            >>> closes = panel.close[panel.row('AAPL')]
+        """
+        if timeframe not in TIMEFRAME_TABLE_MAP:
+            raise ValueError(
+                f"Invalid timeframe: {timeframe}. "
+                f"Supported: {', '.join(TIMEFRAME_TABLE_MAP.keys())}"
+            )
+
+        table_name = TIMEFRAME_TABLE_MAP[timeframe]
+        time_column = TIMEFRAME_COLUMN_MAP[timeframe]
+        symbols_upper = list(dict.fromkeys(s.upper() for s in symbols))
+        positions = {symbol: i for i, symbol in enumerate(symbols_upper)}
+
+        if not symbols_upper:
+            return OHLCVPanel.from_flat([], np.empty(0), np.empty(0), {
+                col: np.empty(0) for col in OHLCV_COLUMNS
+            })
+
+        query = text(f"""
+            WITH ranked AS (
+                SELECT
+                    symbol, {time_column} AS bar_time, open, high, low, close, volume,
+                    ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY {time_column} DESC) AS rn
+                FROM {table_name}
+                WHERE symbol = ANY(:symbols)
+            )
+            SELECT symbol, bar_time,
+                open::float8, high::float8, low::float8, close::float8, volume::float8
+            FROM ranked
+            WHERE rn <= :limit
+            ORDER BY symbol, bar_time
+        """)
+        params = {'symbols': symbols_upper, 'limit': limit}
+
+        rows, times = [], []
+        columns = {col: [] for col in OHLCV_COLUMNS}
+
+        try:
+            with self.db.get_connection() as conn:
+                result = conn.execution_options(stream_results=True).execute(query, params)
+                for block in result.partitions(self.PANEL_FETCH_ROWS):
+                    symbol_col, time_col, *value_cols = zip(*block, strict=True)
+                    rows.append(np.fromiter(
+                        (positions[symbol] for symbol in symbol_col),
+                        dtype=np.int64, count=len(block),
+                    ))
+                    bar_times = pd.to_datetime(list(time_col), utc=True).tz_localize(None)
+                    times.append(bar_times.to_numpy(dtype='datetime64[ns]'))
+                    for col, values in zip(OHLCV_COLUMNS, value_cols, strict=True):
+                        columns[col].append(np.array(values, dtype=np.float64))
+
+        except Exception as e:
+            logger.error(f"Panel query failed: {e}")
+            raise RuntimeError(f"Failed to fetch OHLCV panel: {str(e)}") from e
+
+        def flat(blocks, dtype):
+            return np.concatenate(blocks) if blocks else np.empty(0, dtype=dtype)
+
+        panel = OHLCVPanel.from_flat(
+            symbols_upper,
+            flat(rows, np.int64),
+            flat(times, 'datetime64[ns]'),
+            {col: flat(blocks, np.float64) for col, blocks in columns.items()},
+        )
+
+        logger.info(
+            f"Panel loaded {int(panel.lengths.sum())} bars for {len(panel)} symbols ({timeframe})"
+        )
+        return panel
+
     def health_check(self) -> dict[str, any]:
         """
         Check database connection and data availability.
@@ -0,0 +1,167 @@
+"""
+Multi-symbol OHLCV panel for batch analysis.
+
+Holds the last N bars of many symbols as 2-D (symbols x bars) NumPy arrays so
+indicators can be computed for a whole universe with vectorized operations.
+
+- Rows are right-aligned: the latest bar of every symbol is the last column
+- Symbols with fewer bars are NaN-padded on the left (NaT for times)
+- Per-symbol DataFrames can be rebuilt for code that still needs them
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+@dataclass
+class OHLCVPanel:
+    """Right-aligned (symbols x bars) OHLCV arrays."""
+
+    symbols: list[str]
+    times: np.ndarray  # datetime64[ns], shape (S, T)
+    open: np.ndarray  # float64, shape (S, T)
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    lengths: np.ndarray  # int64, bars available per symbol
+    _rows: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._rows = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def bars(self) -> int:
+        """Number of columns (bars of the longest symbol)."""
+        return self.close.shape[1]
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean (S, T) mask of columns that hold a real bar for each symbol."""
+        columns = np.arange(self.bars)
+        return columns >= (self.bars - self.lengths)[:, None]
+
+    def column(self, name: str) -> np.ndarray:
+        """2-D array for an OHLCV column name."""
+        if name not in OHLCV_COLUMNS:
+            raise KeyError(f"Unknown OHLCV column: {name}")
+        return getattr(self, name)
+
+    def row(self, symbol: str) -> int | None:
+        return self._rows.get(symbol.upper())
+
+    def frame(self, symbol: str) -> pd.DataFrame:
+        """
+        Rebuild one symbol's bars as an analysis-ready DataFrame.
+
+        Returns:
+            DataFrame with columns [timestamp, open, high, low, close, volume]
+            and a RangeIndex, or an empty DataFrame if the symbol is unknown
+        """
+        row = self.row(symbol)
+        if row is None or self.lengths[row] == 0:
+            return pd.DataFrame(columns=['timestamp', *OHLCV_COLUMNS])
+
+        start = self.bars - int(self.lengths[row])
+        frame = pd.DataFrame({
+            col: getattr(self, col)[row, start:] for col in OHLCV_COLUMNS
+        })
+        frame.insert(0, 'timestamp', pd.to_datetime(self.times[row, start:]))
+        return frame
+
+    @classmethod
+    def from_frames(cls, frames: dict[str, pd.DataFrame], limit: int | None = None) -> 'OHLCVPanel':
+        """
+        Pack per-symbol OHLCV DataFrames into a panel.
+
+        Args:
+            frames: Mapping of symbol to DataFrame sorted ascending, indexed by
+                time or with a timestamp/date column (as returned by
+                OHLCVDataService.get_universe_ohlcv_data)
+            limit: Keep at most this many trailing bars per symbol
+
+        Returns:
+            OHLCVPanel with one row per symbol, in mapping order
+        """
+        symbols = [symbol.upper() for symbol in frames]
+        lengths = np.array(
+            [min(len(df), limit) if limit else len(df) for df in frames.values()],
+            dtype=np.int64
+        )
+        bars = int(lengths.max()) if len(lengths) else 0
+
+        times = np.full((len(symbols), bars), np.datetime64('NaT'), dtype='datetime64[ns]')
+        columns = {col: np.full((len(symbols), bars), np.nan) for col in OHLCV_COLUMNS}
+
+        for i, df in enumerate(frames.values()):
+            count = int(lengths[i])
+            if count == 0:
+                continue
+            df = df.iloc[-count:]
+            if 'timestamp' in df.columns:
+                index = df['timestamp']
+            elif 'date' in df.columns:
+                index = df['date']
+            else:
+                index = df.index
+            times[i, bars - count:] = pd.to_datetime(index).to_numpy(dtype='datetime64[ns]')
+            for col in OHLCV_COLUMNS:
+                columns[col][i, bars - count:] = df[col].to_numpy(dtype=np.float64)
+
+        return cls(symbols=symbols, times=times, lengths=lengths, **columns)
+
+    @classmethod
+    def from_flat(
+        cls,
+        symbols: list[str],
+        rows: np.ndarray,
+        times: np.ndarray,
+        columns: dict[str, np.ndarray],
+    ) -> 'OHLCVPanel':
+        """
+        Pack flat per-bar arrays (e.g. rows of one bulk query) into a panel.
+
+        Args:
+            symbols: Panel symbols, in row order
+            rows: int array giving each bar's position in `symbols`
+            times: datetime64[ns] array of bar times; each symbol's bars must
+                be in ascending time order
+            columns: OHLCV column name -> float64 array aligned with `rows`
+
+        Returns:
+            OHLCVPanel with one row per symbol (symbols without bars have
+            length 0)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        order = np.argsort(rows, kind='stable')
+        rows = rows[order]
+
+        lengths = np.bincount(rows, minlength=len(symbols)).astype(np.int64)
+        bars = int(lengths.max()) if len(lengths) else 0
+
+        # Right-align: bar k of a symbol with n bars goes to column bars - n + k
+        starts = np.cumsum(lengths) - lengths
+        cols = np.arange(len(rows)) - starts[rows] + (bars - lengths)[rows]
+
+        panel_times = np.full((len(symbols), bars), np.datetime64('NaT'), dtype='datetime64[ns]')
+        panel_times[rows, cols] = np.asarray(times, dtype='datetime64[ns]')[order]
+
+        panel_columns = {}
+        for col in OHLCV_COLUMNS:
+            values = np.full((len(symbols), bars), np.nan)
+            values[rows, cols] = np.asarray(columns[col], dtype=np.float64)[order]
+            panel_columns[col] = values
+
+        return cls(
+            symbols=[symbol.upper() for symbol in symbols],
+            times=panel_times,
+            lengths=lengths,
+            **panel_columns
+        )
@@ -0,0 +1,456 @@
+"""
+Rolling in-memory OHLCV windows for real-time analysis.
+
+Keeps the most recent N bars per (symbol, timeframe) in preallocated NumPy
+buffers so bar analysis reads from memory instead of re-querying TimescaleDB
+on every tick.
+
+- Windows are bulk-loaded once (one batched query per chunk of symbols)
+- Live bars append, or update the last bar in place
+- Intraday bars fold into the current daily bar
+- Memory is accounted per window; idle windows are evicted
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Daily bars are keyed by the US market session date
+MARKET_TZ = ZoneInfo('America/New_York')
+
+
+class OHLCVWindow:
+    """
+    Fixed-capacity OHLCV window for one (symbol, timeframe).
+
+    Uses a buffer of twice the capacity and appends linearly; when the end of
+    the buffer is reached the live window is moved to a fresh buffer. This keeps
+    the live rows contiguous so readers get zero-copy slices, and previously
+    handed-out views are never overwritten by compaction.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buffer_size = capacity * 2
+        self._times = np.empty(self._buffer_size, dtype='datetime64[ns]')
+        self._values = np.empty((len(OHLCV_COLUMNS), self._buffer_size), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self.lock = threading.Lock()
+        self.last_access = time.time()
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def nbytes(self) -> int:
+        return self._times.nbytes + self._values.nbytes
+
+    def last_time(self) -> np.datetime64 | None:
+        return self._times[self._end - 1] if self._end > self._start else None
+
+    def load(self, times: np.ndarray, values: np.ndarray):
+        """Replace contents with the last `capacity` rows of times/values (ascending)."""
+        times = times[-self.capacity:]
+        values = values[:, -self.capacity:]
+        count = len(times)
+
+        self._times = np.empty(self._buffer_size, dtype='datetime64[ns]')
+        self._values = np.empty((len(OHLCV_COLUMNS), self._buffer_size), dtype=np.float64)
+        self._times[:count] = times
+        self._values[:, :count] = values
+        self._start = 0
+        self._end = count
+
+    def append(self, timestamp: np.datetime64, values: tuple[float, ...]):
+        """Append a new bar, dropping the oldest once at capacity."""
+        if self._end == self._buffer_size:
+            # Move the live window to a fresh buffer so existing views stay valid
+            keep = self.capacity - 1
+            times = np.empty(self._buffer_size, dtype='datetime64[ns]')
+            data = np.empty((len(OHLCV_COLUMNS), self._buffer_size), dtype=np.float64)
+            times[:keep] = self._times[self._end - keep:self._end]
+            data[:, :keep] = self._values[:, self._end - keep:self._end]
+            self._times, self._values = times, data
+            self._start, self._end = 0, keep
+
+        self._times[self._end] = timestamp
+        self._values[:, self._end] = values
+        self._end += 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+
+    def update_last(self, values: tuple[float, ...]):
+        """Overwrite the most recent bar in place."""
+        self._values[:, self._end - 1] = values
+
+    def last_values(self) -> np.ndarray:
+        return self._values[:, self._end - 1]
+
+    def views(self) -> tuple[np.ndarray, np.ndarray]:
+        """Zero-copy (times, values[5, n]) views of the live window."""
+        return self._times[self._start:self._end], self._values[:, self._start:self._end]
+
+
+class OHLCVWindowStore:
+    """Shared store of rolling OHLCV windows keyed by (symbol, timeframe)."""
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        """
+        Initialize window store.
+
+        Args:
+            config: Configuration dictionary with store settings
+        """
+        self.config = config or {}
+        self.capacity = int(self.config.get('OHLCV_WINDOW_BARS', 250))
+        self.max_windows = int(self.config.get('OHLCV_WINDOW_MAX_WINDOWS', 10000))
+        self.idle_ttl_seconds = float(self.config.get('OHLCV_WINDOW_IDLE_TTL_SECONDS', 4 * 3600))
+        self.load_chunk_size = int(self.config.get('OHLCV_WINDOW_LOAD_CHUNK_SIZE', 500))
+
+        # LRU order: least recently used first
+        self._windows: OrderedDict[tuple[str, str], OHLCVWindow] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'bars_appended': 0,
+            'bars_updated': 0,
+            'stale_bars_ignored': 0,
+            'windows_loaded': 0,
+            'windows_evicted': 0
+        }
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def load_frame(self, symbol: str, timeframe: str, data: pd.DataFrame):
+        """
+        Replace a window from an OHLCV DataFrame.
+
+        Args:
+            symbol: Stock symbol
+            timeframe: Data timeframe ('daily', '1min', ...)
+            data: DataFrame with OHLCV columns, indexed by time or with a
+                timestamp/date column, sorted ascending
+        """
+        if data is None or data.empty:
+            return
+
+        if 'timestamp' in data.columns:
+            times = data['timestamp']
+        elif 'date' in data.columns:
+            times = data['date']
+        else:
+            times = data.index
+
+        times = self._to_datetime64(times, timeframe)
+        values = np.vstack([data[col].to_numpy(dtype=np.float64) for col in OHLCV_COLUMNS])
+
+        window = self._get_or_create(symbol.upper(), timeframe)
+        with window.lock:
+            window.load(times, values)
+            window.last_access = time.time()
+
+        self.stats['windows_loaded'] += 1
+
+    def bulk_load(self, symbols: list[str], timeframe: str = 'daily', ohlcv_service=None) -> int:
+        """
+        Load windows for many symbols using batched queries.
+
+        Args:
+            symbols: Symbols to load
+            timeframe: Data timeframe
+            ohlcv_service: OHLCVDataService instance (created if not provided)
+
+        Returns:
+            int: Number of windows loaded
+        """
+        if ohlcv_service is None:
+            from src.analysis.data.ohlcv_data_service import OHLCVDataService
+            ohlcv_service = OHLCVDataService()
+
+        start_time = time.time()
+        loaded = 0
+
+        for start in range(0, len(symbols), self.load_chunk_size):
+            chunk = symbols[start:start + self.load_chunk_size]
+            try:
+                frames = ohlcv_service.get_universe_ohlcv_data(
+                    chunk, timeframe, limit=self.capacity
+                )
+            except Exception as e:
+                logger.error(f"OHLCV-WINDOW-STORE: Bulk load failed for {len(chunk)} symbols: {e}")
+                continue
+
+            for symbol, frame in frames.items():
+                if frame is not None and not frame.empty:
+                    self.load_frame(symbol, timeframe, frame)
+                    loaded += 1
+
+        logger.info(
+            f"OHLCV-WINDOW-STORE: Loaded {loaded}/{len(symbols)} {timeframe} windows "
+            f"in {(time.time() - start_time) * 1000:.0f}ms"
+        )
+        return loaded
+
+    # ------------------------------------------------------------------
+    # Live updates
+    # ------------------------------------------------------------------
+
+    def update_bar(
+        self,
+        symbol: str,
+        timeframe: str,
+        timestamp: datetime,
+        open_price: float,
+        high_price: float,
+        low_price: float,
+        close_price: float,
+        volume: float
+    ) -> bool:
+        """
+        Append a bar, or replace the last bar if it has the same timestamp.
+
+        Only windows that are already loaded are updated; a partial window
+        would give indicators too little history.
+
+        Returns:
+            bool: True if the window changed
+        """
+        window = self._get_existing(symbol.upper(), timeframe)
+        if window is None:
+            return False
+
+        bar_time = self._to_datetime64([timestamp], timeframe)[0]
+        values = (open_price, high_price, low_price, close_price, volume)
+
+        with window.lock:
+            last = window.last_time()
+            if last is not None and bar_time < last:
+                self.stats['stale_bars_ignored'] += 1
+                return False
+            if last is not None and bar_time == last:
+                window.update_last(values)
+                self.stats['bars_updated'] += 1
+            else:
+                window.append(bar_time, values)
+                self.stats['bars_appended'] += 1
+
+        return True
+
+    def fold_into_daily(
+        self,
+        symbol: str,
+        timestamp: datetime,
+        open_price: float,
+        high_price: float,
+        low_price: float,
+        close_price: float,
+        volume: float
+    ) -> bool:
+        """
+        Fold an intraday bar into the symbol's current daily bar.
+
+        Extends high/low, sets close and adds volume when the bar belongs to
+        the last daily session; otherwise starts a new daily bar.
+
+        Returns:
+            bool: True if the daily window changed
+        """
+        window = self._get_existing(symbol.upper(), 'daily')
+        if window is None:
+            return False
+
+        session = self._to_datetime64([timestamp], 'daily')[0]
+
+        with window.lock:
+            last = window.last_time()
+            if last is not None and session < last:
+                self.stats['stale_bars_ignored'] += 1
+                return False
+            if last is not None and session == last:
+                current = window.last_values()
+                window.update_last((
+                    current[0],
+                    max(current[1], high_price),
+                    min(current[2], low_price),
+                    close_price,
+                    current[4] + volume
+                ))
+                self.stats['bars_updated'] += 1
+            else:
+                window.append(session, (open_price, high_price, low_price, close_price, volume))
+                self.stats['bars_appended'] += 1
+
+        return True
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_arrays(self, symbol: str, timeframe: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Zero-copy views of a window.
+
+        Returns:
+            (times, values) where values has rows in OHLCV_COLUMNS order, or
+            None if the window is not loaded. The last bar may be updated in
+            place by live ticks; use get_frame() for a consistent snapshot.
+        """
+        window = self._get_existing(symbol.upper(), timeframe, count=True)
+        if window is None:
+            return None
+        with window.lock:
+            return window.views()
+
+    def get_frame(self, symbol: str, timeframe: str) -> pd.DataFrame | None:
+        """
+        Consistent snapshot of a window as an analysis-ready DataFrame.
+
+        Returns:
+            DataFrame with columns [timestamp, open, high, low, close, volume],
+            sorted ascending, or None if the window is not loaded
+        """
+        window = self._get_existing(symbol.upper(), timeframe, count=True)
+        if window is None:
+            return None
+
+        with window.lock:
+            times, values = window.views()
+            frame = pd.DataFrame(values.T.copy(), columns=list(OHLCV_COLUMNS))
+            frame.insert(0, 'timestamp', times.copy())
+
+        return frame
+
+    def has_window(self, symbol: str, timeframe: str) -> bool:
+        with self._lock:
+            return (symbol.upper(), timeframe) in self._windows
+
+    # ------------------------------------------------------------------
+    # Memory management
+    # ------------------------------------------------------------------
+
+    def evict_inactive(self, now: float | None = None) -> int:
+        """
+        Drop windows not read or loaded within the idle TTL.
+
+        Returns:
+            int: Number of windows evicted
+        """
+        cutoff = (now if now is not None else time.time()) - self.idle_ttl_seconds
+
+        with self._lock:
+            stale = [key for key, window in self._windows.items() if window.last_access < cutoff]
+            for key in stale:
+                del self._windows[key]
+            self.stats['windows_evicted'] += len(stale)
+
+        if stale:
+            logger.info(f"OHLCV-WINDOW-STORE: Evicted {len(stale)} inactive windows")
+        return len(stale)
+
+    def memory_bytes(self) -> int:
+        """Total bytes held by window buffers."""
+        with self._lock:
+            return sum(window.nbytes for window in self._windows.values())
+
+    def clear(self):
+        with self._lock:
+            self._windows.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics including memory usage."""
+        with self._lock:
+            window_count = len(self._windows)
+            memory = sum(window.nbytes for window in self._windows.values())
+
+        stats = self.stats.copy()
+        lookups = stats['hits'] + stats['misses']
+        stats['windows'] = window_count
+        stats['max_windows'] = self.max_windows
+        stats['capacity_bars'] = self.capacity
+        stats['memory_bytes'] = memory
+        stats['memory_mb'] = round(memory / (1024 * 1024), 2)
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_existing(self, symbol: str, timeframe: str, count: bool = False) -> OHLCVWindow | None:
+        key = (symbol, timeframe)
+        with self._lock:
+            window = self._windows.get(key)
+            if window is not None:
+                self._windows.move_to_end(key)
+                window.last_access = time.time()
+            if count:
+                self.stats['hits' if window is not None else 'misses'] += 1
+        return window
+
+    def _get_or_create(self, symbol: str, timeframe: str) -> OHLCVWindow:
+        key = (symbol, timeframe)
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None:
+                window = OHLCVWindow(self.capacity)
+                self._windows[key] = window
+                # LRU eviction when over the window budget
+                while len(self._windows) > self.max_windows:
+                    self._windows.popitem(last=False)
+                    self.stats['windows_evicted'] += 1
+            else:
+                self._windows.move_to_end(key)
+        return window
+
+    @staticmethod
+    def _to_datetime64(times, timeframe: str) -> np.ndarray:
+        """Normalize times to naive datetime64[ns]: UTC for intraday, session date for daily."""
+        index = pd.DatetimeIndex(pd.to_datetime(times))
+        if timeframe == 'daily':
+            if index.tz is not None:
+                index = index.tz_convert(MARKET_TZ).tz_localize(None)
+            index = index.normalize()
+        elif index.tz is not None:
+            index = index.tz_convert('UTC').tz_localize(None)
+        return index.to_numpy(dtype='datetime64[ns]')
+
+
+_store_instance: OHLCVWindowStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_ohlcv_window_store(config: dict[str, Any] | None = None) -> OHLCVWindowStore:
+    """
+    Get singleton window store instance.
+
+    Args:
+        config: Configuration used on first creation only
+
+    Returns:
+        OHLCVWindowStore instance
+    """
+    global _store_instance
+
+    if _store_instance is None:
+        with _store_lock:
+            if _store_instance is None:
+                _store_instance = OHLCVWindowStore(config)
+
+    return _store_instance
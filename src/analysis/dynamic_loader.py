@@ -41,7 +41,7 @@ class DynamicPatternIndicatorLoader:
             config: Configuration dict. If None, uses get_config().
         """
         self.config = config or get_config()
-        self.db = TickStockDatabase(self.config)
+        self.db = TickStockDatabase(self.config, role='analysis')
 
         # Cache for loaded classes by timeframe
         self._pattern_cache: Dict[str, Dict[str, Any]] = {}
@@ -5,12 +5,15 @@ Sprint 70: Indicator Library Extension
 Trend strength indicator using directional movement.
 """
 
+import math
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
 
 from .base_indicator import BaseIndicator, IndicatorParams
+from .streaming import EWMState, RollingStats
 from ..exceptions import IndicatorError
 
 
@@ -124,23 +127,7 @@ class ADX(BaseIndicator):
         if pd.isna(adx_value) or pd.isna(plus_di) or pd.isna(minus_di):
             return self._empty_result(timeframe, data, symbol, "calculation_failed")
 
-        # Determine trend strength (ADX thresholds)
-        if adx_value < 20:
-            trend_strength = "weak"
-        elif adx_value < 40:
-            trend_strength = "moderate"
-        elif adx_value < 60:
-            trend_strength = "strong"
-        else:
-            trend_strength = "very_strong"
-
-        # Determine trend direction based on +DI vs -DI
-        if plus_di > minus_di:
-            trend_direction = "uptrend"
-        elif minus_di > plus_di:
-            trend_direction = "downtrend"
-        else:
-            trend_direction = "neutral"
+        trend_strength, trend_direction = self._classify_trend(adx_value, plus_di, minus_di)
 
         return {
             "indicator_type": "adx",
@@ -259,6 +246,112 @@ class ADX(BaseIndicator):
 
         return result
 
+    def _classify_trend(self, adx_value: float, plus_di: float, minus_di: float) -> tuple[str, str]:
+        """
+        Classify trend strength (ADX thresholds) and direction (+DI vs -DI).
+
+        Returns:
+            (trend_strength, trend_direction)
+        """
+        if adx_value < 20:
+            trend_strength = "weak"
+        elif adx_value < 40:
+            trend_strength = "moderate"
+        elif adx_value < 60:
+            trend_strength = "strong"
+        else:
+            trend_strength = "very_strong"
+
+        if plus_di > minus_di:
+            trend_direction = "uptrend"
+        elif minus_di > plus_di:
+            trend_direction = "downtrend"
+        else:
+            trend_direction = "neutral"
+
+        return trend_strength, trend_direction
+
+    def reset(self) -> None:
+        """Clear streaming state (previous bar and smoothed TR, +DM, -DM, DX)."""
+        super().reset()
+        self._prev_bar = None
+        if self.params.use_sma:
+            self._tr, self._plus_dm, self._minus_dm, self._adx = (
+                RollingStats(self.params.period) for _ in range(4)
+            )
+        else:
+            alpha = 1 / self.params.period
+            self._tr, self._plus_dm, self._minus_dm, self._adx = (
+                EWMState(alpha=alpha, min_periods=self.params.period) for _ in range(4)
+            )
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, Any]:
+        """
+        Fold one bar into the smoothed directional movement state.
+
+        Args:
+            bar: Mapping with high, low and close
+
+        Returns:
+            Dict with adx_{period}, plus_di, minus_di, trend_strength and
+            trend_direction (all None until period * 2 + 1 bars are seen)
+        """
+        self.bars_seen += 1
+        high = float(bar["high"])
+        low = float(bar["low"])
+        close = float(bar["close"])
+
+        if self._prev_bar is None:
+            # No previous bar: TR is high-low and directional movement is undefined
+            true_range = high - low
+            plus_dm = minus_dm = math.nan
+        else:
+            prev_high, prev_low, prev_close = self._prev_bar
+            true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+            high_diff = high - prev_high
+            low_diff = prev_low - low
+            plus_dm = 0.0 if high_diff < 0 or high_diff < low_diff else high_diff
+            minus_dm = 0.0 if low_diff < 0 or low_diff < high_diff else low_diff
+        self._prev_bar = (high, low, close)
+
+        self._tr.push(true_range)
+        self._plus_dm.push(plus_dm)
+        self._minus_dm.push(minus_dm)
+
+        tr_smooth = self._tr.value
+        plus_di = self._directional_index(self._plus_dm.value, tr_smooth)
+        minus_di = self._directional_index(self._minus_dm.value, tr_smooth)
+
+        di_sum = plus_di + minus_di
+        dx = (abs(plus_di - minus_di) / di_sum) * 100 if di_sum else 0.0
+        self._adx.push(dx)
+        adx_value = self._adx.value
+
+        if self.bars_seen < self.get_minimum_periods() or adx_value is None:
+            return {
+                f"adx_{self.params.period}": None,
+                "plus_di": None,
+                "minus_di": None,
+                "trend_strength": None,
+                "trend_direction": None,
+            }
+
+        trend_strength, trend_direction = self._classify_trend(adx_value, plus_di, minus_di)
+        return {
+            f"adx_{self.params.period}": round(adx_value, 4),
+            "plus_di": round(plus_di, 4),
+            "minus_di": round(minus_di, 4),
+            "trend_strength": trend_strength,
+            "trend_direction": trend_direction,
+        }
+
+    @staticmethod
+    def _directional_index(dm_smooth: float | None, tr_smooth: float | None) -> float:
+        """(+/-DM / TR) * 100, zero while either side is undefined (matches fillna(0.0))."""
+        if dm_smooth is None or not tr_smooth:
+            return 0.0
+        return (dm_smooth / tr_smooth) * 100
+
     def get_minimum_periods(self) -> int:
         """
         Get minimum number of periods required for calculation.
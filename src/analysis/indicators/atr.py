@@ -5,12 +5,15 @@ Sprint 70: Indicator Library Extension
 Measures market volatility using exponentially smoothed true range.
 """
 
+import math
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
 
 from .base_indicator import BaseIndicator, IndicatorParams
+from .streaming import EWMState, RollingStats
 from ..exceptions import IndicatorError
 
 
@@ -120,11 +123,7 @@ class ATR(BaseIndicator):
             # Compare current ATR to 50-period average
             atr_series = self.calculate_series(data)
             avg_atr = atr_series.iloc[-50:].mean()
-
-            if atr_value > avg_atr * 1.5:
-                volatility_signal = "high"
-            elif atr_value < avg_atr * 0.5:
-                volatility_signal = "low"
+            volatility_signal = self._volatility_signal(atr_value, avg_atr)
 
         # Calculate true range components for diagnostics
         tr_series = self._calculate_true_range(data)
@@ -239,6 +238,67 @@ class ATR(BaseIndicator):
         latest = atr_series.iloc[-1]
         return float(latest) if not pd.isna(latest) else None
 
+    def _volatility_signal(self, atr_value: float, avg_atr: float | None) -> str:
+        """Classify ATR relative to its recent (50-bar) average."""
+        if avg_atr is None:
+            return "normal"
+        if atr_value > avg_atr * 1.5:
+            return "high"
+        if atr_value < avg_atr * 0.5:
+            return "low"
+        return "normal"
+
+    def reset(self) -> None:
+        """Clear streaming state (previous close, smoothed TR and 50-bar ATR mean)."""
+        super().reset()
+        self._prev_close = None
+        if self.params.use_sma:
+            self._atr = RollingStats(self.params.period)
+        else:
+            self._atr = EWMState(alpha=1 / self.params.period, min_periods=self.params.period)
+        self._recent_atr = RollingStats(50, min_periods=1)
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, Any]:
+        """
+        Fold one bar into the smoothed true range.
+
+        Args:
+            bar: Mapping with high, low and close
+
+        Returns:
+            Dict with atr_{period}, volatility_signal, current_true_range and
+            period (ATR is None until period + 1 bars are seen)
+        """
+        self.bars_seen += 1
+        high = float(bar["high"])
+        low = float(bar["low"])
+        close = float(bar["close"])
+
+        # First bar has no previous close, so TR is just high-low
+        if self._prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+
+        self._atr.push(true_range)
+        atr_value = self._atr.value
+        self._recent_atr.push(atr_value if atr_value is not None else math.nan)
+
+        if self.bars_seen < self.get_minimum_periods():
+            atr_value = None
+
+        volatility_signal = "normal"
+        if atr_value is not None and self.bars_seen >= 50:
+            volatility_signal = self._volatility_signal(atr_value, self._recent_atr.mean)
+
+        return {
+            f"atr_{self.params.period}": atr_value,
+            "volatility_signal": volatility_signal,
+            "current_true_range": round(true_range, 4),
+            "period": self.params.period,
+        }
+
     def get_minimum_periods(self) -> int:
         """
         Get minimum number of periods required for calculation.
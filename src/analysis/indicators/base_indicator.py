@@ -8,6 +8,7 @@ Sprint 68: Core Analysis Migration from TickStockPL
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -48,7 +49,7 @@ class BaseIndicator(ABC):
     Performance Requirements:
     - <500ms calculation time for 250 bars
     - Memory-efficient vectorized operations
-    - Support for streaming updates with minimal computation
+    - Support for streaming updates with minimal computation (see update())
 
     Return Format Convention (for database storage):
         {
@@ -81,6 +82,8 @@ class BaseIndicator(ABC):
                 indicator_name=self.__class__.__name__,
             )
 
+        self.reset()
+
     @abstractmethod
     def calculate(
         self, data: pd.DataFrame, symbol: str = None, timeframe: str = "daily"
@@ -128,6 +131,54 @@ class BaseIndicator(ABC):
         """
         pass
 
+    def update(self, bar: Mapping[str, float]) -> dict[str, Any]:
+        """
+        Fold one new bar into the indicator's streaming state.
+
+        Indicators that support streaming keep O(1) per-bar state, so a new
+        bar costs a handful of arithmetic operations instead of a full
+        recalculation. After N updates the returned values match
+        calculate()['value_data'] over the same N bars.
+
+        Args:
+            bar: Mapping with open/high/low/close/volume values (dict or
+                DataFrame row)
+
+        Returns:
+            Dictionary of latest values keyed as in calculate()['value_data'];
+            values are None until enough bars have been seen
+
+        Raises:
+            IndicatorError: If the indicator does not support streaming
+        """
+        raise IndicatorError(
+            f"{self.indicator_name} does not support streaming updates",
+            indicator_name=self.indicator_name,
+        )
+
+    def reset(self) -> None:
+        """Clear streaming state."""
+        self.bars_seen = 0
+
+    def warm_up(self, data: pd.DataFrame) -> dict[str, Any] | None:
+        """
+        Reset streaming state and fold every row of data into it.
+
+        Args:
+            data: DataFrame with OHLCV columns, oldest bar first
+
+        Returns:
+            Result of the last update(), or None if data is empty
+        """
+        self.reset()
+        columns = [col for col in ("open", "high", "low", "close", "volume") if col in data.columns]
+        arrays = [data[col].to_numpy(dtype=float) for col in columns]
+
+        result = None
+        for values in zip(*arrays):
+            result = self.update(dict(zip(columns, values)))
+        return result
+
     def get_minimum_periods(self) -> int:
         """
         Get minimum number of periods required for calculation.
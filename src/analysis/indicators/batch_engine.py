@@ -0,0 +1,624 @@
+"""
+Vectorized multi-symbol indicator engine.
+
+Computes indicators for a whole universe at once on an OHLCVPanel
+(symbols x bars arrays) instead of building a DataFrame and calling
+calculate() once per symbol per indicator.
+
+- Rolling windows use cumulative sums or strided window views over all rows
+- Recursive smoothing (EMA, Wilder) steps through time once, updating every
+  symbol in a single vector operation
+- Results use the same format as BaseIndicator.calculate()
+- Symbols the vectorized path cannot reproduce exactly (too little history,
+  gaps in the data, unsupported indicators) fall back to calculate()
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.analysis.data.ohlcv_panel import OHLCV_COLUMNS, OHLCVPanel
+
+from .adx import ADX
+from .atr import ATR
+from .base_indicator import BaseIndicator
+from .bollinger_bands import BollingerBands
+from .ema import EMA
+from .macd import MACD
+from .rsi import RSI
+from .sma import SMA
+from .stochastic import Stochastic
+
+logger = logging.getLogger(__name__)
+
+VALID_TIMEFRAMES = ["daily", "weekly", "hourly", "intraday", "monthly", "1min"]
+
+
+# ----------------------------------------------------------------------
+# Vectorized kernels (operate along axis 1 of (S, T) arrays)
+# ----------------------------------------------------------------------
+
+def _ewm(values: np.ndarray, span: float | None = None, alpha: float | None = None,
+         min_periods: int = 0) -> np.ndarray:
+    """
+    Row-wise ewm(adjust=False).mean(), seeded at each row's first observation.
+
+    Mirrors the pandas recursion exactly (including the center-of-mass
+    conversion), so results are bit-identical for gap-free rows.
+    """
+    com = (span - 1) / 2 if span is not None else (1 - alpha) / alpha
+    alpha = 1.0 / (1.0 + com)
+    old_wt = 1.0 - alpha
+    min_periods = max(min_periods, 1)
+
+    out = np.full(values.shape, np.nan)
+    weighted = np.full(values.shape[0], np.nan)
+    nobs = np.zeros(values.shape[0], dtype=np.int64)
+
+    for t in range(values.shape[1]):
+        cur = values[:, t]
+        observed = ~np.isnan(cur)
+        nobs += observed
+        smoothed = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+        weighted = np.where(
+            np.isnan(weighted), cur, np.where(observed & (weighted != cur), smoothed, weighted)
+        )
+        out[:, t] = np.where(nobs >= min_periods, weighted, np.nan)
+
+    return out
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Row-wise rolling(window, min_periods=window).mean() via cumulative sums."""
+    valid = ~np.isnan(values)
+    # Center each row so the cumulative sums stay small relative to the data
+    filled = np.where(valid, values, 0.0)
+    offset = filled.sum(axis=1, keepdims=True) / np.maximum(valid.sum(axis=1, keepdims=True), 1)
+    centered = np.where(valid, values - offset, 0.0)
+
+    sums = np.cumsum(centered, axis=1)
+    counts = np.cumsum(valid, axis=1)
+    sums[:, window:] = sums[:, window:] - sums[:, :-window]
+    counts[:, window:] = counts[:, window:] - counts[:, :-window]
+
+    out = sums / window + offset
+    # Constant windows are exact in pandas; snap them so thresholds like == 0 agree
+    out = np.where(_same_run(values) >= window, values, out)
+    out[counts < window] = np.nan
+    return out
+
+
+def _same_run(values: np.ndarray) -> np.ndarray:
+    """Length of the trailing run of identical values at each position."""
+    runs = np.zeros(values.shape, dtype=np.int64)
+    if values.shape[1] == 0:
+        return runs
+    runs[:, 0] = 1
+    for t in range(1, values.shape[1]):
+        runs[:, t] = np.where(values[:, t] == values[:, t - 1], runs[:, t - 1] + 1, 1)
+    return runs
+
+
+def _tail(values: np.ndarray, count: int) -> np.ndarray:
+    """Last `count` columns, NaN-padded on the left when the panel is shorter."""
+    if values.shape[1] >= count:
+        return values[:, values.shape[1] - count:]
+    pad = np.full((values.shape[0], count - values.shape[1]), np.nan)
+    return np.hstack([pad, values])
+
+
+def _window_stats(values: np.ndarray, window: int, positions: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and sample std for the last `positions` windows of each row.
+
+    Uses strided window views (two-pass, no cumulative error); windows that
+    include padding are NaN.
+
+    Returns:
+        (mean, std) arrays of shape (S, positions)
+    """
+    windows = sliding_window_view(_tail(values, window + positions - 1), window, axis=1)
+    mean = windows.mean(axis=2)
+    std = windows.std(axis=2, ddof=1) if window > 1 else np.full(mean.shape, np.nan)
+
+    # Constant windows have exactly zero variance (as in pandas)
+    constant = windows.max(axis=2) == windows.min(axis=2)
+    mean = np.where(constant, windows[:, :, -1], mean)
+    std = np.where(constant & ~np.isnan(std), 0.0, std)
+    return mean, std
+
+
+def _true_range(panel: OHLCVPanel) -> np.ndarray:
+    """True range; the first bar of each symbol is high - low."""
+    prev_close = np.roll(panel.close, 1, axis=1)
+    prev_close[:, 0] = np.nan
+    high_low = panel.high - panel.low
+    true_range = np.fmax(
+        high_low, np.fmax(np.abs(panel.high - prev_close), np.abs(panel.low - prev_close))
+    )
+    return np.where(np.isnan(panel.close), np.nan, true_range)
+
+
+def _diff(values: np.ndarray) -> np.ndarray:
+    out = np.full(values.shape, np.nan)
+    out[:, 1:] = values[:, 1:] - values[:, :-1]
+    return out
+
+
+def _opt(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+class BatchIndicatorEngine:
+    """Compute indicators for every symbol of an OHLCVPanel at once."""
+
+    def __init__(self):
+        # indicator class -> (kernel, indicator_type used in results)
+        self._kernels: dict[type, tuple[Callable, str]] = {
+            SMA: (self._sma, "sma"),
+            EMA: (self._ema, "ema"),
+            RSI: (self._rsi, "rsi"),
+            MACD: (self._macd, "macd"),
+            ATR: (self._atr, "atr"),
+            ADX: (self._adx, "adx"),
+            Stochastic: (self._stochastic, "stochastic"),
+            BollingerBands: (self._bollinger_bands, "bollinger_bands"),
+        }
+
+        # Statistics
+        self.stats = {
+            'runs': 0,
+            'symbols_processed': 0,
+            'vectorized_results': 0,
+            'fallback_results': 0,
+            'total_run_ms': 0.0,
+        }
+
+    def supports(self, indicator: BaseIndicator) -> bool:
+        """True if the indicator has a vectorized kernel."""
+        return type(indicator) in self._kernels
+
+    def calculate(
+        self,
+        panel: OHLCVPanel,
+        indicators: dict[str, BaseIndicator],
+        timeframe: str = "daily",
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Calculate indicators for all symbols of a panel.
+
+        Args:
+            panel: Universe OHLCV panel
+            indicators: Mapping of indicator name to configured instance
+            timeframe: Timeframe for calculation (default: 'daily')
+
+        Returns:
+            {symbol: {indicator_name: result}} where each result has the
+            BaseIndicator.calculate() format
+        """
+        start_time = time.time()
+        results: dict[str, dict[str, dict[str, Any]]] = {symbol: {} for symbol in panel.symbols}
+        if len(panel) == 0:
+            return results
+
+        # Symbols with gaps inside their history take the per-symbol path
+        valid = panel.valid
+        gap_free = np.ones(len(panel), dtype=bool)
+        for col in OHLCV_COLUMNS:
+            gap_free &= ~(valid & np.isnan(panel.column(col))).any(axis=1)
+        timestamps = [self._timestamp(panel, row) for row in range(len(panel))]
+
+        for name, indicator in indicators.items():
+            kernel, indicator_type = self._kernels.get(type(indicator), (None, None))
+            if kernel is None or timeframe not in VALID_TIMEFRAMES:
+                rows = {}
+            else:
+                rows = kernel(indicator, panel)
+
+            for row, symbol in enumerate(panel.symbols):
+                computed = rows.get(row) if gap_free[row] else None
+                if computed is None:
+                    results[symbol][name] = indicator.calculate(
+                        panel.frame(symbol), symbol, timeframe
+                    )
+                    self.stats['fallback_results'] += 1
+                    continue
+
+                value, value_data, metadata = computed
+                results[symbol][name] = {
+                    "indicator_type": indicator_type,
+                    "symbol": symbol,
+                    "timeframe": timeframe,
+                    "value": value,
+                    "value_data": value_data,
+                    "calculation_timestamp": timestamps[row],
+                    "metadata": metadata,
+                }
+                self.stats['vectorized_results'] += 1
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        self.stats['runs'] += 1
+        self.stats['symbols_processed'] += len(panel)
+        self.stats['total_run_ms'] += elapsed_ms
+        logger.info(
+            f"BATCH-INDICATORS: {len(indicators)} indicators x {len(panel)} symbols "
+            f"in {elapsed_ms:.0f}ms"
+        )
+        return results
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get engine statistics."""
+        stats = self.stats.copy()
+        total = stats['vectorized_results'] + stats['fallback_results']
+        stats['vectorized_ratio'] = stats['vectorized_results'] / total if total else 0.0
+        stats['avg_run_ms'] = stats['total_run_ms'] / stats['runs'] if stats['runs'] else 0.0
+        return stats
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _timestamp(panel: OHLCVPanel, row: int) -> str | None:
+        if panel.lengths[row] == 0:
+            return None
+        return pd.Timestamp(panel.times[row, -1]).isoformat()
+
+    @staticmethod
+    def _rows_with(panel: OHLCVPanel, min_bars: int) -> np.ndarray:
+        return np.flatnonzero(panel.lengths >= min_bars)
+
+    # ------------------------------------------------------------------
+    # Kernels: return {row: (value, value_data, metadata)} for rows they cover
+    # ------------------------------------------------------------------
+
+    def _moving_average(self, indicator, panel, prefix, series_fn, cross_pair, cross_names):
+        """Shared SMA/EMA kernel: latest value per period plus crossover detection."""
+        params = indicator.params
+        periods = params.periods or [params.period]
+        source = panel.column(params.source)
+
+        fast, slow = cross_pair
+        series = {period: series_fn(source, period) for period in set(periods)}
+
+        out = {}
+        for row in self._rows_with(panel, indicator.get_minimum_periods()):
+            length = int(panel.lengths[row])
+            value_data = {}
+            metadata = {"periods_calculated": [], "crossovers": []}
+            for period in periods:
+                if length < period:
+                    value_data[f"{prefix}_{period}"] = None
+                    continue
+                value_data[f"{prefix}_{period}"] = _opt(series[period][row, -1])
+                metadata["periods_calculated"].append(period)
+
+            fast_value = value_data.get(f"{prefix}_{fast}")
+            slow_value = value_data.get(f"{prefix}_{slow}")
+            if fast_value and slow_value and length > slow:
+                fast_prev = series[fast][row, -2]
+                slow_prev = series[slow][row, -2]
+                # calculate() labels crossovers with the frame's (positional) index
+                if fast_prev and slow_prev:
+                    crossover = None
+                    if fast_prev <= slow_prev and fast_value > slow_value:
+                        crossover = cross_names[0]
+                    elif fast_prev >= slow_prev and fast_value < slow_value:
+                        crossover = cross_names[1]
+                    if crossover:
+                        metadata["crossovers"].append(
+                            {"type": crossover, "timestamp": str(length - 1)}
+                        )
+
+            primary = next(
+                (v for v in (value_data.get(f"{prefix}_{p}") for p in periods) if v is not None),
+                None
+            )
+            out[row] = (primary, value_data, metadata)
+        return out
+
+    def _sma(self, indicator: SMA, panel: OHLCVPanel):
+        return self._moving_average(
+            indicator, panel, "sma", _rolling_mean, (50, 200), ("golden_cross", "death_cross")
+        )
+
+    def _ema(self, indicator: EMA, panel: OHLCVPanel):
+        return self._moving_average(
+            indicator, panel, "ema",
+            lambda values, period: _ewm(values, span=period, min_periods=period),
+            (12, 26), ("bullish_crossover", "bearish_crossover")
+        )
+
+    def _rsi(self, indicator: RSI, panel: OHLCVPanel):
+        params = indicator.params
+        period = params.period
+        prices = panel.column(params.source)
+        valid = panel.valid
+
+        # diff() is NaN on each symbol's first bar; calculate() counts it as no change
+        delta = _diff(prices)
+        gains = np.where(valid, np.where(delta > 0, delta, 0.0), np.nan)
+        losses = np.where(valid, np.where(delta < 0, -delta, 0.0), np.nan)
+
+        wilder_gain = _ewm(gains, alpha=1 / period, min_periods=period)
+        wilder_loss = _ewm(losses, alpha=1 / period, min_periods=period)
+        if params.use_sma:
+            avg_gains, avg_losses = _rolling_mean(gains, period), _rolling_mean(losses, period)
+        else:
+            avg_gains, avg_losses = wilder_gain, wilder_loss
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - (100 / (1 + avg_gains / avg_losses))
+        rsi = np.where(np.isnan(rsi), 100.0, rsi)
+        rsi = np.where(avg_gains == 0, 0.0, rsi)
+
+        # Divergence inputs over each row's lookback = min(50, length - 1)
+        recent_prices = _tail(prices, 50)
+        recent_rsi = _tail(rsi, 50)
+        lookback = np.minimum(50, panel.lengths - 1)
+        in_lookback = np.arange(50) >= (50 - lookback)[:, None]
+        recent_prices = np.where(in_lookback, recent_prices, np.nan)
+
+        out = {}
+        for row in self._rows_with(panel, period + 1):
+            rsi_value = float(rsi[row, -1])
+            signal, overbought_flag, oversold_flag, confidence = indicator._classify(rsi_value)
+
+            divergence = None
+            if panel.lengths[row] >= 20:
+                window = recent_prices[row]
+                min_idx, max_idx = np.nanargmin(window), np.nanargmax(window)
+                last_price = prices[row, -1]
+                if last_price < window[min_idx] * 1.01 and rsi_value > recent_rsi[row, min_idx]:
+                    divergence = "bullish"
+                elif last_price > window[max_idx] * 0.99 and rsi_value < recent_rsi[row, max_idx]:
+                    divergence = "bearish"
+
+            value_data = {
+                f"rsi_{period}": rsi_value,
+                "signal": signal,
+                "overbought": overbought_flag,
+                "oversold": oversold_flag,
+                "overbought_threshold": params.overbought,
+                "oversold_threshold": params.oversold,
+                "confidence": confidence,
+                "avg_gain": round(float(wilder_gain[row, -1]), 4),
+                "avg_loss": round(float(wilder_loss[row, -1]), 4),
+                "period": period,
+                "divergence": divergence,
+            }
+            metadata = {
+                "signal": signal,
+                "overbought_threshold": params.overbought,
+                "oversold_threshold": params.oversold,
+                "divergence": divergence,
+                "calculation_method": "sma" if params.use_sma else "wilder",
+                "min_bars_required": period,
+            }
+            out[row] = (rsi_value, value_data, metadata)
+        return out
+
+    def _macd(self, indicator: MACD, panel: OHLCVPanel):
+        params = indicator.params
+        source = panel.column(params.source)
+
+        macd_line = _ewm(source, span=params.fast_period) - _ewm(source, span=params.slow_period)
+        signal_line = _ewm(macd_line, span=params.signal_period)
+        histogram = macd_line - signal_line
+
+        out = {}
+        for row in self._rows_with(panel, indicator.get_minimum_periods()):
+            current_macd = float(macd_line[row, -1])
+            current_signal = float(signal_line[row, -1])
+            current_histogram = float(histogram[row, -1])
+            macd_signal = indicator._classify_histogram(histogram[row, -2], current_histogram)
+
+            value_data = {
+                "macd": current_macd,
+                "signal": current_signal,
+                "histogram": current_histogram,
+                "macd_signal": macd_signal,
+                "confidence": indicator._confidence(macd_signal, current_macd, current_histogram),
+            }
+            metadata = {
+                "fast_period": params.fast_period,
+                "slow_period": params.slow_period,
+                "signal_period": params.signal_period,
+                "crossover": macd_signal,
+                "calculation_method": "ema",
+                "min_bars_required": params.slow_period + params.signal_period,
+            }
+            out[row] = (current_macd, value_data, metadata)
+        return out
+
+    def _atr(self, indicator: ATR, panel: OHLCVPanel):
+        params = indicator.params
+        period = params.period
+
+        true_range = _true_range(panel)
+        if params.use_sma:
+            atr = _rolling_mean(true_range, period)
+        else:
+            atr = _ewm(true_range, alpha=1 / period, min_periods=period)
+
+        recent = _tail(atr, 50)
+        with np.errstate(invalid='ignore'):
+            recent_counts = (~np.isnan(recent)).sum(axis=1)
+            avg_atr = np.where(
+                recent_counts > 0, np.nansum(recent, axis=1) / np.maximum(recent_counts, 1), np.nan
+            )
+
+        out = {}
+        for row in self._rows_with(panel, period + 1):
+            atr_value = _opt(atr[row, -1])
+            volatility_signal = "normal"
+            if atr_value is not None and panel.lengths[row] >= 50:
+                volatility_signal = indicator._volatility_signal(atr_value, float(avg_atr[row]))
+
+            value_data = {
+                f"atr_{period}": atr_value,
+                "volatility_signal": volatility_signal,
+                "current_true_range": round(float(true_range[row, -1]), 4),
+                "period": period,
+            }
+            metadata = {
+                "volatility_signal": volatility_signal,
+                "calculation_method": "sma" if params.use_sma else "wilder",
+                "min_bars_required": period + 1,
+            }
+            out[row] = (atr_value, value_data, metadata)
+        return out
+
+    def _adx(self, indicator: ADX, panel: OHLCVPanel):
+        params = indicator.params
+        period = params.period
+        valid = panel.valid
+
+        true_range = _true_range(panel)
+        high_diff = _diff(panel.high)
+        low_diff = -_diff(panel.low)
+        plus_dm = np.where((high_diff < 0) | (high_diff < low_diff), 0.0, high_diff)
+        minus_dm = np.where((low_diff < 0) | (low_diff < high_diff), 0.0, low_diff)
+
+        if params.use_sma:
+            smooth = lambda values: _rolling_mean(values, period)  # noqa: E731
+        else:
+            smooth = lambda values: _ewm(values, alpha=1 / period, min_periods=period)  # noqa: E731
+
+        tr_smooth = smooth(true_range)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            plus_di = (smooth(plus_dm) / tr_smooth) * 100
+            minus_di = (smooth(minus_dm) / tr_smooth) * 100
+            # fillna(0.0) applies to each symbol's own bars only; padding stays NaN
+            plus_di = np.where(valid & np.isnan(plus_di), 0.0, plus_di)
+            minus_di = np.where(valid & np.isnan(minus_di), 0.0, minus_di)
+            dx = (np.abs(plus_di - minus_di) / (plus_di + minus_di)) * 100
+            dx = np.where(valid & np.isnan(dx), 0.0, dx)
+        adx = smooth(dx)
+
+        out = {}
+        for row in self._rows_with(panel, period * 2 + 1):
+            adx_value, plus, minus = adx[row, -1], plus_di[row, -1], minus_di[row, -1]
+            if np.isnan(adx_value) or np.isnan(plus) or np.isnan(minus):
+                continue
+            adx_value, plus, minus = float(adx_value), float(plus), float(minus)
+            trend_strength, trend_direction = indicator._classify_trend(adx_value, plus, minus)
+
+            value_data = {
+                f"adx_{period}": round(adx_value, 4),
+                "plus_di": round(plus, 4),
+                "minus_di": round(minus, 4),
+                "trend_strength": trend_strength,
+                "trend_direction": trend_direction,
+            }
+            metadata = {
+                "trend_strength": trend_strength,
+                "trend_direction": trend_direction,
+                "period": period,
+                "calculation_method": "sma" if params.use_sma else "wilder",
+            }
+            out[row] = (round(adx_value, 4), value_data, metadata)
+        return out
+
+    def _stochastic(self, indicator: Stochastic, panel: OHLCVPanel):
+        params = indicator.params
+        k_period, d_period = params.k_period, params.d_period
+
+        # Only the last d_period + 1 %K values are needed (current and previous %D)
+        positions = d_period + 1
+        window_bars = k_period + positions - 1
+        highs = sliding_window_view(_tail(panel.high, window_bars), k_period, axis=1).max(axis=2)
+        lows = sliding_window_view(_tail(panel.low, window_bars), k_period, axis=1).min(axis=2)
+        closes = _tail(panel.close, positions)
+        in_series = _tail(panel.valid.astype(float), positions) == 1.0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percent_k = ((closes - lows) / (highs - lows)) * 100
+        # Partial window or flat range defaults to the middle (fillna(50.0))
+        percent_k = np.where(in_series & np.isnan(percent_k), 50.0, percent_k)
+
+        percent_d = percent_k[:, 1:].mean(axis=1)
+        prev_d = percent_k[:, :-1].mean(axis=1)
+
+        out = {}
+        for row in self._rows_with(panel, k_period + d_period - 1):
+            current_k, current_d = percent_k[row, -1], percent_d[row]
+            if np.isnan(current_k) or np.isnan(current_d):
+                continue
+            current_k, current_d = float(current_k), float(current_d)
+            (
+                signal, overbought_flag, oversold_flag, crossover_type, confidence
+            ) = indicator._classify(current_k, current_d, percent_k[row, -2], prev_d[row])
+
+            value_data = {
+                "percent_k": round(current_k, 4),
+                "percent_d": round(current_d, 4),
+                "signal": signal,
+                "overbought": overbought_flag,
+                "oversold": oversold_flag,
+                "crossover": crossover_type,
+                "confidence": round(confidence, 2),
+            }
+            metadata = {
+                "signal": signal,
+                "overbought_threshold": params.overbought,
+                "oversold_threshold": params.oversold,
+                "crossover": crossover_type,
+                "k_period": k_period,
+                "d_period": d_period,
+            }
+            out[row] = (round(current_k, 4), value_data, metadata)
+        return out
+
+    def _bollinger_bands(self, indicator: BollingerBands, panel: OHLCVPanel):
+        params = indicator.params
+        period = params.period
+        source = panel.column(params.source)
+
+        # Latest 50 windows cover both the current bands and the expansion check
+        mean, std = _window_stats(source, period, 50)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hist_bandwidth = ((std * params.num_std_dev * 2) / mean) * 100
+            counts = (~np.isnan(hist_bandwidth)).sum(axis=1)
+            avg_bandwidth = np.where(
+                counts > 0, np.nansum(hist_bandwidth, axis=1) / np.maximum(counts, 1), np.nan
+            )
+
+        out = {}
+        for row in self._rows_with(panel, period):
+            middle_value, std_value = mean[row, -1], std[row, -1]
+            if np.isnan(middle_value) or np.isnan(std_value):
+                continue
+            middle_value, std_value = float(middle_value), float(std_value)
+            current_price = float(source[row, -1])
+            upper_band, lower_band, percent_b, bandwidth = indicator._band_values(
+                current_price, middle_value, std_value
+            )
+
+            expansion_detected = bool(
+                panel.lengths[row] >= 50 and bandwidth > avg_bandwidth[row] * 1.5
+            )
+
+            value_data = {
+                "upper_band": round(upper_band, 4),
+                "middle_band": round(middle_value, 4),
+                "lower_band": round(lower_band, 4),
+                "percent_b": round(percent_b, 4),
+                "bandwidth": round(bandwidth, 4),
+                "current_price": round(current_price, 4),
+                "std_dev": round(std_value, 4),
+            }
+            metadata = {
+                "position_signal": indicator._position_signal(percent_b),
+                "squeeze_detected": bandwidth < 10.0,
+                "expansion_detected": expansion_detected,
+                "period": period,
+                "num_std_dev": params.num_std_dev,
+            }
+            out[row] = (round(percent_b, 4), value_data, metadata)
+        return out
@@ -5,12 +5,14 @@ Sprint 70: Indicator Library Extension
 Volatility bands based on standard deviations from moving average.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
 
 from .base_indicator import BaseIndicator, IndicatorParams
+from .streaming import RollingStats
 from ..exceptions import IndicatorError
 
 
@@ -138,33 +140,12 @@ class BollingerBands(BaseIndicator):
         if std_value is None:
             return self._empty_result(timeframe, data, symbol, "calculation_failed")
 
-        # Calculate upper and lower bands
-        upper_band = middle_value + (self.params.num_std_dev * std_value)
-        lower_band = middle_value - (self.params.num_std_dev * std_value)
-
-        # Calculate %B (Percent B): where price is within the bands
-        # %B = (Price - Lower) / (Upper - Lower)
-        # Values: >1 = above upper, 0.5 = middle, <0 = below lower
-        band_range = upper_band - lower_band
-        if band_range > 0:
-            percent_b = (current_price - lower_band) / band_range
-        else:
-            percent_b = 0.5  # Default to middle if bands are flat
-
-        # Calculate bandwidth: (Upper - Lower) / Middle * 100
-        # Measures volatility - low values indicate squeeze
-        bandwidth = (band_range / middle_value) * 100 if middle_value > 0 else 0.0
+        upper_band, lower_band, percent_b, bandwidth = self._band_values(
+            current_price, middle_value, std_value
+        )
 
         # Determine position signal
-        position_signal = "middle"
-        if percent_b > 1.0:
-            position_signal = "above_upper"
-        elif percent_b > 0.8:
-            position_signal = "near_upper"
-        elif percent_b < 0.0:
-            position_signal = "below_lower"
-        elif percent_b < 0.2:
-            position_signal = "near_lower"
+        position_signal = self._position_signal(percent_b)
 
         # Detect squeeze (low volatility) - bandwidth < 10% considered squeeze
         squeeze_detected = bandwidth < 10.0
@@ -261,6 +242,85 @@ class BollingerBands(BaseIndicator):
 
         return result
 
+    def _band_values(
+        self, price: float, middle_value: float, std_value: float
+    ) -> tuple[float, float, float, float]:
+        """
+        Calculate bands, %B and bandwidth for the latest bar.
+
+        Returns:
+            (upper_band, lower_band, percent_b, bandwidth)
+        """
+        # Calculate upper and lower bands
+        upper_band = middle_value + (self.params.num_std_dev * std_value)
+        lower_band = middle_value - (self.params.num_std_dev * std_value)
+
+        # Calculate %B (Percent B): where price is within the bands
+        # %B = (Price - Lower) / (Upper - Lower)
+        # Values: >1 = above upper, 0.5 = middle, <0 = below lower
+        band_range = upper_band - lower_band
+        if band_range > 0:
+            percent_b = (price - lower_band) / band_range
+        else:
+            percent_b = 0.5  # Default to middle if bands are flat
+
+        # Calculate bandwidth: (Upper - Lower) / Middle * 100
+        # Measures volatility - low values indicate squeeze
+        bandwidth = (band_range / middle_value) * 100 if middle_value > 0 else 0.0
+
+        return upper_band, lower_band, percent_b, bandwidth
+
+    def _position_signal(self, percent_b: float) -> str:
+        """Classify %B into a band position signal."""
+        if percent_b > 1.0:
+            return "above_upper"
+        if percent_b > 0.8:
+            return "near_upper"
+        if percent_b < 0.0:
+            return "below_lower"
+        if percent_b < 0.2:
+            return "near_lower"
+        return "middle"
+
+    def reset(self) -> None:
+        """Clear streaming state (running mean/variance window)."""
+        super().reset()
+        self._window = RollingStats(self.params.period)
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, Any]:
+        """
+        Fold one bar into the running mean/variance window.
+
+        Args:
+            bar: Mapping with the source column
+
+        Returns:
+            Dict with upper_band, middle_band, lower_band, percent_b,
+            bandwidth, current_price and std_dev (all None until the
+            window is full)
+        """
+        self.bars_seen += 1
+        price = float(bar[self.params.source])
+        self._window.push(price)
+
+        middle_value = self._window.mean
+        std_value = self._window.std
+        if middle_value is None or std_value is None:
+            return dict.fromkeys(
+                ("upper_band", "middle_band", "lower_band", "percent_b", "bandwidth", "current_price", "std_dev")
+            )
+
+        upper_band, lower_band, percent_b, bandwidth = self._band_values(price, middle_value, std_value)
+        return {
+            "upper_band": round(upper_band, 4),
+            "middle_band": round(middle_value, 4),
+            "lower_band": round(lower_band, 4),
+            "percent_b": round(percent_b, 4),
+            "bandwidth": round(bandwidth, 4),
+            "current_price": round(price, 4),
+            "std_dev": round(std_value, 4),
+        }
+
     def get_minimum_periods(self) -> int:
         """
         Get minimum number of periods required for calculation.
@@ -5,12 +5,14 @@ Sprint 70: Indicator Library Extension
 Exponential smoothing gives more weight to recent prices.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
 
 from .base_indicator import BaseIndicator, IndicatorParams
+from .streaming import EWMState
 from ..exceptions import IndicatorError
 
 
@@ -243,6 +245,33 @@ class EMA(BaseIndicator):
 
         return result
 
+    def reset(self) -> None:
+        """Clear streaming state (one EMA per period)."""
+        super().reset()
+        periods = self.params.periods or [self.params.period]
+        self._emas = {period: EWMState(span=period, min_periods=period) for period in periods}
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, Any]:
+        """
+        Fold one bar into the running EMAs.
+
+        Args:
+            bar: Mapping with the source column
+
+        Returns:
+            Dict of ema_{period} values (None until the longest period is seen)
+        """
+        self.bars_seen += 1
+        value = float(bar[self.params.source])
+
+        # Like calculate(), report nothing until the longest period is covered
+        warm = self.bars_seen >= self.get_minimum_periods()
+        result = {}
+        for period, ema in self._emas.items():
+            ema.push(value)
+            result[f"ema_{period}"] = ema.value if warm else None
+        return result
+
     def get_minimum_periods(self) -> int:
         """
         Get minimum number of periods required for calculation.
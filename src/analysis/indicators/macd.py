@@ -5,12 +5,14 @@ Sprint 68: Core Analysis Migration from TickStockPL
 Migrated from TickStockPL with TickStockAppV2 architecture adaptations.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
 
 from .base_indicator import BaseIndicator, IndicatorParams
+from .streaming import EWMState
 from ..exceptions import IndicatorError
 
 
@@ -177,11 +179,7 @@ class MACD(BaseIndicator):
         current_histogram = float(histogram.iloc[-1])
 
         # Determine confidence based on signal strength
-        confidence = 0.70  # Base confidence
-        if macd_signal in ["bullish_crossover", "bearish_crossover"]:
-            confidence = 0.85  # Higher confidence on crossovers
-        elif abs(current_histogram) > abs(current_macd) * 0.1:
-            confidence = 0.80  # Strong divergence from signal
+        confidence = self._confidence(macd_signal, current_macd, current_histogram)
 
         # CONVENTION-COMPLIANT return format
         # CRITICAL: Primary value = MACD line (NOT histogram)
@@ -261,9 +259,20 @@ class MACD(BaseIndicator):
         if len(histogram) < 2:
             return "neutral"
 
-        prev_histogram = histogram.iloc[-2]
-        current_histogram = histogram.iloc[-1]
+        return self._classify_histogram(histogram.iloc[-2], histogram.iloc[-1])
+
+    def _classify_histogram(self, prev_histogram: float, current_histogram: float) -> str:
+        """
+        Classify the latest histogram value relative to the previous one.
+
+        Args:
+            prev_histogram: Previous histogram value
+            current_histogram: Latest histogram value
 
+        Returns:
+            Signal status: 'bullish_crossover', 'bearish_crossover',
+            'bullish', 'bearish', or 'neutral'
+        """
         # Bullish crossover: MACD crosses above Signal (histogram goes from <= 0 to > 0)
         if current_histogram > 0 and prev_histogram <= 0:
             return "bullish_crossover"
@@ -279,6 +288,58 @@ class MACD(BaseIndicator):
             return "bearish"
         return "neutral"
 
+    def _confidence(self, macd_signal: str, macd_value: float, histogram: float) -> float:
+        """Confidence for a MACD reading based on signal strength."""
+        if macd_signal in ["bullish_crossover", "bearish_crossover"]:
+            return 0.85  # Higher confidence on crossovers
+        if abs(histogram) > abs(macd_value) * 0.1:
+            return 0.80  # Strong divergence from signal
+        return 0.70  # Base confidence
+
+    def reset(self) -> None:
+        """Clear streaming state (fast, slow and signal EMAs)."""
+        super().reset()
+        self._ema_fast = EWMState(span=self.params.fast_period)
+        self._ema_slow = EWMState(span=self.params.slow_period)
+        self._signal_ema = EWMState(span=self.params.signal_period)
+        self._prev_histogram = None
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, Any]:
+        """
+        Fold one bar into the fast/slow/signal EMA state.
+
+        Args:
+            bar: Mapping with the source column
+
+        Returns:
+            Dict with macd, signal, histogram, macd_signal and confidence
+            (all None until slow_period + signal_period bars are seen)
+        """
+        self.bars_seen += 1
+        value = float(bar[self.params.source])
+
+        self._ema_fast.push(value)
+        self._ema_slow.push(value)
+        macd_value = self._ema_fast.value - self._ema_slow.value
+        self._signal_ema.push(macd_value)
+        signal_value = self._signal_ema.value
+        histogram = macd_value - signal_value
+
+        prev_histogram = self._prev_histogram
+        self._prev_histogram = histogram
+
+        if self.bars_seen < self.get_minimum_periods():
+            return {"macd": None, "signal": None, "histogram": None, "macd_signal": None, "confidence": None}
+
+        macd_signal = self._classify_histogram(prev_histogram, histogram)
+        return {
+            "macd": macd_value,
+            "signal": signal_value,
+            "histogram": histogram,
+            "macd_signal": macd_signal,
+            "confidence": self._confidence(macd_signal, macd_value, histogram),
+        }
+
     def get_minimum_periods(self) -> int:
         """
         Get minimum number of periods required for calculation.
@@ -5,12 +5,14 @@ Sprint 68: Core Analysis Migration from TickStockPL
 Migrated from TickStockPL with TickStockAppV2 architecture adaptations.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
 
 from .base_indicator import BaseIndicator, IndicatorParams
+from .streaming import EWMState, RollingStats
 from ..exceptions import IndicatorError
 
 
@@ -136,20 +138,7 @@ class RSI(BaseIndicator):
         rsi_value = self._calculate_rsi(source_values)
 
         # Determine signal
-        signal = "neutral"
-        overbought_flag = False
-        oversold_flag = False
-        confidence = 0.70  # Base confidence
-
-        if rsi_value is not None:
-            if rsi_value >= self.params.overbought:
-                signal = "overbought"
-                overbought_flag = True
-                confidence = 0.80
-            elif rsi_value <= self.params.oversold:
-                signal = "oversold"
-                oversold_flag = True
-                confidence = 0.80
+        signal, overbought_flag, oversold_flag, confidence = self._classify(rsi_value)
 
         # Check for divergence if we have enough data
         divergence = None
@@ -311,6 +300,72 @@ class RSI(BaseIndicator):
 
         return None
 
+    def _classify(self, rsi_value: float | None) -> tuple[str, bool, bool, float]:
+        """
+        Classify an RSI value against the overbought/oversold thresholds.
+
+        Returns:
+            (signal, overbought, oversold, confidence)
+        """
+        if rsi_value is not None:
+            if rsi_value >= self.params.overbought:
+                return "overbought", True, False, 0.80
+            if rsi_value <= self.params.oversold:
+                return "oversold", False, True, 0.80
+        return "neutral", False, False, 0.70  # Base confidence
+
+    def reset(self) -> None:
+        """Clear streaming state (previous price and average gain/loss)."""
+        super().reset()
+        self._prev_value = None
+        if self.params.use_sma:
+            self._avg_gain = RollingStats(self.params.period)
+            self._avg_loss = RollingStats(self.params.period)
+        else:
+            alpha = 1 / self.params.period
+            self._avg_gain = EWMState(alpha=alpha, min_periods=self.params.period)
+            self._avg_loss = EWMState(alpha=alpha, min_periods=self.params.period)
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, Any]:
+        """
+        Fold one bar into the Wilder (or SMA) average gain/loss.
+
+        Args:
+            bar: Mapping with the source column
+
+        Returns:
+            Dict with rsi_{period}, signal, overbought, oversold and confidence
+            (RSI is None until period + 1 bars are seen)
+        """
+        self.bars_seen += 1
+        value = float(bar[self.params.source])
+
+        # First bar has no change; batch diff() counts it as zero gain and loss
+        delta = value - self._prev_value if self._prev_value is not None else 0.0
+        self._prev_value = value
+        self._avg_gain.push(delta if delta > 0 else 0.0)
+        self._avg_loss.push(-delta if delta < 0 else 0.0)
+
+        avg_gain = self._avg_gain.value
+        avg_loss = self._avg_loss.value
+        rsi_value = None
+        if self.bars_seen >= self.get_minimum_periods() and avg_gain is not None and avg_loss is not None:
+            if avg_gain == 0:
+                rsi_value = 0.0
+            elif avg_loss == 0:
+                rsi_value = 100.0
+            else:
+                rsi_value = 100 - (100 / (1 + avg_gain / avg_loss))
+
+        signal, overbought_flag, oversold_flag, confidence = self._classify(rsi_value)
+        return {
+            f"rsi_{self.params.period}": rsi_value,
+            "signal": signal,
+            "overbought": overbought_flag,
+            "oversold": oversold_flag,
+            "confidence": confidence,
+        }
+
     def get_minimum_periods(self) -> int:
         """
         Get minimum number of periods required for calculation.
@@ -5,12 +5,14 @@ Sprint 68: Core Analysis Migration from TickStockPL
 Migrated from TickStockPL with TickStockAppV2 architecture adaptations.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
 
 from .base_indicator import BaseIndicator, IndicatorParams
+from .streaming import RollingStats
 from ..exceptions import IndicatorError
 
 
@@ -242,6 +244,33 @@ class SMA(BaseIndicator):
 
         return result
 
+    def reset(self) -> None:
+        """Clear streaming state (one running window per period)."""
+        super().reset()
+        periods = self.params.periods or [self.params.period]
+        self._windows = {period: RollingStats(period) for period in periods}
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, Any]:
+        """
+        Fold one bar into the running window sums.
+
+        Args:
+            bar: Mapping with the source column
+
+        Returns:
+            Dict of sma_{period} values (None until every window is full)
+        """
+        self.bars_seen += 1
+        value = float(bar[self.params.source])
+
+        # Like calculate(), report nothing until the longest period is covered
+        warm = self.bars_seen >= self.get_minimum_periods()
+        result = {}
+        for period, window in self._windows.items():
+            window.push(value)
+            result[f"sma_{period}"] = window.mean if warm else None
+        return result
+
     def get_minimum_periods(self) -> int:
         """
         Get minimum number of periods required for calculation.
@@ -5,12 +5,14 @@ Sprint 70: Indicator Library Extension
 Momentum indicator showing price position relative to high-low range.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
 
 from .base_indicator import BaseIndicator, IndicatorParams
+from .streaming import RollingExtreme, RollingStats
 from ..exceptions import IndicatorError
 
 
@@ -154,38 +156,11 @@ class Stochastic(BaseIndicator):
         if pd.isna(percent_k) or pd.isna(percent_d):
             return self._empty_result(timeframe, data, symbol, "calculation_failed")
 
-        # Determine signal
-        signal = "neutral"
-        overbought_flag = False
-        oversold_flag = False
-        confidence = 0.70  # Base confidence
-
-        if percent_k >= self.params.overbought:
-            signal = "overbought"
-            overbought_flag = True
-            confidence = 0.80
-        elif percent_k <= self.params.oversold:
-            signal = "oversold"
-            oversold_flag = True
-            confidence = 0.80
-
-        # Detect crossovers
-        crossover_type = None
-        if len(data) >= 2:
-            prev_k = series_df["percent_k"].iloc[-2]
-            prev_d = series_df["percent_d"].iloc[-2]
-
-            if not pd.isna(prev_k) and not pd.isna(prev_d):
-                # Bullish crossover: %K crosses above %D
-                if prev_k <= prev_d and percent_k > percent_d:
-                    crossover_type = "bullish"
-                    if percent_k < self.params.oversold:
-                        confidence = 0.90  # Strong signal if in oversold zone
-                # Bearish crossover: %K crosses below %D
-                elif prev_k >= prev_d and percent_k < percent_d:
-                    crossover_type = "bearish"
-                    if percent_k > self.params.overbought:
-                        confidence = 0.90  # Strong signal if in overbought zone
+        prev_k = series_df["percent_k"].iloc[-2] if len(data) >= 2 else None
+        prev_d = series_df["percent_d"].iloc[-2] if len(data) >= 2 else None
+        signal, overbought_flag, oversold_flag, crossover_type, confidence = self._classify(
+            percent_k, percent_d, prev_k, prev_d
+        )
 
         return {
             "indicator_type": "stochastic",
@@ -262,6 +237,114 @@ class Stochastic(BaseIndicator):
 
         return result
 
+    def _classify(
+        self,
+        percent_k: float,
+        percent_d: float,
+        prev_k: float | None,
+        prev_d: float | None,
+    ) -> tuple[str, bool, bool, str | None, float]:
+        """
+        Classify %K/%D against thresholds and detect %K/%D crossovers.
+
+        Returns:
+            (signal, overbought, oversold, crossover, confidence)
+        """
+        signal = "neutral"
+        overbought_flag = False
+        oversold_flag = False
+        confidence = 0.70  # Base confidence
+
+        if percent_k >= self.params.overbought:
+            signal = "overbought"
+            overbought_flag = True
+            confidence = 0.80
+        elif percent_k <= self.params.oversold:
+            signal = "oversold"
+            oversold_flag = True
+            confidence = 0.80
+
+        # Detect crossovers
+        crossover_type = None
+        if not pd.isna(prev_k) and not pd.isna(prev_d):
+            # Bullish crossover: %K crosses above %D
+            if prev_k <= prev_d and percent_k > percent_d:
+                crossover_type = "bullish"
+                if percent_k < self.params.oversold:
+                    confidence = 0.90  # Strong signal if in oversold zone
+            # Bearish crossover: %K crosses below %D
+            elif prev_k >= prev_d and percent_k < percent_d:
+                crossover_type = "bearish"
+                if percent_k > self.params.overbought:
+                    confidence = 0.90  # Strong signal if in overbought zone
+
+        return signal, overbought_flag, oversold_flag, crossover_type, confidence
+
+    def reset(self) -> None:
+        """Clear streaming state (monotonic high/low deques and %D window)."""
+        super().reset()
+        self._highest_high = RollingExtreme(self.params.k_period, "max")
+        self._lowest_low = RollingExtreme(self.params.k_period, "min")
+        self._percent_d = RollingStats(self.params.d_period)
+        self._prev_k = None
+        self._prev_d = None
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, Any]:
+        """
+        Fold one bar into the rolling high/low and %D state.
+
+        Args:
+            bar: Mapping with high, low and close
+
+        Returns:
+            Dict with percent_k, percent_d, signal, overbought, oversold,
+            crossover and confidence (all None until k_period + d_period - 1
+            bars are seen)
+        """
+        self.bars_seen += 1
+        self._highest_high.push(float(bar["high"]))
+        self._lowest_low.push(float(bar["low"]))
+        close = float(bar["close"])
+
+        highest_high = self._highest_high.value
+        lowest_low = self._lowest_low.value
+        # Partial window or flat range defaults to the middle, as in calculate_series()
+        if highest_high is None or lowest_low is None or highest_high == lowest_low:
+            percent_k = 50.0
+        else:
+            percent_k = ((close - lowest_low) / (highest_high - lowest_low)) * 100
+
+        self._percent_d.push(percent_k)
+        percent_d = self._percent_d.mean
+
+        prev_k, prev_d = self._prev_k, self._prev_d
+        self._prev_k, self._prev_d = percent_k, percent_d
+
+        min_required = self.params.k_period + self.params.d_period - 1
+        if self.bars_seen < min_required or percent_d is None:
+            return {
+                "percent_k": None,
+                "percent_d": None,
+                "signal": None,
+                "overbought": None,
+                "oversold": None,
+                "crossover": None,
+                "confidence": None,
+            }
+
+        signal, overbought_flag, oversold_flag, crossover_type, confidence = self._classify(
+            percent_k, percent_d, prev_k, prev_d
+        )
+        return {
+            "percent_k": round(percent_k, 4),
+            "percent_d": round(percent_d, 4),
+            "signal": signal,
+            "overbought": overbought_flag,
+            "oversold": oversold_flag,
+            "crossover": crossover_type,
+            "confidence": round(confidence, 2),
+        }
+
     def get_minimum_periods(self) -> int:
         """
         Get minimum number of periods required for calculation.
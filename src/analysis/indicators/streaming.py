@@ -0,0 +1,161 @@
+"""
+Streaming state primitives for incremental indicator updates.
+
+Each primitive folds one value per bar in O(1) (amortized for the monotonic
+deque) and reproduces the pandas batch calculation the indicators use:
+- RollingStats: rolling(window, min_periods).mean() / .std()
+- EWMState: ewm(span=... or alpha=..., adjust=False, min_periods).mean()
+- RollingExtreme: rolling(window, min_periods=window).min() / .max()
+
+NaN inputs are treated like pandas does: they are skipped but still occupy
+their slot in the window.
+"""
+
+import math
+from collections import deque
+
+
+class RollingStats:
+    """Rolling mean and sample standard deviation over a fixed window."""
+
+    def __init__(self, window: int, min_periods: int | None = None):
+        self.window = window
+        self.min_periods = window if min_periods is None else max(min_periods, 1)
+        self.reset()
+
+    def reset(self):
+        self._values: deque[float] = deque()
+        self._count = 0  # Non-NaN values in the window
+        self._mean = 0.0
+        self._m2 = 0.0
+        # Trailing run of identical values; a constant window has exactly zero variance
+        self._last = math.nan
+        self._same_run = 0
+
+    def push(self, value: float):
+        if len(self._values) == self.window:
+            self._remove(self._values.popleft())
+        self._values.append(value)
+
+        if math.isnan(value):
+            self._same_run = 0
+        else:
+            # Welford update
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+            self._same_run = self._same_run + 1 if value == self._last else 1
+        self._last = value
+
+    def _remove(self, value: float):
+        if math.isnan(value):
+            return
+        self._count -= 1
+        if self._count == 0:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (value - self._mean)
+
+    def _is_constant(self) -> bool:
+        return self._same_run >= len(self._values)
+
+    @property
+    def mean(self) -> float | None:
+        if self._count < self.min_periods:
+            return None
+        return self._last if self._is_constant() else self._mean
+
+    @property
+    def value(self) -> float | None:
+        return self.mean
+
+    @property
+    def std(self) -> float | None:
+        """Sample standard deviation (ddof=1), as pandas rolling().std()."""
+        if self._count < self.min_periods or self._count < 2:
+            return None
+        if self._is_constant():
+            return 0.0
+        return math.sqrt(max(self._m2, 0.0) / (self._count - 1))
+
+
+class EWMState:
+    """Exponentially weighted mean with adjust=False, seeded by the first observation."""
+
+    def __init__(self, span: float | None = None, alpha: float | None = None, min_periods: int = 0):
+        # Same center-of-mass conversion as pandas so results match bit for bit
+        com = (span - 1) / 2 if span is not None else (1 - alpha) / alpha
+        alpha = 1.0 / (1.0 + com)
+        self._factor = 1.0 - alpha
+        self._new_wt = alpha
+        self.min_periods = max(min_periods, 1)
+        self.reset()
+
+    def reset(self):
+        self._mean: float | None = None
+        self._old_wt = 1.0
+        self._nobs = 0
+
+    def push(self, value: float):
+        observed = not math.isnan(value)
+        self._nobs += observed
+
+        if self._mean is None:
+            if observed:
+                self._mean = value
+            return
+
+        self._old_wt *= self._factor
+        if observed:
+            if self._mean != value:
+                self._mean = (self._old_wt * self._mean + self._new_wt * value) / (
+                    self._old_wt + self._new_wt
+                )
+            self._old_wt = 1.0
+
+    @property
+    def value(self) -> float | None:
+        return self._mean if self._nobs >= self.min_periods else None
+
+
+class RollingExtreme:
+    """Rolling minimum or maximum using a monotonic deque."""
+
+    def __init__(self, window: int, mode: str = "max"):
+        if mode not in ("min", "max"):
+            raise ValueError(f"mode must be 'min' or 'max', got {mode}")
+        self.window = window
+        self._is_max = mode == "max"
+        self.reset()
+
+    def reset(self):
+        self._candidates: deque[tuple[int, float]] = deque()
+        self._index = -1
+        self._last_nan = -1 - self.window
+
+    def push(self, value: float):
+        self._index += 1
+        if math.isnan(value):
+            self._last_nan = self._index
+        else:
+            # Drop candidates the new value dominates
+            while self._candidates and (
+                self._candidates[-1][1] <= value if self._is_max
+                else self._candidates[-1][1] >= value
+            ):
+                self._candidates.pop()
+            self._candidates.append((self._index, value))
+
+        while self._candidates and self._candidates[0][0] <= self._index - self.window:
+            self._candidates.popleft()
+
+    @property
+    def value(self) -> float | None:
+        # Full window of non-NaN values required (min_periods=window)
+        if self._index + 1 < self.window or self._index - self._last_nan < self.window:
+            return None
+        return self._candidates[0][1]
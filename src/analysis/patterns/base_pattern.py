@@ -279,6 +279,28 @@ class BasePattern(ABC):
 
         return filtered_detections
 
+    def detect_with_confidence(self, data: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+        """
+        Detect pattern occurrences and score them in one call.
+
+        Args:
+            data: OHLCV DataFrame
+
+        Returns:
+            Tuple of (detected, confidence) Series indexed like the detection
+            results; confidence is 0.0 wherever nothing was detected
+        """
+        detected = self.detect(data).astype(bool)
+        confidence = np.zeros(len(detected))
+
+        hits = np.flatnonzero(detected.to_numpy())
+        if len(hits) > 0:
+            detection_indices = detected.index[hits]
+            scores = self.calculate_confidence(data, detection_indices)
+            confidence[hits] = [scores.get(idx, 0.0) for idx in detection_indices]
+
+        return detected, pd.Series(confidence, index=detected.index)
+
     # =============================================================================
     # Utility Methods for Pattern Detection
     # =============================================================================
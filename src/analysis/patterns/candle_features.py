@@ -0,0 +1,154 @@
+"""
+Shared candle geometry for candlestick pattern detection.
+
+Every candlestick pattern needs the same per-bar measurements (body, range,
+shadows, direction, gaps). CandleFeatures computes them once per DataFrame as
+NumPy arrays so detection and confidence scoring are plain array expressions.
+
+- get_candle_features(data) builds features for a DataFrame
+- Inside shared_candle_features(data), all patterns reuse one feature pass
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+_local = threading.local()
+
+
+@dataclass
+class CandleFeatures:
+    """Per-bar candle geometry as float64 arrays aligned with the source rows."""
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    body: np.ndarray = field(init=False)
+    range: np.ndarray = field(init=False)
+    body_top: np.ndarray = field(init=False)
+    body_bottom: np.ndarray = field(init=False)
+    upper_shadow: np.ndarray = field(init=False)
+    lower_shadow: np.ndarray = field(init=False)
+    direction: np.ndarray = field(init=False)  # +1 bullish, -1 bearish, 0 flat
+
+    def __post_init__(self):
+        self.body = np.abs(self.close - self.open)
+        self.range = self.high - self.low
+        self.body_top = np.maximum(self.open, self.close)
+        self.body_bottom = np.minimum(self.open, self.close)
+        self.upper_shadow = self.high - self.body_top
+        self.lower_shadow = self.body_bottom - self.low
+        self.direction = np.sign(self.close - self.open).astype(np.int8)
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @property
+    def bullish(self) -> np.ndarray:
+        return self.direction > 0
+
+    @property
+    def bearish(self) -> np.ndarray:
+        return self.direction < 0
+
+    @property
+    def gap_up(self) -> np.ndarray:
+        """Bar's low is above the previous bar's high."""
+        return self.low > self.prev(self.high)
+
+    @property
+    def gap_down(self) -> np.ndarray:
+        """Bar's high is below the previous bar's low."""
+        return self.high < self.prev(self.low)
+
+    @staticmethod
+    def prev(values: np.ndarray, periods: int = 1) -> np.ndarray:
+        """
+        Shift an array forward by `periods` bars.
+
+        Float arrays are NaN-padded (so comparisons are False); boolean
+        arrays are padded with False.
+        """
+        shifted = np.zeros_like(values) if values.dtype == bool else np.full(values.shape, np.nan)
+        if periods < len(values):
+            shifted[periods:] = values[:len(values) - periods]
+        return shifted
+
+    @staticmethod
+    def ratio(numerator: np.ndarray, denominator: np.ndarray, where: np.ndarray) -> np.ndarray:
+        """numerator / denominator where `where` holds, 0.0 elsewhere."""
+        return np.divide(
+            numerator, denominator, out=np.zeros(numerator.shape), where=where
+        )
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> 'CandleFeatures':
+        """Build features from an OHLCV DataFrame (volume is NaN if absent)."""
+        columns = {
+            col: data[col].to_numpy(dtype=np.float64)
+            for col in ('open', 'high', 'low', 'close')
+        }
+        if 'volume' in data.columns:
+            columns['volume'] = data['volume'].to_numpy(dtype=np.float64)
+        else:
+            columns['volume'] = np.full(len(data), np.nan)
+        return cls(**columns)
+
+
+def get_candle_features(data: pd.DataFrame) -> CandleFeatures:
+    """
+    Candle features for a DataFrame.
+
+    Returns the shared features when called inside shared_candle_features()
+    for the same DataFrame, otherwise computes them.
+    """
+    shared = getattr(_local, 'shared', None)
+    if shared is not None and shared[0] is data:
+        return shared[1]
+    return CandleFeatures.from_frame(data)
+
+
+@contextmanager
+def shared_candle_features(data: pd.DataFrame) -> Iterator[CandleFeatures | None]:
+    """
+    Compute candle features once and share them with every pattern run on
+    `data` within the block (per thread). The DataFrame must not be modified
+    inside the block.
+    """
+    try:
+        features = CandleFeatures.from_frame(data)
+    except (KeyError, TypeError, ValueError):
+        # Not OHLCV data; each pattern reports it when validating its input
+        yield None
+        return
+
+    previous = getattr(_local, 'shared', None)
+    _local.shared = (data, features)
+    try:
+        yield features
+    finally:
+        _local.shared = previous
+
+
+def scores_for_indices(
+    data: pd.DataFrame, detection_indices: pd.Index, scores: np.ndarray
+) -> dict:
+    """
+    Map per-bar confidence scores to the calculate_confidence() dict format.
+
+    Indices not found in `data`, or whose score is NaN (e.g. leading bars of a
+    multi-bar pattern), are skipped.
+    """
+    positions = data.index.get_indexer(detection_indices)
+    rounded = np.round(np.minimum(scores, 1.0), 3)
+    return {
+        idx: float(rounded[pos])
+        for idx, pos in zip(detection_indices, positions, strict=True)
+        if pos >= 0 and not np.isnan(rounded[pos])
+    }
@@ -7,10 +7,12 @@ Single-bar pattern with very small body indicating indecision.
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from pydantic import Field, field_validator
 
 from ..base_pattern import BasePattern, PatternParams
+from ..candle_features import CandleFeatures, get_candle_features, scores_for_indices
 from ...exceptions import PatternDetectionError
 
 
@@ -88,26 +90,20 @@ class Doji(BasePattern):
         """
         try:
             self._validate_data_format(data)
-
-            # Calculate body size and candle range
-            body_size = self.calculate_body_size(data)
-            candle_range = self.calculate_candle_range(data)
-
-            # Filter out candles with insufficient range
-            valid_range = candle_range >= self.params.min_range
-
-            # Calculate body ratio (avoiding division by zero)
-            body_ratio = pd.Series(0.0, index=data.index)
-            body_ratio[valid_range] = body_size[valid_range] / candle_range[valid_range]
-
-            # Detect Doji: body ratio below threshold
-            doji_detected = (body_ratio < self.params.body_threshold) & valid_range
-
-            return doji_detected
+            features = get_candle_features(data)
+            return pd.Series(self._detect_array(features), index=data.index)
 
         except Exception as e:
             raise PatternDetectionError(f"Doji detection failed: {e}") from e
 
+    def _detect_array(self, features: CandleFeatures) -> np.ndarray:
+        # Filter out candles with insufficient range
+        valid_range = features.range >= self.params.min_range
+
+        # Detect Doji: body ratio below threshold (0 where range is invalid)
+        body_ratio = features.ratio(features.body, features.range, valid_range)
+        return (body_ratio < self.params.body_threshold) & valid_range
+
     def get_minimum_bars(self) -> int:
         """Doji requires only 1 bar."""
         return 1
@@ -129,34 +125,21 @@ class Doji(BasePattern):
         Returns:
             Dictionary mapping detection indices to confidence scores (0.6 to 1.0)
         """
-        confidence_scores = {}
-
-        body_size = self.calculate_body_size(data)
-        candle_range = self.calculate_candle_range(data)
+        features = get_candle_features(data)
+        return scores_for_indices(data, detection_indices, self._confidence_array(features))
 
-        for idx in detection_indices:
+    def _confidence_array(self, features: CandleFeatures) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
             # Base confidence from body ratio
-            body_ratio = body_size.loc[idx] / candle_range.loc[idx]
+            body_ratio = features.body / features.range
             base_confidence = 1.0 - (body_ratio / self.params.body_threshold)
 
-            # Calculate shadow symmetry bonus
-            body_top = max(data.loc[idx, "open"], data.loc[idx, "close"])
-            body_bottom = min(data.loc[idx, "open"], data.loc[idx, "close"])
-            upper_shadow = data.loc[idx, "high"] - body_top
-            lower_shadow = body_bottom - data.loc[idx, "low"]
-
             # Symmetric shadows increase confidence
-            if candle_range.loc[idx] > 0:
-                shadow_diff = abs(upper_shadow - lower_shadow)
-                symmetry_ratio = shadow_diff / candle_range.loc[idx]
-                symmetry_bonus = (1.0 - symmetry_ratio) * 0.15  # Up to +0.15
-            else:
-                symmetry_bonus = 0
-
-            confidence = base_confidence + symmetry_bonus
-            confidence_scores[idx] = round(min(confidence, 1.0), 3)
+            shadow_diff = np.abs(features.upper_shadow - features.lower_shadow)
+            symmetry_ratio = shadow_diff / features.range
 
-        return confidence_scores
+        symmetry_bonus = np.where(features.range > 0, (1.0 - symmetry_ratio) * 0.15, 0.0)  # Up to +0.15
+        return base_confidence + symmetry_bonus
 
     def get_doji_subtype(self, data: pd.DataFrame, index: Any) -> str:
         """
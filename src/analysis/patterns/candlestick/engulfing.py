@@ -7,10 +7,12 @@ Two-bar pattern where current candle completely engulfs the previous candle.
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from pydantic import Field, field_validator
 
 from ..base_pattern import BasePattern, PatternParams
+from ..candle_features import CandleFeatures, get_candle_features, scores_for_indices
 from ...exceptions import PatternDetectionError
 
 
@@ -98,59 +100,44 @@ class Engulfing(BasePattern):
         """
         try:
             self._validate_data_format(data)
+            features = get_candle_features(data)
+            return pd.Series(self._detect_array(features), index=data.index)
 
-            if len(data) < 2:
-                # Need at least 2 bars for engulfing pattern
-                return pd.Series(False, index=data.index)
-
-            # Calculate body sizes
-            body_size = self.calculate_body_size(data)
-
-            # Calculate body top/bottom for each candle
-            body_top = data[["open", "close"]].max(axis=1)
-            body_bottom = data[["open", "close"]].min(axis=1)
-
-            # Get previous bar values (shift forward by 1)
-            prev_body_size = body_size.shift(1)
-            prev_body_top = body_top.shift(1)
-            prev_body_bottom = body_bottom.shift(1)
-
-            # Check candle colors
-            is_bullish = self.is_bullish_candle(data)
-            is_bearish = self.is_bearish_candle(data)
-            prev_is_bullish = is_bullish.shift(1)
-            prev_is_bearish = is_bearish.shift(1)
-
-            # Filter valid range
-            candle_range = self.calculate_candle_range(data)
-            valid_range = candle_range >= self.params.min_range
-
-            # Engulfing criteria:
-            # 1. Current body top > previous body top
-            # 2. Current body bottom < previous body bottom
-            # 3. Current body size >= min_body_ratio * previous body size
-            # 4. If require_opposite_colors: colors must be opposite
-            body_engulfs = (
-                (body_top > prev_body_top)
-                & (body_bottom < prev_body_bottom)
-                & (body_size >= self.params.min_body_ratio * prev_body_size)
-            )
-
-            if self.params.require_opposite_colors:
-                # Bullish engulfing: prev bearish, current bullish
-                # Bearish engulfing: prev bullish, current bearish
-                opposite_colors = (prev_is_bearish & is_bullish) | (prev_is_bullish & is_bearish)
-                engulfing_detected = body_engulfs & opposite_colors & valid_range
-            else:
-                engulfing_detected = body_engulfs & valid_range
+        except Exception as e:
+            raise PatternDetectionError(f"Engulfing detection failed: {e}") from e
 
-            # First bar cannot have an engulfing pattern (no previous bar)
-            engulfing_detected.iloc[0] = False
+    def _detect_array(self, features: CandleFeatures) -> np.ndarray:
+        prev = features.prev
+
+        # Filter valid range
+        valid_range = features.range >= self.params.min_range
+
+        # Engulfing criteria:
+        # 1. Current body top > previous body top
+        # 2. Current body bottom < previous body bottom
+        # 3. Current body size >= min_body_ratio * previous body size
+        # 4. If require_opposite_colors: colors must be opposite
+        body_engulfs = (
+            (features.body_top > prev(features.body_top))
+            & (features.body_bottom < prev(features.body_bottom))
+            & (features.body >= self.params.min_body_ratio * prev(features.body))
+        )
+
+        if self.params.require_opposite_colors:
+            # Bullish engulfing: prev bearish, current bullish
+            # Bearish engulfing: prev bullish, current bearish
+            opposite_colors = (
+                (prev(features.bearish) & features.bullish)
+                | (prev(features.bullish) & features.bearish)
+            )
+            engulfing_detected = body_engulfs & opposite_colors & valid_range
+        else:
+            engulfing_detected = body_engulfs & valid_range
 
-            return engulfing_detected
+        # First bar cannot have an engulfing pattern (no previous bar)
+        engulfing_detected[:1] = False
 
-        except Exception as e:
-            raise PatternDetectionError(f"Engulfing detection failed: {e}") from e
+        return engulfing_detected
 
     def get_minimum_bars(self) -> int:
         """Engulfing requires 2 bars."""
@@ -174,48 +161,35 @@ class Engulfing(BasePattern):
         Returns:
             Dictionary mapping detection indices to confidence scores (0.6 to 1.0)
         """
-        confidence_scores = {}
-
-        body_size = self.calculate_body_size(data)
-
-        for idx in detection_indices:
-            # Get index position
-            idx_pos = data.index.get_loc(idx)
-            if idx_pos == 0:
-                continue  # Skip first bar (no previous)
+        features = get_candle_features(data)
+        return scores_for_indices(data, detection_indices, self._confidence_array(features))
 
-            prev_idx = data.index[idx_pos - 1]
+    def _confidence_array(self, features: CandleFeatures) -> np.ndarray:
+        prev = features.prev
+        prev_body = prev(features.body)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            body_ratio = features.body / prev_body
 
-            # Base confidence
-            confidence = 0.6
+        # Base confidence
+        confidence = np.full(len(features), 0.6)
 
-            # Bonus for strong body size ratio
-            if body_size.loc[prev_idx] > 0:
-                body_ratio = body_size.loc[idx] / body_size.loc[prev_idx]
-                if body_ratio >= 1.5:
-                    confidence += 0.15
+        # Bonus for strong body size ratio
+        confidence += np.where((prev_body > 0) & (body_ratio >= 1.5), 0.15, 0.0)
 
-            # Bonus for complete range engulfment (not just body)
-            if (
-                data.loc[idx, "high"] > data.loc[prev_idx, "high"]
-                and data.loc[idx, "low"] < data.loc[prev_idx, "low"]
-            ):
-                confidence += 0.10
+        # Bonus for complete range engulfment (not just body)
+        range_engulfs = (features.high > prev(features.high)) & (features.low < prev(features.low))
+        confidence += np.where(range_engulfs, 0.10, 0.0)
 
-            # Bonus for volume confirmation
-            if "volume" in data.columns:
-                if data.loc[idx, "volume"] > data.loc[prev_idx, "volume"]:
-                    confidence += 0.10
+        # Bonus for volume confirmation
+        confidence += np.where(features.volume > prev(features.volume), 0.10, 0.0)
 
-            # Bonus for strong color contrast
-            curr_bullish = data.loc[idx, "close"] > data.loc[idx, "open"]
-            prev_bullish = data.loc[prev_idx, "close"] > data.loc[prev_idx, "open"]
-            if curr_bullish != prev_bullish:
-                confidence += 0.05
+        # Bonus for strong color contrast
+        confidence += np.where(features.bullish != prev(features.bullish), 0.05, 0.0)
 
-            confidence_scores[idx] = round(min(confidence, 1.0), 3)
+        # First bar has no previous bar to score against
+        confidence[:1] = np.nan
 
-        return confidence_scores
+        return confidence
 
     def get_engulfing_type(self, data: pd.DataFrame, index: Any) -> str | None:
         """
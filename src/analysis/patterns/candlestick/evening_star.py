@@ -7,10 +7,12 @@ Three-bar bearish reversal pattern (uptrend → small body → downtrend).
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from pydantic import Field, field_validator
 
 from ..base_pattern import BasePattern, PatternParams
+from ..candle_features import CandleFeatures, get_candle_features, scores_for_indices
 from ...exceptions import PatternDetectionError
 
 
@@ -99,77 +101,43 @@ class EveningStar(BasePattern):
         """
         try:
             self._validate_data_format(data)
+            features = get_candle_features(data)
+            return pd.Series(self._detect_array(features), index=data.index)
 
-            if len(data) < 3:
-                # Need at least 3 bars for evening star pattern
-                return pd.Series(False, index=data.index)
-
-            # Calculate metrics
-            body_size = self.calculate_body_size(data)
-            candle_range = self.calculate_candle_range(data)
-
-            # Calculate body top/bottom
-            body_top = data[["open", "close"]].max(axis=1)
-            body_bottom = data[["open", "close"]].min(axis=1)
-
-            # Get previous bars (shift forward)
-            prev1_body_size = body_size.shift(1)  # Bar -1 (middle)
-            prev2_body_size = body_size.shift(2)  # Bar -2 (first)
-
-            prev1_body_top = body_top.shift(1)
-            prev1_body_bottom = body_bottom.shift(1)
-            prev2_body_top = body_top.shift(2)
-            prev2_body_bottom = body_bottom.shift(2)
-
-            prev2_range = candle_range.shift(2)
-
-            # Check candle types
-            is_bullish = self.is_bullish_candle(data)
-            prev2_is_bullish = is_bullish.shift(2)
-
-            # Filter valid range
-            valid_range = candle_range >= self.params.min_range
-
-            # Evening Star criteria:
-            # 1. First candle (bar -2): Bullish with significant body
-            first_bullish = prev2_is_bullish
-
-            # 2. Middle candle (bar -1): Small body (indecision)
-            middle_small_body = (prev1_body_size <= self.params.body_size_threshold * prev2_range)
+        except Exception as e:
+            raise PatternDetectionError(f"Evening Star detection failed: {e}") from e
 
-            # 3. Third candle (current): Bearish, closes well into first candle's body
-            third_bearish = self.is_bearish_candle(data)
+    def _detect_array(self, features: CandleFeatures) -> np.ndarray:
+        prev = features.prev
 
-            # Calculate how far third candle closes into first candle's body
-            first_body_midpoint = (prev2_body_top + prev2_body_bottom) / 2
-            closes_into_first_body = data["close"] <= first_body_midpoint
+        # Filter valid range
+        valid_range = features.range >= self.params.min_range
 
-            # Optional: Check for gap up between first and middle candle
-            # Gap up: middle candle's low > first candle's high
-            prev1_low = data["low"].shift(1)
-            prev2_high = data["high"].shift(2)
-            gap_up = prev1_low > prev2_high
+        # Evening Star criteria:
+        # 1. First candle (bar -2): Bullish with significant body
+        first_bullish = prev(features.bullish, 2)
 
-            # Evening Star detection
-            evening_star_detected = (
-                valid_range
-                & first_bullish
-                & middle_small_body
-                & third_bearish
-                & closes_into_first_body
-            )
+        # 2. Middle candle (bar -1): Small body (indecision)
+        middle_small_body = prev(features.body) <= self.params.body_size_threshold * prev(features.range, 2)
 
-            # Bonus for gap (not required, but increases confidence if present)
-            # We'll use this in confidence scoring
+        # 3. Third candle (current): Bearish, closes well into first candle's body
+        first_body_midpoint = (prev(features.body_top, 2) + prev(features.body_bottom, 2)) / 2
+        closes_into_first_body = features.close <= first_body_midpoint
 
-            # First two bars cannot have evening star (need 3 bars)
-            evening_star_detected.iloc[0] = False
-            evening_star_detected.iloc[1] = False
+        # A gap up between first and middle candle is not required;
+        # it only adds to the confidence score
+        evening_star_detected = (
+            valid_range
+            & first_bullish
+            & middle_small_body
+            & features.bearish
+            & closes_into_first_body
+        )
 
-            return evening_star_detected
+        # First two bars cannot have evening star (need 3 bars)
+        evening_star_detected[:2] = False
 
-        except Exception as e:
-            raise PatternDetectionError(f"Evening Star detection failed: {e}") from e
+        return evening_star_detected
 
     def get_minimum_bars(self) -> int:
         """Evening Star requires 3 bars."""
@@ -194,46 +162,34 @@ class EveningStar(BasePattern):
         Returns:
             Dictionary mapping detection indices to confidence scores (0.6 to 1.0)
         """
-        confidence_scores = {}
-
-        body_size = self.calculate_body_size(data)
-
-        for idx in detection_indices:
-            # Get index position
-            idx_pos = data.index.get_loc(idx)
-            if idx_pos < 2:
-                continue  # Skip first two bars (need 3 bars)
-
-            first_idx = data.index[idx_pos - 2]
-            middle_idx = data.index[idx_pos - 1]
+        features = get_candle_features(data)
+        return scores_for_indices(data, detection_indices, self._confidence_array(features))
 
-            # Base confidence
-            confidence = 0.6
+    def _confidence_array(self, features: CandleFeatures) -> np.ndarray:
+        prev = features.prev
+        first_body = prev(features.body, 2)
+        first_body_top = prev(features.body_top, 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            middle_body_ratio = prev(features.body) / prev(features.range, 2)
+            third_body_ratio = features.body / features.range
+            penetration = (first_body_top - features.close) / first_body
 
-            # Bonus for gap up (middle low > first high)
-            if data.loc[middle_idx, "low"] > data.loc[first_idx, "high"]:
-                confidence += 0.15
+        # Base confidence
+        confidence = np.full(len(features), 0.6)
 
-            # Bonus for very small middle candle
-            middle_body_ratio = body_size.loc[middle_idx] / (data.loc[first_idx, "high"] - data.loc[first_idx, "low"])
-            if middle_body_ratio < 0.2:
-                confidence += 0.10
+        # Bonus for gap up (middle low > first high)
+        confidence += np.where(prev(features.gap_up), 0.15, 0.0)
 
-            # Bonus for strong third candle (large bearish body)
-            third_body_ratio = body_size.loc[idx] / (data.loc[idx, "high"] - data.loc[idx, "low"])
-            if third_body_ratio > 0.7:
-                confidence += 0.10
+        # Bonus for very small middle candle
+        confidence += np.where(middle_body_ratio < 0.2, 0.10, 0.0)
 
-            # Bonus for deep close into first body
-            first_body_top = max(data.loc[first_idx, "open"], data.loc[first_idx, "close"])
-            first_body_bottom = min(data.loc[first_idx, "open"], data.loc[first_idx, "close"])
-            first_body_size = first_body_top - first_body_bottom
+        # Bonus for strong third candle (large bearish body)
+        confidence += np.where(third_body_ratio > 0.7, 0.10, 0.0)
 
-            if first_body_size > 0:
-                penetration = (first_body_top - data.loc[idx, "close"]) / first_body_size
-                if penetration > 0.7:  # Closes > 70% into first body
-                    confidence += 0.05
+        # Bonus for deep close into first body (> 70%)
+        confidence += np.where((first_body > 0) & (penetration > 0.7), 0.05, 0.0)
 
-            confidence_scores[idx] = round(min(confidence, 1.0), 3)
+        # First two bars cannot be scored (need 3 bars)
+        confidence[:2] = np.nan
 
-        return confidence_scores
+        return confidence
@@ -7,10 +7,12 @@ Single-bar pattern with same structure as Hammer but appears at uptrend top (bea
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from pydantic import Field, field_validator
 
 from ..base_pattern import BasePattern, PatternParams
+from ..candle_features import CandleFeatures, get_candle_features, scores_for_indices
 from ...exceptions import PatternDetectionError
 
 
@@ -114,60 +116,58 @@ class HangingMan(BasePattern):
         """
         try:
             self._validate_data_format(data)
-
-            # Calculate metrics
-            body_size = self.calculate_body_size(data)
-            candle_range = self.calculate_candle_range(data)
-
-            # Calculate body positions
-            body_top = data[["open", "close"]].max(axis=1)
-            body_bottom = data[["open", "close"]].min(axis=1)
-
-            # Calculate shadows
-            upper_shadow = data["high"] - body_top
-            lower_shadow = body_bottom - data["low"]
-
-            # Filter valid range
-            valid_range = candle_range >= self.params.min_range
-
-            # Calculate ratios (avoiding division by zero)
-            body_ratio = pd.Series(0.0, index=data.index)
-            upper_shadow_ratio = pd.Series(0.0, index=data.index)
-            lower_shadow_ratio = pd.Series(0.0, index=data.index)
-
-            body_ratio[valid_range] = body_size[valid_range] / candle_range[valid_range]
-            upper_shadow_ratio[valid_range] = upper_shadow[valid_range] / candle_range[valid_range]
-            lower_shadow_ratio[valid_range] = lower_shadow[valid_range] / candle_range[valid_range]
-
-            # Detect Hanging Man structure (same as Hammer):
-            # 1. Lower shadow >= min_shadow_ratio * body
-            # 2. Upper shadow < max_upper_shadow_ratio * range
-            # 3. Lower shadow > min_lower_shadow_ratio * range
-            # 4. Body < max_body_ratio * range
-            structure_match = (
-                valid_range
-                & (lower_shadow >= self.params.min_shadow_ratio * body_size)
-                & (upper_shadow_ratio < self.params.max_upper_shadow_ratio)
-                & (lower_shadow_ratio > self.params.min_lower_shadow_ratio)
-                & (body_ratio < self.params.max_body_ratio)
-            )
-
-            # Check for uptrend context
-            uptrend_context = pd.Series(False, index=data.index)
-            for i in range(self.params.trend_lookback, len(data)):
-                # Simple uptrend check: current close higher than average of previous closes
-                lookback_closes = data["close"].iloc[i - self.params.trend_lookback : i]
-                if data["close"].iloc[i] > lookback_closes.mean():
-                    uptrend_context.iloc[i] = True
-
-            # Hanging Man = structure match + uptrend context
-            hanging_man_detected = structure_match & uptrend_context
-
-            return hanging_man_detected
+            features = get_candle_features(data)
+            return pd.Series(self._detect_array(features), index=data.index)
 
         except Exception as e:
             raise PatternDetectionError(f"Hanging Man detection failed: {e}") from e
 
+    def _detect_array(self, features: CandleFeatures) -> np.ndarray:
+        # Filter valid range
+        valid_range = features.range >= self.params.min_range
+
+        # Calculate ratios (0 where range is invalid)
+        body_ratio = features.ratio(features.body, features.range, valid_range)
+        upper_shadow_ratio = features.ratio(features.upper_shadow, features.range, valid_range)
+        lower_shadow_ratio = features.ratio(features.lower_shadow, features.range, valid_range)
+
+        # Detect Hanging Man structure (same as Hammer):
+        # 1. Lower shadow >= min_shadow_ratio * body
+        # 2. Upper shadow < max_upper_shadow_ratio * range
+        # 3. Lower shadow > min_lower_shadow_ratio * range
+        # 4. Body < max_body_ratio * range
+        structure_match = (
+            valid_range
+            & (features.lower_shadow >= self.params.min_shadow_ratio * features.body)
+            & (upper_shadow_ratio < self.params.max_upper_shadow_ratio)
+            & (lower_shadow_ratio > self.params.min_lower_shadow_ratio)
+            & (body_ratio < self.params.max_body_ratio)
+        )
+
+        # Uptrend context: close higher than the average of the previous closes
+        lookback_mean, _, _ = self._lookback_closes(features)
+        uptrend_context = features.close > lookback_mean
+
+        # Hanging Man = structure match + uptrend context
+        return structure_match & uptrend_context
+
+    def _lookback_closes(
+        self, features: CandleFeatures
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Mean, min and max of the trend_lookback closes before each bar.
+
+        Bars without a full lookback window get NaN.
+        """
+        lookback = self.params.trend_lookback
+        mean, low, high = (np.full(len(features), np.nan) for _ in range(3))
+        if len(features) > lookback:
+            windows = np.lib.stride_tricks.sliding_window_view(features.close, lookback)[:-1]
+            mean[lookback:] = windows.mean(axis=1)
+            low[lookback:] = windows.min(axis=1)
+            high[lookback:] = windows.max(axis=1)
+        return mean, low, high
+
     def get_minimum_bars(self) -> int:
         """Hanging Man requires 1 bar + trend lookback."""
         return 1 + self.params.trend_lookback
@@ -191,49 +191,29 @@ class HangingMan(BasePattern):
         Returns:
             Dictionary mapping detection indices to confidence scores (0.6 to 1.0)
         """
-        confidence_scores = {}
-
-        body_size = self.calculate_body_size(data)
-        candle_range = self.calculate_candle_range(data)
-
-        for idx in detection_indices:
-            # Base confidence
-            confidence = 0.6
-
-            # Calculate shadows
-            body_top = max(data.loc[idx, "open"], data.loc[idx, "close"])
-            body_bottom = min(data.loc[idx, "open"], data.loc[idx, "close"])
-            lower_shadow = body_bottom - data.loc[idx, "low"]
-
-            # Bonus for strong shadow/body ratio
-            if body_size.loc[idx] > 0:
-                shadow_body_ratio = lower_shadow / body_size.loc[idx]
-                if shadow_body_ratio >= 3.0:
-                    confidence += 0.15
-
-            # Bonus for minimal upper shadow
-            upper_shadow = data.loc[idx, "high"] - body_top
-            if candle_range.loc[idx] > 0:
-                upper_ratio = upper_shadow / candle_range.loc[idx]
-                if upper_ratio < 0.05:
-                    confidence += 0.10
-
-            # Bonus for bearish color (close < open)
-            if data.loc[idx, "close"] < data.loc[idx, "open"]:
-                confidence += 0.10
-
-            # Bonus for strong uptrend before
-            idx_pos = data.index.get_loc(idx)
-            if idx_pos >= self.params.trend_lookback:
-                lookback_closes = data["close"].iloc[
-                    idx_pos - self.params.trend_lookback : idx_pos
-                ]
-                trend_strength = (data.loc[idx, "close"] - lookback_closes.min()) / (
-                    lookback_closes.max() - lookback_closes.min() + 0.0001
-                )
-                if trend_strength > 0.8:
-                    confidence += 0.05
-
-            confidence_scores[idx] = round(min(confidence, 1.0), 3)
-
-        return confidence_scores
+        features = get_candle_features(data)
+        return scores_for_indices(data, detection_indices, self._confidence_array(features))
+
+    def _confidence_array(self, features: CandleFeatures) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shadow_body_ratio = features.lower_shadow / features.body
+            upper_ratio = features.upper_shadow / features.range
+
+        # Base confidence
+        confidence = np.full(len(features), 0.6)
+
+        # Bonus for strong shadow/body ratio
+        confidence += np.where((features.body > 0) & (shadow_body_ratio >= 3.0), 0.15, 0.0)
+
+        # Bonus for minimal upper shadow
+        confidence += np.where((features.range > 0) & (upper_ratio < 0.05), 0.10, 0.0)
+
+        # Bonus for bearish color (close < open)
+        confidence += np.where(features.bearish, 0.10, 0.0)
+
+        # Bonus for strong uptrend before
+        _, lookback_min, lookback_max = self._lookback_closes(features)
+        trend_strength = (features.close - lookback_min) / (lookback_max - lookback_min + 0.0001)
+        confidence += np.where(trend_strength > 0.8, 0.05, 0.0)
+
+        return confidence
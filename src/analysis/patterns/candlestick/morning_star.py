@@ -7,10 +7,12 @@ Three-bar bullish reversal pattern (downtrend → small body → uptrend).
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from pydantic import Field, field_validator
 
 from ..base_pattern import BasePattern, PatternParams
+from ..candle_features import CandleFeatures, get_candle_features, scores_for_indices
 from ...exceptions import PatternDetectionError
 
 
@@ -99,77 +101,43 @@ class MorningStar(BasePattern):
         """
         try:
             self._validate_data_format(data)
+            features = get_candle_features(data)
+            return pd.Series(self._detect_array(features), index=data.index)
 
-            if len(data) < 3:
-                # Need at least 3 bars for morning star pattern
-                return pd.Series(False, index=data.index)
-
-            # Calculate metrics
-            body_size = self.calculate_body_size(data)
-            candle_range = self.calculate_candle_range(data)
-
-            # Calculate body top/bottom
-            body_top = data[["open", "close"]].max(axis=1)
-            body_bottom = data[["open", "close"]].min(axis=1)
-
-            # Get previous bars (shift forward)
-            prev1_body_size = body_size.shift(1)  # Bar -1 (middle)
-            prev2_body_size = body_size.shift(2)  # Bar -2 (first)
-
-            prev1_body_top = body_top.shift(1)
-            prev1_body_bottom = body_bottom.shift(1)
-            prev2_body_top = body_top.shift(2)
-            prev2_body_bottom = body_bottom.shift(2)
-
-            prev2_range = candle_range.shift(2)
-
-            # Check candle types
-            is_bearish = self.is_bearish_candle(data)
-            prev2_is_bearish = is_bearish.shift(2)
-
-            # Filter valid range
-            valid_range = candle_range >= self.params.min_range
-
-            # Morning Star criteria:
-            # 1. First candle (bar -2): Bearish with significant body
-            first_bearish = prev2_is_bearish
-
-            # 2. Middle candle (bar -1): Small body (indecision)
-            middle_small_body = (prev1_body_size <= self.params.body_size_threshold * prev2_range)
+        except Exception as e:
+            raise PatternDetectionError(f"Morning Star detection failed: {e}") from e
 
-            # 3. Third candle (current): Bullish, closes well into first candle's body
-            third_bullish = self.is_bullish_candle(data)
+    def _detect_array(self, features: CandleFeatures) -> np.ndarray:
+        prev = features.prev
 
-            # Calculate how far third candle closes into first candle's body
-            first_body_midpoint = (prev2_body_top + prev2_body_bottom) / 2
-            closes_into_first_body = data["close"] >= first_body_midpoint
+        # Filter valid range
+        valid_range = features.range >= self.params.min_range
 
-            # Optional: Check for gap down between first and middle candle
-            # Gap down: middle candle's high < first candle's low
-            prev1_high = data["high"].shift(1)
-            prev2_low = data["low"].shift(2)
-            gap_down = prev1_high < prev2_low
+        # Morning Star criteria:
+        # 1. First candle (bar -2): Bearish with significant body
+        first_bearish = prev(features.bearish, 2)
 
-            # Morning Star detection
-            morning_star_detected = (
-                valid_range
-                & first_bearish
-                & middle_small_body
-                & third_bullish
-                & closes_into_first_body
-            )
+        # 2. Middle candle (bar -1): Small body (indecision)
+        middle_small_body = prev(features.body) <= self.params.body_size_threshold * prev(features.range, 2)
 
-            # Bonus for gap (not required, but increases confidence if present)
-            # We'll use this in confidence scoring
+        # 3. Third candle (current): Bullish, closes well into first candle's body
+        first_body_midpoint = (prev(features.body_top, 2) + prev(features.body_bottom, 2)) / 2
+        closes_into_first_body = features.close >= first_body_midpoint
 
-            # First two bars cannot have morning star (need 3 bars)
-            morning_star_detected.iloc[0] = False
-            morning_star_detected.iloc[1] = False
+        # A gap down between first and middle candle is not required;
+        # it only adds to the confidence score
+        morning_star_detected = (
+            valid_range
+            & first_bearish
+            & middle_small_body
+            & features.bullish
+            & closes_into_first_body
+        )
 
-            return morning_star_detected
+        # First two bars cannot have morning star (need 3 bars)
+        morning_star_detected[:2] = False
 
-        except Exception as e:
-            raise PatternDetectionError(f"Morning Star detection failed: {e}") from e
+        return morning_star_detected
 
     def get_minimum_bars(self) -> int:
         """Morning Star requires 3 bars."""
@@ -194,46 +162,34 @@ class MorningStar(BasePattern):
         Returns:
             Dictionary mapping detection indices to confidence scores (0.6 to 1.0)
         """
-        confidence_scores = {}
-
-        body_size = self.calculate_body_size(data)
-
-        for idx in detection_indices:
-            # Get index position
-            idx_pos = data.index.get_loc(idx)
-            if idx_pos < 2:
-                continue  # Skip first two bars (need 3 bars)
-
-            first_idx = data.index[idx_pos - 2]
-            middle_idx = data.index[idx_pos - 1]
+        features = get_candle_features(data)
+        return scores_for_indices(data, detection_indices, self._confidence_array(features))
 
-            # Base confidence
-            confidence = 0.6
+    def _confidence_array(self, features: CandleFeatures) -> np.ndarray:
+        prev = features.prev
+        first_body = prev(features.body, 2)
+        first_body_bottom = prev(features.body_bottom, 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            middle_body_ratio = prev(features.body) / prev(features.range, 2)
+            third_body_ratio = features.body / features.range
+            penetration = (features.close - first_body_bottom) / first_body
 
-            # Bonus for gap down (middle high < first low)
-            if data.loc[middle_idx, "high"] < data.loc[first_idx, "low"]:
-                confidence += 0.15
+        # Base confidence
+        confidence = np.full(len(features), 0.6)
 
-            # Bonus for very small middle candle
-            middle_body_ratio = body_size.loc[middle_idx] / (data.loc[first_idx, "high"] - data.loc[first_idx, "low"])
-            if middle_body_ratio < 0.2:
-                confidence += 0.10
+        # Bonus for gap down (middle high < first low)
+        confidence += np.where(prev(features.gap_down), 0.15, 0.0)
 
-            # Bonus for strong third candle (large bullish body)
-            third_body_ratio = body_size.loc[idx] / (data.loc[idx, "high"] - data.loc[idx, "low"])
-            if third_body_ratio > 0.7:
-                confidence += 0.10
+        # Bonus for very small middle candle
+        confidence += np.where(middle_body_ratio < 0.2, 0.10, 0.0)
 
-            # Bonus for deep close into first body
-            first_body_top = max(data.loc[first_idx, "open"], data.loc[first_idx, "close"])
-            first_body_bottom = min(data.loc[first_idx, "open"], data.loc[first_idx, "close"])
-            first_body_size = first_body_top - first_body_bottom
+        # Bonus for strong third candle (large bullish body)
+        confidence += np.where(third_body_ratio > 0.7, 0.10, 0.0)
 
-            if first_body_size > 0:
-                penetration = (data.loc[idx, "close"] - first_body_bottom) / first_body_size
-                if penetration > 0.7:  # Closes > 70% into first body
-                    confidence += 0.05
+        # Bonus for deep close into first body (> 70%)
+        confidence += np.where((first_body > 0) & (penetration > 0.7), 0.05, 0.0)
 
-            confidence_scores[idx] = round(min(confidence, 1.0), 3)
+        # First two bars cannot be scored (need 3 bars)
+        confidence[:2] = np.nan
 
-        return confidence_scores
+        return confidence
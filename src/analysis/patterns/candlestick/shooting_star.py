@@ -7,10 +7,12 @@ Single-bar pattern with small body at bottom and long upper shadow (bearish reve
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from pydantic import Field, field_validator
 
 from ..base_pattern import BasePattern, PatternParams
+from ..candle_features import CandleFeatures, get_candle_features, scores_for_indices
 from ...exceptions import PatternDetectionError
 
 
@@ -102,49 +104,34 @@ class ShootingStar(BasePattern):
         """
         try:
             self._validate_data_format(data)
-
-            # Calculate metrics
-            body_size = self.calculate_body_size(data)
-            candle_range = self.calculate_candle_range(data)
-
-            # Calculate body positions
-            body_top = data[["open", "close"]].max(axis=1)
-            body_bottom = data[["open", "close"]].min(axis=1)
-
-            # Calculate shadows
-            upper_shadow = data["high"] - body_top
-            lower_shadow = body_bottom - data["low"]
-
-            # Filter valid range
-            valid_range = candle_range >= self.params.min_range
-
-            # Calculate ratios (avoiding division by zero)
-            body_ratio = pd.Series(0.0, index=data.index)
-            upper_shadow_ratio = pd.Series(0.0, index=data.index)
-            lower_shadow_ratio = pd.Series(0.0, index=data.index)
-
-            body_ratio[valid_range] = body_size[valid_range] / candle_range[valid_range]
-            upper_shadow_ratio[valid_range] = upper_shadow[valid_range] / candle_range[valid_range]
-            lower_shadow_ratio[valid_range] = lower_shadow[valid_range] / candle_range[valid_range]
-
-            # Detect Shooting Star criteria:
-            # 1. Upper shadow >= min_shadow_ratio * body
-            # 2. Lower shadow < max_lower_shadow_ratio * range
-            # 3. Upper shadow > min_upper_shadow_ratio * range
-            # 4. Body < max_body_ratio * range
-            shooting_star_detected = (
-                valid_range
-                & (upper_shadow >= self.params.min_shadow_ratio * body_size)
-                & (lower_shadow_ratio < self.params.max_lower_shadow_ratio)
-                & (upper_shadow_ratio > self.params.min_upper_shadow_ratio)
-                & (body_ratio < self.params.max_body_ratio)
-            )
-
-            return shooting_star_detected
+            features = get_candle_features(data)
+            return pd.Series(self._detect_array(features), index=data.index)
 
         except Exception as e:
             raise PatternDetectionError(f"Shooting Star detection failed: {e}") from e
 
+    def _detect_array(self, features: CandleFeatures) -> np.ndarray:
+        # Filter valid range
+        valid_range = features.range >= self.params.min_range
+
+        # Calculate ratios (0 where range is invalid)
+        body_ratio = features.ratio(features.body, features.range, valid_range)
+        upper_shadow_ratio = features.ratio(features.upper_shadow, features.range, valid_range)
+        lower_shadow_ratio = features.ratio(features.lower_shadow, features.range, valid_range)
+
+        # Detect Shooting Star criteria:
+        # 1. Upper shadow >= min_shadow_ratio * body
+        # 2. Lower shadow < max_lower_shadow_ratio * range
+        # 3. Upper shadow > min_upper_shadow_ratio * range
+        # 4. Body < max_body_ratio * range
+        return (
+            valid_range
+            & (features.upper_shadow >= self.params.min_shadow_ratio * features.body)
+            & (lower_shadow_ratio < self.params.max_lower_shadow_ratio)
+            & (upper_shadow_ratio > self.params.min_upper_shadow_ratio)
+            & (body_ratio < self.params.max_body_ratio)
+        )
+
     def get_minimum_bars(self) -> int:
         """Shooting Star requires only 1 bar."""
         return 1
@@ -167,37 +154,24 @@ class ShootingStar(BasePattern):
         Returns:
             Dictionary mapping detection indices to confidence scores (0.6 to 1.0)
         """
-        confidence_scores = {}
-
-        body_size = self.calculate_body_size(data)
-        candle_range = self.calculate_candle_range(data)
-
-        for idx in detection_indices:
-            # Base confidence
-            confidence = 0.6
+        features = get_candle_features(data)
+        return scores_for_indices(data, detection_indices, self._confidence_array(features))
 
-            # Calculate shadows
-            body_top = max(data.loc[idx, "open"], data.loc[idx, "close"])
-            body_bottom = min(data.loc[idx, "open"], data.loc[idx, "close"])
-            upper_shadow = data.loc[idx, "high"] - body_top
+    def _confidence_array(self, features: CandleFeatures) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shadow_body_ratio = features.upper_shadow / features.body
+            lower_ratio = features.lower_shadow / features.range
 
-            # Bonus for strong shadow/body ratio
-            if body_size.loc[idx] > 0:
-                shadow_body_ratio = upper_shadow / body_size.loc[idx]
-                if shadow_body_ratio >= 3.0:
-                    confidence += 0.15
+        # Base confidence
+        confidence = np.full(len(features), 0.6)
 
-            # Bonus for minimal lower shadow
-            lower_shadow = body_bottom - data.loc[idx, "low"]
-            if candle_range.loc[idx] > 0:
-                lower_ratio = lower_shadow / candle_range.loc[idx]
-                if lower_ratio < 0.05:
-                    confidence += 0.10
+        # Bonus for strong shadow/body ratio
+        confidence += np.where((features.body > 0) & (shadow_body_ratio >= 3.0), 0.15, 0.0)
 
-            # Bonus for bearish color (close < open)
-            if data.loc[idx, "close"] < data.loc[idx, "open"]:
-                confidence += 0.10
+        # Bonus for minimal lower shadow
+        confidence += np.where((features.range > 0) & (lower_ratio < 0.05), 0.10, 0.0)
 
-            confidence_scores[idx] = round(min(confidence, 1.0), 3)
+        # Bonus for bearish color (close < open)
+        confidence += np.where(features.bearish, 0.10, 0.0)
 
-        return confidence_scores
+        return confidence
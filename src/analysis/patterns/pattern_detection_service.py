@@ -11,6 +11,7 @@ import pandas as pd
 
 from .loader import load_pattern, get_available_patterns, is_pattern_available
 from .base_pattern import BasePattern
+from .candle_features import shared_candle_features
 from ..exceptions import InvalidPatternError, PatternDetectionError
 
 
@@ -32,6 +33,7 @@ class PatternDetectionService:
         pattern_name: str,
         data: pd.DataFrame,
         timeframe: str = "daily",
+        apply_threshold: bool = True,
     ) -> dict[str, pd.Series]:
         """
         Detect a specific pattern in price data.
@@ -40,12 +42,14 @@ class PatternDetectionService:
             pattern_name: Name of pattern to detect (e.g., 'doji', 'hammer')
             data: OHLCV DataFrame
             timeframe: Timeframe for analysis
+            apply_threshold: Drop detections scoring below the pattern's
+                confidence_threshold from pattern_definitions
 
         Returns:
             Dictionary with detection results:
             {
                 'detected': pd.Series[bool],  # True where pattern detected
-                'confidence': pd.Series[float],  # Confidence scores (0.0-1.0)
+                'confidence': pd.Series[float],  # Confidence scores (0.0-1.0), 0.0 where not detected
             }
 
         Raises:
@@ -69,6 +73,43 @@ class PatternDetectionService:
         try:
             # Get pattern instance and metadata (cached)
             pattern_meta = self._get_pattern_metadata(pattern_name, timeframe)
+        except Exception as e:
+            raise self._detection_error(pattern_name, timeframe, data, e) from e
+
+        return self.detect_with_metadata(
+            pattern_name, pattern_meta, data, timeframe, apply_threshold=apply_threshold
+        )
+
+    def detect_with_metadata(
+        self,
+        pattern_name: str,
+        pattern_meta: dict[str, Any],
+        data: pd.DataFrame,
+        timeframe: str = "daily",
+        apply_threshold: bool = True,
+    ) -> dict[str, pd.Series]:
+        """
+        Detect a pattern from already-loaded pattern_definitions metadata.
+
+        Same results as detect_pattern() without consulting the dynamic
+        loader, so it can run where the database is not available (e.g.
+        analysis worker processes).
+
+        Args:
+            pattern_name: Pattern name (for errors)
+            pattern_meta: Metadata from get_pattern_metadata() with 'instance',
+                'min_bars_required' and 'confidence_threshold'
+            data: OHLCV DataFrame
+            timeframe: Timeframe for analysis
+            apply_threshold: Drop detections scoring below confidence_threshold
+
+        Returns:
+            Dictionary with 'detected' and 'confidence' Series (see detect_pattern)
+
+        Raises:
+            PatternDetectionError: If detection fails
+        """
+        try:
             pattern = pattern_meta['instance']
 
             # Sprint 74: Validate min_bars_required
@@ -82,30 +123,71 @@ class PatternDetectionService:
                     timeframe=timeframe,
                 )
 
-            # Detect pattern (patterns work on any timeframe data)
-            detected_series = pattern.detect(data)
+            # Detect and score in one pass (patterns work on any timeframe data)
+            detected, confidence = pattern.detect_with_confidence(data)
+
+            # Sprint 17: enforce the registry threshold at the source
+            threshold = pattern_meta.get('confidence_threshold')
+            if apply_threshold and threshold is not None:
+                detected = detected & (confidence >= threshold)
+                confidence = confidence.where(detected, 0.0)
 
-            # Wrap result in expected dict format
-            # Patterns return pd.Series[bool], we need {'detected': Series, 'confidence': Series}
-            import pandas as pd
-            result = {
-                'detected': detected_series,
-                'confidence': pd.Series(1.0, index=detected_series.index)  # Default confidence
+            return {
+                'detected': detected,
+                'confidence': confidence,
             }
 
-            return result
+        except Exception as e:
+            raise self._detection_error(pattern_name, timeframe, data, e) from e
+
+    @staticmethod
+    def _detection_error(
+        pattern_name: str, timeframe: str, data: pd.DataFrame, error: Exception
+    ) -> PatternDetectionError:
+        return PatternDetectionError(
+            f"Pattern detection failed for '{pattern_name}': {str(error)}",
+            pattern_name=pattern_name,
+            symbol=None,
+            timeframe=timeframe,
+            data_info=f"{len(data)} rows",
+        )
+
+    def detect_patterns(
+        self,
+        pattern_names: list[str],
+        data: pd.DataFrame,
+        timeframe: str = "daily",
+        apply_threshold: bool = True,
+    ) -> dict[str, dict[str, pd.Series]]:
+        """
+        Detect several patterns in the same price data.
+
+        Candle geometry is computed once and shared by every pattern, and
+        each pattern is detected and scored in a single pass.
 
-        except InvalidPatternError:
-            raise
+        Args:
+            pattern_names: Names of patterns to detect
+            data: OHLCV DataFrame
+            timeframe: Timeframe for analysis
+            apply_threshold: Drop detections scoring below each pattern's
+                confidence_threshold from pattern_definitions
 
-        except Exception as e:
-            raise PatternDetectionError(
-                f"Pattern detection failed for '{pattern_name}': {str(e)}",
-                pattern_name=pattern_name,
-                symbol=None,
-                timeframe=timeframe,
-                data_info=f"{len(data)} rows",
-            ) from e
+        Returns:
+            Dictionary mapping pattern name to detect_pattern() results
+
+        Raises:
+            InvalidPatternError: If a pattern doesn't exist
+            PatternDetectionError: If detection fails
+        """
+        results = {}
+
+        with shared_candle_features(data):
+            for pattern_name in pattern_names:
+                results[pattern_name] = self.detect_pattern(
+                    pattern_name, data, timeframe, apply_threshold=apply_threshold
+                )
+
+        return results
 
     def get_available_patterns(self) -> dict[str, list[str]]:
         """
@@ -133,6 +215,20 @@ class PatternDetectionService:
         """
         return is_pattern_available(pattern_name)
 
+    def get_pattern_metadata(self, pattern_name: str, timeframe: str = 'daily') -> dict:
+        """
+        Get pattern instance with its pattern_definitions metadata.
+
+        Args:
+            pattern_name: Pattern name
+            timeframe: Timeframe to load pattern for
+
+        Returns:
+            Pattern metadata dict with 'instance', 'min_bars_required',
+            'confidence_threshold' and other fields
+        """
+        return self._get_pattern_metadata(pattern_name, timeframe)
+
     def _get_pattern_metadata(self, pattern_name: str, timeframe: str = 'daily') -> dict:
         """
         Get or create cached pattern with full metadata.
@@ -0,0 +1,395 @@
+"""
+Parallel multi-symbol analysis job runner.
+
+Sprint 73 admin analysis jobs walked every symbol through AnalysisService on
+one background thread. AnalysisJobRunner instead:
+
+- Splits the symbol list into chunks and prefetches each chunk's OHLCV as
+  one panel (OHLCVDataService.get_ohlcv_panel), while earlier chunks are
+  still being analyzed
+- Computes indicators (BatchIndicatorEngine) and patterns for whole chunks on
+  a process pool, since the work is CPU-bound pandas/NumPy
+- Hands each finished chunk back to the calling thread for persistence
+- Tracks throughput, per-stage timing and an ETA for progress polling
+
+Workers never touch the database: the configured indicator and pattern
+instances are loaded once by the caller (load_analysis_spec) and shipped to
+each worker process when it starts. With workers=0 chunks are computed inline
+on the calling thread.
+"""
+
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+
+from src.analysis.data.ohlcv_panel import OHLCVPanel
+from src.analysis.indicators.batch_engine import BatchIndicatorEngine
+from src.analysis.patterns.candle_features import shared_candle_features
+from src.analysis.patterns.pattern_detection_service import PatternDetectionService
+
+logger = logging.getLogger(__name__)
+
+# Symbols loaded into one OHLCV panel (one bulk query + one batch indicator run)
+CHUNK_SIZE = 100
+BARS = 250  # 250 bars for indicator calculations
+
+STAGES = ('fetch', 'compute', 'persist')
+
+
+@dataclass
+class AnalysisSpec:
+    """What to compute for every symbol of a job."""
+
+    analysis_type: str  # 'patterns', 'indicators' or 'both'
+    timeframe: str
+    # name -> (instance, min_bars_required)
+    indicators: dict[str, tuple[Any, int]] = field(default_factory=dict)
+    # name -> pattern_definitions metadata
+    patterns: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class ChunkResult:
+    """Analysis results for one chunk of symbols."""
+
+    # symbol -> {'patterns', 'indicators'}
+    results: dict[str, dict[str, dict]] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)  # symbol -> error message
+    compute_seconds: float = 0.0
+
+
+@dataclass
+class JobProgress:
+    """Progress counters and stage timings of a running job."""
+
+    symbols_total: int
+    symbols_completed: int = 0
+    started_at: float = field(default_factory=time.time)
+    stage_seconds: dict[str, float] = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.time() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Symbols completed per second of wall time."""
+        elapsed = self.elapsed_seconds
+        return self.symbols_completed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> float | None:
+        """Estimated seconds until all symbols are done (None until measurable)."""
+        throughput = self.throughput
+        if throughput <= 0:
+            return None
+        return (self.symbols_total - self.symbols_completed) / throughput
+
+    def to_dict(self) -> dict[str, Any]:
+        eta = self.eta_seconds
+        return {
+            'throughput': round(self.throughput, 2),
+            'eta_seconds': round(eta, 1) if eta is not None else None,
+            'elapsed_seconds': round(self.elapsed_seconds, 1),
+            'stage_timings': {
+                stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()
+            },
+        }
+
+
+def load_analysis_spec(analysis_service, analysis_type: str, timeframe: str) -> AnalysisSpec:
+    """
+    Load configured indicator and pattern instances for a job.
+
+    Args:
+        analysis_service: AnalysisService whose loaders read the
+            indicator_definitions / pattern_definitions tables
+        analysis_type: 'patterns', 'indicators' or 'both'
+        timeframe: Job timeframe
+
+    Returns:
+        AnalysisSpec ready to ship to worker processes
+    """
+    spec = AnalysisSpec(analysis_type=analysis_type, timeframe=timeframe)
+
+    if analysis_type in ('indicators', 'both'):
+        loader = analysis_service.indicator_loader
+        for name in loader.get_available_indicators():
+            try:
+                meta = loader.get_indicator_metadata(name)
+            except KeyError:
+                continue
+            spec.indicators[name] = (meta['instance'], meta.get('min_bars_required', 1))
+
+    if analysis_type in ('patterns', 'both'):
+        pattern_service = analysis_service.pattern_service
+        for names in pattern_service.get_available_patterns().values():
+            for name in names:
+                spec.patterns[name] = pattern_service.get_pattern_metadata(name, timeframe)
+
+    return spec
+
+
+def analyze_chunk(panel: OHLCVPanel, spec: AnalysisSpec) -> ChunkResult:
+    """
+    Compute indicators and patterns for one chunk of symbols.
+
+    Args:
+        panel: The chunk's OHLCV panel
+        spec: What to compute
+
+    Returns:
+        ChunkResult; a symbol that fails is reported in errors and does not
+        affect the rest of the chunk
+    """
+    start = time.perf_counter()
+    chunk = ChunkResult()
+
+    panel_indicators = None
+    if spec.indicators:
+        try:
+            panel_indicators = _calculate_panel_indicators(panel, spec)
+        except Exception as e:
+            # Fall back to per-symbol calculation
+            logger.error(f"ANALYSIS-JOB: Batch indicator calculation failed: {e}", exc_info=True)
+
+    pattern_service = PatternDetectionService()
+    for symbol in panel.symbols:
+        try:
+            data = panel.frame(symbol)
+            if data.empty:
+                chunk.errors[symbol] = "No OHLCV data available"
+                continue
+
+            if panel_indicators is not None:
+                indicators = panel_indicators[symbol]
+            else:
+                indicators = _calculate_symbol_indicators(symbol, data, spec)
+
+            chunk.results[symbol] = {
+                'indicators': indicators,
+                'patterns': _detect_symbol_patterns(data, spec, pattern_service),
+            }
+        except Exception as e:
+            chunk.errors[symbol] = str(e)
+
+    chunk.compute_seconds = time.perf_counter() - start
+    return chunk
+
+
+def _calculate_panel_indicators(panel: OHLCVPanel, spec: AnalysisSpec) -> dict[str, dict]:
+    """
+    Calculate indicators for every symbol of a panel in one batch run.
+
+    Indicators a symbol lacks min_bars_required history for are left out of
+    that symbol's results.
+    """
+    batch = BatchIndicatorEngine().calculate(
+        panel, {name: indicator for name, (indicator, _) in spec.indicators.items()}, spec.timeframe
+    )
+    return {
+        symbol: {
+            name: result for name, result in batch[symbol].items()
+            if panel.lengths[row] >= spec.indicators[name][1]
+        }
+        for row, symbol in enumerate(panel.symbols)
+    }
+
+
+def _calculate_symbol_indicators(
+    symbol: str, data: pd.DataFrame, spec: AnalysisSpec
+) -> dict[str, dict]:
+    return {
+        name: indicator.calculate(data, symbol, spec.timeframe)
+        for name, (indicator, min_bars) in spec.indicators.items()
+        if len(data) >= min_bars
+    }
+
+
+def _detect_symbol_patterns(
+    data: pd.DataFrame, spec: AnalysisSpec, pattern_service: PatternDetectionService
+) -> dict[str, dict[str, Any]]:
+    """Latest-bar pattern results in the AnalysisService format."""
+    results = {}
+    with shared_candle_features(data):
+        for name, meta in spec.patterns.items():
+            detection = pattern_service.detect_with_metadata(name, meta, data, spec.timeframe)
+            results[name] = {
+                'detected': bool(detection['detected'].iloc[-1]),
+                'confidence': float(detection['confidence'].iloc[-1]),
+            }
+    return results
+
+
+# Per-process spec, set once by the pool initializer
+_worker_spec: AnalysisSpec | None = None
+
+
+def _init_worker(spec: AnalysisSpec) -> None:
+    global _worker_spec
+    _worker_spec = spec
+
+
+def _analyze_chunk_in_worker(panel: OHLCVPanel) -> ChunkResult:
+    return analyze_chunk(panel, _worker_spec)
+
+
+class AnalysisJobRunner:
+    """
+    Runs a multi-symbol analysis job chunk by chunk on a process pool.
+
+    Fetching and persistence happen on the calling thread (which owns the
+    database connections); computation happens in worker processes. Up to
+    workers + 1 chunks are in flight, so the next chunk's OHLCV is fetched
+    while the pool is busy.
+    """
+
+    def __init__(
+        self,
+        data_service,
+        spec: AnalysisSpec,
+        workers: int = 0,
+        chunk_size: int = CHUNK_SIZE,
+        bars: int = BARS,
+    ):
+        """
+        Args:
+            data_service: OHLCVDataService used for bulk prefetching
+            spec: What to compute (from load_analysis_spec)
+            workers: Worker processes (0 = compute inline)
+            chunk_size: Symbols per chunk
+            bars: Bars fetched per symbol
+        """
+        self.data_service = data_service
+        self.spec = spec
+        self.workers = max(0, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.bars = bars
+
+    def run(
+        self,
+        symbols: list[str],
+        on_chunk: Callable[[list[str], ChunkResult, JobProgress], None],
+        is_cancelled: Callable[[], bool] = lambda: False,
+        progress: JobProgress | None = None,
+    ) -> JobProgress:
+        """
+        Analyze all symbols.
+
+        Args:
+            symbols: Symbols to analyze
+            on_chunk: Called on the calling thread as each chunk finishes,
+                with the chunk's symbols, its results and the job progress;
+                used for persistence (timed as 'persist')
+            is_cancelled: Polled between chunks; once it returns True no new
+                chunks are fetched and unreported results are dropped
+            progress: Progress object to update (created if not given)
+
+        Returns:
+            Final JobProgress
+        """
+        progress = progress or JobProgress(symbols_total=len(symbols))
+        chunks = self._chunks(symbols)
+        executor = self._create_executor()
+        in_flight: dict[Future, list[str]] = {}
+        max_in_flight = max(1, self.workers) + 1
+
+        try:
+            while True:
+                # Keep the pool busy: prefetch and submit until the window is full
+                while len(in_flight) < max_in_flight and not is_cancelled():
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    in_flight[self._submit(executor, chunk, progress)] = chunk
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                # Report chunks as they finish: a later chunk that completes first is
+                # persisted first (only chunks done in the same wait keep submission order)
+                for future in [future for future in in_flight if future in done]:
+                    if is_cancelled():
+                        break
+                    chunk = in_flight.pop(future)
+                    result = self._chunk_result(future, chunk)
+                    progress.stage_seconds['compute'] += result.compute_seconds
+
+                    start = time.perf_counter()
+                    progress.symbols_completed += len(chunk)
+                    on_chunk(chunk, result, progress)
+                    progress.stage_seconds['persist'] += time.perf_counter() - start
+
+                if is_cancelled():
+                    for future in in_flight:
+                        future.cancel()
+                    break
+        finally:
+            if executor is not None:
+                # At most the chunks already running are waited for
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        return progress
+
+    def _chunks(self, symbols: list[str]) -> Iterator[list[str]]:
+        for start in range(0, len(symbols), self.chunk_size):
+            yield symbols[start:start + self.chunk_size]
+
+    def _create_executor(self) -> ProcessPoolExecutor | None:
+        if self.workers == 0:
+            return None
+        # spawn: forked workers would inherit the parent's database sockets
+        # and eventlet hub
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.spec,),
+        )
+
+    def _submit(self, executor, chunk: list[str], progress: JobProgress) -> Future:
+        future = Future()
+        start = time.perf_counter()
+        try:
+            panel = self.data_service.get_ohlcv_panel(chunk, self.spec.timeframe, limit=self.bars)
+        except Exception as e:
+            # A failed fetch fails only this chunk's symbols; the job carries on
+            logger.error(f"ANALYSIS-JOB: Fetch of {len(chunk)} symbols failed: {e}")
+            error = f"Failed to fetch data: {e}"
+            future.set_result(
+                ChunkResult(errors=dict.fromkeys((symbol.upper() for symbol in chunk), error))
+            )
+            return future
+        finally:
+            progress.stage_seconds['fetch'] += time.perf_counter() - start
+
+        if executor is not None:
+            return executor.submit(_analyze_chunk_in_worker, panel)
+
+        try:
+            future.set_result(analyze_chunk(panel, self.spec))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    @staticmethod
+    def _chunk_result(future: Future, chunk: list[str]) -> ChunkResult:
+        """Chunk result with symbols that returned no data (or crashed) marked as failed."""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"ANALYSIS-JOB: Chunk of {len(chunk)} symbols failed: {e}", exc_info=True)
+            return ChunkResult(errors=dict.fromkeys(chunk, str(e)))
+
+        for symbol in chunk:
+            symbol = symbol.upper()
+            if symbol not in result.results and symbol not in result.errors:
+                result.errors[symbol] = "No OHLCV data available"
+        return result
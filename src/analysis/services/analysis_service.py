@@ -31,15 +31,22 @@ class AnalysisService:
     - Result aggregation and formatting
     """
 
-    def __init__(self):
-        """Initialize analysis service with loaders."""
+    def __init__(self, window_store=None):
+        """
+        Initialize analysis service with loaders.
+
+        Args:
+            window_store: Optional OHLCVWindowStore used when analyze_symbol is
+                called without data (defaults to the shared store)
+        """
         self.pattern_service = PatternDetectionService()
         self.indicator_loader = IndicatorLoader()
+        self.window_store = window_store
 
     def analyze_symbol(
         self,
         symbol: str,
-        data: pd.DataFrame,
+        data: pd.DataFrame | None = None,
         timeframe: str = "daily",
         indicators: list[str] | None = None,
         patterns: list[str] | None = None,
@@ -50,7 +57,8 @@ class AnalysisService:
 
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
-            data: OHLCV DataFrame with columns [open, high, low, close, volume]
+            data: OHLCV DataFrame with columns [open, high, low, close, volume].
+                If None, the symbol's in-memory window for `timeframe` is used.
             timeframe: Timeframe for analysis (daily, weekly, hourly, etc.)
             indicators: List of indicator names to calculate (None = none)
             patterns: List of pattern names to detect (None = none)
@@ -75,6 +83,9 @@ class AnalysisService:
             InvalidPatternError: If requested pattern doesn't exist
             AnalysisError: For other analysis failures
         """
+        if data is None:
+            data = self._get_window_data(symbol, timeframe)
+
         # Validate data format
         self._validate_ohlcv_data(data)
 
@@ -303,35 +314,54 @@ class AnalysisService:
         Raises:
             InvalidPatternError: If pattern doesn't exist
         """
+        try:
+            # One batched pass: shared candle geometry, real confidence
+            # scores, registry thresholds applied at the source
+            detections = self.pattern_service.detect_patterns(
+                pattern_names=patterns,
+                data=data,
+                timeframe=timeframe,
+            )
+
+        except KeyError as e:
+            raise InvalidPatternError(
+                f"Pattern {e} not found. "
+                f"Available patterns: "
+                f"{', '.join(self.pattern_service.get_available_patterns().keys())}"
+            )
+        except Exception as e:
+            pattern_name = (getattr(e, 'context', None) or {}).get('pattern_name')
+            raise AnalysisError(
+                f"Failed to detect pattern '{pattern_name}': {str(e)}"
+            )
+
         results = {}
+        for pattern_name, detection in detections.items():
+            # Convert to dict format (latest bar)
+            results[pattern_name] = {
+                'detected': bool(detection['detected'].iloc[-1] if len(detection['detected']) > 0 else False),
+                'confidence': float(detection['confidence'].iloc[-1] if len(detection['confidence']) > 0 else 0.0),
+            }
 
-        for pattern_name in patterns:
-            try:
-                # Detect pattern
-                detection = self.pattern_service.detect_pattern(
-                    pattern_name=pattern_name,
-                    data=data,
-                    timeframe=timeframe,
-                )
+        return results
 
-                # Convert to dict format
-                results[pattern_name] = {
-                    'detected': bool(detection['detected'].iloc[-1] if len(detection['detected']) > 0 else False),
-                    'confidence': float(detection['confidence'].iloc[-1] if len(detection['confidence']) > 0 else 0.0),
-                }
+    def _get_window_data(self, symbol: str, timeframe: str) -> pd.DataFrame:
+        """
+        Read a symbol's OHLCV window from the in-memory store.
 
-            except KeyError:
-                raise InvalidPatternError(
-                    f"Pattern '{pattern_name}' not found. "
-                    f"Available patterns: "
-                    f"{', '.join(self.pattern_service.get_available_patterns().keys())}"
-                )
-            except Exception as e:
-                raise AnalysisError(
-                    f"Failed to detect pattern '{pattern_name}': {str(e)}"
-                )
+        Raises:
+            DataValidationError: If no window is loaded for the symbol
+        """
+        if self.window_store is None:
+            from src.analysis.data.ohlcv_window_store import get_ohlcv_window_store
+            self.window_store = get_ohlcv_window_store()
 
-        return results
+        data = self.window_store.get_frame(symbol, timeframe)
+        if data is None:
+            raise DataValidationError(
+                f"No OHLCV window loaded for {symbol} ({timeframe})"
+            )
+        return data
 
     def _validate_ohlcv_data(self, data: pd.DataFrame) -> None:
         """
@@ -0,0 +1,472 @@
+"""
+Asynchronous universe analysis jobs.
+
+POST /api/analysis/universe analyzes every symbol inside the HTTP request and
+returns one JSON body when the last symbol is done. UniverseJobManager runs
+the same analysis in the background instead:
+
+- The symbol list is split into chunks; the first chunk is small so the
+  first results are ready well under a second after submission
+- Each chunk (one bulk OHLCV fetch plus per-symbol AnalysisService calls) is
+  one task on a thread pool shared by all jobs. A job submits its next chunk
+  only when the previous one finishes, so concurrent jobs interleave instead
+  of one large universe holding a worker until it is done
+- Per-symbol results are appended to the job as each chunk completes and can
+  be read, or followed until the job finishes, from any offset
+- Cancellation stops the job at the next symbol; results already produced
+  are kept
+
+Finished jobs are kept in memory for ttl_seconds.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+BARS = 250  # Bars fetched per symbol, as in the synchronous endpoint
+CHUNK_SIZE = 50
+FIRST_CHUNK_SIZE = 5
+WORKERS = 4
+JOB_TTL_SECONDS = 900
+
+
+class UniverseJobStatus(Enum):
+    """Universe analysis job status."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = frozenset({
+    UniverseJobStatus.COMPLETED, UniverseJobStatus.FAILED, UniverseJobStatus.CANCELLED
+})
+
+
+def analyze_universe_symbol(
+    analysis_service, data, symbol: str, timeframe: str,
+    indicators: list[str] | None, patterns: list[str] | None
+) -> dict[str, Any]:
+    """
+    Analyze one symbol of a universe request.
+
+    Returns:
+        {'indicators', 'patterns'}, or the same keys empty plus 'error' if
+        the analysis raised
+    """
+    try:
+        result = analysis_service.analyze_symbol(
+            data=data,
+            symbol=symbol,
+            timeframe=timeframe,
+            indicators=indicators,
+            patterns=patterns
+        )
+    except Exception as e:
+        return {'error': str(e), 'indicators': {}, 'patterns': {}}
+
+    return {
+        'indicators': result.get('indicators', {}),
+        'patterns': result.get('patterns', {})
+    }
+
+
+@dataclass
+class UniverseSummary:
+    """Aggregate statistics over the analyzed symbols of a universe."""
+
+    symbols_ok: int = 0
+    symbols_with_errors: int = 0
+    total_patterns: int = 0
+    indicator_totals: dict[str, float] = field(default_factory=dict)
+    indicator_counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, result: dict[str, Any]) -> None:
+        """Fold one analyze_universe_symbol() result into the summary."""
+        if 'error' in result:
+            self.symbols_with_errors += 1
+            return
+
+        self.symbols_ok += 1
+        self.total_patterns += len(result['patterns'])
+        for ind_name, ind_data in result['indicators'].items():
+            self.indicator_counts.setdefault(ind_name, 0)
+            value = ind_data.get('value') if isinstance(ind_data, dict) else None
+            if value is not None:
+                self.indicator_totals[ind_name] = self.indicator_totals.get(ind_name, 0) + value
+                self.indicator_counts[ind_name] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        summary = {
+            'total_patterns_detected': self.total_patterns,
+            'symbols_with_errors': self.symbols_with_errors,
+        }
+        for ind_name, count in self.indicator_counts.items():
+            if count:
+                summary[f'avg_{ind_name}'] = round(self.indicator_totals[ind_name] / count, 2)
+        return summary
+
+
+@dataclass
+class UniverseJob:
+    """
+    One asynchronous universe analysis.
+
+    records holds one dict per analyzed symbol ({'type': 'result', 'symbol',
+    'indicators', 'patterns'[, 'error']}) in completion order. All mutable
+    state is guarded by the job's condition, which is notified whenever
+    records are appended or the job finishes.
+    """
+
+    job_id: str
+    universe_key: str
+    timeframe: str
+    symbols: list[str]
+    indicators: list[str] | None
+    patterns: list[str] | None
+    analysis_service: Any = field(repr=False)
+    data_service: Any = field(repr=False)
+    status: UniverseJobStatus = UniverseJobStatus.QUEUED
+    error: str | None = None
+    records: list[dict[str, Any]] = field(default_factory=list, repr=False)
+    summary: UniverseSummary = field(default_factory=UniverseSummary, repr=False)
+    symbols_completed: int = 0
+    chunks_completed: int = 0
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    first_result_at: float | None = None
+    finished_at: float | None = None
+    pending_chunks: deque = field(default_factory=deque, repr=False)
+    condition: threading.Condition = field(default_factory=threading.Condition, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def read(
+        self, offset: int = 0, timeout: float | None = None
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """
+        Records from offset on.
+
+        Args:
+            offset: Number of records the caller has already seen
+            timeout: If given and there is nothing new yet, wait up to this
+                many seconds for more records or for the job to finish
+
+        Returns:
+            (new records, whether the job had finished when they were read)
+        """
+        with self.condition:
+            if timeout:
+                self.condition.wait_for(
+                    lambda: len(self.records) > offset or self.finished, timeout
+                )
+            return self.records[offset:], self.finished
+
+    def follow(self, offset: int = 0, poll_seconds: float = 5.0) -> Iterator[dict[str, Any]]:
+        """Yield records from offset on as they arrive, until the job finishes."""
+        while True:
+            records, finished = self.read(offset, timeout=poll_seconds)
+            yield from records
+            offset += len(records)
+            if finished:
+                return
+
+    def to_dict(self) -> dict[str, Any]:
+        """Status snapshot, including the summary of the results so far."""
+        with self.condition:
+            end = self.finished_at or time.time()
+            return {
+                'job_id': self.job_id,
+                'status': self.status.value,
+                'universe_key': self.universe_key,
+                'timeframe': self.timeframe,
+                'created_at': datetime.fromtimestamp(self.created_at, tz=UTC).isoformat(),
+                'symbols_total': len(self.symbols),
+                'symbols_completed': self.symbols_completed,
+                'results_available': len(self.records),
+                'summary': self.summary.to_dict(),
+                'metadata': {
+                    'calculation_time_ms': round((end - self.created_at) * 1000, 2),
+                    'time_to_first_result_ms': (
+                        round((self.first_result_at - self.created_at) * 1000, 2)
+                        if self.first_result_at else None
+                    ),
+                    'chunks_completed': self.chunks_completed,
+                    'cache_hits': self.summary.symbols_ok,
+                    'cache_misses': self.summary.symbols_with_errors,
+                },
+                'error': self.error,
+            }
+
+
+class UniverseJobManager:
+    """
+    Runs universe analysis jobs chunk by chunk on a shared thread pool.
+
+    Each job's chunks run one after another (a job's AnalysisService and
+    OHLCVDataService are only ever used by one thread at a time); chunks of
+    different jobs run concurrently.
+    """
+
+    def __init__(self, workers: int = WORKERS, chunk_size: int = CHUNK_SIZE,
+                 first_chunk_size: int = FIRST_CHUNK_SIZE, ttl_seconds: float = JOB_TTL_SECONDS,
+                 bars: int = BARS):
+        """
+        Args:
+            workers: Pool threads shared by all jobs
+            chunk_size: Symbols per chunk
+            first_chunk_size: Symbols in a job's first chunk
+            ttl_seconds: How long finished jobs stay readable
+            bars: Bars fetched per symbol
+        """
+        self.chunk_size = max(1, chunk_size)
+        self.first_chunk_size = max(1, min(first_chunk_size, self.chunk_size))
+        self.ttl_seconds = ttl_seconds
+        self.bars = bars
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix='universe-job'
+        )
+        self._jobs: dict[str, UniverseJob] = {}
+        self._lock = threading.Lock()
+        self.stats = dict.fromkeys(('submitted', 'completed', 'failed', 'cancelled', 'expired'), 0)
+
+    def submit(self, universe_key: str, timeframe: str, symbols: list[str],
+               indicators: list[str] | None, patterns: list[str] | None,
+               analysis_service, data_service) -> UniverseJob:
+        """
+        Start analyzing symbols in the background.
+
+        Args:
+            universe_key: Universe the symbols came from (reported back only)
+            timeframe: Analysis timeframe
+            symbols: Symbols to analyze
+            indicators: Indicators to calculate (None = all)
+            patterns: Patterns to detect (None = all)
+            analysis_service: AnalysisService owned by this job
+            data_service: OHLCVDataService owned by this job
+
+        Returns:
+            The queued job
+        """
+        self.cleanup_expired_jobs()
+
+        job = UniverseJob(
+            job_id=uuid.uuid4().hex,
+            universe_key=universe_key,
+            timeframe=timeframe,
+            symbols=list(symbols),
+            indicators=indicators,
+            patterns=patterns,
+            analysis_service=analysis_service,
+            data_service=data_service,
+        )
+        job.pending_chunks.extend(self._chunks(job.symbols))
+
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self.stats['submitted'] += 1
+
+        logger.info(
+            f"UNIVERSE-JOB: {job.job_id} queued ({len(job.symbols)} symbols of "
+            f"{universe_key}, {len(job.pending_chunks)} chunks)"
+        )
+        self._schedule_next_chunk(job)
+        return job
+
+    def get_job(self, job_id: str) -> UniverseJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel_job(self, job_id: str) -> UniverseJob | None:
+        """
+        Cancel a job.
+
+        The job is marked cancelled immediately; a chunk that is running
+        stops at its next symbol and its remaining results are dropped.
+
+        Returns:
+            The job (whatever its final status), or None if unknown
+        """
+        job = self.get_job(job_id)
+        if job is not None and self._finish(job, UniverseJobStatus.CANCELLED):
+            logger.info(f"UNIVERSE-JOB: {job_id} cancelled after {job.symbols_completed} symbols")
+        return job
+
+    def cleanup_expired_jobs(self) -> int:
+        """Drop jobs that finished more than ttl_seconds ago."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at is not None and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+            self.stats['expired'] += len(expired)
+        return len(expired)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['jobs'] = len(self._jobs)
+            stats['active_jobs'] = sum(not job.finished for job in self._jobs.values())
+        return stats
+
+    def shutdown(self) -> None:
+        """Cancel unfinished jobs and stop the pool."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            self._finish(job, UniverseJobStatus.CANCELLED)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _chunks(self, symbols: list[str]) -> Iterator[list[str]]:
+        first = symbols[:self.first_chunk_size]
+        if first:
+            yield first
+        for start in range(len(first), len(symbols), self.chunk_size):
+            yield symbols[start:start + self.chunk_size]
+
+    def _schedule_next_chunk(self, job: UniverseJob) -> None:
+        with job.condition:
+            if job.finished:
+                return
+            chunk = job.pending_chunks.popleft() if job.pending_chunks else None
+
+        if chunk is None:
+            self._finish(job, UniverseJobStatus.COMPLETED)
+            return
+
+        try:
+            self._executor.submit(self._run_chunk, job, chunk)
+        except RuntimeError as e:
+            # Pool shut down
+            self._finish(job, UniverseJobStatus.FAILED, str(e))
+
+    def _run_chunk(self, job: UniverseJob, chunk: list[str]) -> None:
+        with job.condition:
+            if job.finished:
+                return
+            if job.status is UniverseJobStatus.QUEUED:
+                job.status = UniverseJobStatus.RUNNING
+                job.started_at = time.time()
+
+        try:
+            self._analyze_chunk(job, chunk)
+        except Exception as e:
+            logger.error(f"UNIVERSE-JOB: {job.job_id} failed: {e}", exc_info=True)
+            self._finish(job, UniverseJobStatus.FAILED, str(e))
+            return
+
+        self._schedule_next_chunk(job)
+
+    def _analyze_chunk(self, job: UniverseJob, chunk: list[str]) -> None:
+        try:
+            universe_data = job.data_service.get_universe_ohlcv_data(
+                symbols=chunk,
+                timeframe=job.timeframe,
+                limit=self.bars
+            )
+        except Exception as e:
+            # Any database/driver error fails only this chunk's symbols; the job carries on
+            logger.error(f"UNIVERSE-JOB: {job.job_id} fetch of {len(chunk)} symbols failed: {e}")
+            error = f"Failed to fetch data: {e}"
+            self._publish(job, len(chunk), [
+                {'type': 'result', 'symbol': symbol, 'error': error,
+                 'indicators': {}, 'patterns': {}}
+                for symbol in chunk
+            ])
+            return
+
+        records = []
+        analyzed = 0
+        for symbol in chunk:
+            if job.finished:
+                return
+            analyzed += 1
+
+            data = universe_data.get(symbol)
+            if data is None or data.empty:
+                logger.warning(f"No data for symbol {symbol}, skipping")
+                continue
+
+            result = analyze_universe_symbol(
+                job.analysis_service, data, symbol, job.timeframe, job.indicators, job.patterns
+            )
+            records.append({'type': 'result', 'symbol': symbol, **result})
+
+        self._publish(job, analyzed, records)
+
+    def _publish(self, job: UniverseJob, analyzed: int, records: list[dict[str, Any]]) -> None:
+        with job.condition:
+            if job.finished:
+                return
+            for record in records:
+                job.summary.add(record)
+            job.records.extend(records)
+            job.symbols_completed += analyzed
+            job.chunks_completed += 1
+            if records and job.first_result_at is None:
+                job.first_result_at = time.time()
+            job.condition.notify_all()
+
+    def _finish(self, job: UniverseJob, status: UniverseJobStatus,
+                error: str | None = None) -> bool:
+        """Move job to a final status; returns False if it had already finished."""
+        with job.condition:
+            if job.finished:
+                return False
+            job.status = status
+            job.error = error
+            job.finished_at = time.time()
+            job.pending_chunks.clear()
+            job.condition.notify_all()
+
+        with self._lock:
+            self.stats[status.value] += 1
+
+        if status is UniverseJobStatus.COMPLETED:
+            logger.info(
+                f"UNIVERSE-JOB: {job.job_id} completed ({job.symbols_completed} symbols in "
+                f"{job.finished_at - job.created_at:.2f}s)"
+            )
+        return True
+
+
+# Singleton instance
+_manager_instance: UniverseJobManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_universe_job_manager() -> UniverseJobManager:
+    """Get the process-wide UniverseJobManager (sized from config on first use)."""
+    global _manager_instance
+
+    if _manager_instance is None:
+        with _manager_lock:
+            if _manager_instance is None:
+                from src.core.services.config_manager import get_config
+
+                config = get_config()
+                _manager_instance = UniverseJobManager(
+                    workers=config.get('UNIVERSE_JOB_WORKERS', WORKERS),
+                    chunk_size=config.get('UNIVERSE_JOB_CHUNK_SIZE', CHUNK_SIZE),
+                    first_chunk_size=config.get('UNIVERSE_JOB_FIRST_CHUNK_SIZE', FIRST_CHUNK_SIZE),
+                    ttl_seconds=config.get('UNIVERSE_JOB_TTL_SECONDS', JOB_TTL_SECONDS),
+                )
+
+    return _manager_instance
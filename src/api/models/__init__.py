@@ -10,6 +10,7 @@ from src.api.models.analysis_models import (
     SymbolAnalysisResponse,
     UniverseAnalysisRequest,
     UniverseAnalysisResponse,
+    UniverseJobResponse,
     DataValidationRequest,
     DataValidationResponse,
     IndicatorsListResponse,
@@ -23,6 +24,7 @@ __all__ = [
     'SymbolAnalysisResponse',
     'UniverseAnalysisRequest',
     'UniverseAnalysisResponse',
+    'UniverseJobResponse',
     'DataValidationRequest',
     'DataValidationResponse',
     'IndicatorsListResponse',
@@ -127,6 +127,45 @@ class UniverseAnalysisResponse(BaseModel):
     )
 
 
+class UniverseJobResponse(BaseModel):
+    """Status of an asynchronous universe analysis job (partial while running)."""
+
+    job_id: str
+    status: str = Field(pattern="^(queued|running|completed|failed|cancelled)$")
+    universe_key: str
+    timeframe: str
+    created_at: datetime
+    symbols_total: int
+    symbols_completed: int
+    results_available: int = Field(description="Per-symbol results readable from /results")
+    summary: dict[str, Any] = Field(description="Aggregate statistics of the results so far")
+    metadata: dict[str, Any]
+    error: str | None = None
+    links: dict[str, str] = Field(default_factory=dict)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "job_id": "3f2b8c1d",
+                "status": "running",
+                "universe_key": "nasdaq100",
+                "timeframe": "daily",
+                "created_at": "2026-02-09T12:00:00",
+                "symbols_total": 102,
+                "symbols_completed": 55,
+                "results_available": 55,
+                "summary": {"total_patterns_detected": 12, "symbols_with_errors": 0},
+                "metadata": {"calculation_time_ms": 640.2, "time_to_first_result_ms": 85.1},
+                "error": None,
+                "links": {
+                    "status": "/api/analysis/universe/jobs/3f2b8c1d",
+                    "results": "/api/analysis/universe/jobs/3f2b8c1d/results"
+                }
+            }
+        }
+    )
+
+
 class DataValidationRequest(BaseModel):
     """Request model for OHLCV data validation."""
 
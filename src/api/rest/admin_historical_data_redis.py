@@ -342,7 +342,7 @@ def register_admin_historical_routes(app):
 
             # Resolve universe to symbols via RelationshipCache
             cache = get_relationship_cache()
-            symbols = cache.get_universe_symbols(universe_key)
+            symbols = list(cache.get_universe_symbols(universe_key))
 
             if not symbols:
                 return jsonify({'error': f'No symbols found for universe: {universe_key}'}), 404
@@ -15,6 +15,7 @@ Features:
 - Integration with Sprint 68-72 analysis services
 """
 
+import json
 import logging
 import time
 from datetime import datetime, timedelta
@@ -22,7 +23,6 @@ from threading import Thread
 
 from flask import Blueprint, flash, jsonify, render_template, request
 from flask_login import current_user, login_required
-from sqlalchemy import text
 
 from src.utils.auth_decorators import admin_required
 from src.infrastructure.database.tickstock_db import TickStockDatabase
@@ -40,37 +40,72 @@ active_jobs = {}
 job_history = []
 
 
-def _cleanup_old_patterns():
+def _pattern_rows(symbol, patterns, timeframe, expiration_date):
     """
-    Clean up old pattern detections (keep last 48 hours).
+    Build daily_patterns rows for a symbol's detected patterns.
 
-    Sprint 74: Pattern retention policy - patterns are detection events,
-    keep recent history for analysis but prevent unbounded growth.
+    Args:
+        patterns: Dict of pattern results from AnalysisService
+                 Format: {pattern_name: {'detected': bool, 'confidence': float}}
 
     Returns:
-        Number of patterns deleted
+        List of INSERT parameter dicts (patterns with detected=True only)
     """
-    try:
-        config = get_config()
-        db = TickStockDatabase(config)
-
-        with db.get_connection() as conn:
-            result = conn.execute(text("""
-                DELETE FROM daily_patterns
-                WHERE detection_timestamp < NOW() - INTERVAL '48 hours'
-            """))
-
-            deleted_count = result.rowcount
-            conn.commit()
-
-            if deleted_count > 0:
-                logger.info(f"Cleaned up {deleted_count} old pattern detections (>48h)")
+    rows = []
+    for pattern_name, result in patterns.items():
+        if result.get('detected', False) is not True:
+            continue
+
+        confidence = float(result.get('confidence', 1.0))
+
+        # Build comprehensive pattern_data
+        pattern_data = {
+            'pattern_name': pattern_name,
+            'detected': True,
+            'confidence': confidence,
+            'detection_timestamp': datetime.now().isoformat(),
+            'timeframe': timeframe,
+            'symbol': symbol,
+        }
 
-            return deleted_count
+        rows.append({
+            'symbol': symbol,
+            'pattern_type': pattern_name,
+            'confidence': confidence,
+            'pattern_data': json.dumps(pattern_data),
+            'expiration_date': expiration_date,
+            'timeframe': timeframe,
+            'metadata': json.dumps({
+                'source': 'admin_process_analysis',
+                'sprint': 73,
+                'detected': True
+            })
+        })
+    return rows
+
+
+def _indicator_rows(symbol, indicators, timeframe, expiration_date):
+    """
+    Build daily_indicators rows for a symbol's indicator results.
 
-    except Exception as e:
-        logger.error(f"Pattern cleanup failed: {e}")
-        return 0
+    Returns:
+        List of INSERT parameter dicts
+    """
+    return [
+        {
+            'symbol': symbol,
+            'indicator_type': indicator_name,
+            'value_data': json.dumps(result),
+            'expiration_date': expiration_date,
+            'timeframe': timeframe,
+            'metadata': json.dumps({
+                'source': 'admin_process_analysis',
+                'sprint': 73,
+                'indicator_type': result.get('indicator_type', 'unknown')
+            })
+        }
+        for indicator_name, result in indicators.items()
+    ]
 
 
 def _persist_pattern_results(symbol, patterns, timeframe):
@@ -86,79 +121,23 @@ def _persist_pattern_results(symbol, patterns, timeframe):
     Returns:
         Number of patterns persisted
     """
-    import json
+    # Expiration: Next day at market close (daily data valid until next update)
+    expiration_date = datetime.now() + timedelta(days=1)
 
     # Filter to only detected patterns (where detected=True)
-    detected_patterns = {
-        name: result for name, result in patterns.items()
-        if result.get('detected', False) is True
-    }
+    rows = _pattern_rows(symbol, patterns, timeframe, expiration_date)
 
-    if not detected_patterns:
+    if not rows:
         logger.info(f"No patterns detected for {symbol} - returning 0")
         return 0
 
-    # Expiration: Next day at market close (daily data valid until next update)
-    expiration_date = datetime.now() + timedelta(days=1)
-
     try:
         config = get_config()
-        db = TickStockDatabase(config)
-
-        with db.get_connection() as conn:
-            for pattern_name, result in detected_patterns.items():
-                detected = result['detected']
-                confidence = result.get('confidence', 1.0)
-
-                # Build comprehensive pattern_data
-                pattern_data = {
-                    'pattern_name': pattern_name,
-                    'detected': True,
-                    'confidence': float(confidence),
-                    'detection_timestamp': datetime.now().isoformat(),
-                    'timeframe': timeframe,
-                    'symbol': symbol,
-                }
-
-                # Sprint 74: DELETE + INSERT for TimescaleDB hypertables
-                # (Hypertables can't use unique constraints without timestamp)
-
-                # Delete existing entry for this symbol+pattern+timeframe
-                conn.execute(text("""
-                    DELETE FROM daily_patterns
-                    WHERE symbol = :symbol
-                        AND pattern_type = :pattern_type
-                        AND timeframe = :timeframe
-                """), {
-                    'symbol': symbol,
-                    'pattern_type': pattern_name,
-                    'timeframe': timeframe
-                })
-
-                # Insert new/updated entry
-                conn.execute(text("""
-                    INSERT INTO daily_patterns
-                    (symbol, pattern_type, confidence, pattern_data,
-                     detection_timestamp, expiration_date, timeframe, metadata)
-                    VALUES (:symbol, :pattern_type, :confidence, :pattern_data,
-                            NOW(), :expiration_date, :timeframe, :metadata)
-                """), {
-                    'symbol': symbol,
-                    'pattern_type': pattern_name,
-                    'confidence': float(confidence),
-                    'pattern_data': json.dumps(pattern_data),
-                    'expiration_date': expiration_date,
-                    'timeframe': timeframe,
-                    'metadata': json.dumps({
-                        'source': 'admin_process_analysis',
-                        'sprint': 73,
-                        'detected': True
-                    })
-                })
-
-            conn.commit()
-            logger.info(f"Persisted {len(detected_patterns)} patterns for {symbol}")
-            return len(detected_patterns)
+        db = TickStockDatabase(config, role="admin")
+
+        persisted, _ = db.replace_daily_analysis_results(rows, [])
+        logger.info(f"Persisted {persisted} patterns for {symbol}")
+        return persisted
 
     except Exception as e:
         logger.error(f"Failed to persist patterns for {symbol}: {e}", exc_info=True)
@@ -177,160 +156,118 @@ def _persist_indicator_results(symbol, indicators, timeframe):
     Returns:
         Number of indicators persisted
     """
-    import json
-
     if not indicators:
         return 0
 
     # Expiration: Next day at market close
     expiration_date = datetime.now() + timedelta(days=1)
+    rows = _indicator_rows(symbol, indicators, timeframe, expiration_date)
 
     try:
         config = get_config()
-        db = TickStockDatabase(config)
-
-        with db.get_connection() as conn:
-            for indicator_name, result in indicators.items():
-                # Sprint 74: DELETE + INSERT for TimescaleDB hypertables
-                # (Hypertables can't use unique constraints without timestamp)
-
-                # Delete existing entry for this symbol+indicator+timeframe
-                conn.execute(text("""
-                    DELETE FROM daily_indicators
-                    WHERE symbol = :symbol
-                        AND indicator_type = :indicator_type
-                        AND timeframe = :timeframe
-                """), {
-                    'symbol': symbol,
-                    'indicator_type': indicator_name,
-                    'timeframe': timeframe
-                })
-
-                # Insert new/updated entry
-                conn.execute(text("""
-                    INSERT INTO daily_indicators
-                    (symbol, indicator_type, value_data,
-                     calculation_timestamp, expiration_date, timeframe, metadata)
-                    VALUES (:symbol, :indicator_type, :value_data,
-                            NOW(), :expiration_date, :timeframe, :metadata)
-                """), {
-                    'symbol': symbol,
-                    'indicator_type': indicator_name,
-                    'value_data': json.dumps(result),
-                    'expiration_date': expiration_date,
-                    'timeframe': timeframe,
-                    'metadata': json.dumps({
-                        'source': 'admin_process_analysis',
-                        'sprint': 73,
-                        'indicator_type': result.get('indicator_type', 'unknown')
-                    })
-                })
-
-            conn.commit()
-            logger.info(f"Persisted {len(indicators)} indicators for {symbol}")
-            return len(indicators)
+        db = TickStockDatabase(config, role="admin")
+
+        _, persisted = db.replace_daily_analysis_results([], rows)
+        logger.info(f"Persisted {persisted} indicators for {symbol}")
+        return persisted
 
     except Exception as e:
         logger.error(f"Failed to persist indicators for {symbol}: {e}", exc_info=True)
         return 0
 
 
-def _process_single_symbol(job_data, symbol, data_service, analysis_service):
+def _persist_chunk_results(results, timeframe):
     """
-    Process analysis for a single symbol.
+    Persist a chunk of symbols' results in one transaction (COPY into
+    staging tables + one set-based replace per table).
 
-    Helper function to reduce complexity of main background job function.
-    Updates job_data in-place with results.
+    Args:
+        results: Dict of symbol -> {'patterns': {...}, 'indicators': {...}}
+        timeframe: Timeframe string (daily, hourly, etc.)
 
     Returns:
-        tuple: (success: bool, error_message: str or None)
+        tuple: (patterns_persisted, indicators_persisted)
     """
+    expiration_date = datetime.now() + timedelta(days=1)
+    pattern_rows = []
+    indicator_rows = []
+    for symbol, result in results.items():
+        pattern_rows.extend(_pattern_rows(symbol, result.get('patterns', {}), timeframe, expiration_date))
+        indicator_rows.extend(_indicator_rows(symbol, result.get('indicators', {}), timeframe, expiration_date))
+
+    if not pattern_rows and not indicator_rows:
+        return 0, 0
+
     try:
-        # Fetch OHLCV data (Sprint 72 database access)
-        data = data_service.get_ohlcv_data(
-            symbol=symbol,
-            timeframe=job_data["timeframe"],
-            limit=250,  # 250 bars for indicator calculations
-        )
+        config = get_config()
+        db = TickStockDatabase(config, role="admin")
 
-        if data.empty:
-            return False, "No OHLCV data available"
-
-        # Ensure timestamp is a column (patterns require it)
-        if 'timestamp' not in data.columns and data.index.name in ['timestamp', 'date']:
-            data = data.reset_index()
-            if 'date' in data.columns:
-                data = data.rename(columns={'date': 'timestamp'})
-
-        # Ensure timestamp column is datetime type
-        if 'timestamp' in data.columns:
-            import pandas as pd
-            data['timestamp'] = pd.to_datetime(data['timestamp'])
-
-        # Determine which analysis to run based on analysis_type
-        indicators_list = None
-        patterns_list = None
-
-        if job_data["analysis_type"] == "indicators":
-            indicators_list = None  # None = all available indicators
-            patterns_list = []  # Empty = skip patterns
-        elif job_data["analysis_type"] == "patterns":
-            indicators_list = []  # Empty = skip indicators
-            patterns_list = None  # None = all available patterns
-        else:  # 'both'
-            indicators_list = None  # All indicators
-            patterns_list = None  # All patterns
-
-        # Run analysis (Sprint 68 AnalysisService)
-        result = analysis_service.analyze_symbol(
-            symbol=symbol,
-            data=data,
-            timeframe=job_data["timeframe"],
-            indicators=indicators_list,
-            patterns=patterns_list,
-            calculate_all=(job_data["analysis_type"] == "both"),
+        persisted = db.replace_daily_analysis_results(pattern_rows, indicator_rows)
+        logger.info(
+            f"Persisted {persisted[0]} patterns, {persisted[1]} indicators "
+            f"for {len(results)} symbols"
         )
+        return persisted
 
-        # Count results for progress reporting
-        patterns_count = sum(
-            1 for p in result.get("patterns", {}).values() if p.get("detected", False)
-        )
-        indicators_count = len(result.get("indicators", {}))
+    except Exception as e:
+        logger.error(f"Failed to persist results for {len(results)} symbols: {e}", exc_info=True)
+        return 0, 0
 
-        job_data["patterns_detected"] += patterns_count
-        job_data["indicators_calculated"] += indicators_count
 
-        # Persist results to database (Sprint 73 enhancement)
-        patterns_persisted = 0
-        indicators_persisted = 0
+def _record_chunk(job_data, chunk, chunk_result, progress):
+    """
+    Persist one finished chunk and update job_data for status polling.
 
-        if result.get("patterns"):
-            patterns_persisted = _persist_pattern_results(
-                symbol=symbol,
-                patterns=result["patterns"],
-                timeframe=job_data["timeframe"]
+    Runs on the job thread (AnalysisJobRunner on_chunk callback).
+    """
+    timeframe = job_data["timeframe"]
+    patterns_persisted, indicators_persisted = _persist_chunk_results(
+        chunk_result.results, timeframe
+    )
+
+    for symbol in chunk:
+        key = symbol.upper()
+        result = chunk_result.results.get(key)
+        if result is None:
+            job_data["failed_symbols"].append(symbol)
+            job_data["log_messages"].append(
+                f"[FAIL] {symbol}: {chunk_result.errors.get(key, 'Analysis failed')}"
             )
+            continue
 
-        if result.get("indicators"):
-            indicators_persisted = _persist_indicator_results(
-                symbol=symbol,
-                indicators=result["indicators"],
-                timeframe=job_data["timeframe"]
-            )
+        patterns_count = sum(
+            1 for p in result["patterns"].values() if p.get("detected", False)
+        )
+        indicators_count = len(result["indicators"])
+        job_data["patterns_detected"] += patterns_count
+        job_data["indicators_calculated"] += indicators_count
+        job_data["log_messages"].append(
+            f"[OK] {symbol}: {patterns_count} patterns, {indicators_count} indicators"
+        )
 
-        return True, f"{patterns_count} patterns, {indicators_count} indicators (saved: {patterns_persisted} patterns, {indicators_persisted} indicators)"
+    job_data["log_messages"].append(
+        f"Saved {patterns_persisted} patterns, {indicators_persisted} indicators "
+        f"({progress.symbols_completed}/{progress.symbols_total} symbols, "
+        f"{progress.throughput:.1f} symbols/sec)"
+    )
 
-    except Exception as e:
-        logger.error(f"Analysis failed for {symbol}: {e}", exc_info=True)
-        return False, str(e)
+    # Update progress (for UI polling)
+    job_data["current_symbol"] = chunk[-1]
+    job_data["symbols_completed"] = progress.symbols_completed
+    job_data["progress"] = int((progress.symbols_completed / progress.symbols_total) * 100)
+    job_data.update(progress.to_dict())
 
 
 def run_analysis_job(job_data: dict, app):
     """
     Background thread function for analyzing symbols.
 
-    Processes symbols sequentially, updating job_data in-place for real-time
-    status polling. Uses Flask app context for database and service access.
+    Runs the job through AnalysisJobRunner: symbols are prefetched in bulk
+    per chunk, analyzed on a pool of ANALYSIS_JOB_WORKERS processes, and each
+    finished chunk is persisted in one transaction on this thread. job_data is
+    updated in-place after every chunk (progress, throughput, ETA and stage
+    timings) for real-time status polling; cancellation takes effect between
+    chunks. Uses Flask app context for database and service access.
 
     Args:
         job_data: Job dict (updated in-place, thread-safe under GIL for simple ops)
@@ -349,38 +286,43 @@ def run_analysis_job(job_data: dict, app):
 
             # Initialize services (Sprint 68-72)
             from src.analysis.data.ohlcv_data_service import OHLCVDataService
+            from src.analysis.services.analysis_job_runner import (
+                AnalysisJobRunner,
+                JobProgress,
+                load_analysis_spec,
+            )
             from src.analysis.services.analysis_service import AnalysisService
 
-            analysis_service = AnalysisService()
-            data_service = OHLCVDataService()
-
-            # Process each symbol
-            for i, symbol in enumerate(job_data["symbols"]):
-                # Cancellation check (CRITICAL: allows user to stop job)
-                if job_data["status"] == "cancelled":
-                    break
-
-                # Update progress (for UI polling)
-                job_data["current_symbol"] = symbol
-                job_data["progress"] = int((i / symbols_total) * 100)
-                job_data["symbols_completed"] = i
+            config = get_config()
+            spec = load_analysis_spec(
+                AnalysisService(), job_data["analysis_type"], job_data["timeframe"]
+            )
+            runner = AnalysisJobRunner(
+                OHLCVDataService(),
+                spec,
+                workers=config.get("ANALYSIS_JOB_WORKERS", 4),
+                chunk_size=config.get("ANALYSIS_JOB_CHUNK_SIZE", 100),
+            )
 
-                # Process symbol using helper function
-                success, message = _process_single_symbol(
-                    job_data, symbol, data_service, analysis_service
-                )
+            # Jobs submitted by the import bridge build their own job dict
+            progress = JobProgress(symbols_total=symbols_total)
+            job_data.update(progress.to_dict())
 
-                if success:
-                    job_data["log_messages"].append(f"[OK] {symbol}: {message}")
-                else:
-                    job_data["failed_symbols"].append(symbol)
-                    job_data["log_messages"].append(f"[FAIL] {symbol}: {message}")
+            runner.run(
+                job_data["symbols"],
+                on_chunk=lambda chunk, result, progress: _record_chunk(
+                    job_data, chunk, result, progress
+                ),
+                # Cancellation check (CRITICAL: allows user to stop job)
+                is_cancelled=lambda: job_data["status"] == "cancelled",
+                progress=progress,
+            )
+            job_data.update(progress.to_dict())
 
             # Complete job (or mark as cancelled if user stopped it)
+            # Sprint 74 48-hour pattern retention runs on a schedule
+            # (PatternRetentionJob), not after every job
             if job_data["status"] != "cancelled":
-                # Sprint 74: Cleanup old patterns (48-hour retention)
-                deleted_count = _cleanup_old_patterns()
-
                 job_data["progress"] = 100
                 job_data["current_symbol"] = None
                 job_data["status"] = "completed"
@@ -390,14 +332,10 @@ def run_analysis_job(job_data: dict, app):
                     f"Analysis complete: {job_data['symbols_completed']} symbols, "
                     f"{job_data['patterns_detected']} patterns detected, "
                     f"{job_data['indicators_calculated']} indicators calculated, "
-                    f"{len(job_data['failed_symbols'])} failed"
+                    f"{len(job_data['failed_symbols'])} failed "
+                    f"({job_data['throughput']} symbols/sec)"
                 )
 
-                if deleted_count > 0:
-                    job_data["log_messages"].append(
-                        f"Cleaned up {deleted_count} old pattern detections (>48h)"
-                    )
-
             # Move to history and remove from active jobs
             job_history.append(job_data.copy())
             job_id = job_data["id"]
@@ -496,7 +434,7 @@ def admin_trigger_analysis():
 
         if universe_key:
             # Load symbols from universe (Sprint 61 RelationshipCache)
-            symbols = cache.get_universe_symbols(universe_key)
+            symbols = list(cache.get_universe_symbols(universe_key))
             if not symbols:
                 return jsonify(
                     {"success": False, "error": f"No symbols found in universe: {universe_key}"}
@@ -576,6 +514,9 @@ def admin_get_analysis_job_status(job_id):
             "symbols_total": job.get("symbols_total", 0),
             "patterns_detected": job.get("patterns_detected", 0),
             "indicators_calculated": job.get("indicators_calculated", 0),
+            "throughput": job.get("throughput", 0.0),
+            "eta_seconds": job.get("eta_seconds"),
+            "stage_timings": job.get("stage_timings", {}),
             "failed_symbols": job.get("failed_symbols", []),
             "log_messages": job.get("log_messages", [])[-20:],  # Last 20 only
             "completed_at": job["completed_at"].isoformat() if job.get("completed_at") else None,
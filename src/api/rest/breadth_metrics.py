@@ -5,25 +5,55 @@ Supports 12 metrics across time periods and moving averages for any universe.
 
 Endpoints:
 - GET /api/breadth-metrics - Calculate breadth metrics for universe
+- GET /api/breadth-metrics/history - Daily breadth metrics history for universe
+
+Results materialized after the EOD update are served when available; the
+metrics are calculated on demand otherwise.
 """
 
 import logging
+import time
 
 from flask import Blueprint, jsonify, request
 from pydantic import ValidationError
 
 from src.core.models.breadth_metrics_models import (
+    BreadthHistoryRequest,
+    BreadthHistoryResponse,
     BreadthMetricsErrorResponse,
     BreadthMetricsRequest,
     BreadthMetricsResponse,
 )
+from src.core.services.breadth_materialization import get_breadth_store
 from src.core.services.breadth_metrics_service import BreadthMetricsService
+from src.core.services.config_manager import get_config
 
 logger = logging.getLogger(__name__)
 
 breadth_metrics_bp = Blueprint("breadth_metrics", __name__)
 
 
+def _materialized_breadth_metrics(universe: str) -> dict | None:
+    """Service-shaped result from the latest materialized record, if current."""
+    start_time = time.time()
+    record = get_breadth_store().latest(
+        universe, max_age_hours=get_config().get("BREADTH_MATERIALIZED_MAX_AGE_HOURS", 96)
+    )
+    if record is None:
+        return None
+
+    return {
+        "metrics": record["metrics"],
+        "metadata": {
+            "universe": universe,
+            "symbol_count": record["symbol_count"],
+            "calculation_time_ms": round((time.time() - start_time) * 1000, 2),
+            "calculated_at": record["calculated_at"],
+            "as_of": record["date"],
+        },
+    }
+
+
 @breadth_metrics_bp.route("/api/breadth-metrics", methods=["GET"])
 # NOTE: Authentication can be added later if needed
 # @login_required
@@ -54,7 +84,8 @@ def get_breadth_metrics():
                 "universe": "SPY",
                 "symbol_count": 504,
                 "calculation_time_ms": 42.3,
-                "calculated_at": "2026-02-07T14:45:00.123456"
+                "calculated_at": "2026-02-07T14:45:00.123456",
+                "as_of": "2026-02-06"  # Only for materialized results
             }
         }
 
@@ -71,9 +102,11 @@ def get_breadth_metrics():
 
         logger.info(f"Breadth metrics request: {request_data.universe}")
 
-        # Calculate metrics
-        service = BreadthMetricsService()
-        result = service.calculate_breadth_metrics(universe=request_data.universe)
+        # Serve the EOD-materialized metrics, calculate on demand otherwise
+        result = _materialized_breadth_metrics(request_data.universe)
+        if result is None:
+            service = BreadthMetricsService()
+            result = service.calculate_breadth_metrics(universe=request_data.universe)
 
         # Validate response
         response = BreadthMetricsResponse.from_service_response(result)
@@ -116,3 +149,56 @@ def get_breadth_metrics():
             message="An unexpected error occurred",
         )
         return jsonify(error_response.model_dump()), 500
+
+
+@breadth_metrics_bp.route("/api/breadth-metrics/history", methods=["GET"])
+def get_breadth_metrics_history():
+    """Daily breadth metrics of a universe as materialized after each EOD update.
+
+    Query Parameters:
+        universe (str): Universe key (default: 'SPY')
+        days (int): Number of most recent trading days (1-400, default: 30)
+
+    Returns:
+        JSON response with structure:
+        {
+            "universe": "SPY",
+            "history": [
+                {"date": "2026-02-05", "symbol_count": 503, "metrics": {...}},
+                {"date": "2026-02-06", "symbol_count": 503, "metrics": {...}}
+            ]
+        }
+
+        Dates are oldest first; an empty history means nothing was materialized yet.
+
+    Error Responses:
+        400: Invalid request parameters (validation failed)
+        500: Server error while reading the history
+    """
+    try:
+        request_data = BreadthHistoryRequest(
+            universe=request.args.get("universe", "SPY"),
+            days=request.args.get("days", 30),
+        )
+
+        records = get_breadth_store().history(request_data.universe, request_data.days)
+        response = BreadthHistoryResponse.from_records(request_data.universe, records)
+
+        return jsonify(response.model_dump()), 200
+
+    except ValidationError as e:
+        logger.warning(f"Breadth history validation error: {e}")
+        error_response = BreadthMetricsErrorResponse.create(
+            error="ValidationError",
+            message="Invalid request parameters",
+            details={"validation_errors": e.errors()},
+        )
+        return jsonify(error_response.model_dump()), 400
+
+    except Exception as e:
+        logger.error(f"Unexpected error in breadth history endpoint: {e}", exc_info=True)
+        error_response = BreadthMetricsErrorResponse.create(
+            error="ServerError",
+            message="An unexpected error occurred",
+        )
+        return jsonify(error_response.model_dump()), 500
@@ -52,6 +52,12 @@ def validate_scan_parameters(args: dict[str, Any]) -> dict[str, Any]:
         if 'symbols' in args:
             symbols = args.getlist('symbols')
 
+        # Parse detection time window (Unix timestamps)
+        detected_after = args.get('detected_after')
+        detected_after = float(detected_after) if detected_after else None
+        detected_before = args.get('detected_before')
+        detected_before = float(detected_before) if detected_before else None
+
         # Parse sectors (for future use)
         sectors = []
         if 'sectors' in args:
@@ -98,6 +104,8 @@ def validate_scan_parameters(args: dict[str, Any]) -> dict[str, Any]:
             'rsi_range': [rsi_min, rsi_max],
             'confidence_min': confidence_min,
             'symbols': symbols,
+            'detected_after': detected_after,
+            'detected_before': detected_before,
             'sectors': sectors,
             'page': page,
             'per_page': per_page,
@@ -126,6 +134,7 @@ def scan_patterns():
     - timeframe: All|Daily|Intraday|Combo (default: All)
     - confidence_min: Minimum confidence (default: 0.5)
     - symbols: Specific symbols to filter
+    - detected_after / detected_before: Detection time window (Unix timestamps)
     - sectors: Sector filters (future feature)
     - page: Page number (default: 1)
     - per_page: Results per page (default: 30, max: 100)
@@ -5,6 +5,9 @@ Supports both Diverging Threshold Bar and Simple Diverging Bar types.
 
 Endpoints:
 - GET /api/threshold-bars - Calculate threshold bar segments
+
+Daily one-day bars materialized after the EOD update are served when
+available; other requests are calculated on demand.
 """
 
 import logging
@@ -18,6 +21,8 @@ from src.core.models.threshold_bar_models import (
     ThresholdBarRequest,
     ThresholdBarResponse,
 )
+from src.core.services.breadth_materialization import get_breadth_store, threshold_bar_key
+from src.core.services.config_manager import get_config
 from src.core.services.threshold_bar_service import ThresholdBarService
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,39 @@ logger = logging.getLogger(__name__)
 threshold_bars_bp = Blueprint("threshold_bars", __name__)
 
 
+def _materialized_threshold_bars(request_data: ThresholdBarRequest) -> dict | None:
+    """Service-shaped result from the latest materialized record, if it has this bar."""
+    if request_data.timeframe != "daily" or request_data.period_days != 1:
+        return None
+
+    record = get_breadth_store().latest(
+        request_data.data_source,
+        max_age_hours=get_config().get("BREADTH_MATERIALIZED_MAX_AGE_HOURS", 96),
+    )
+    if record is None:
+        return None
+
+    segments = record["threshold_bars"].get(
+        threshold_bar_key(request_data.bar_type, request_data.threshold)
+    )
+    if segments is None:
+        return None
+
+    return {
+        "metadata": {
+            "data_source": request_data.data_source,
+            "bar_type": request_data.bar_type,
+            "timeframe": request_data.timeframe,
+            "threshold": request_data.threshold,
+            "period_days": request_data.period_days,
+            "symbol_count": record["symbol_count"],
+            "calculated_at": record["calculated_at"],
+            "as_of": record["date"],
+        },
+        "segments": segments,
+    }
+
+
 @threshold_bars_bp.route("/api/threshold-bars", methods=["GET"])
 # NOTE: Authentication can be added later if needed
 # @login_required
@@ -53,7 +91,8 @@ def get_threshold_bars():
                 "threshold": float,
                 "period_days": int,
                 "symbol_count": int,
-                "calculated_at": str (ISO timestamp)
+                "calculated_at": str (ISO timestamp),
+                "as_of": str (trading day, only for materialized results)
             },
             "segments": {
                 "significant_decline": float,
@@ -88,15 +127,17 @@ def get_threshold_bars():
             f"(type={request_data.bar_type}, timeframe={request_data.timeframe})"
         )
 
-        # Calculate threshold bars
-        service = ThresholdBarService()
-        result = service.calculate_threshold_bars(
-            data_source=request_data.data_source,
-            bar_type=request_data.bar_type,
-            timeframe=request_data.timeframe,
-            threshold=request_data.threshold,
-            period_days=request_data.period_days,
-        )
+        # Serve the EOD-materialized bar, calculate on demand otherwise
+        result = _materialized_threshold_bars(request_data)
+        if result is None:
+            service = ThresholdBarService()
+            result = service.calculate_threshold_bars(
+                data_source=request_data.data_source,
+                bar_type=request_data.bar_type,
+                timeframe=request_data.timeframe,
+                threshold=request_data.threshold,
+                period_days=request_data.period_days,
+            )
 
         # Validate response
         response = ThresholdBarResponse.from_service_response(result)
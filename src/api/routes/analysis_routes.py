@@ -6,13 +6,14 @@ Sprint 72: Database Integration
 Endpoints for single symbol and universe batch analysis.
 """
 
+import json
 import logging
 import time
 from datetime import datetime
 from io import StringIO
 
 import pandas as pd
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, url_for
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
@@ -22,12 +23,18 @@ from src.api.models.analysis_models import (
     SymbolAnalysisResponse,
     UniverseAnalysisRequest,
     UniverseAnalysisResponse,
+    UniverseJobResponse,
     DataValidationRequest,
     DataValidationResponse,
     ErrorResponse,
 )
 from src.analysis.services.analysis_service import AnalysisService
 from src.analysis.data.ohlcv_data_service import OHLCVDataService
+from src.analysis.services.universe_jobs import (
+    UniverseSummary,
+    analyze_universe_symbol,
+    get_universe_job_manager,
+)
 from src.core.services.relationship_cache import get_relationship_cache
 from src.analysis.exceptions import IndicatorError, PatternDetectionError, DataValidationError
 
@@ -177,6 +184,10 @@ def analyze_universe():
         400: ValidationError
         404: Universe not found
         500: Analysis error
+
+    Large universes hold the request until every symbol is analyzed; use
+    POST /api/analysis/universe/jobs to analyze in the background and stream
+    results as they complete.
     """
     try:
         # Parse and validate request
@@ -224,78 +235,33 @@ def analyze_universe():
                 details={'universe_key': request_data.universe_key}
             ).model_dump()), 500
 
+        # Determine which indicators/patterns to calculate
+        if request_data.calculate_all:
+            indicators_to_calc = None
+            patterns_to_calc = None
+        else:
+            indicators_to_calc = request_data.indicators
+            patterns_to_calc = request_data.patterns
+
         # Batch analyze symbols
         results = {}
-        cache_hits = 0
-        cache_misses = 0
-
-        # Summary statistics
-        total_patterns = 0
-        indicator_sums = {}
+        summary = UniverseSummary()
 
         for symbol in symbols:
-            try:
-                # Get data for this symbol
-                data = universe_data.get(symbol)
-
-                # Skip if no data available for symbol
-                if data is None or data.empty:
-                    logger.warning(f"No data for symbol {symbol}, skipping")
-                    continue
-
-                # Determine which indicators/patterns to calculate
-                if request_data.calculate_all:
-                    indicators_to_calc = None
-                    patterns_to_calc = None
-                else:
-                    indicators_to_calc = request_data.indicators
-                    patterns_to_calc = request_data.patterns
-
-                # Analyze symbol
-                analysis_result = analysis_service.analyze_symbol(
-                    data=data,
-                    symbol=symbol,
-                    timeframe=request_data.timeframe,
-                    indicators=indicators_to_calc,
-                    patterns=patterns_to_calc
-                )
-
-                results[symbol] = {
-                    'indicators': analysis_result.get('indicators', {}),
-                    'patterns': analysis_result.get('patterns', {})
-                }
-
-                # Update summary statistics
-                total_patterns += len(analysis_result.get('patterns', {}))
-
-                # Aggregate indicator values
-                for ind_name, ind_data in analysis_result.get('indicators', {}).items():
-                    if ind_name not in indicator_sums:
-                        indicator_sums[ind_name] = []
-                    if 'value' in ind_data and ind_data['value'] is not None:
-                        indicator_sums[ind_name].append(ind_data['value'])
-
-                cache_hits += 1
-
-            except Exception as e:
-                # Log error but continue with other symbols
-                results[symbol] = {
-                    'error': str(e),
-                    'indicators': {},
-                    'patterns': {}
-                }
-                cache_misses += 1
-
-        # Calculate summary statistics
-        summary = {
-            'total_patterns_detected': total_patterns,
-            'symbols_with_errors': cache_misses,
-        }
-
-        # Add average indicator values
-        for ind_name, values in indicator_sums.items():
-            if values:
-                summary[f'avg_{ind_name}'] = round(sum(values) / len(values), 2)
+            # Get data for this symbol
+            data = universe_data.get(symbol)
+
+            # Skip if no data available for symbol
+            if data is None or data.empty:
+                logger.warning(f"No data for symbol {symbol}, skipping")
+                continue
+
+            # Analyze symbol (a failure is recorded in its result, other symbols continue)
+            results[symbol] = analyze_universe_symbol(
+                analysis_service, data, symbol, request_data.timeframe,
+                indicators_to_calc, patterns_to_calc
+            )
+            summary.add(results[symbol])
 
         # Calculate metadata
         calculation_time_ms = (time.time() - start_time) * 1000
@@ -307,11 +273,11 @@ def analyze_universe():
             timestamp=datetime.utcnow(),
             symbols_analyzed=len(symbols),
             results=results,
-            summary=summary,
+            summary=summary.to_dict(),
             metadata={
                 'calculation_time_ms': round(calculation_time_ms, 2),
-                'cache_hits': cache_hits,
-                'cache_misses': cache_misses,
+                'cache_hits': summary.symbols_ok,
+                'cache_misses': summary.symbols_with_errors,
                 'total_symbols': len(symbols)
             }
         )
@@ -326,6 +292,182 @@ def analyze_universe():
         ).model_dump()), 500
 
 
+def _job_response(job) -> dict:
+    """UniverseJobResponse for a job, with links to its status and results."""
+    return UniverseJobResponse(
+        **job.to_dict(),
+        links={
+            'status': url_for('analysis.get_universe_job', job_id=job.job_id),
+            'results': url_for('analysis.stream_universe_job_results', job_id=job.job_id),
+        }
+    ).model_dump()
+
+
+def _job_not_found(job_id: str):
+    return jsonify(ErrorResponse(
+        error="NotFoundError",
+        message=f"Universe analysis job '{job_id}' not found or expired",
+        details={'job_id': job_id}
+    ).model_dump()), 404
+
+
+@analysis_bp.route('/universe/jobs', methods=['POST'])
+def submit_universe_job():
+    """
+    Start a universe analysis in the background.
+
+    POST /api/analysis/universe/jobs
+    (same body as POST /api/analysis/universe)
+
+    Symbols are analyzed in chunks on a shared worker pool; per-symbol
+    results can be streamed from the job's results URL as each chunk
+    completes.
+
+    Returns:
+        202: UniverseJobResponse (status "queued")
+        400: ValidationError
+        404: Universe not found
+        500: Submission error
+    """
+    try:
+        # Parse and validate request
+        request_data = UniverseAnalysisRequest(**request.get_json())
+    except ValidationError as e:
+        return jsonify(ErrorResponse(
+            error="ValidationError",
+            message="Invalid request data",
+            details={"validation_errors": e.errors()}
+        ).model_dump()), 400
+
+    try:
+        # Get universe symbols from RelationshipCache
+        cache = get_relationship_cache()
+        symbols = cache.get_universe_symbols(request_data.universe_key)
+
+        if not symbols:
+            return jsonify(ErrorResponse(
+                error="NotFoundError",
+                message=f"Universe '{request_data.universe_key}' not found or empty",
+                details={'universe_key': request_data.universe_key}
+            ).model_dump()), 404
+
+        # Apply max_symbols limit
+        if request_data.max_symbols:
+            symbols = symbols[:request_data.max_symbols]
+
+        job = get_universe_job_manager().submit(
+            universe_key=request_data.universe_key,
+            timeframe=request_data.timeframe,
+            symbols=list(symbols),
+            indicators=None if request_data.calculate_all else request_data.indicators,
+            patterns=None if request_data.calculate_all else request_data.patterns,
+            analysis_service=AnalysisService(),
+            data_service=OHLCVDataService(),
+        )
+
+        return jsonify(_job_response(job)), 202
+
+    except Exception as e:
+        return jsonify(ErrorResponse(
+            error="InternalServerError",
+            message=f"Failed to start universe analysis: {str(e)}",
+            details={'universe_key': request_data.universe_key}
+        ).model_dump()), 500
+
+
+@analysis_bp.route('/universe/jobs/<job_id>', methods=['GET'])
+def get_universe_job(job_id: str):
+    """
+    Status and summary-so-far of a universe analysis job.
+
+    GET /api/analysis/universe/jobs/<job_id>
+
+    Returns:
+        200: UniverseJobResponse
+        404: Job not found or expired
+    """
+    job = get_universe_job_manager().get_job(job_id)
+    if job is None:
+        return _job_not_found(job_id)
+
+    return jsonify(_job_response(job)), 200
+
+
+@analysis_bp.route('/universe/jobs/<job_id>/results', methods=['GET'])
+def stream_universe_job_results(job_id: str):
+    """
+    Stream a universe analysis job's results as NDJSON.
+
+    GET /api/analysis/universe/jobs/<job_id>/results?offset=0&follow=true
+
+    One JSON object per line:
+        {"type": "result", "symbol": "AAPL", "indicators": {...}, "patterns": {...}}
+        ...
+        {"type": "summary", "status": "completed", ...}  (UniverseJobResponse fields)
+
+    Query Parameters:
+        offset: Skip the first N results (resume after a dropped connection)
+        follow: If true (default), keep the response open and send results
+            as chunks complete until the job finishes; if false, send the
+            results available now
+
+    The summary line is always last; its status tells whether the results
+    are complete, partial (running, cancelled) or cut short (failed).
+
+    Returns:
+        200: application/x-ndjson stream
+        400: Invalid offset
+        404: Job not found or expired
+    """
+    job = get_universe_job_manager().get_job(job_id)
+    if job is None:
+        return _job_not_found(job_id)
+
+    offset = request.args.get('offset', 0, type=int)
+    if offset < 0:
+        return jsonify(ErrorResponse(
+            error="ValidationError",
+            message="offset must be non-negative",
+            details={'offset': offset}
+        ).model_dump()), 400
+    follow = request.args.get('follow', 'true').lower() not in ('false', '0', 'no')
+
+    def generate():
+        records = job.follow(offset) if follow else job.read(offset)[0]
+        for record in records:
+            yield json.dumps(record, default=str) + '\n'
+
+        summary = UniverseJobResponse(**job.to_dict()).model_dump(mode='json')
+        yield json.dumps({'type': 'summary', **summary}) + '\n'
+
+    return Response(
+        generate(),
+        mimetype='application/x-ndjson',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@analysis_bp.route('/universe/jobs/<job_id>', methods=['DELETE'])
+def cancel_universe_job(job_id: str):
+    """
+    Cancel a universe analysis job.
+
+    DELETE /api/analysis/universe/jobs/<job_id>
+
+    Results produced before cancellation stay readable. Cancelling a job
+    that has already finished leaves it unchanged.
+
+    Returns:
+        200: UniverseJobResponse
+        404: Job not found or expired
+    """
+    job = get_universe_job_manager().cancel_job(job_id)
+    if job is None:
+        return _job_not_found(job_id)
+
+    return jsonify(_job_response(job)), 200
+
+
 @analysis_bp.route('/validate-data', methods=['POST'])
 def validate_data():
     """
@@ -35,7 +35,7 @@ from datetime import datetime, timedelta
 import redis
 from flask import jsonify, render_template, request
 from flask_login import current_user, login_required
-from flask_socketio import emit
+from flask_socketio import emit, join_room, leave_room
 
 # Core application imports
 from config.app_config import create_flask_app, initialize_flask_extensions, initialize_socketio
@@ -74,6 +74,7 @@ from src.core.services.redis_validator import (
 )
 from src.core.services.startup_service import run_startup_sequence
 from src.core.services.websocket_broadcaster import WebSocketBroadcaster
+from src.infrastructure.websocket.pattern_alert_fanout import PatternAlertFanout
 from src.presentation.websocket.manager import WebSocketManager
 
 logger = logging.getLogger(__name__)
@@ -106,6 +107,9 @@ comparison_tools_service = None
 # Sprint 76: Disabled ImportAnalysisBridge (manual two-step workflow)
 # import_analysis_bridge = None
 
+# Scheduled daily_patterns retention cleanup
+pattern_retention_job = None
+
 APP_VERSION = "2.0.0-simplified"
 
 def initialize_redis(config):
@@ -417,6 +421,24 @@ def register_socketio_handlers(socketio, market_service):
             logger.error(f"SUBSCRIPTION-ERROR: {e}")
             emit('error', {'message': 'Subscription failed'})
 
+    @socketio.on('subscribe_pattern_topics')
+    def handle_subscribe_pattern_topics(data):
+        """Join/leave shared pattern:{pattern}:{symbol} alert rooms."""
+        try:
+            joined = []
+            for topic in data.get('topics', []):
+                room = PatternAlertFanout.topic_room(topic['pattern'], topic['symbol'])
+                if data.get('unsubscribe'):
+                    leave_room(room)
+                else:
+                    join_room(room)
+                joined.append(room)
+            emit('pattern_topics_updated', {'rooms': joined, 'unsubscribe': bool(data.get('unsubscribe'))})
+
+        except Exception as e:
+            logger.error(f"PATTERN-TOPIC-SUBSCRIPTION-ERROR: {e}")
+            emit('error', {'message': 'Pattern topic subscription failed'})
+
     # Sprint 12 Phase 2: TickStockPL Integration WebSocket Handlers
     @socketio.on('subscribe_tickstockpl_watchlist')
     def handle_subscribe_watchlist(data):
@@ -2236,6 +2258,18 @@ def main():
             logger.error(f"STARTUP: SocketIO handler registration failed: {e}")
             raise
 
+        # Sprint 74 pattern retention (48h) runs on a schedule, not after every analysis
+        logger.info("STARTUP: Starting pattern retention job...")
+        try:
+            from src.jobs.pattern_retention_job import PatternRetentionJob
+            retention_job = PatternRetentionJob(config)
+            retention_job.start()
+            globals()['pattern_retention_job'] = retention_job
+            logger.info("STARTUP: Pattern retention job started successfully")
+        except Exception as e:
+            logger.error(f"STARTUP: Pattern retention job failed to start: {e}")
+            # Non-critical - old detections are only kept longer
+
         # Sprint 76: Disabled ImportAnalysisBridge (manual two-step workflow)
         # Sprint 75 Phase 2: Initialize Import Analysis Bridge
         # logger.info("STARTUP: Initializing Import Analysis Bridge...")
@@ -2559,6 +2593,9 @@ def main():
         except:
             pass
 
+        if pattern_retention_job:
+            pattern_retention_job.stop()
+
         if pattern_alert_manager:
             pattern_alert_manager.cleanup_expired_data()
 
@@ -68,6 +68,9 @@ class BreadthMetricsMetadata(BaseModel):
     symbol_count: int = Field(ge=0, description="Number of symbols analyzed")
     calculation_time_ms: float = Field(ge=0.0, description="Calculation duration in milliseconds")
     calculated_at: str = Field(description="ISO 8601 timestamp")
+    as_of: str | None = Field(
+        default=None, description="Trading day of materialized results (YYYY-MM-DD)"
+    )
 
     @field_validator("calculated_at")
     @classmethod
@@ -140,6 +143,56 @@ class BreadthMetricsResponse(BaseModel):
         )
 
 
+class BreadthHistoryRequest(BaseModel):
+    """Request model for the breadth metrics history."""
+
+    universe: UniverseKey = Field(
+        default="SPY",
+        description="Universe key (e.g., 'SPY', 'QQQ', 'dow30', 'nasdaq100')",
+        min_length=1,
+        max_length=50,
+    )
+    days: int = Field(default=30, ge=1, le=400, description="Most recent trading days")
+
+    @field_validator("universe")
+    @classmethod
+    def validate_universe(cls, v: str) -> str:
+        """Validate universe is not empty or whitespace."""
+        if not v or not v.strip():
+            raise ValueError("universe cannot be empty or whitespace")
+        return v.strip().upper()
+
+
+class BreadthHistoryPoint(BaseModel):
+    """Breadth metrics of one trading day."""
+
+    date: str = Field(description="Trading day (YYYY-MM-DD)")
+    symbol_count: int = Field(ge=0, description="Number of symbols analyzed")
+    metrics: dict[str, MetricData]
+
+
+class BreadthHistoryResponse(BaseModel):
+    """Daily breadth metrics history of a universe, oldest first."""
+
+    universe: UniverseKey
+    history: list[BreadthHistoryPoint]
+
+    @classmethod
+    def from_records(
+        cls, universe: str, records: list[dict[str, Any]]
+    ) -> "BreadthHistoryResponse":
+        """Factory method to create response from materialized breadth records."""
+        return cls(
+            universe=universe,
+            history=[
+                BreadthHistoryPoint(
+                    date=r["date"], symbol_count=r["symbol_count"], metrics=r["metrics"]
+                )
+                for r in records
+            ],
+        )
+
+
 class BreadthMetricsErrorResponse(BaseModel):
     """Standardized error response model.
 
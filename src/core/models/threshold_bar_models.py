@@ -78,6 +78,9 @@ class ThresholdBarMetadata(BaseModel):
     period_days: int = Field(..., description="Period in days for calculation")
     symbol_count: int = Field(..., description="Number of symbols included in calculation")
     calculated_at: str = Field(..., description="ISO timestamp of calculation")
+    as_of: str | None = Field(
+        default=None, description="Trading day of materialized results (YYYY-MM-DD)"
+    )
 
 
 class DivergingThresholdBarSegments(BaseModel):
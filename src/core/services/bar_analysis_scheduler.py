@@ -0,0 +1,222 @@
+"""
+Bar Analysis Scheduler
+Bounded, coalescing work queue for real-time bar analysis.
+
+Replaces one-thread-per-bar spawning in MarketDataService:
+- Fixed pool of worker threads shared by all symbols
+- At most one pending entry per symbol; newer bars merge into it
+- A symbol is never analyzed by two workers at once
+- Maximum queue depth with a drop_new or drop_oldest overflow policy
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ('drop_new', 'drop_oldest')
+
+
+class BarAnalysisScheduler:
+    """Fixed worker pool with per-symbol request coalescing."""
+
+    def __init__(
+        self,
+        handler: Callable[[str, datetime], None],
+        config: dict[str, Any] | None = None
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            handler: Callable run by workers as handler(symbol, timestamp)
+            config: Configuration dictionary with scheduler settings
+        """
+        self.handler = handler
+        self.config = config or {}
+
+        self.worker_count = int(self.config.get('BAR_ANALYSIS_WORKERS', 4))
+        self.max_queue_depth = int(self.config.get('BAR_ANALYSIS_MAX_QUEUE_DEPTH', 5000))
+        self.overflow_policy = self.config.get('BAR_ANALYSIS_OVERFLOW_POLICY', 'drop_oldest')
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Invalid overflow policy: {self.overflow_policy}. "
+                f"Supported: {', '.join(OVERFLOW_POLICIES)}"
+            )
+
+        # symbol -> (latest bar timestamp, first enqueue time); insertion order = FIFO
+        self._pending: OrderedDict[str, tuple[datetime, float]] = OrderedDict()
+        self._in_flight: set[str] = set()
+        self._condition = threading.Condition()
+
+        # Thread management
+        self._workers: list[threading.Thread] = []
+        self.is_running = False
+
+        # Statistics
+        self._recent_completions: deque = deque(maxlen=1000)
+        self.stats = {
+            'submitted': 0,
+            'coalesced': 0,
+            'dropped': 0,
+            'completed': 0,
+            'failed': 0,
+            'last_queue_lag_ms': 0.0,
+            'max_queue_lag_ms': 0.0,
+            'total_queue_lag_ms': 0.0,
+            'total_run_ms': 0.0,
+            'start_time': time.time()
+        }
+
+    def start(self):
+        """Start worker threads."""
+        if self.is_running:
+            logger.warning("BAR-ANALYSIS-SCHEDULER: Already running")
+            return
+
+        self.is_running = True
+        for i in range(self.worker_count):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"BarAnalysisWorker-{i}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        logger.info(
+            f"BAR-ANALYSIS-SCHEDULER: Started {self.worker_count} workers "
+            f"(max_queue={self.max_queue_depth}, policy={self.overflow_policy})"
+        )
+
+    def stop(self, timeout: float = 5.0):
+        """Stop workers; pending requests are discarded."""
+        if not self.is_running:
+            return
+
+        with self._condition:
+            self.is_running = False
+            self._condition.notify_all()
+
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._workers = []
+
+        logger.info(f"BAR-ANALYSIS-SCHEDULER: Stopped. Stats: {self.get_stats()}")
+
+    def submit(self, symbol: str, timestamp: datetime) -> bool:
+        """
+        Request analysis for a symbol's latest bar.
+
+        If the symbol is already pending, the request merges into the existing
+        entry (keeping its queue position and the newest timestamp).
+
+        Returns:
+            bool: True if queued or merged, False if dropped
+        """
+        with self._condition:
+            self.stats['submitted'] += 1
+
+            entry = self._pending.get(symbol)
+            if entry is not None:
+                if timestamp > entry[0]:
+                    self._pending[symbol] = (timestamp, entry[1])
+                self.stats['coalesced'] += 1
+                return True
+
+            if len(self._pending) >= self.max_queue_depth:
+                if self.overflow_policy == 'drop_new':
+                    self._record_drop(symbol)
+                    return False
+                dropped_symbol, _ = self._pending.popitem(last=False)
+                self._record_drop(dropped_symbol)
+
+            self._pending[symbol] = (timestamp, time.time())
+            self._condition.notify()
+            return True
+
+    def _record_drop(self, symbol: str):
+        """Count a dropped request. Caller holds the condition lock."""
+        self.stats['dropped'] += 1
+        dropped = self.stats['dropped']
+        if dropped == 1 or dropped % 1000 == 0:
+            logger.warning(
+                f"BAR-ANALYSIS-SCHEDULER: Queue full ({self.max_queue_depth}), "
+                f"dropped {symbol} ({dropped} dropped so far)"
+            )
+
+    def _next_request(self) -> tuple[str, datetime, float] | None:
+        """Pop the oldest pending symbol that is not already in flight."""
+        with self._condition:
+            while self.is_running:
+                for symbol in self._pending:
+                    if symbol not in self._in_flight:
+                        timestamp, enqueued_at = self._pending.pop(symbol)
+                        self._in_flight.add(symbol)
+                        return symbol, timestamp, enqueued_at
+                self._condition.wait(timeout=1.0)
+        return None
+
+    def _worker_loop(self):
+        """Run analysis requests until stopped."""
+        while True:
+            request = self._next_request()
+            if request is None:
+                return
+
+            symbol, timestamp, enqueued_at = request
+            started = time.time()
+            lag_ms = (started - enqueued_at) * 1000
+
+            try:
+                self.handler(symbol, timestamp)
+                succeeded = True
+            except Exception as e:
+                succeeded = False
+                logger.error(f"BAR-ANALYSIS-SCHEDULER: Analysis failed for {symbol}: {e}")
+
+            finished = time.time()
+            with self._condition:
+                self._in_flight.discard(symbol)
+                self.stats['completed' if succeeded else 'failed'] += 1
+                self.stats['last_queue_lag_ms'] = lag_ms
+                self.stats['max_queue_lag_ms'] = max(self.stats['max_queue_lag_ms'], lag_ms)
+                self.stats['total_queue_lag_ms'] += lag_ms
+                self.stats['total_run_ms'] += (finished - started) * 1000
+                self._recent_completions.append(finished)
+                if symbol in self._pending:
+                    # A newer bar arrived while this one ran; let another worker take it
+                    self._condition.notify()
+
+    def queue_depth(self) -> int:
+        """Number of symbols waiting for analysis."""
+        with self._condition:
+            return len(self._pending)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics including queue lag and throughput."""
+        with self._condition:
+            stats = self.stats.copy()
+            stats['queue_depth'] = len(self._pending)
+            stats['in_flight'] = len(self._in_flight)
+            recent = list(self._recent_completions)
+
+        processed = stats['completed'] + stats['failed']
+        now = time.time()
+        uptime = now - stats['start_time']
+        window = [t for t in recent if now - t <= 60]
+
+        stats['avg_queue_lag_ms'] = stats['total_queue_lag_ms'] / processed if processed else 0.0
+        stats['avg_run_ms'] = stats['total_run_ms'] / processed if processed else 0.0
+        stats['throughput_per_sec'] = processed / uptime if uptime > 0 else 0.0
+        stats['recent_throughput_per_sec'] = len(window) / 60.0
+        stats['workers'] = self.worker_count
+        stats['max_queue_depth'] = self.max_queue_depth
+        stats['overflow_policy'] = self.overflow_policy
+        stats['is_running'] = self.is_running
+        return stats
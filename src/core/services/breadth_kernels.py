@@ -0,0 +1,194 @@
+"""
+Breadth Kernels
+
+Array kernels behind the market breadth and threshold bar calculations.
+
+A universe's daily bars are laid out as a right-aligned (symbols x days)
+OHLCVPanel, so every metric is a handful of NumPy operations over all symbols
+at once instead of a groupby().transform(lambda ...) per metric:
+- Long query frames are sorted once and reshaped with pack_frame()
+- Period returns and SMAs read fixed columns from the right edge
+- EMAs step once through the time axis, updating every symbol per step with
+  the same recursion pandas' ewm(adjust=False) uses
+- latest_columns() computes every latest-bar value in one pass and
+  breadth_metrics() turns them into the 11 up/down/unchanged counts
+
+Used by UniverseSnapshotCache (precomputed per snapshot) and by the
+DataFrame methods of BreadthMetricsService and ThresholdBarService.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.data.ohlcv_panel import OHLCV_COLUMNS, OHLCVPanel
+
+# Lookbacks of the breadth metrics (bars)
+RETURN_PERIODS = (5, 21, 63, 126, 252)
+EMA_PERIODS = (10, 20)
+SMA_PERIODS = (50, 200)
+
+# Metric name -> latest_columns() key for the return-based metrics
+CHANGE_METRICS = {
+    "day_change": "day_change",
+    "open_change": "open_change",
+    "week": "return_5",
+    "month": "return_21",
+    "quarter": "return_63",
+    "half_year": "return_126",
+    "year": "return_252",
+}
+
+
+def pack_frame(df: pd.DataFrame, time_column: str = "date") -> OHLCVPanel:
+    """
+    Sort a long OHLCV frame once and reshape it into a panel.
+
+    Args:
+        df: Frame with a symbol column, a time column and any OHLCV columns
+            (missing ones become NaN); row order does not matter
+        time_column: Name of the time column
+
+    Returns:
+        OHLCVPanel with one row per symbol in sorted symbol order
+    """
+    codes, symbols = pd.factorize(df["symbol"], sort=True)
+
+    times = pd.to_datetime(df[time_column])
+    if getattr(times.dt, "tz", None) is not None:
+        times = times.dt.tz_convert(None)
+    times = times.to_numpy(dtype="datetime64[ns]")
+
+    order = np.lexsort((times, codes))
+    columns = {
+        col: (
+            df[col].to_numpy(dtype=np.float64)[order]
+            if col in df.columns
+            else np.full(len(df), np.nan)
+        )
+        for col in OHLCV_COLUMNS
+    }
+    return OHLCVPanel.from_flat(list(symbols), codes[order], times[order], columns)
+
+
+def latest(values: np.ndarray, lengths: np.ndarray, back: int = 0, fill=np.nan) -> np.ndarray:
+    """Per-row value `back` bars before the latest one (fill where too short)."""
+    count, bars = values.shape
+    if bars <= back:
+        return np.full(count, fill, dtype=values.dtype)
+    return np.where(lengths > back, values[:, bars - 1 - back], fill)
+
+
+def day_change(panel: OHLCVPanel) -> np.ndarray:
+    """Latest close vs previous close in percent (pct_change() * 100)."""
+    close = latest(panel.close, panel.lengths)
+    return (close / latest(panel.close, panel.lengths, 1) - 1) * 100
+
+
+def period_change(panel: OHLCVPanel, days: int) -> np.ndarray:
+    """Latest close vs the close `days - 1` bars earlier, in percent."""
+    close = latest(panel.close, panel.lengths)
+    base = latest(panel.close, panel.lengths, days - 1)
+    return (close - base) / base * 100
+
+
+def ema_last(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    Latest ewm(span=period, adjust=False, min_periods=period).mean() per row.
+
+    Steps once through the time axis updating every row in one vector
+    operation. Follows the pandas recursion exactly, including the weight
+    decay across missing closes, so values are bit-identical to the
+    per-symbol calculation.
+    """
+    # pandas converts span -> center of mass -> alpha; keep its rounding
+    alpha = 1.0 / (1.0 + (period - 1) / 2)
+    old_wt_factor = 1.0 - alpha
+
+    weighted = np.full(close.shape[0], np.nan)
+    old_wt = np.ones(close.shape[0])
+    nobs = np.zeros(close.shape[0], dtype=np.int64)
+
+    for t in range(close.shape[1]):
+        cur = close[:, t]
+        observed = ~np.isnan(cur)
+        nobs += observed
+
+        started = ~np.isnan(weighted)
+        old_wt = np.where(started, old_wt * old_wt_factor, old_wt)
+        update = started & observed & (weighted != cur)
+        smoothed = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+        weighted = np.where(update, smoothed, np.where(~started & observed, cur, weighted))
+        old_wt = np.where(started & observed, 1.0, old_wt)
+
+    return np.where(nobs >= period, weighted, np.nan)
+
+
+def sma_last(close: np.ndarray, lengths: np.ndarray, period: int) -> np.ndarray:
+    """Latest rolling(period, min_periods=period).mean() per row."""
+    count, bars = close.shape
+    if bars < period:
+        return np.full(count, np.nan)
+    return np.where(lengths >= period, close[:, bars - period:].mean(axis=1), np.nan)
+
+
+def latest_columns(panel: OHLCVPanel) -> dict[str, np.ndarray]:
+    """
+    Compute every latest-bar value the breadth/threshold metrics use.
+
+    Returns:
+        Per-symbol arrays aligned with panel.symbols (NaN/NaT where a symbol
+        has too few bars): time, prev_time, close, open, day_change,
+        open_change, return_<n>, ema_<n>, sma_<n>
+    """
+    lengths = panel.lengths
+    close = latest(panel.close, lengths)
+    open_ = latest(panel.open, lengths)
+
+    columns = {
+        "time": latest(panel.times, lengths, 0, np.datetime64("NaT")),
+        "prev_time": latest(panel.times, lengths, 1, np.datetime64("NaT")),
+        "close": close,
+        "open": open_,
+        "day_change": day_change(panel),
+        "open_change": (close - open_) / open_ * 100,
+    }
+    for days in RETURN_PERIODS:
+        columns[f"return_{days}"] = period_change(panel, days)
+    for period in EMA_PERIODS:
+        columns[f"ema_{period}"] = ema_last(panel.close, period)
+    for period in SMA_PERIODS:
+        columns[f"sma_{period}"] = sma_last(panel.close, lengths, period)
+
+    return columns
+
+
+def count_vs(values: np.ndarray, reference: np.ndarray | float = 0.0) -> dict:
+    """Count values above/below/equal to a reference, skipping NaNs."""
+    valid = ~np.isnan(values) & ~np.isnan(reference)
+    values = values[valid]
+    if isinstance(reference, np.ndarray):
+        reference = reference[valid]
+
+    up_count = int((values > reference).sum())
+    down_count = int((values < reference).sum())
+    unchanged_count = int((values == reference).sum())
+
+    total = len(values)
+    pct_up = (up_count / total * 100) if total > 0 else 0.0
+
+    return {
+        "up": up_count,
+        "down": down_count,
+        "unchanged": unchanged_count,
+        "pct_up": round(pct_up, 2),
+    }
+
+
+def breadth_metrics(columns: dict[str, np.ndarray]) -> dict[str, dict]:
+    """All breadth metrics from latest_columns() output."""
+    metrics = {name: count_vs(columns[key]) for name, key in CHANGE_METRICS.items()}
+    for period in EMA_PERIODS:
+        metrics[f"price_to_ema{period}"] = count_vs(columns["close"], columns[f"ema_{period}"])
+    for period in SMA_PERIODS:
+        metrics[f"price_to_sma{period}"] = count_vs(columns["close"], columns[f"sma_{period}"])
+    return metrics
@@ -0,0 +1,318 @@
+"""
+Breadth Materialization
+
+Precomputes breadth metrics and daily threshold bar segments for every
+registered universe once the EOD update has finished, so the breadth and
+threshold endpoints read stored values instead of recomputing them, and
+historical breadth charts become a hash lookup.
+
+Redis layout (records are JSON):
+- tickstock:breadth:daily:{UNIVERSE}  hash: YYYY-MM-DD -> record of that date
+- tickstock:breadth:latest            hash: UNIVERSE -> most recent record
+
+Record:
+    {
+        "date": "2026-02-06",
+        "symbol_count": 503,
+        "metrics": {...},  # BreadthMetricsService metrics
+        "threshold_bars": {
+            "SimpleDivergingBar": {"decline": 41.2, "advance": 58.8},
+            "DivergingThresholdBar:0.05": {...},
+            ...
+        },
+        "calculated_at": "2026-02-06T17:42:10.123456"
+    }
+
+Threshold bars are the last trading day's close-to-close changes
+(timeframe=daily, period_days=1) at each BREADTH_MATERIALIZED_THRESHOLDS value;
+BREADTH_HISTORY_DAYS dates are kept per universe.
+
+Usage:
+    from src.core.services.breadth_materialization import get_breadth_store
+
+    record = get_breadth_store().latest('SPY')
+    history = get_breadth_store().history('SPY', days=30)
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+from threading import Lock
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.core.services.breadth_kernels import breadth_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLDS = (0.01, 0.02, 0.05, 0.10)
+
+
+def threshold_bar_key(bar_type: str, threshold: float) -> str:
+    """Record key of a threshold bar (SimpleDivergingBar ignores the threshold)."""
+    if bar_type == "SimpleDivergingBar":
+        return bar_type
+    return f"{bar_type}:{float(threshold):g}"
+
+
+class BreadthStore:
+    """Per-universe, per-date breadth records in Redis hashes."""
+
+    DAILY_KEY = "tickstock:breadth:daily:{universe}"
+    LATEST_KEY = "tickstock:breadth:latest"
+
+    # Reads skip Redis this long after a failed read instead of paying the
+    # connection retries on every request
+    READ_BACKOFF_SECONDS = 60.0
+
+    def __init__(self, redis_client=None, history_days: int = 400):
+        """
+        Initialize the store.
+
+        Args:
+            redis_client: Optional Redis client with decode_responses=True;
+                created from the application config on first use otherwise
+            history_days: Dates kept per universe
+        """
+        self._redis_client = redis_client
+        self.history_days = max(1, int(history_days))
+        self._read_backoff_until = 0.0
+
+    @property
+    def redis_client(self):
+        if self._redis_client is None:
+            from src.config.redis_config import get_redis_client
+
+            self._redis_client = get_redis_client()
+        return self._redis_client
+
+    def save(self, universe: str, record: dict[str, Any]):
+        """
+        Store a universe's record under its date and as its latest record.
+
+        Raises:
+            redis.RedisError: If the write fails
+        """
+        universe = universe.upper()
+        daily_key = self.DAILY_KEY.format(universe=universe)
+        payload = json.dumps(record)
+
+        pipe = self.redis_client.pipeline()
+        pipe.hset(daily_key, record["date"], payload)
+        pipe.hset(self.LATEST_KEY, universe, payload)
+        pipe.execute()
+
+        dates = sorted(self.redis_client.hkeys(daily_key))
+        expired = dates[:-self.history_days]
+        if expired:
+            self.redis_client.hdel(daily_key, *expired)
+
+    def latest(self, universe: str, max_age_hours: float | None = None) -> dict | None:
+        """
+        Most recent record of a universe.
+
+        Args:
+            universe: Universe key (case-insensitive)
+            max_age_hours: Ignore records calculated longer ago than this
+
+        Returns:
+            Record dict, or None when missing, too old or Redis is unavailable
+        """
+        if time.time() < self._read_backoff_until:
+            return None
+
+        try:
+            payload = self.redis_client.hget(self.LATEST_KEY, universe.upper())
+        except Exception as e:
+            self._read_backoff_until = time.time() + self.READ_BACKOFF_SECONDS
+            logger.warning(f"BREADTH-STORE: Failed to read latest record for {universe}: {e}")
+            return None
+
+        if not payload:
+            return None
+
+        record = json.loads(payload)
+        if max_age_hours is not None:
+            age = datetime.now() - datetime.fromisoformat(record["calculated_at"])
+            if age.total_seconds() > max_age_hours * 3600:
+                return None
+        return record
+
+    def history(self, universe: str, days: int) -> list[dict]:
+        """
+        Records of a universe's last `days` stored dates, oldest first.
+
+        Raises:
+            redis.RedisError: If the read fails
+        """
+        daily_key = self.DAILY_KEY.format(universe=universe.upper())
+        dates = sorted(self.redis_client.hkeys(daily_key))[-days:]
+        if not dates:
+            return []
+        return [json.loads(p) for p in self.redis_client.hmget(daily_key, dates) if p]
+
+
+class BreadthMaterializer:
+    """Computes and stores breadth records for all registered universes."""
+
+    def __init__(
+        self,
+        store: BreadthStore,
+        config: dict[str, Any] | None = None,
+        relationship_cache=None,
+        snapshot_cache=None,
+        threshold_service=None,
+    ):
+        """
+        Initialize the materializer.
+
+        Args:
+            store: BreadthStore the records are written to
+            config: Configuration dictionary with BREADTH_MATERIALIZED_THRESHOLDS
+            relationship_cache: Optional RelationshipCache instance (for testing)
+            snapshot_cache: Optional UniverseSnapshotCache instance (for testing)
+            threshold_service: Optional ThresholdBarService instance (for testing)
+        """
+        config = config or {}
+        self.store = store
+        self.thresholds = sorted({
+            float(t) for t in config.get("BREADTH_MATERIALIZED_THRESHOLDS", DEFAULT_THRESHOLDS)
+        })
+
+        self._relationship_cache = relationship_cache
+        self._snapshot_cache = snapshot_cache
+        self._threshold_service = threshold_service
+
+    @property
+    def relationship_cache(self):
+        if self._relationship_cache is None:
+            from src.core.services.relationship_cache import get_relationship_cache
+
+            self._relationship_cache = get_relationship_cache()
+        return self._relationship_cache
+
+    @property
+    def snapshot_cache(self):
+        if self._snapshot_cache is None:
+            from src.core.services.universe_snapshot_cache import get_universe_snapshot_cache
+
+            self._snapshot_cache = get_universe_snapshot_cache()
+        return self._snapshot_cache
+
+    @property
+    def threshold_service(self):
+        if self._threshold_service is None:
+            from src.core.services.threshold_bar_service import ThresholdBarService
+
+            self._threshold_service = ThresholdBarService(
+                relationship_cache=self.relationship_cache,
+                snapshot_cache=self.snapshot_cache,
+            )
+        return self._threshold_service
+
+    def materialize(self) -> dict[str, Any]:
+        """
+        Materialize every universe from RelationshipCache.get_available_universes().
+
+        A failing universe is logged and skipped.
+
+        Returns:
+            Summary: {'universes': int, 'failed': [names], 'elapsed_ms': float}
+        """
+        start_time = time.time()
+
+        # Snapshots held by a long-running process predate the EOD load
+        self.snapshot_cache.mark_stale()
+
+        stored, failed = 0, []
+        for universe in self.relationship_cache.get_available_universes():
+            name = universe["name"]
+            try:
+                if self.materialize_universe(name) is not None:
+                    stored += 1
+            except Exception as e:
+                logger.error(f"BREADTH-MATERIALIZER: Failed to materialize {name}: {e}")
+                failed.append(name)
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        logger.info(
+            f"BREADTH-MATERIALIZER: Materialized {stored} universes in {elapsed_ms:.1f}ms "
+            f"({len(failed)} failed)"
+        )
+        return {"universes": stored, "failed": failed, "elapsed_ms": round(elapsed_ms, 1)}
+
+    def materialize_universe(self, universe: str) -> dict[str, Any] | None:
+        """
+        Compute and store one universe's record for its latest trading day.
+
+        Returns:
+            The stored record, or None when the universe has no members or bars
+        """
+        symbols = self.relationship_cache.get_universe_symbols(universe)
+        if not symbols:
+            return None
+
+        snapshot = self.snapshot_cache.get_snapshot(universe, symbols)
+        as_of = snapshot.as_of
+        if np.isnat(as_of):
+            return None
+
+        columns = snapshot.columns
+        record = {
+            "date": str(as_of.astype("datetime64[D]")),
+            "symbol_count": len(symbols),
+            "metrics": breadth_metrics(columns),
+            "threshold_bars": self._threshold_bars(columns, as_of),
+            "calculated_at": datetime.now().isoformat(),
+        }
+        self.store.save(universe, record)
+        return record
+
+    def _threshold_bars(self, columns: dict[str, np.ndarray], as_of) -> dict[str, dict]:
+        # Symbols that traded on the latest day, with their close-to-close change
+        traded = (columns["time"] == as_of) & ~np.isnan(columns["day_change"])
+        changes = pd.DataFrame({"pct_change": columns["day_change"][traded]})
+        if changes.empty:
+            return {}
+
+        service = self.threshold_service
+        bars = {
+            threshold_bar_key("SimpleDivergingBar", 0.0): service.calculate_segments(
+                changes, "SimpleDivergingBar", 0.0
+            )
+        }
+        for threshold in self.thresholds:
+            bars[threshold_bar_key("DivergingThresholdBar", threshold)] = (
+                service.calculate_segments(changes, "DivergingThresholdBar", threshold)
+            )
+        return bars
+
+
+# Singleton instance
+_breadth_store: BreadthStore | None = None
+_breadth_store_lock = Lock()
+
+
+def get_breadth_store() -> BreadthStore:
+    """
+    Get singleton breadth store instance
+
+    Returns:
+        BreadthStore configured from the application config
+    """
+    global _breadth_store
+
+    if _breadth_store is None:
+        with _breadth_store_lock:
+            if _breadth_store is None:
+                from src.core.services.config_manager import get_config
+
+                config = get_config()
+                _breadth_store = BreadthStore(
+                    history_days=config.get("BREADTH_HISTORY_DAYS", 400)
+                )
+
+    return _breadth_store
@@ -9,10 +9,24 @@ Sprint 66: Market Breadth Metrics Implementation
 import logging
 from datetime import datetime, timedelta
 
-import numpy as np
 import pandas as pd
 
+from src.core.services.breadth_kernels import (
+    breadth_metrics,
+    count_vs,
+    day_change,
+    ema_last,
+    latest,
+    latest_columns,
+    pack_frame,
+    period_change,
+    sma_last,
+)
 from src.core.services.relationship_cache import get_relationship_cache
+from src.core.services.universe_snapshot_cache import (
+    UniverseSnapshot,
+    get_universe_snapshot_cache,
+)
 from src.infrastructure.database.tickstock_db import TickStockDatabase
 
 logger = logging.getLogger(__name__)
@@ -32,15 +46,17 @@ class BreadthMetricsService:
     - Pandas calculation: <20ms
     """
 
-    def __init__(self, relationship_cache=None, db=None, config=None):
+    def __init__(self, relationship_cache=None, db=None, config=None, snapshot_cache=None):
         """Initialize the breadth metrics service.
 
         Args:
             relationship_cache: Optional RelationshipCache instance (for testing)
             db: Optional TickStockDatabase instance (for testing)
             config: Optional configuration dict for TickStockDatabase
+            snapshot_cache: Optional UniverseSnapshotCache instance (for testing)
         """
         self.relationship_cache = relationship_cache or get_relationship_cache()
+        self.snapshot_cache = snapshot_cache or get_universe_snapshot_cache()
 
         # Initialize database
         if db is not None:
@@ -110,32 +126,18 @@ class BreadthMetricsService:
 
         logger.debug(f"Loaded {len(symbols)} symbols for {universe}")
 
-        # Step 2: Fetch 252 days of OHLCV data (covers all periods up to 1 year)
-        df = self._query_ohlcv_data(symbols, timeframe="daily", period_days=252)
+        # Step 2: Daily bar snapshot of the universe (last 252 bars, shared cache)
+        snapshot = self.snapshot_cache.get_snapshot(universe, symbols)
 
-        if df.empty:
+        if not snapshot.panel.lengths.any():
             raise RuntimeError(
                 f"No OHLCV data available for {universe} "
-                f"(symbols={len(symbols)}, period_days=252). "
+                f"(symbols={len(symbols)}, bars={self.snapshot_cache.max_bars}). "
                 f"Check if daily OHLCV data exists for these symbols."
             )
 
-        logger.debug(f"Queried {len(df)} OHLCV rows")
-
-        # Step 3: Calculate all 12 metrics from same DataFrame
-        metrics = {
-            "day_change": self._calculate_day_change(df),
-            "open_change": self._calculate_open_change(df),
-            "week": self._calculate_period_change(df, 5),
-            "month": self._calculate_period_change(df, 21),
-            "quarter": self._calculate_period_change(df, 63),
-            "half_year": self._calculate_period_change(df, 126),
-            "year": self._calculate_period_change(df, 252),
-            "price_to_ema10": self._calculate_ema_comparison(df, 10),
-            "price_to_ema20": self._calculate_ema_comparison(df, 20),
-            "price_to_sma50": self._calculate_sma_comparison(df, 50),
-            "price_to_sma200": self._calculate_sma_comparison(df, 200),
-        }
+        # Step 3: Count all 12 metrics from the precomputed snapshot columns
+        metrics = self._calculate_snapshot_metrics(snapshot)
 
         elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
         logger.info(
@@ -153,62 +155,34 @@ class BreadthMetricsService:
             },
         }
 
+    def _calculate_snapshot_metrics(self, snapshot: UniverseSnapshot) -> dict:
+        """Calculate all metrics from a snapshot's precomputed latest-bar columns."""
+        return breadth_metrics(snapshot.columns)
+
+    def _calculate_frame_metrics(self, df: pd.DataFrame) -> dict:
+        """Calculate all metrics from an OHLCV DataFrame in one pass.
+
+        Sorts once, reshapes into a (symbols x days) panel and computes every
+        latest-bar value with array operations.
+        """
+        return breadth_metrics(latest_columns(pack_frame(df)))
+
     def _calculate_day_change(self, df: pd.DataFrame) -> dict:
         """Calculate day change: Today close vs yesterday close.
 
         Formula: (close_today - close_yesterday) / close_yesterday
         """
-        df_sorted = df.sort_values(["symbol", "date"])
-
-        # Calculate percentage change per symbol
-        df_sorted["pct_change"] = df_sorted.groupby("symbol")["close"].transform(
-            lambda x: x.pct_change() * 100
-        )
-
-        # Get latest change per symbol
-        latest = df_sorted.groupby("symbol").last().reset_index()
-        latest = latest.dropna(subset=["pct_change"])
-
-        # Count up/down/unchanged
-        up_count = (latest["pct_change"] > 0).sum()
-        down_count = (latest["pct_change"] < 0).sum()
-        unchanged_count = (latest["pct_change"] == 0).sum()
-
-        total = len(latest)
-        pct_up = (up_count / total * 100) if total > 0 else 0.0
-
-        return {
-            "up": int(up_count),
-            "down": int(down_count),
-            "unchanged": int(unchanged_count),
-            "pct_up": round(pct_up, 2),
-        }
+        return count_vs(day_change(pack_frame(df)))
 
     def _calculate_open_change(self, df: pd.DataFrame) -> dict:
         """Calculate open change: Today close vs today open.
 
         Formula: (close_today - open_today) / open_today
         """
-        latest = df.groupby("symbol").last().reset_index()
-
-        # Calculate intraday change
-        latest["pct_change"] = (latest["close"] - latest["open"]) / latest["open"] * 100
-        latest = latest.dropna(subset=["pct_change"])
-
-        # Count up/down/unchanged
-        up_count = (latest["pct_change"] > 0).sum()
-        down_count = (latest["pct_change"] < 0).sum()
-        unchanged_count = (latest["pct_change"] == 0).sum()
-
-        total = len(latest)
-        pct_up = (up_count / total * 100) if total > 0 else 0.0
-
-        return {
-            "up": int(up_count),
-            "down": int(down_count),
-            "unchanged": int(unchanged_count),
-            "pct_up": round(pct_up, 2),
-        }
+        panel = pack_frame(df)
+        close = latest(panel.close, panel.lengths)
+        open_ = latest(panel.open, panel.lengths)
+        return count_vs((close - open_) / open_ * 100)
 
     def _calculate_period_change(self, df: pd.DataFrame, days: int) -> dict:
         """Generic period change calculation.
@@ -219,36 +193,7 @@ class BreadthMetricsService:
 
         Formula: (close_latest - close_N_days_ago) / close_N_days_ago
         """
-        df_sorted = df.sort_values(["symbol", "date"])
-
-        # Calculate change from N days ago per symbol
-        def calc_period_pct_change(x):
-            if len(x) >= days:
-                return (x.iloc[-1] - x.iloc[-days]) / x.iloc[-days] * 100
-            return np.nan
-
-        df_sorted["pct_change"] = df_sorted.groupby("symbol")["close"].transform(
-            calc_period_pct_change
-        )
-
-        # Get latest value per symbol
-        latest = df_sorted.groupby("symbol").last().reset_index()
-        latest = latest.dropna(subset=["pct_change"])
-
-        # Count up/down/unchanged
-        up_count = (latest["pct_change"] > 0).sum()
-        down_count = (latest["pct_change"] < 0).sum()
-        unchanged_count = (latest["pct_change"] == 0).sum()
-
-        total = len(latest)
-        pct_up = (up_count / total * 100) if total > 0 else 0.0
-
-        return {
-            "up": int(up_count),
-            "down": int(down_count),
-            "unchanged": int(unchanged_count),
-            "pct_up": round(pct_up, 2),
-        }
+        return count_vs(period_change(pack_frame(df), days))
 
     def _calculate_ema_comparison(self, df: pd.DataFrame, period: int) -> dict:
         """Calculate price vs EMA comparison.
@@ -259,31 +204,8 @@ class BreadthMetricsService:
 
         Formula: close > EMA(period) → above, close < EMA(period) → below
         """
-        df_sorted = df.sort_values(["symbol", "date"])
-
-        # Calculate EMA per symbol (adjust=False for standard EMA)
-        df_sorted["ema"] = df_sorted.groupby("symbol")["close"].transform(
-            lambda x: x.ewm(span=period, adjust=False, min_periods=period).mean()
-        )
-
-        # Get latest values
-        latest = df_sorted.groupby("symbol").last().reset_index()
-        latest = latest.dropna(subset=["ema"])
-
-        # Count above/below EMA
-        above_count = (latest["close"] > latest["ema"]).sum()
-        below_count = (latest["close"] < latest["ema"]).sum()
-        equal_count = (latest["close"] == latest["ema"]).sum()
-
-        total = len(latest)
-        pct_above = (above_count / total * 100) if total > 0 else 0.0
-
-        return {
-            "up": int(above_count),  # 'up' = above EMA
-            "down": int(below_count),  # 'down' = below EMA
-            "unchanged": int(equal_count),
-            "pct_up": round(pct_above, 2),
-        }
+        panel = pack_frame(df)
+        return count_vs(latest(panel.close, panel.lengths), ema_last(panel.close, period))
 
     def _calculate_sma_comparison(self, df: pd.DataFrame, period: int) -> dict:
         """Calculate price vs SMA comparison.
@@ -294,32 +216,11 @@ class BreadthMetricsService:
 
         Formula: close > SMA(period) → above, close < SMA(period) → below
         """
-        df_sorted = df.sort_values(["symbol", "date"])
-
-        # Calculate SMA per symbol (min_periods=period for true SMA)
-        df_sorted["sma"] = df_sorted.groupby("symbol")["close"].transform(
-            lambda x: x.rolling(window=period, min_periods=period).mean()
+        panel = pack_frame(df)
+        return count_vs(
+            latest(panel.close, panel.lengths), sma_last(panel.close, panel.lengths, period)
         )
 
-        # Get latest values
-        latest = df_sorted.groupby("symbol").last().reset_index()
-        latest = latest.dropna(subset=["sma"])
-
-        # Count above/below SMA
-        above_count = (latest["close"] > latest["sma"]).sum()
-        below_count = (latest["close"] < latest["sma"]).sum()
-        equal_count = (latest["close"] == latest["sma"]).sum()
-
-        total = len(latest)
-        pct_above = (above_count / total * 100) if total > 0 else 0.0
-
-        return {
-            "up": int(above_count),  # 'up' = above SMA
-            "down": int(below_count),  # 'down' = below SMA
-            "unchanged": int(equal_count),
-            "pct_up": round(pct_above, 2),
-        }
-
     def _query_ohlcv_data(
         self, symbols: list[str], timeframe: str = "daily", period_days: int = 252
     ) -> pd.DataFrame:
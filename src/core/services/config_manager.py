@@ -71,6 +71,52 @@ class ConfigManager:
         "TICKSTOCK_DB_NAME": "tickstock",
         "TICKSTOCK_DB_USER": "app_readwrite",
         "TICKSTOCK_DB_PASSWORD": "password",  # Default placeholder - must be set in .env
+        # Shared connection pool sizes per role
+        "DB_POOL_UI_SIZE": 5,
+        "DB_POOL_UI_MAX_OVERFLOW": 2,
+        "DB_POOL_ANALYSIS_SIZE": 10,
+        "DB_POOL_ANALYSIS_MAX_OVERFLOW": 5,
+        "DB_POOL_ADMIN_SIZE": 3,
+        "DB_POOL_ADMIN_MAX_OVERFLOW": 2,
+        "DB_POOL_CACHE_SIZE": 2,
+        "DB_POOL_CACHE_MAX_OVERFLOW": 2,
+        # Batched ohlcv_1min writer and minute bar aggregation
+        "OHLCV_WRITER_FLUSH_INTERVAL_MS": 250,
+        "OHLCV_WRITER_MAX_BATCH_ROWS": 1000,
+        "OHLCV_WRITER_MAX_PENDING_ROWS": 20000,
+        "MINUTE_BAR_WATERMARK_SECONDS": 5,
+        # Real-time bar analysis worker pool
+        "BAR_ANALYSIS_WORKERS": 4,
+        "BAR_ANALYSIS_MAX_QUEUE_DEPTH": 5000,
+        "BAR_ANALYSIS_OVERFLOW_POLICY": "drop_oldest",
+        # In-memory OHLCV windows for bar analysis
+        "OHLCV_WINDOW_BARS": 250,
+        "OHLCV_WINDOW_MAX_WINDOWS": 10000,
+        "OHLCV_WINDOW_IDLE_TTL_SECONDS": 14400,
+        "OHLCV_WINDOW_LOAD_CHUNK_SIZE": 500,
+        # Admin analysis job process pool (0 = analyze on the job thread)
+        "ANALYSIS_JOB_WORKERS": 4,
+        "ANALYSIS_JOB_CHUNK_SIZE": 100,
+        # Async /api/analysis/universe jobs (thread pool shared by all jobs)
+        "UNIVERSE_JOB_WORKERS": 4,
+        "UNIVERSE_JOB_CHUNK_SIZE": 50,
+        "UNIVERSE_JOB_FIRST_CHUNK_SIZE": 5,
+        "UNIVERSE_JOB_TTL_SECONDS": 900,
+        # Scheduled daily_patterns retention cleanup
+        "PATTERN_RETENTION_HOURS": 48,
+        "PATTERN_RETENTION_INTERVAL_SECONDS": 3600,
+        # Shared daily bar snapshots for breadth/threshold endpoints
+        "UNIVERSE_SNAPSHOT_BARS": 252,
+        "UNIVERSE_SNAPSHOT_REFRESH_SECONDS": 300,
+        "UNIVERSE_SNAPSHOT_MAX_UNIVERSES": 32,
+        # Breadth/threshold results materialized after the EOD update
+        "BREADTH_MATERIALIZED_THRESHOLDS": [0.01, 0.02, 0.05, 0.10],
+        "BREADTH_HISTORY_DAYS": 400,
+        "BREADTH_MATERIALIZED_MAX_AGE_HOURS": 96,
+        # Pattern alert WebSocket fan-out and SocketIO transport options
+        "PATTERN_ALERT_ROOMS_PER_EMIT": 1000,
+        "SOCKETIO_SERIALIZER": "default",  # 'msgpack' needs socket.io-msgpack-parser on the client
+        "SOCKETIO_COMPRESSION_THRESHOLD": 1024,  # Bytes; smaller packets are sent uncompressed
         "COLLECTION_INTERVAL": COLLECTION_INTERVAL,
         "EMISSION_INTERVAL": EMISSION_INTERVAL,
         "USE_MASSIVE_API": False,
@@ -284,6 +330,52 @@ class ConfigManager:
         "TICKSTOCKPL_HOST": str,
         "TICKSTOCKPL_PORT": int,
         "TICKSTOCKPL_API_KEY": str,
+        # Shared connection pool size types
+        "DB_POOL_UI_SIZE": int,
+        "DB_POOL_UI_MAX_OVERFLOW": int,
+        "DB_POOL_ANALYSIS_SIZE": int,
+        "DB_POOL_ANALYSIS_MAX_OVERFLOW": int,
+        "DB_POOL_ADMIN_SIZE": int,
+        "DB_POOL_ADMIN_MAX_OVERFLOW": int,
+        "DB_POOL_CACHE_SIZE": int,
+        "DB_POOL_CACHE_MAX_OVERFLOW": int,
+        # Batched ohlcv_1min writer and minute bar aggregation types
+        "OHLCV_WRITER_FLUSH_INTERVAL_MS": int,
+        "OHLCV_WRITER_MAX_BATCH_ROWS": int,
+        "OHLCV_WRITER_MAX_PENDING_ROWS": int,
+        "MINUTE_BAR_WATERMARK_SECONDS": float,
+        # Real-time bar analysis worker pool types
+        "BAR_ANALYSIS_WORKERS": int,
+        "BAR_ANALYSIS_MAX_QUEUE_DEPTH": int,
+        "BAR_ANALYSIS_OVERFLOW_POLICY": str,
+        # In-memory OHLCV window types
+        "OHLCV_WINDOW_BARS": int,
+        "OHLCV_WINDOW_MAX_WINDOWS": int,
+        "OHLCV_WINDOW_IDLE_TTL_SECONDS": float,
+        "OHLCV_WINDOW_LOAD_CHUNK_SIZE": int,
+        # Admin analysis job process pool types
+        "ANALYSIS_JOB_WORKERS": int,
+        "ANALYSIS_JOB_CHUNK_SIZE": int,
+        # Async universe analysis job types
+        "UNIVERSE_JOB_WORKERS": int,
+        "UNIVERSE_JOB_CHUNK_SIZE": int,
+        "UNIVERSE_JOB_FIRST_CHUNK_SIZE": int,
+        "UNIVERSE_JOB_TTL_SECONDS": float,
+        # Scheduled daily_patterns retention cleanup types
+        "PATTERN_RETENTION_HOURS": float,
+        "PATTERN_RETENTION_INTERVAL_SECONDS": float,
+        # Shared daily bar snapshot types
+        "UNIVERSE_SNAPSHOT_BARS": int,
+        "UNIVERSE_SNAPSHOT_REFRESH_SECONDS": float,
+        "UNIVERSE_SNAPSHOT_MAX_UNIVERSES": int,
+        # Materialized breadth types
+        "BREADTH_MATERIALIZED_THRESHOLDS": list,
+        "BREADTH_HISTORY_DAYS": int,
+        "BREADTH_MATERIALIZED_MAX_AGE_HOURS": float,
+        # Pattern alert fan-out / SocketIO transport types
+        "PATTERN_ALERT_ROOMS_PER_EMIT": int,
+        "SOCKETIO_SERIALIZER": str,
+        "SOCKETIO_COMPRESSION_THRESHOLD": int,
         # LOGGING CONFIGURATION TYPES
         "LOG_CONSOLE_VERBOSE": bool,
         "LOG_CONSOLE_DEBUG": bool,
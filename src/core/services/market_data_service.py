@@ -13,11 +13,12 @@ import logging
 import threading
 import time
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
 from src.core.domain.market.tick import TickData
+from src.core.services.minute_bar_aggregator import MinuteBar, MinuteBarAggregator
 from src.infrastructure.data_sources.adapters.realtime_adapter import (
     RealTimeDataAdapter,
     SyntheticDataAdapter,
@@ -30,6 +31,7 @@ class ServiceStats:
     """Simple service statistics."""
     ticks_processed: int = 0
     events_published: int = 0
+    database_writes_completed: int = 0
     start_time: float = None
     last_tick_time: float = None
 
@@ -56,6 +58,19 @@ class MarketDataService:
         self._service_thread = None
         self._shutdown_event = threading.Event()
 
+        # Per-second ticks -> closed 1-minute bars (config may be a plain object in tests)
+        self.bar_aggregator = MinuteBarAggregator(config if isinstance(config, dict) else None)
+
+        # Batched ohlcv_1min writer (created on first tick)
+        self._ohlcv_writer = None
+        self._writer_lock = threading.Lock()
+
+        # Bounded bar analysis worker pool (created on first flushed bar)
+        self._analysis_scheduler = None
+        self._scheduler_lock = threading.Lock()
+        self._ohlcv_service = None
+        self._worker_local = threading.local()
+
         logger.info("MARKET-DATA-SERVICE: Simplified service initialized")
 
     def start(self) -> bool:
@@ -96,6 +111,20 @@ class MarketDataService:
         if self.data_adapter:
             self.data_adapter.disconnect()
 
+        # Persist open minute bars and flush remaining writes before shutdown
+        try:
+            open_bars = self.bar_aggregator.flush_all()
+            if open_bars:
+                self._write_closed_bars(open_bars)
+        except Exception as e:
+            logger.error(f"MARKET-DATA-SERVICE: Final minute bar flush error: {e}")
+
+        if self._ohlcv_writer:
+            self._ohlcv_writer.stop()
+
+        if self._analysis_scheduler:
+            self._analysis_scheduler.stop()
+
         # Wait for service thread to finish
         if self._service_thread and self._service_thread.is_alive():
             self._service_thread.join(timeout=5.0)
@@ -128,13 +157,25 @@ class MarketDataService:
             # Get universe of tickers to monitor
             universe = self._get_universe()
 
+            # Preload daily windows so bar analysis never re-queries history
+            self._load_analysis_windows(universe)
+
             # Connect to data source
             if self.data_adapter and self.data_adapter.connect(universe):
                 logger.info(f"MARKET-DATA-SERVICE: Connected to data source with {len(universe)} tickers")
 
                 # Keep service running
+                loop_count = 0
                 while self.running and not self._shutdown_event.is_set():
                     time.sleep(1.0)
+                    loop_count += 1
+
+                    # Emit minute bars for symbols whose minute has closed
+                    self._flush_due_bars()
+
+                    # Drop OHLCV windows for symbols that went inactive
+                    if loop_count % 60 == 0:
+                        self._get_window_store().evict_inactive()
 
                     # Log stats periodically
                     self._log_stats_if_needed()
@@ -166,7 +207,7 @@ class MarketDataService:
 
             if universe_tickers and len(universe_tickers) > 0:
                 logger.info(f"MARKET-DATA-SERVICE: Using universe '{universe_key}' with {len(universe_tickers)} tickers: {', '.join(universe_tickers[:10])}{'...' if len(universe_tickers) > 10 else ''}")
-                return universe_tickers
+                return list(universe_tickers)
             logger.warning(f"MARKET-DATA-SERVICE: Universe key '{universe_key}' not found or empty, using default")
 
         except Exception as e:
@@ -201,48 +242,11 @@ class MarketDataService:
                     tick_data.timestamp
                 )
 
-            # STAGE 3: Write to database (NEW - Sprint 54)
+            # STAGE 3: Fold tick into its 1-minute bar; persist bars as they close
             try:
-                # Extract OHLCV fields from TickData
-                symbol = tick_data.ticker
-
-                # Convert Unix timestamp to timezone-aware datetime
-                timestamp = datetime.fromtimestamp(tick_data.timestamp, tz=UTC)
-
-                # Use tick-level OHLCV if available (Massive 'A' events), else fall back to current price
-                open_price = getattr(tick_data, 'tick_open', None) or tick_data.price
-                high_price = getattr(tick_data, 'tick_high', None) or tick_data.price
-                low_price = getattr(tick_data, 'tick_low', None) or tick_data.price
-                close_price = getattr(tick_data, 'tick_close', None) or tick_data.price
-                volume = getattr(tick_data, 'tick_volume', None) or tick_data.volume or 0
-
-                # Lazy initialize database connection
-                if not hasattr(self, '_db'):
-                    from src.core.services.config_manager import get_config
-                    from src.infrastructure.database.tickstock_db import TickStockDatabase
-                    self._db = TickStockDatabase(get_config())
-
-                # Write to database (async, non-blocking)
-                success = self._db.write_ohlcv_1min(
-                    symbol=symbol,
-                    timestamp=timestamp,
-                    open_price=Decimal(str(open_price)),
-                    high_price=Decimal(str(high_price)),
-                    low_price=Decimal(str(low_price)),
-                    close_price=Decimal(str(close_price)),
-                    volume=int(volume)
-                )
-
-                if success:
-                    # Track successful database writes
-                    if not hasattr(self.stats, 'database_writes_completed'):
-                        self.stats.database_writes_completed = 0
-                    self.stats.database_writes_completed += 1
-
-                    # Sprint 75 Phase 1: Trigger pattern/indicator analysis
-                    self._trigger_bar_analysis_async(symbol, timestamp)
-                else:
-                    logger.warning(f"MARKET-DATA-SERVICE: Database write failed for {symbol} at {timestamp}")
+                closed_bars = self.bar_aggregator.add_tick(tick_data)
+                if closed_bars:
+                    self._write_closed_bars(closed_bars)
 
             except Exception as e:
                 logger.error(f"MARKET-DATA-SERVICE: Database write error for {tick_data.ticker}: {e}")
@@ -257,12 +261,95 @@ class MarketDataService:
         except Exception as e:
             logger.error(f"MARKET-DATA-SERVICE: Error handling tick data: {e}")
 
+    def _write_closed_bars(self, bars: list[MinuteBar]):
+        """Queue closed minute bars for the batched ohlcv_1min writer."""
+        writer = self._get_ohlcv_writer()
+        window_store = self._get_window_store()
+
+        for bar in bars:
+            # Keep the in-memory daily window current for bar analysis
+            window_store.fold_into_daily(
+                bar.symbol, bar.timestamp, bar.open, bar.high, bar.low, bar.close, bar.volume
+            )
+
+            # Analysis is triggered from _handle_bars_flushed once persisted
+            queued = writer.submit(
+                symbol=bar.symbol,
+                timestamp=bar.timestamp,
+                open_price=Decimal(str(bar.open)),
+                high_price=Decimal(str(bar.high)),
+                low_price=Decimal(str(bar.low)),
+                close_price=Decimal(str(bar.close)),
+                volume=int(bar.volume)
+            )
+
+            if not queued:
+                logger.debug(
+                    f"MARKET-DATA-SERVICE: OHLCV writer backpressure, dropped {bar.symbol} at {bar.timestamp}"
+                )
+
+    def _flush_due_bars(self):
+        """Close bars whose minute has passed the watermark (symbols that went quiet)."""
+        try:
+            closed_bars = self.bar_aggregator.flush_due()
+            if closed_bars:
+                self._write_closed_bars(closed_bars)
+        except Exception as e:
+            logger.error(f"MARKET-DATA-SERVICE: Minute bar flush error: {e}")
+
+    def _get_window_store(self):
+        """Shared in-memory OHLCV windows used by bar analysis."""
+        from src.analysis.data.ohlcv_window_store import get_ohlcv_window_store
+        from src.core.services.config_manager import get_config
+        return get_ohlcv_window_store(get_config())
+
+    def _load_analysis_windows(self, universe: list[str]):
+        """Bulk-load daily OHLCV windows for the universe before streaming starts."""
+        try:
+            self._get_window_store().bulk_load(universe, 'daily')
+        except Exception as e:
+            logger.error(f"MARKET-DATA-SERVICE: Failed to preload OHLCV windows: {e}")
+
+    def _get_ohlcv_writer(self):
+        """Lazily create and start the batched ohlcv_1min writer."""
+        if self._ohlcv_writer is None:
+            with self._writer_lock:
+                if self._ohlcv_writer is None:
+                    from src.core.services.config_manager import get_config
+                    from src.infrastructure.database.ohlcv_bulk_writer import OHLCVBulkWriter
+                    from src.infrastructure.database.tickstock_db import TickStockDatabase
+
+                    config = get_config()
+                    # ohlcv_1min writes go through the analysis pool, not the read-only UI pool
+                    self._db = TickStockDatabase(config, role='analysis')
+                    writer = OHLCVBulkWriter(self._db, config, on_flush=self._handle_bars_flushed)
+                    writer.start()
+                    self._ohlcv_writer = writer
+        return self._ohlcv_writer
+
+    def _handle_bars_flushed(self, bars: list[dict[str, Any]]):
+        """Track persisted bars and trigger analysis once per flushed symbol."""
+        self.stats.database_writes_completed += len(bars)
+
+        # Latest flushed timestamp per symbol - one analysis per symbol per flush
+        latest: dict[str, datetime] = {}
+        for bar in bars:
+            symbol = bar['symbol']
+            if symbol not in latest or bar['timestamp'] > latest[symbol]:
+                latest[symbol] = bar['timestamp']
+
+        for symbol, timestamp in latest.items():
+            # Sprint 75 Phase 1: Trigger pattern/indicator analysis
+            self._trigger_bar_analysis_async(symbol, timestamp)
+
     def _trigger_bar_analysis_async(self, symbol: str, timestamp: datetime):
         """
         Trigger pattern/indicator analysis for newly created OHLCV bar.
 
         Sprint 75 Phase 1: Real-Time WebSocket Integration
-        Runs in background thread to avoid blocking tick ingestion.
+        Queues the symbol on the bounded analysis scheduler to avoid blocking
+        tick ingestion. A symbol already waiting is merged rather than queued
+        again, so bursts never spawn extra threads or DB connections.
 
         Performance target: <100ms total (non-blocking)
 
@@ -270,21 +357,43 @@ class MarketDataService:
             symbol: Stock symbol (e.g., 'AAPL')
             timestamp: Bar timestamp (timezone-aware datetime)
         """
-        def run_analysis():
-            try:
-                # Import here to avoid circular dependency
-                from src.analysis.services.analysis_service import AnalysisService
-                from src.analysis.data.ohlcv_data_service import OHLCVDataService
-                from src.api.rest.admin_process_analysis import (
-                    _persist_pattern_results,
-                    _persist_indicator_results,
-                    _cleanup_old_patterns
-                )
+        self._get_analysis_scheduler().submit(symbol, timestamp)
+
+    def _get_analysis_scheduler(self):
+        """Lazily create and start the bar analysis worker pool."""
+        if self._analysis_scheduler is None:
+            with self._scheduler_lock:
+                if self._analysis_scheduler is None:
+                    from src.core.services.bar_analysis_scheduler import BarAnalysisScheduler
+                    from src.core.services.config_manager import get_config
+
+                    scheduler = BarAnalysisScheduler(self._run_bar_analysis, get_config())
+                    scheduler.start()
+                    self._analysis_scheduler = scheduler
+        return self._analysis_scheduler
+
+    def _run_bar_analysis(self, symbol: str, timestamp: datetime):
+        """Run analysis for one bar on a scheduler worker thread."""
+        try:
+            # Import here to avoid circular dependency
+            from src.analysis.services.analysis_service import AnalysisService
+            from src.analysis.data.ohlcv_data_service import OHLCVDataService
+            from src.api.rest.admin_process_analysis import (
+                _persist_pattern_results,
+                _persist_indicator_results,
+            )
 
-                # Fetch last 200 DAILY bars (sufficient for all patterns/indicators)
-                # Sprint 76: Fixed to use 'daily' data (was '1min' causing incorrect SMA values)
-                ohlcv_service = OHLCVDataService()
-                data = ohlcv_service.get_ohlcv_data(
+            # Read DAILY bars from the in-memory window (kept current by closed minute bars)
+            # Sprint 76: Fixed to use 'daily' data (was '1min' causing incorrect SMA values)
+            window_store = self._get_window_store()
+            data = window_store.get_frame(symbol, 'daily')
+
+            if data is None:
+                # Window not loaded yet - fetch last 200 daily bars once and keep them
+                with self._scheduler_lock:
+                    if self._ohlcv_service is None:
+                        self._ohlcv_service = OHLCVDataService()
+                data = self._ohlcv_service.get_ohlcv_data(
                     symbol=symbol,
                     timeframe='daily',
                     limit=200
@@ -299,59 +408,53 @@ class MarketDataService:
                 # Ensure column is named 'timestamp' (may be 'date' from daily tables)
                 if 'date' in data.columns:
                     data = data.rename(columns={'date': 'timestamp'})
-
-                # Run analysis with all available patterns/indicators
-                # Note: Use 'daily' for loading patterns/indicators (registered for 'daily' timeframe)
-                # Candlestick patterns are timeframe-agnostic and work on any OHLCV data
+                window_store.load_frame(symbol, 'daily', data)
+
+            # Run analysis with all available patterns/indicators
+            # Note: Use 'daily' for loading patterns/indicators (registered for 'daily' timeframe)
+            # Candlestick patterns are timeframe-agnostic and work on any OHLCV data
+            # One AnalysisService per worker thread, reused across bars
+            analysis_service = getattr(self._worker_local, 'analysis_service', None)
+            if analysis_service is None:
                 analysis_service = AnalysisService()
-                results = analysis_service.analyze_symbol(
-                    symbol=symbol,
-                    data=data,
-                    timeframe='daily',  # Load patterns/indicators registered for 'daily'
-                    indicators=None,  # Use all available (18 indicators)
-                    patterns=None,    # Use all available (8 patterns)
-                    calculate_all=True
-                )
-
-                # Persist results with 'daily' timeframe (matches data source)
-                # Sprint 76: Changed from '1min' to 'daily' to match fetched data
-                _persist_pattern_results(symbol, results['patterns'], 'daily')
-                _persist_indicator_results(symbol, results['indicators'], 'daily')
-
-                # Cleanup old patterns (48-hour retention from Sprint 74)
-                _cleanup_old_patterns()
-
-                # Publish Redis event for UI updates
-                try:
-                    from src.infrastructure.redis.redis_connection_manager import get_redis_manager
-                    redis_manager = get_redis_manager()
-                    if redis_manager:
-                        event_data = {
-                            'symbol': symbol,
-                            'timestamp': timestamp.isoformat(),
-                            'timeframe': '1min',
-                            'patterns_detected': len([p for p in results['patterns'].values() if p['detected']]),
-                            'indicators_calculated': len(results['indicators'])
-                        }
-                        redis_manager.publish_message('tickstock:events:analysis_complete', event_data)
-                except Exception as e:
-                    logger.warning(f"ANALYSIS: Redis event publish failed: {e}")
+                self._worker_local.analysis_service = analysis_service
+            results = analysis_service.analyze_symbol(
+                symbol=symbol,
+                data=data,
+                timeframe='daily',  # Load patterns/indicators registered for 'daily'
+                indicators=None,  # Use all available (18 indicators)
+                patterns=None,    # Use all available (8 patterns)
+                calculate_all=True
+            )
 
-                logger.info(
-                    f"ANALYSIS: Bar analysis complete for {symbol} at {timestamp}: "
-                    f"{len(results['patterns'])} patterns, {len(results['indicators'])} indicators"
-                )
+            # Persist results with 'daily' timeframe (matches data source)
+            # Sprint 76: Changed from '1min' to 'daily' to match fetched data
+            _persist_pattern_results(symbol, results['patterns'], 'daily')
+            _persist_indicator_results(symbol, results['indicators'], 'daily')
 
+            # Publish Redis event for UI updates
+            try:
+                from src.infrastructure.redis.redis_connection_manager import get_redis_manager
+                redis_manager = get_redis_manager()
+                if redis_manager:
+                    event_data = {
+                        'symbol': symbol,
+                        'timestamp': timestamp.isoformat(),
+                        'timeframe': '1min',
+                        'patterns_detected': len([p for p in results['patterns'].values() if p['detected']]),
+                        'indicators_calculated': len(results['indicators'])
+                    }
+                    redis_manager.publish_message('tickstock:events:analysis_complete', event_data)
             except Exception as e:
-                logger.error(f"ANALYSIS: Bar analysis failed for {symbol} at {timestamp}: {e}", exc_info=True)
+                logger.warning(f"ANALYSIS: Redis event publish failed: {e}")
+
+            logger.info(
+                f"ANALYSIS: Bar analysis complete for {symbol} at {timestamp}: "
+                f"{len(results['patterns'])} patterns, {len(results['indicators'])} indicators"
+            )
 
-        # Spawn background thread (non-blocking)
-        thread = threading.Thread(
-            target=run_analysis,
-            daemon=True,
-            name=f"BarAnalysis-{symbol}-{timestamp.strftime('%H%M%S')}"
-        )
-        thread.start()
+        except Exception as e:
+            logger.error(f"ANALYSIS: Bar analysis failed for {symbol} at {timestamp}: {e}", exc_info=True)
 
     def _handle_status_update(self, status: str, data: dict[str, Any] = None):
         """Handle status updates from data sources."""
@@ -381,18 +484,29 @@ class MarketDataService:
             'events_published': self.stats.events_published,
             'uptime_seconds': uptime,
             'tick_rate': self.stats.ticks_processed / uptime if uptime > 0 else 0,
-            'last_tick_time': self.stats.last_tick_time
+            'last_tick_time': self.stats.last_tick_time,
+            'database_writes_completed': self.stats.database_writes_completed
         }
 
         # Add publisher stats if available
-        if self.data_publisher:
-            publisher_stats = self.data_publisher.get_stats()
+        data_publisher = getattr(self, 'data_publisher', None)
+        if data_publisher:
+            publisher_stats = data_publisher.get_stats()
             base_stats.update({f'publisher_{k}': v for k, v in publisher_stats.items()})
 
-        if self.websocket_publisher:
-            ws_stats = self.websocket_publisher.get_stats()
+        websocket_publisher = getattr(self, 'websocket_publisher', None)
+        if websocket_publisher:
+            ws_stats = websocket_publisher.get_stats()
             base_stats.update({f'websocket_{k}': v for k, v in ws_stats.items()})
 
+        base_stats.update({f'bar_aggregator_{k}': v for k, v in self.bar_aggregator.get_stats().items()})
+
+        if self._ohlcv_writer:
+            base_stats.update({f'ohlcv_writer_{k}': v for k, v in self._ohlcv_writer.get_stats().items()})
+
+        if self._analysis_scheduler:
+            base_stats.update({f'analysis_{k}': v for k, v in self._analysis_scheduler.get_stats().items()})
+
         return base_stats
 
     def is_running(self) -> bool:
@@ -401,12 +515,24 @@ class MarketDataService:
 
     def get_health_status(self) -> dict[str, Any]:
         """Get health status for monitoring."""
+        data_publisher = getattr(self, 'data_publisher', None)
         health_status = {
             'service_running': self.running,
             'ticks_processed': self.stats.ticks_processed,
             'last_tick_age_seconds': time.time() - self.stats.last_tick_time if self.stats.last_tick_time else None,
             'data_adapter_connected': self.data_adapter is not None,
-            'redis_connected': self.data_publisher.redis_client is not None if self.data_publisher else False
+            'redis_connected': data_publisher.redis_client is not None if data_publisher else False,
+            'database_writes_completed': self.stats.database_writes_completed
         }
 
+        health_status['bar_aggregator'] = self.bar_aggregator.get_stats()
+
+        if self._ohlcv_writer:
+            health_status['ohlcv_writer'] = self._ohlcv_writer.get_stats()
+
+        if self._analysis_scheduler:
+            health_status['analysis_scheduler'] = self._analysis_scheduler.get_stats()
+
+        health_status['ohlcv_windows'] = self._get_window_store().get_stats()
+
         return health_status
@@ -0,0 +1,239 @@
+"""
+Minute Bar Aggregator
+Folds per-second aggregate ('A') ticks into 1-minute OHLCV bars.
+
+Sits between RealTimeDataAdapter and the ohlcv_1min writer so that only one
+closed bar per symbol-minute is persisted instead of up to 60 per-second rows.
+
+- One open bar per symbol, stored in preallocated NumPy column arrays
+- High/low/close/volume/VWAP updated in place on every tick
+- A bar is emitted when the symbol's next tick crosses a minute boundary,
+  or when the watermark (wall clock minus a grace period) passes its minute
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+
+from src.core.domain.market.tick import TickData
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for slots without an open bar
+_NO_BAR = -1
+
+
+@dataclass
+class MinuteBar:
+    """Closed 1-minute OHLCV bar."""
+    symbol: str
+    timestamp: datetime  # Minute start (UTC)
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+    vwap: float
+    tick_count: int
+
+
+class MinuteBarAggregator:
+    """Array-backed per-symbol minute bar builder."""
+
+    def __init__(self, config: dict[str, Any] | None = None, initial_capacity: int = 512):
+        """
+        Initialize aggregator.
+
+        Args:
+            config: Configuration dictionary with aggregator settings
+            initial_capacity: Number of symbol slots to preallocate
+        """
+        self.config = config or {}
+        self.watermark_seconds = float(self.config.get('MINUTE_BAR_WATERMARK_SECONDS', 5))
+
+        # Symbol -> slot index into the column arrays
+        self._slots: dict[str, int] = {}
+        self._symbols: list[str] = []
+        self._capacity = 0
+
+        self._minute = np.empty(0, dtype=np.int64)
+        self._open = np.empty(0, dtype=np.float64)
+        self._high = np.empty(0, dtype=np.float64)
+        self._low = np.empty(0, dtype=np.float64)
+        self._close = np.empty(0, dtype=np.float64)
+        self._volume = np.empty(0, dtype=np.int64)
+        self._pv = np.empty(0, dtype=np.float64)  # Sum of price * volume for VWAP
+        self._ticks = np.empty(0, dtype=np.int32)
+        self._last_emitted = np.empty(0, dtype=np.int64)
+        self._grow(initial_capacity)
+
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.stats = {
+            'ticks_received': 0,
+            'bars_emitted': 0,
+            'bars_emitted_by_watermark': 0,
+            'late_ticks_dropped': 0
+        }
+
+    def _grow(self, capacity: int):
+        """Resize column arrays to hold at least `capacity` symbols."""
+        old = self._capacity
+
+        def resize(array: np.ndarray, fill) -> np.ndarray:
+            grown = np.full(capacity, fill, dtype=array.dtype)
+            grown[:old] = array[:old]
+            return grown
+
+        self._minute = resize(self._minute, _NO_BAR)
+        self._open = resize(self._open, 0.0)
+        self._high = resize(self._high, 0.0)
+        self._low = resize(self._low, 0.0)
+        self._close = resize(self._close, 0.0)
+        self._volume = resize(self._volume, 0)
+        self._pv = resize(self._pv, 0.0)
+        self._ticks = resize(self._ticks, 0)
+        self._last_emitted = resize(self._last_emitted, _NO_BAR)
+        self._capacity = capacity
+
+    def _slot_for(self, symbol: str) -> int:
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = len(self._symbols)
+            if slot >= self._capacity:
+                self._grow(max(self._capacity * 2, 1))
+            self._slots[symbol] = slot
+            self._symbols.append(symbol)
+        return slot
+
+    @staticmethod
+    def _minute_of(tick: TickData) -> int:
+        """Minute bucket (epoch seconds) for a tick, based on its window start."""
+        start = tick.tick_start_timestamp or tick.timestamp
+        return int(start // 60) * 60
+
+    def add_tick(self, tick: TickData) -> list[MinuteBar]:
+        """
+        Fold a tick into its symbol's open bar.
+
+        Args:
+            tick: Per-second aggregate or trade tick
+
+        Returns:
+            list[MinuteBar]: The symbol's previous bar if this tick closed it, else empty
+        """
+        minute = self._minute_of(tick)
+        open_price = tick.tick_open or tick.price
+        high_price = tick.tick_high or tick.price
+        low_price = tick.tick_low or tick.price
+        close_price = tick.tick_close or tick.price
+        volume = tick.tick_volume or tick.volume or 0
+        vwap = tick.tick_vwap or close_price
+
+        closed = []
+        with self._lock:
+            self.stats['ticks_received'] += 1
+            slot = self._slot_for(tick.ticker)
+            current = self._minute[slot]
+
+            if minute <= self._last_emitted[slot] or (current != _NO_BAR and minute < current):
+                # Bar for this minute was already emitted
+                self.stats['late_ticks_dropped'] += 1
+                return closed
+
+            if current != _NO_BAR and minute > current:
+                closed.append(self._emit(slot))
+                current = _NO_BAR
+
+            if current == _NO_BAR:
+                self._minute[slot] = minute
+                self._open[slot] = open_price
+                self._high[slot] = high_price
+                self._low[slot] = low_price
+                self._close[slot] = close_price
+                self._volume[slot] = volume
+                self._pv[slot] = vwap * volume
+                self._ticks[slot] = 1
+            else:
+                if high_price > self._high[slot]:
+                    self._high[slot] = high_price
+                if low_price < self._low[slot]:
+                    self._low[slot] = low_price
+                self._close[slot] = close_price
+                self._volume[slot] += volume
+                self._pv[slot] += vwap * volume
+                self._ticks[slot] += 1
+
+        return closed
+
+    def flush_due(self, now: float | None = None) -> list[MinuteBar]:
+        """
+        Emit open bars whose minute ended before the watermark.
+
+        Args:
+            now: Current epoch seconds (defaults to wall clock)
+
+        Returns:
+            list[MinuteBar]: Bars closed by the watermark
+        """
+        watermark = (now if now is not None else time.time()) - self.watermark_seconds
+
+        with self._lock:
+            count = len(self._symbols)
+            minutes = self._minute[:count]
+            due = np.flatnonzero((minutes != _NO_BAR) & (minutes + 60 <= watermark))
+            bars = [self._emit(int(slot)) for slot in due]
+            self.stats['bars_emitted_by_watermark'] += len(bars)
+
+        return bars
+
+    def flush_all(self) -> list[MinuteBar]:
+        """Emit every open bar regardless of watermark (used on shutdown)."""
+        with self._lock:
+            count = len(self._symbols)
+            open_slots = np.flatnonzero(self._minute[:count] != _NO_BAR)
+            return [self._emit(int(slot)) for slot in open_slots]
+
+    def _emit(self, slot: int) -> MinuteBar:
+        """Build a MinuteBar from a slot and mark the slot empty. Caller holds the lock."""
+        minute = int(self._minute[slot])
+        volume = int(self._volume[slot])
+        close_price = float(self._close[slot])
+
+        bar = MinuteBar(
+            symbol=self._symbols[slot],
+            timestamp=datetime.fromtimestamp(minute, tz=UTC),
+            open=float(self._open[slot]),
+            high=float(self._high[slot]),
+            low=float(self._low[slot]),
+            close=close_price,
+            volume=volume,
+            vwap=float(self._pv[slot]) / volume if volume > 0 else close_price,
+            tick_count=int(self._ticks[slot])
+        )
+
+        self._last_emitted[slot] = minute
+        self._minute[slot] = _NO_BAR
+        self.stats['bars_emitted'] += 1
+        return bar
+
+    def open_bar_count(self) -> int:
+        """Number of symbols with a bar currently in progress."""
+        with self._lock:
+            return int(np.count_nonzero(self._minute[:len(self._symbols)] != _NO_BAR))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get aggregator statistics."""
+        stats = self.stats.copy()
+        stats['symbols_tracked'] = len(self._symbols)
+        stats['open_bars'] = self.open_bar_count()
+        stats['ticks_per_bar'] = (
+            stats['ticks_received'] / stats['bars_emitted'] if stats['bars_emitted'] else 0.0
+        )
+        return stats
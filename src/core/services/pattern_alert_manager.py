@@ -7,11 +7,17 @@ Sprint 10 Phase 4: Pattern Alert System
 - Alert preference configuration (notification types, thresholds)
 - Real-time pattern notification delivery
 - Alert history and performance tracking
+
+Alert matching uses an inverted subscription index (pattern -> symbol or
+wildcard -> sorted confidence thresholds -> user IDs), maintained on every
+subscription write, held in memory and mirrored in Redis sorted sets.
 """
 
 import json
 import logging
+import threading
 import time
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -130,6 +136,96 @@ class UserAlertPreferences:
             updated_at=data.get('updated_at', 0.0)
         )
 
+class PatternSubscriptionIndex:
+    """
+    Inverted index of enabled pattern subscriptions.
+
+    Maps pattern -> symbol (or WILDCARD for all symbols) -> confidence
+    thresholds (sorted) -> user IDs, so matching an alert is a dict lookup
+    plus a prefix of a sorted list instead of a scan over every user.
+    """
+
+    WILDCARD = '*'
+
+    def __init__(self):
+        # (pattern, symbol) -> (sorted thresholds, user IDs in threshold order)
+        self._buckets: dict[tuple[str, str], tuple[list[float], list[str]]] = {}
+        # user_id -> [(pattern, symbol, threshold)] currently indexed
+        self._user_entries: dict[str, list[tuple[str, str, float]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def entries_for(
+        cls, subscriptions: dict[str, PatternSubscription]
+    ) -> list[tuple[str, str, float]]:
+        """Index entries (pattern, symbol, threshold) for a user's subscriptions."""
+        entries = []
+        for pattern, sub in subscriptions.items():
+            if not sub.enabled:
+                continue
+            for symbol in (sub.symbols or {cls.WILDCARD}):
+                entries.append((pattern, symbol, float(sub.confidence_threshold)))
+        return entries
+
+    def set_user(self, user_id: str, entries: list[tuple[str, str, float]]):
+        """Replace a user's index entries."""
+        with self._lock:
+            self._remove_locked(user_id)
+            for pattern, symbol, threshold in entries:
+                thresholds, users = self._buckets.setdefault((pattern, symbol), ([], []))
+                position = bisect_right(thresholds, threshold)
+                thresholds.insert(position, threshold)
+                users.insert(position, user_id)
+            if entries:
+                self._user_entries[user_id] = list(entries)
+
+    def remove_user(self, user_id: str):
+        """Drop a user from the index."""
+        with self._lock:
+            self._remove_locked(user_id)
+
+    def _remove_locked(self, user_id: str):
+        for pattern, symbol, _ in self._user_entries.pop(user_id, []):
+            bucket = self._buckets.get((pattern, symbol))
+            if bucket is None:
+                continue
+            thresholds, users = bucket
+            position = users.index(user_id)
+            del thresholds[position]
+            del users[position]
+            if not users:
+                del self._buckets[(pattern, symbol)]
+
+    def match(self, pattern: str, symbol: str, confidence: float) -> set[str]:
+        """User IDs subscribed to pattern on symbol with threshold <= confidence."""
+        matched = set()
+        with self._lock:
+            for key in ((pattern, symbol), (pattern, self.WILDCARD)):
+                bucket = self._buckets.get(key)
+                if bucket is not None:
+                    thresholds, users = bucket
+                    matched.update(users[:bisect_right(thresholds, confidence)])
+        return matched
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._buckets.clear()
+            self._user_entries.clear()
+
+    def entries(self, user_id: str) -> list[tuple[str, str, float]]:
+        """A user's index entries."""
+        with self._lock:
+            return list(self._user_entries.get(user_id, []))
+
+    def users(self) -> list[str]:
+        """Indexed user IDs."""
+        with self._lock:
+            return list(self._user_entries)
+
+    def __len__(self) -> int:
+        return len(self._user_entries)
+
 class PatternAlertManager:
     """
     Manages pattern alert subscriptions and notifications for TickStockAppV2.
@@ -138,6 +234,9 @@ class PatternAlertManager:
     and performance tracking for the pattern alert system.
     """
 
+    # Max age of the in-memory subscription index before checking the mirror version
+    INDEX_SYNC_SECONDS = 1.0
+
     def __init__(self, redis_client: redis.Redis, tickstock_db: TickStockDatabase | None = None):
         """Initialize pattern alert manager."""
         self.redis_client = redis_client
@@ -152,6 +251,12 @@ class PatternAlertManager:
         self.alert_history_key = "tickstock:alerts:history:{user_id}"
         self.rate_limit_key = "tickstock:alerts:ratelimit:{user_id}:{hour}"
 
+        # Subscription index mirror: one sorted set (member user_id, score
+        # threshold) per pattern/symbol, the indexed users and a change counter
+        self.index_key = "tickstock:alerts:index:{pattern}:{symbol}"
+        self.index_users_key = "tickstock:alerts:index:users"
+        self.index_version_key = "tickstock:alerts:index:version"
+
         # Available patterns (from Sprint 5-9)
         self.available_patterns = [
             'Doji', 'Hammer', 'ShootingStar', 'Engulfing', 'Harami',
@@ -165,9 +270,17 @@ class PatternAlertManager:
             'alerts_filtered': 0,
             'rate_limited': 0,
             'users_subscribed': 0,
+            'index_reloads': 0,
             'start_time': time.time()
         }
 
+        # Inverted subscription index; resynced from the Redis mirror when
+        # another instance changed it (checked at most every INDEX_SYNC_SECONDS)
+        self.subscription_index = PatternSubscriptionIndex()
+        self._index_version: int | None = None
+        self._index_checked_at = 0.0
+        self._sync_subscription_index(force=True)
+
         logger.info("PATTERN-ALERT-MANAGER: Initialized successfully")
 
     def get_user_preferences(self, user_id: str) -> UserAlertPreferences:
@@ -272,14 +385,28 @@ class PatternAlertManager:
 
     def _save_user_subscriptions(self, user_id: str,
                                subscriptions: dict[str, PatternSubscription]) -> bool:
-        """Save user subscriptions to Redis."""
+        """Save user subscriptions to Redis and update the subscription index."""
         try:
             subs_key = self.user_subscriptions_key.format(user_id=user_id)
             subs_dict = {pattern: sub.to_dict() for pattern, sub in subscriptions.items()}
             subs_data = json.dumps(subs_dict)
 
+            # Entries indexed for the previously stored subscriptions
+            previous = self._parse_subscriptions(self.redis_client.get(subs_key))
+            old_entries = PatternSubscriptionIndex.entries_for(previous)
+            new_entries = PatternSubscriptionIndex.entries_for(subscriptions)
+
+            pipe = self.redis_client.pipeline()
             # Store with 30-day TTL
-            self.redis_client.setex(subs_key, 86400 * 30, subs_data)
+            pipe.setex(subs_key, 86400 * 30, subs_data)
+            self._queue_index_update(pipe, user_id, old_entries, new_entries)
+            pipe.incr(self.index_version_key)
+            version = pipe.execute()[-1]
+
+            self.subscription_index.set_user(user_id, new_entries)
+            if self._index_version is not None and version == self._index_version + 1:
+                # Nobody else changed the index since our last sync
+                self._index_version = version
 
             logger.debug(f"PATTERN-ALERT-MANAGER: Saved subscriptions for user {user_id}")
             return True
@@ -497,26 +624,22 @@ class PatternAlertManager:
     def get_subscribed_users_count(self) -> int:
         """Get count of users with active subscriptions."""
         try:
-            # This is an approximation - in production you'd want a more efficient method
-            pattern = self.user_subscriptions_key.format(user_id="*")
-            keys = self.redis_client.keys(pattern)
-            return len(keys)
+            return self.redis_client.scard(self.index_users_key)
 
         except Exception as e:
             logger.error(f"PATTERN-ALERT-MANAGER: Error getting subscribed users count: {e}")
-            return 0
+            return len(self.subscription_index)
 
     def get_stats(self) -> dict[str, Any]:
         """Get alert manager statistics."""
         runtime = time.time() - self.stats['start_time']
+        considered = self.stats['alerts_filtered'] + self.stats['alerts_sent']
 
         return {
             **self.stats,
             'runtime_seconds': round(runtime, 1),
             'alerts_per_hour': round(self.stats['alerts_sent'] / max(runtime / 3600, 1), 2),
-            'filter_rate': round(
-                self.stats['alerts_filtered'] / max(self.stats['alerts_filtered'] + self.stats['alerts_sent'], 1) * 100, 1
-            ),
+            'filter_rate': round(self.stats['alerts_filtered'] / max(considered, 1) * 100, 1),
             'available_patterns': len(self.available_patterns),
             'subscribed_users': self.get_subscribed_users_count()
         }
@@ -524,7 +647,33 @@ class PatternAlertManager:
     def cleanup_expired_data(self):
         """Clean up expired alert data and rate limiting keys."""
         try:
-            # Redis TTL handles most cleanup, but we can do additional maintenance here
+            # Redis TTL handles most cleanup; drop index entries of users whose
+            # subscriptions expired
+            users = self.subscription_index.users()
+            if users:
+                pipe = self.redis_client.pipeline()
+                for user_id in users:
+                    pipe.exists(self.user_subscriptions_key.format(user_id=user_id))
+                expired = [
+                    user_id
+                    for user_id, exists in zip(users, pipe.execute(), strict=True)
+                    if not exists
+                ]
+
+                if expired:
+                    pipe = self.redis_client.pipeline()
+                    for user_id in expired:
+                        entries = self.subscription_index.entries(user_id)
+                        self._queue_index_update(pipe, user_id, entries, [])
+                    pipe.incr(self.index_version_key)
+                    pipe.execute()
+                    for user_id in expired:
+                        self.subscription_index.remove_user(user_id)
+                    logger.info(
+                        f"PATTERN-ALERT-MANAGER: Removed {len(expired)} expired users "
+                        "from subscription index"
+                    )
+
             logger.debug("PATTERN-ALERT-MANAGER: Cleanup completed")
 
         except Exception as e:
@@ -533,68 +682,38 @@ class PatternAlertManager:
     def get_users_for_alert(self, pattern_name: str, symbol: str, confidence: float) -> list[str]:
         """
         Get list of user IDs who should receive this pattern alert.
-        
+
+        Candidates come from the subscription index; preferences (global
+        switch, quiet hours) and hourly rate limits are then read for the
+        candidates only, in one pipeline, and counters of approved users are
+        incremented in a second one.
+
         Args:
             pattern_name: Name of the detected pattern
             symbol: Stock symbol
-            confidence: Pattern detection confidence (0-100)
-            
+            confidence: Pattern detection confidence (0-1, or 0-100)
+
         Returns:
             List of user IDs who should receive the alert
         """
         try:
-            interested_users = []
-
-            # Get all users who have subscriptions
-            subscription_keys = self.redis_client.keys(f"{self.key_prefix}subscriptions:*")
-
-            for key in subscription_keys:
-                try:
-                    user_id = key.split(':')[-1]  # Extract user_id from key
-
-                    # Get user preferences
-                    preferences = self.get_preferences(user_id)
-
-                    # Check if user meets minimum confidence threshold
-                    if confidence < preferences.get('confidence_threshold', 70):
-                        continue
-
-                    # Check quiet hours
-                    if self._is_in_quiet_hours(preferences):
-                        continue
-
-                    # Check rate limiting
-                    if not self._check_rate_limit(user_id, preferences):
-                        continue
-
-                    # Get user's subscriptions
-                    subscriptions = self.get_subscriptions(user_id)
-
-                    # Check if user is subscribed to this pattern
-                    pattern_subscription = None
-                    for sub in subscriptions:
-                        if sub['pattern_name'] == pattern_name and sub.get('active', True):
-                            pattern_subscription = sub
-                            break
-
-                    if not pattern_subscription:
-                        continue
-
-                    # Check pattern-specific confidence threshold
-                    if confidence < pattern_subscription.get('confidence', 70):
-                        continue
+            if confidence > 1:
+                confidence /= 100
 
-                    # Check symbol filtering
-                    if pattern_subscription.get('symbols'):
-                        if symbol not in pattern_subscription['symbols']:
-                            continue
+            self._sync_subscription_index()
+            candidates = sorted(self.subscription_index.match(pattern_name, symbol, confidence))
+            if not candidates:
+                return []
 
-                    # User passes all filters
-                    interested_users.append(user_id)
+            interested_users, approved_keys = self._filter_by_preferences(candidates)
 
-                except Exception as e:
-                    logger.debug(f"PATTERN-ALERT-MANAGER: Skipping user {key}: {e}")
-                    continue
+            if approved_keys:
+                # Increment counters with 1-hour TTL
+                pipe = self.redis_client.pipeline()
+                for rate_key in approved_keys:
+                    pipe.incr(rate_key)
+                    pipe.expire(rate_key, 3600)
+                pipe.execute()
 
             return interested_users
 
@@ -602,60 +721,153 @@ class PatternAlertManager:
             logger.error(f"PATTERN-ALERT-MANAGER: Error getting users for alert: {e}")
             return []
 
-    def _is_in_quiet_hours(self, preferences: dict[str, Any]) -> bool:
-        """Check if current time is within user's quiet hours."""
-        quiet_hours = preferences.get('quiet_hours')
-        if not quiet_hours:
-            return False
+    def _filter_by_preferences(self, candidates: list[str]) -> tuple[list[str], list[str]]:
+        """
+        Drop candidates that disabled alerts, are in quiet hours or hit their hourly limit.
 
-        try:
-            now = datetime.now()
-            current_time = now.hour * 60 + now.minute
+        Returns:
+            (approved user IDs, their rate limit keys)
+        """
+        current_hour = int(time.time() // 3600)
+        rate_keys = [
+            self.rate_limit_key.format(user_id=user_id, hour=current_hour)
+            for user_id in candidates
+        ]
 
-            start_time = self._time_to_minutes(quiet_hours.get('start', '22:00'))
-            end_time = self._time_to_minutes(quiet_hours.get('end', '07:00'))
+        pipe = self.redis_client.pipeline()
+        for user_id in candidates:
+            pipe.get(self.user_prefs_key.format(user_id=user_id))
+        for rate_key in rate_keys:
+            pipe.get(rate_key)
+        results = pipe.execute()
+        prefs_data, counts = results[:len(candidates)], results[len(candidates):]
+
+        approved_users = []
+        approved_keys = []
+        for user_id, rate_key, prefs_blob, count in zip(
+            candidates, rate_keys, prefs_data, counts, strict=True
+        ):
+            prefs = (
+                UserAlertPreferences.from_dict(json.loads(prefs_blob))
+                if prefs_blob else self._create_default_preferences(user_id)
+            )
+            if not prefs.global_enabled or self._is_quiet_hours(prefs):
+                continue
+            if int(count or 0) >= prefs.max_alerts_per_hour:
+                self.stats['rate_limited'] += 1
+                continue
+            approved_users.append(user_id)
+            approved_keys.append(rate_key)
 
-            if start_time > end_time:
-                # Quiet hours cross midnight
-                return current_time >= start_time or current_time <= end_time
-            return start_time <= current_time <= end_time
+        return approved_users, approved_keys
 
+    def _parse_subscriptions(self, subs_data) -> dict[str, PatternSubscription]:
+        """Decode a stored subscriptions blob (empty if missing or invalid)."""
+        if not subs_data:
+            return {}
+        try:
+            return {
+                pattern: PatternSubscription.from_dict(sub_data)
+                for pattern, sub_data in json.loads(subs_data).items()
+            }
         except Exception as e:
-            logger.error(f"PATTERN-ALERT-MANAGER: Error checking quiet hours: {e}")
-            return False
+            logger.warning(f"PATTERN-ALERT-MANAGER: Invalid subscriptions data: {e}")
+            return {}
 
-    def _time_to_minutes(self, time_str: str) -> int:
-        """Convert HH:MM time string to minutes since midnight."""
-        try:
-            hours, minutes = map(int, time_str.split(':'))
-            return hours * 60 + minutes
-        except Exception:
-            return 0
-
-    def _check_rate_limit(self, user_id: str, preferences: dict[str, Any]) -> bool:
-        """Check if user is within their alert rate limit."""
-        max_per_hour = preferences.get('max_alerts_per_hour', 20)
-        if max_per_hour == -1:  # Unlimited
-            return True
+    def _queue_index_update(self, pipe, user_id: str,
+                            old_entries: list[tuple[str, str, float]],
+                            new_entries: list[tuple[str, str, float]]):
+        """Queue Redis mirror updates replacing a user's index entries."""
+        for pattern, symbol, _ in old_entries:
+            pipe.zrem(self.index_key.format(pattern=pattern, symbol=symbol), user_id)
+        for pattern, symbol, threshold in new_entries:
+            pipe.zadd(self.index_key.format(pattern=pattern, symbol=symbol), {user_id: threshold})
+        if new_entries:
+            pipe.sadd(self.index_users_key, user_id)
+        else:
+            pipe.srem(self.index_users_key, user_id)
+
+    def _sync_subscription_index(self, force: bool = False):
+        """Reload the in-memory index if the Redis mirror changed since the last sync."""
+        now = time.time()
+        if not force and now - self._index_checked_at < self.INDEX_SYNC_SECONDS:
+            return
+        self._index_checked_at = now
 
         try:
-            # Get current hour's alert count
-            current_hour = int(time.time() // 3600)  # Hour since epoch
-            rate_limit_key = f"{self.key_prefix}rate_limit:{user_id}:{current_hour}"
-
-            current_count = int(self.redis_client.get(rate_limit_key) or 0)
-
-            if current_count >= max_per_hour:
-                return False
-
-            # Increment counter (with 2-hour TTL)
-            pipe = self.redis_client.pipeline()
-            pipe.incr(rate_limit_key)
-            pipe.expire(rate_limit_key, 7200)  # 2 hours TTL
-            pipe.execute()
-
-            return True
+            version = self.redis_client.get(self.index_version_key)
+            if version is None:
+                # Mirror never built - index the stored subscriptions
+                self.rebuild_subscription_index()
+                return
+            version = int(version)
+            if version != self._index_version:
+                self._load_subscription_index(version)
 
         except Exception as e:
-            logger.error(f"PATTERN-ALERT-MANAGER: Error checking rate limit: {e}")
-            return True  # Allow on error
+            logger.error(f"PATTERN-ALERT-MANAGER: Error syncing subscription index: {e}")
+
+    def _load_subscription_index(self, version: int):
+        """Load the in-memory index from the Redis mirror."""
+        prefix = self.index_key.format(pattern='', symbol='')[:-1]
+        keys = [
+            key.decode() if isinstance(key, bytes) else key
+            for key in self.redis_client.scan_iter(match=f"{prefix}*:*", count=1000)
+        ]
+        keys = [key for key in keys if key not in (self.index_users_key, self.index_version_key)]
+
+        pipe = self.redis_client.pipeline()
+        for key in keys:
+            pipe.zrange(key, 0, -1, withscores=True)
+
+        user_entries: dict[str, list[tuple[str, str, float]]] = {}
+        for key, members in zip(keys, pipe.execute() if keys else [], strict=True):
+            pattern, symbol = key[len(prefix):].split(':', 1)
+            for user_id, threshold in members:
+                if isinstance(user_id, bytes):
+                    user_id = user_id.decode()
+                user_entries.setdefault(user_id, []).append((pattern, symbol, float(threshold)))
+
+        self.subscription_index.clear()
+        for user_id, entries in user_entries.items():
+            self.subscription_index.set_user(user_id, entries)
+        self._index_version = version
+        self.stats['index_reloads'] += 1
+
+        logger.info(
+            f"PATTERN-ALERT-MANAGER: Loaded subscription index for {len(user_entries)} users "
+            f"(version {version})"
+        )
+
+    def rebuild_subscription_index(self):
+        """Rebuild the subscription index and its Redis mirror from stored subscriptions."""
+        subs_keys = [
+            key.decode() if isinstance(key, bytes) else key
+            for key in self.redis_client.scan_iter(
+                match=self.user_subscriptions_key.format(user_id='*'), count=1000
+            )
+        ]
+        user_ids = [key.split(':')[-1] for key in subs_keys]
+
+        pipe = self.redis_client.pipeline()
+        for key in subs_keys:
+            pipe.get(key)
+        blobs = pipe.execute() if subs_keys else []
+
+        self.subscription_index.clear()
+        pipe = self.redis_client.pipeline()
+        # Drop mirror keys left from an earlier build
+        mirror_keys = self.redis_client.scan_iter(
+            match=self.index_key.format(pattern='*', symbol='*'), count=1000
+        )
+        for key in mirror_keys:
+            pipe.delete(key)
+        pipe.delete(self.index_users_key)
+        for user_id, subs_data in zip(user_ids, blobs, strict=True):
+            entries = PatternSubscriptionIndex.entries_for(self._parse_subscriptions(subs_data))
+            self.subscription_index.set_user(user_id, entries)
+            self._queue_index_update(pipe, user_id, [], entries)
+        pipe.incr(self.index_version_key)
+        self._index_version = pipe.execute()[-1]
+
+        logger.info(f"PATTERN-ALERT-MANAGER: Rebuilt subscription index for {len(user_ids)} users")
@@ -27,6 +27,7 @@ from src.core.services.integration_logger import (
     log_websocket_delivery,
 )
 from src.core.services.redis_monitor import RedisMonitor
+from src.infrastructure.websocket.pattern_alert_fanout import PatternAlertFanout
 
 logger = logging.getLogger(__name__)
 
@@ -147,6 +148,11 @@ class RedisEventSubscriber:
         # Redis Monitor for debugging (Sprint 43)
         self.redis_monitor = RedisMonitor(max_messages=500)
 
+        # Batched pattern alert delivery (one emit per chunk of user rooms)
+        self.pattern_fanout = PatternAlertFanout(
+            socketio, rooms_per_emit=config.get('PATTERN_ALERT_ROOMS_PER_EMIT', 1000)
+        ) if socketio else None
+
     def start(self) -> bool:
         """Start the Redis event subscription service."""
         if self.is_running:
@@ -415,19 +421,21 @@ class RedisEventSubscriber:
                         pattern_name, symbol, confidence
                     )
 
-                    if interested_users:
-                        # Send targeted alerts to specific users
-                        websocket_data = {
-                            'type': 'pattern_alert',
-                            'event': event.to_websocket_dict()
-                        }
-
-                        # Only emit if socketio is available
-                        if self.socketio:
-                            for user_id in interested_users:
-                                # Emit to specific user rooms (if using Socket.IO rooms)
-                                self.socketio.emit('pattern_alert', websocket_data, room=f'user_{user_id}')
+                    websocket_data = {
+                        'type': 'pattern_alert',
+                        'event': event.to_websocket_dict()
+                    }
+
+                    # Only emit if socketio is available
+                    if self.pattern_fanout:
+                        # The pattern/symbol topic room always gets the alert; the
+                        # matched users' rooms are added to the same batched emits
+                        self.pattern_fanout.publish(
+                            'pattern_alert', websocket_data, pattern_name, symbol, interested_users
+                        )
 
+                    if interested_users:
+                        if self.pattern_fanout:
                             self.stats['events_forwarded'] += len(interested_users)
                         else:
                             logger.warning(f"REDIS-SUBSCRIBER: SocketIO not available, cannot emit to {len(interested_users)} users")
@@ -815,7 +823,8 @@ class RedisEventSubscriber:
             'events_per_second': round(self.stats['events_received'] / max(runtime, 1), 2),
             'is_running': self.is_running,
             'subscribed_channels': list(self.channels.keys()),
-            'active_thread': self.subscriber_thread and self.subscriber_thread.is_alive()
+            'active_thread': self.subscriber_thread and self.subscriber_thread.is_alive(),
+            'pattern_fanout': self.pattern_fanout.get_stats() if self.pattern_fanout else None
         }
 
     def get_health_status(self) -> dict[str, Any]:
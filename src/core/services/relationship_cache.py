@@ -9,25 +9,47 @@ Performance Targets:
 - Cache miss: <10ms (database query + cache population)
 - Cache size: <50MB for 3,700 stocks + 24 ETFs + 20 themes
 
+Loading:
+- Connections come from the shared 'cache' pool of the EngineRegistry
+  (bounded; callers wait up to the pool timeout instead of opening more)
+- Concurrent misses of the same key are coalesced into one database load
+- Entry timestamps are jittered by up to TTL_JITTER of the TTL so entries
+  loaded together do not all expire together
+- warm_cache() loads every group, membership and catalog in two queries
+
+Expiry (stale-while-revalidate):
+- Entries older than ttl_seconds (soft TTL) are still served while a
+  background worker reloads them
+- Entries older than hard_ttl_seconds are reloaded on the request path
+- revalidate() marks everything stale and re-warms in the background; it is
+  driven by the universe_updated / cache_sync_complete Redis events
+
+Symbol getters return immutable tuples shared with the cache; metadata
+getters return copies.
+
 Usage:
     from src.core.services.relationship_cache import get_relationship_cache
 
     cache = get_relationship_cache()
-    holdings = cache.get_etf_holdings('SPY')  # Returns list of symbols
+    holdings = cache.get_etf_holdings('SPY')  # Returns tuple of symbols
     sectors = cache.get_stock_sector('AAPL')  # Returns sector dict
 """
 
 import logging
+import random
 import time
-from typing import Any, Dict, List, Optional, Set
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from threading import Lock
 
-import psycopg2
-from urllib.parse import urlparse
-
 from src.core.services.config_manager import get_config
 
+# Group types held by the cache
+GROUP_TYPES = ('ETF', 'SECTOR', 'THEME', 'UNIVERSE')
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,98 +58,245 @@ class RelationshipCache:
     In-memory cache for relationship data with TTL-based expiration
     """
 
-    def __init__(self, ttl_seconds: int = 3600):
+    # Fraction of the TTL entry expiry is spread over
+    TTL_JITTER = 0.1
+
+    # Background refresh threads (each holds one 'cache' pool connection)
+    REFRESH_WORKERS = 2
+
+    def __init__(self, ttl_seconds: int = 3600, db=None, hard_ttl_seconds: Optional[int] = None):
         """
         Initialize cache
 
         Args:
-            ttl_seconds: Time-to-live for cache entries (default: 1 hour)
+            ttl_seconds: Soft time-to-live for cache entries (default: 1 hour);
+                older entries are served while being refreshed in the background
+            db: Optional TickStockDatabase instance (for testing); attached to
+                the shared 'cache' pool on first load otherwise
+            hard_ttl_seconds: Age after which entries are reloaded on the
+                request path (default: twice ttl_seconds)
         """
         self.ttl_seconds = ttl_seconds
+        self.hard_ttl_seconds = max(hard_ttl_seconds or 2 * ttl_seconds, ttl_seconds)
         self.config = get_config()
         self.db_uri = self.config.get('DATABASE_URI')
         self.environment = self.config.get('ENVIRONMENT', 'DEFAULT')
+        self._db = db
 
         # Cache storage
-        self._etf_holdings: Dict[str, tuple[List[str], datetime]] = {}
-        self._stock_etfs: Dict[str, tuple[List[str], datetime]] = {}
+        self._etf_holdings: Dict[str, tuple[Tuple[str, ...], datetime]] = {}
+        self._stock_etfs: Dict[str, tuple[Tuple[str, ...], datetime]] = {}
         self._stock_sector: Dict[str, tuple[Dict[str, str], datetime]] = {}
-        self._sector_stocks: Dict[str, tuple[List[str], datetime]] = {}
-        self._theme_members: Dict[str, tuple[List[str], datetime]] = {}
-        self._universe_members: Dict[str, tuple[List[str], datetime]] = {}
-        self._universe_symbols: Dict[str, tuple[List[str], datetime]] = {}  # Sprint 61: Multi-universe join support
-        self._universe_metadata_cache: Dict[str, tuple[List[Dict], datetime]] = {}  # Sprint 62: Available universes metadata
-        self._all_etfs: Optional[tuple[List[Dict], datetime]] = None
-        self._all_sectors: Optional[tuple[List[Dict], datetime]] = None
-        self._all_themes: Optional[tuple[List[Dict], datetime]] = None
-        self._all_universes: Optional[tuple[List[Dict], datetime]] = None
+        self._sector_stocks: Dict[str, tuple[Tuple[str, ...], datetime]] = {}
+        self._theme_members: Dict[str, tuple[Tuple[str, ...], datetime]] = {}
+        self._universe_members: Dict[str, tuple[Tuple[str, ...], datetime]] = {}
+        # Sprint 61: Multi-universe join support
+        self._universe_symbols: Dict[str, tuple[Tuple[str, ...], datetime]] = {}
+        # Sprint 62: Available universes metadata
+        self._universe_metadata_cache: Dict[str, tuple[List[Dict], datetime]] = {}
+        # Catalogs: 'etfs', 'sectors', 'themes', 'universes'
+        self._catalogs: Dict[str, tuple[List[Dict], datetime]] = {}
 
         # Thread safety
         self._lock = Lock()
+        # One lock per key being loaded (single-flight)
+        self._load_locks: Dict[tuple, Lock] = {}
+
+        # Background refresh of stale entries
+        self._refresher = ThreadPoolExecutor(
+            max_workers=self.REFRESH_WORKERS, thread_name_prefix='RelationshipCacheRefresh'
+        )
+        self._refreshing: Set[tuple] = set()
+        self._warm_pending = False
 
         # Statistics
         self._stats = {
             'hits': 0,
             'misses': 0,
             'loads': 0,
+            'coalesced': 0,
+            'stale_hits': 0,
+            'refreshes': 0,
+            'revalidations': 0,
             'evictions': 0
         }
 
-        logger.info(f"RelationshipCache initialized (TTL: {ttl_seconds}s)")
+        logger.info(
+            "RelationshipCache initialized "
+            f"(TTL: {ttl_seconds}s, hard TTL: {self.hard_ttl_seconds}s)"
+        )
 
     def _get_connection(self):
-        """Get database connection"""
-        parsed = urlparse(self.db_uri)
-        return psycopg2.connect(
-            host=parsed.hostname,
-            port=parsed.port or 5432,
-            database=parsed.path.lstrip('/'),
-            user=parsed.username,
-            password=parsed.password
-        )
+        """Get a pooled database connection (close() returns it to the pool)"""
+        if self._db is None:
+            from src.infrastructure.database.tickstock_db import TickStockDatabase
+
+            self._db = TickStockDatabase(self.config, role='cache')
+        return self._db.engine.raw_connection()
+
+    @contextmanager
+    def _connection(self):
+        """Pooled database connection, returned to the pool on exit"""
+        conn = self._get_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _fetch(self, query: str, params: tuple) -> List[tuple]:
+        """Run a query on a pooled connection and return all rows"""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    def _age(self, timestamp: datetime) -> float:
+        """Age of a cache entry in seconds"""
+        return (datetime.now() - timestamp).total_seconds()
 
     def _is_expired(self, timestamp: datetime) -> bool:
-        """Check if cache entry is expired"""
-        return datetime.now() - timestamp > timedelta(seconds=self.ttl_seconds)
+        """Check if cache entry is past the soft TTL"""
+        return self._age(timestamp) > self.ttl_seconds
 
-    def get_etf_holdings(self, etf_symbol: str) -> List[str]:
+    def _stamp(self) -> datetime:
+        """Entry timestamp, backdated by a random part of TTL_JITTER"""
+        jitter = random.uniform(0, self.ttl_seconds * self.TTL_JITTER)
+        return datetime.now() - timedelta(seconds=jitter)
+
+    def _stores(self) -> List[Dict]:
+        """All cache dicts holding (value, timestamp) entries"""
+        return [
+            self._etf_holdings, self._stock_etfs, self._stock_sector, self._sector_stocks,
+            self._theme_members, self._universe_members, self._universe_symbols,
+            self._universe_metadata_cache, self._catalogs
+        ]
+
+    def _get_cached(self, store: Dict, key: Any, loader: Callable[[], Any]) -> Any:
         """
-        Get holdings for an ETF
+        Return the cached value for a key, loading it if needed.
+
+        Entries within the soft TTL are returned as is. Stale entries (past the
+        soft TTL, within the hard TTL) are returned while a background refresh
+        is scheduled. Missing or hard-expired entries are loaded on the calling
+        thread; concurrent misses of the same key wait for one load instead of
+        each querying the database.
 
         Args:
-            etf_symbol: ETF ticker symbol (e.g., 'SPY')
+            store: Cache dict holding (value, timestamp) entries
+            key: Entry key
+            loader: Loads the value from the database; None means the load
+                failed and is not cached
 
         Returns:
-            List of stock symbols in the ETF
+            Cached value (shared, not copied), or None if it could not be loaded
         """
-        etf_symbol = etf_symbol.upper()
-
         with self._lock:
-            # Check cache
-            if etf_symbol in self._etf_holdings:
-                holdings, timestamp = self._etf_holdings[etf_symbol]
-                if not self._is_expired(timestamp):
+            entry = store.get(key)
+            if entry is not None:
+                age = self._age(entry[1])
+                if age <= self.ttl_seconds:
                     self._stats['hits'] += 1
-                    return holdings.copy()
-
-            # Cache miss - load from database
+                    return entry[0]
+                if age <= self.hard_ttl_seconds:
+                    self._stats['hits'] += 1
+                    self._stats['stale_hits'] += 1
+                    self._schedule_refresh(store, key, loader)
+                    return entry[0]
             self._stats['misses'] += 1
+            load_key = (id(store), key)
+            load_lock = self._load_locks.setdefault(load_key, Lock())
 
-        # Load outside lock to avoid blocking
-        holdings = self._load_etf_holdings_from_db(etf_symbol)
+        with load_lock:
+            # A concurrent load may have finished while we waited
+            with self._lock:
+                entry = store.get(key)
+                if entry is not None and not self._is_expired(entry[1]):
+                    self._stats['coalesced'] += 1
+                    return entry[0]
+
+            try:
+                value = loader()
+            except Exception:
+                with self._lock:
+                    self._load_locks.pop(load_key, None)
+                raise
+
+            with self._lock:
+                if value is not None:
+                    store[key] = (value, self._stamp())
+                    self._stats['loads'] += 1
+                self._load_locks.pop(load_key, None)
+
+        return value
+
+    def _schedule_refresh(self, store: Dict, key: Any, loader: Callable[[], Any]):
+        """Queue a background reload of a stale entry (caller holds the lock)"""
+        refresh_key = (id(store), key)
+        if refresh_key in self._refreshing:
+            return
+        self._refreshing.add(refresh_key)
+        self._refresher.submit(self._refresh, store, key, loader, refresh_key)
+
+    def _refresh(self, store: Dict, key: Any, loader: Callable[[], Any], refresh_key: tuple):
+        """Reload a stale entry; on failure the stale value is kept"""
+        try:
+            value = loader()
+        except Exception as e:
+            logger.error(f"Error refreshing cache entry {key}: {e}")
+            value = None
 
         with self._lock:
-            self._etf_holdings[etf_symbol] = (holdings, datetime.now())
-            self._stats['loads'] += 1
+            if value is not None:
+                store[key] = (value, self._stamp())
+                self._stats['refreshes'] += 1
+            self._refreshing.discard(refresh_key)
 
-        return holdings.copy()
+    def revalidate(self):
+        """
+        Mark every entry stale and re-warm the cache in the background.
 
-    def _load_etf_holdings_from_db(self, etf_symbol: str) -> List[str]:
+        Callers keep receiving the current entries until the reload replaces
+        them. Requests arriving while a re-warm is queued are coalesced into it.
+        """
+        with self._lock:
+            stale_stamp = datetime.now() - timedelta(seconds=self.ttl_seconds + 1)
+            for store in self._stores():
+                for key, (value, timestamp) in store.items():
+                    if timestamp > stale_stamp:
+                        store[key] = (value, stale_stamp)
+            self._stats['revalidations'] += 1
+            if self._warm_pending:
+                return
+            self._warm_pending = True
+
+        self._refresher.submit(self._background_warm)
+
+    def _background_warm(self):
+        """Run warm_cache() on the refresh worker"""
+        with self._lock:
+            # Cleared before loading so revalidations during the load queue another run
+            self._warm_pending = False
+        self.warm_cache()
+
+    def get_etf_holdings(self, etf_symbol: str) -> Tuple[str, ...]:
+        """
+        Get holdings for an ETF
+
+        Args:
+            etf_symbol: ETF ticker symbol (e.g., 'SPY')
+
+        Returns:
+            Tuple of stock symbols in the ETF
+        """
+        etf_symbol = etf_symbol.upper()
+        return self._get_cached(
+            self._etf_holdings, etf_symbol,
+            lambda: self._load_etf_holdings_from_db(etf_symbol)
+        ) or ()
+
+    def _load_etf_holdings_from_db(self, etf_symbol: str) -> Optional[Tuple[str, ...]]:
         """Load ETF holdings from database"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             query = """
                 SELECT gm.symbol
                 FROM definition_groups dg
@@ -135,17 +304,13 @@ class RelationshipCache:
                 WHERE dg.name = %s AND dg.type = 'ETF' AND dg.environment = %s
                 ORDER BY gm.symbol
             """
-            cursor.execute(query, (etf_symbol, self.environment))
-            holdings = [row[0] for row in cursor.fetchall()]
-
-            conn.close()
-            return holdings
+            return tuple(row[0] for row in self._fetch(query, (etf_symbol, self.environment)))
 
         except Exception as e:
             logger.error(f"Error loading ETF holdings for {etf_symbol}: {e}")
-            return []
+            return None
 
-    def get_stock_etfs(self, stock_symbol: str) -> List[str]:
+    def get_stock_etfs(self, stock_symbol: str) -> Tuple[str, ...]:
         """
         Get all ETFs that contain a stock
 
@@ -153,36 +318,17 @@ class RelationshipCache:
             stock_symbol: Stock ticker symbol (e.g., 'AAPL')
 
         Returns:
-            List of ETF symbols containing the stock
+            Tuple of ETF symbols containing the stock
         """
         stock_symbol = stock_symbol.upper()
+        return self._get_cached(
+            self._stock_etfs, stock_symbol,
+            lambda: self._load_stock_etfs_from_db(stock_symbol)
+        ) or ()
 
-        with self._lock:
-            # Check cache
-            if stock_symbol in self._stock_etfs:
-                etfs, timestamp = self._stock_etfs[stock_symbol]
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    return etfs.copy()
-
-            # Cache miss
-            self._stats['misses'] += 1
-
-        # Load from database
-        etfs = self._load_stock_etfs_from_db(stock_symbol)
-
-        with self._lock:
-            self._stock_etfs[stock_symbol] = (etfs, datetime.now())
-            self._stats['loads'] += 1
-
-        return etfs.copy()
-
-    def _load_stock_etfs_from_db(self, stock_symbol: str) -> List[str]:
+    def _load_stock_etfs_from_db(self, stock_symbol: str) -> Optional[Tuple[str, ...]]:
         """Load ETFs containing a stock from database"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             query = """
                 SELECT dg.name
                 FROM definition_groups dg
@@ -190,15 +336,11 @@ class RelationshipCache:
                 WHERE gm.symbol = %s AND dg.type = 'ETF' AND dg.environment = %s
                 ORDER BY dg.name
             """
-            cursor.execute(query, (stock_symbol, self.environment))
-            etfs = [row[0] for row in cursor.fetchall()]
-
-            conn.close()
-            return etfs
+            return tuple(row[0] for row in self._fetch(query, (stock_symbol, self.environment)))
 
         except Exception as e:
             logger.error(f"Error loading ETFs for {stock_symbol}: {e}")
-            return []
+            return None
 
     def get_stock_sector(self, stock_symbol: str) -> Dict[str, str]:
         """
@@ -211,33 +353,15 @@ class RelationshipCache:
             Dict with 'sector' and 'industry' keys
         """
         stock_symbol = stock_symbol.upper()
+        sector_info = self._get_cached(
+            self._stock_sector, stock_symbol,
+            lambda: self._load_stock_sector_from_db(stock_symbol)
+        )
+        return dict(sector_info) if sector_info else {'sector': 'unknown', 'industry': 'Unknown'}
 
-        with self._lock:
-            # Check cache
-            if stock_symbol in self._stock_sector:
-                sector_info, timestamp = self._stock_sector[stock_symbol]
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    return sector_info.copy()
-
-            # Cache miss
-            self._stats['misses'] += 1
-
-        # Load from database
-        sector_info = self._load_stock_sector_from_db(stock_symbol)
-
-        with self._lock:
-            self._stock_sector[stock_symbol] = (sector_info, datetime.now())
-            self._stats['loads'] += 1
-
-        return sector_info.copy()
-
-    def _load_stock_sector_from_db(self, stock_symbol: str) -> Dict[str, str]:
+    def _load_stock_sector_from_db(self, stock_symbol: str) -> Optional[Dict[str, str]]:
         """Load stock sector from database"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             query = """
                 SELECT dg.name, gm.metadata->>'industry'
                 FROM definition_groups dg
@@ -245,23 +369,20 @@ class RelationshipCache:
                 WHERE gm.symbol = %s AND dg.type = 'SECTOR' AND dg.environment = %s
                 LIMIT 1
             """
-            cursor.execute(query, (stock_symbol, self.environment))
-            result = cursor.fetchone()
+            rows = self._fetch(query, (stock_symbol, self.environment))
 
-            conn.close()
-
-            if result:
+            if rows:
                 return {
-                    'sector': result[0],
-                    'industry': result[1] or 'Unknown'
+                    'sector': rows[0][0],
+                    'industry': rows[0][1] or 'Unknown'
                 }
             return {'sector': 'unknown', 'industry': 'Unknown'}
 
         except Exception as e:
             logger.error(f"Error loading sector for {stock_symbol}: {e}")
-            return {'sector': 'unknown', 'industry': 'Unknown'}
+            return None
 
-    def get_sector_stocks(self, sector_key: str) -> List[str]:
+    def get_sector_stocks(self, sector_key: str) -> Tuple[str, ...]:
         """
         Get all stocks in a sector
 
@@ -269,54 +390,15 @@ class RelationshipCache:
             sector_key: Sector key (e.g., 'information_technology')
 
         Returns:
-            List of stock symbols in the sector
+            Tuple of stock symbols in the sector
         """
         sector_key = sector_key.lower()
+        return self._get_cached(
+            self._sector_stocks, sector_key,
+            lambda: self._load_group_members_from_db('SECTOR', sector_key)
+        ) or ()
 
-        with self._lock:
-            # Check cache
-            if sector_key in self._sector_stocks:
-                stocks, timestamp = self._sector_stocks[sector_key]
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    return stocks.copy()
-
-            # Cache miss
-            self._stats['misses'] += 1
-
-        # Load from database
-        stocks = self._load_sector_stocks_from_db(sector_key)
-
-        with self._lock:
-            self._sector_stocks[sector_key] = (stocks, datetime.now())
-            self._stats['loads'] += 1
-
-        return stocks.copy()
-
-    def _load_sector_stocks_from_db(self, sector_key: str) -> List[str]:
-        """Load sector stocks from database"""
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            query = """
-                SELECT gm.symbol
-                FROM definition_groups dg
-                JOIN group_memberships gm ON dg.id = gm.group_id
-                WHERE dg.name = %s AND dg.type = 'SECTOR' AND dg.environment = %s
-                ORDER BY gm.symbol
-            """
-            cursor.execute(query, (sector_key, self.environment))
-            stocks = [row[0] for row in cursor.fetchall()]
-
-            conn.close()
-            return stocks
-
-        except Exception as e:
-            logger.error(f"Error loading stocks for sector {sector_key}: {e}")
-            return []
-
-    def get_theme_members(self, theme_key: str) -> List[str]:
+    def get_theme_members(self, theme_key: str) -> Tuple[str, ...]:
         """
         Get all stocks in a theme
 
@@ -324,54 +406,15 @@ class RelationshipCache:
             theme_key: Theme key (e.g., 'crypto_miners')
 
         Returns:
-            List of stock symbols in the theme
+            Tuple of stock symbols in the theme
         """
         theme_key = theme_key.lower()
+        return self._get_cached(
+            self._theme_members, theme_key,
+            lambda: self._load_group_members_from_db('THEME', theme_key)
+        ) or ()
 
-        with self._lock:
-            # Check cache
-            if theme_key in self._theme_members:
-                stocks, timestamp = self._theme_members[theme_key]
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    return stocks.copy()
-
-            # Cache miss
-            self._stats['misses'] += 1
-
-        # Load from database
-        stocks = self._load_theme_members_from_db(theme_key)
-
-        with self._lock:
-            self._theme_members[theme_key] = (stocks, datetime.now())
-            self._stats['loads'] += 1
-
-        return stocks.copy()
-
-    def _load_theme_members_from_db(self, theme_key: str) -> List[str]:
-        """Load theme members from database"""
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            query = """
-                SELECT gm.symbol
-                FROM definition_groups dg
-                JOIN group_memberships gm ON dg.id = gm.group_id
-                WHERE dg.name = %s AND dg.type = 'THEME' AND dg.environment = %s
-                ORDER BY gm.symbol
-            """
-            cursor.execute(query, (theme_key, self.environment))
-            stocks = [row[0] for row in cursor.fetchall()]
-
-            conn.close()
-            return stocks
-
-        except Exception as e:
-            logger.error(f"Error loading theme members for {theme_key}: {e}")
-            return []
-
-    def get_universe_members(self, universe_key: str) -> List[str]:
+    def get_universe_members(self, universe_key: str) -> Tuple[str, ...]:
         """
         Get all stocks in a universe
 
@@ -379,54 +422,34 @@ class RelationshipCache:
             universe_key: Universe key (e.g., 'nasdaq100')
 
         Returns:
-            List of stock symbols in the universe
+            Tuple of stock symbols in the universe
         """
         universe_key = universe_key.lower()
-
-        with self._lock:
-            # Check cache
-            if universe_key in self._universe_members:
-                stocks, timestamp = self._universe_members[universe_key]
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    return stocks.copy()
-
-            # Cache miss
-            self._stats['misses'] += 1
-
-        # Load from database
-        stocks = self._load_universe_members_from_db(universe_key)
-
-        with self._lock:
-            self._universe_members[universe_key] = (stocks, datetime.now())
-            self._stats['loads'] += 1
-
-        return stocks.copy()
-
-    def _load_universe_members_from_db(self, universe_key: str) -> List[str]:
-        """Load universe members from database"""
+        return self._get_cached(
+            self._universe_members, universe_key,
+            lambda: self._load_group_members_from_db('UNIVERSE', universe_key)
+        ) or ()
+
+    def _load_group_members_from_db(
+        self, group_type: str, group_key: str
+    ) -> Optional[Tuple[str, ...]]:
+        """Load the member symbols of a SECTOR, THEME or UNIVERSE group from database"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             query = """
                 SELECT gm.symbol
                 FROM definition_groups dg
                 JOIN group_memberships gm ON dg.id = gm.group_id
-                WHERE dg.name = %s AND dg.type = 'UNIVERSE' AND dg.environment = %s
+                WHERE dg.name = %s AND dg.type = %s AND dg.environment = %s
                 ORDER BY gm.symbol
             """
-            cursor.execute(query, (universe_key, self.environment))
-            stocks = [row[0] for row in cursor.fetchall()]
-
-            conn.close()
-            return stocks
+            rows = self._fetch(query, (group_key, group_type, self.environment))
+            return tuple(row[0] for row in rows)
 
         except Exception as e:
-            logger.error(f"Error loading universe members for {universe_key}: {e}")
-            return []
+            logger.error(f"Error loading {group_type.lower()} members for {group_key}: {e}")
+            return None
 
-    def get_universe_symbols(self, universe_key: str) -> List[str]:
+    def get_universe_symbols(self, universe_key: str) -> Tuple[str, ...]:
         """
         Get symbols for universe(s). Supports multi-universe join with colon separator.
 
@@ -442,22 +465,17 @@ class RelationshipCache:
             universe_key: Universe key (single or colon-separated for join)
 
         Returns:
-            List of distinct stock symbols (sorted)
+            Tuple of distinct stock symbols (sorted)
         """
         universe_key = universe_key.strip()
-
-        # Check cache first
         cache_key = f"universe_symbols:{universe_key}"
-        with self._lock:
-            if cache_key in self._universe_symbols:
-                symbols, timestamp = self._universe_symbols[cache_key]
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    return symbols.copy()
-
-            # Cache miss
-            self._stats['misses'] += 1
+        return self._get_cached(
+            self._universe_symbols, cache_key,
+            lambda: self._load_joined_universe_symbols(universe_key)
+        ) or ()
 
+    def _load_joined_universe_symbols(self, universe_key: str) -> Optional[Tuple[str, ...]]:
+        """Load the sorted union of symbols for a (colon-joined) universe key"""
         # Parse universe key (supports multi-universe join)
         universe_parts = self._parse_universe_key(universe_key)
         logger.debug(f"Parsed universe key '{universe_key}' into parts: {universe_parts}")
@@ -466,22 +484,18 @@ class RelationshipCache:
         all_symbols: Set[str] = set()
         for universe_name in universe_parts:
             symbols = self._load_universe_symbols_from_db(universe_name)
+            if symbols is None:
+                return None
             all_symbols.update(symbols)
             logger.debug(f"Loaded {len(symbols)} symbols from '{universe_name}'")
 
         # Convert to sorted list
-        symbols_list = sorted(list(all_symbols))
+        symbols_list = tuple(sorted(all_symbols))
         logger.info(
             f"Loaded {len(symbols_list)} distinct symbols from universe key '{universe_key}' "
             f"({len(universe_parts)} universes)"
         )
-
-        # Cache result
-        with self._lock:
-            self._universe_symbols[cache_key] = (symbols_list, datetime.now())
-            self._stats['loads'] += 1
-
-        return symbols_list.copy()
+        return symbols_list
 
     def _parse_universe_key(self, universe_key: str) -> List[str]:
         """
@@ -505,7 +519,7 @@ class RelationshipCache:
         parts = [part.strip() for part in universe_key.split(':') if part.strip()]
         return parts
 
-    def _load_universe_symbols_from_db(self, universe_name: str) -> List[str]:
+    def _load_universe_symbols_from_db(self, universe_name: str) -> Optional[List[str]]:
         """
         Load symbols for a single universe from database.
 
@@ -517,12 +531,9 @@ class RelationshipCache:
             universe_name: Single universe/ETF name (e.g., 'nasdaq100', 'SPY')
 
         Returns:
-            List of symbols for this universe
+            List of symbols for this universe, None if the query failed
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             # Query for both UNIVERSE and ETF types
             query = """
                 SELECT gm.symbol
@@ -533,10 +544,7 @@ class RelationshipCache:
                   AND dg.environment = %s
                 ORDER BY gm.symbol
             """
-            cursor.execute(query, (universe_name, self.environment))
-            symbols = [row[0] for row in cursor.fetchall()]
-
-            conn.close()
+            symbols = [row[0] for row in self._fetch(query, (universe_name, self.environment))]
 
             if not symbols:
                 logger.warning(
@@ -548,7 +556,7 @@ class RelationshipCache:
 
         except Exception as e:
             logger.error(f"Error loading symbols for universe '{universe_name}': {e}")
-            return []
+            return None
 
     def get_available_universes(self, types: List[str] = None) -> List[Dict]:
         """
@@ -578,22 +586,34 @@ class RelationshipCache:
         if types is None:
             types = ['UNIVERSE', 'ETF']
 
-        # Check cache first
-        cache_key = f"available_universes:{':'.join(sorted(types))}"
-        with self._lock:
-            if cache_key in self._universe_metadata_cache:
-                metadata, timestamp = self._universe_metadata_cache[cache_key]
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    logger.debug(f"Cache hit for available_universes (types: {types})")
-                    return metadata.copy()
-            self._stats['misses'] += 1
+        cache_key = self._available_universes_key(types)
+        return _copy_rows(self._get_cached(
+            self._universe_metadata_cache, cache_key,
+            lambda: self._load_available_universes_from_db(types)
+        ) or [])
+
+    @staticmethod
+    def _available_universes_key(types: List[str]) -> str:
+        """Cache key for get_available_universes()"""
+        return f"available_universes:{':'.join(sorted(types))}"
+
+    @staticmethod
+    def _universe_metadata(row: tuple) -> Dict:
+        """Build a get_available_universes() entry from (name, type, description,
+        member_count, environment, created_at, updated_at)"""
+        return {
+            'name': row[0],
+            'type': row[1],
+            'description': row[2] or f"{row[1]}: {row[0]}",
+            'member_count': row[3],
+            'environment': row[4],
+            'created_at': row[5].isoformat() if row[5] else None,
+            'updated_at': row[6].isoformat() if row[6] else None
+        }
 
-        # Query database
+    def _load_available_universes_from_db(self, types: List[str]) -> Optional[List[Dict]]:
+        """Load universe metadata for the given group types from database"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             query = """
                 SELECT
                     dg.name,
@@ -610,38 +630,20 @@ class RelationshipCache:
                 GROUP BY dg.id, dg.name, dg.type, dg.description, dg.environment, dg.created_at, dg.updated_at
                 ORDER BY dg.type, dg.name
             """
-
-            cursor.execute(query, (types, self.environment))
-
-            universes = []
-            for row in cursor.fetchall():
-                universes.append({
-                    'name': row[0],
-                    'type': row[1],
-                    'description': row[2] or f"{row[1]}: {row[0]}",
-                    'member_count': row[3],
-                    'environment': row[4],
-                    'created_at': row[5].isoformat() if row[5] else None,
-                    'updated_at': row[6].isoformat() if row[6] else None
-                })
-
-            conn.close()
+            universes = [
+                self._universe_metadata(row)
+                for row in self._fetch(query, (types, self.environment))
+            ]
 
             logger.info(
                 f"Loaded {len(universes)} available universes from database "
                 f"(types: {types}, environment: {self.environment})"
             )
-
-            # Cache result
-            with self._lock:
-                self._universe_metadata_cache[cache_key] = (universes, datetime.now())
-                self._stats['loads'] += 1
-
-            return universes.copy()
+            return universes
 
         except Exception as e:
             logger.error(f"Error loading available universes: {e}")
-            return []
+            return None
 
     def get_all_etfs(self) -> List[Dict]:
         """
@@ -650,32 +652,13 @@ class RelationshipCache:
         Returns:
             List of dicts with ETF info (name, description, holdings_count)
         """
-        with self._lock:
-            # Check cache
-            if self._all_etfs is not None:
-                etfs, timestamp = self._all_etfs
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    return [e.copy() for e in etfs]
-
-            # Cache miss
-            self._stats['misses'] += 1
-
-        # Load from database
-        etfs = self._load_all_etfs_from_db()
-
-        with self._lock:
-            self._all_etfs = (etfs, datetime.now())
-            self._stats['loads'] += 1
-
-        return [e.copy() for e in etfs]
+        return _copy_rows(
+            self._get_cached(self._catalogs, 'etfs', self._load_all_etfs_from_db) or []
+        )
 
-    def _load_all_etfs_from_db(self) -> List[Dict]:
+    def _load_all_etfs_from_db(self) -> Optional[List[Dict]]:
         """Load all ETFs from database"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             query = """
                 SELECT dg.name, dg.description, COUNT(gm.symbol) as holdings_count
                 FROM definition_groups dg
@@ -684,22 +667,14 @@ class RelationshipCache:
                 GROUP BY dg.id, dg.name, dg.description
                 ORDER BY dg.name
             """
-            cursor.execute(query, (self.environment,))
-
-            etfs = []
-            for row in cursor.fetchall():
-                etfs.append({
-                    'symbol': row[0],
-                    'name': row[1],
-                    'holdings_count': row[2]
-                })
-
-            conn.close()
-            return etfs
+            return [
+                {'symbol': row[0], 'name': row[1], 'holdings_count': row[2]}
+                for row in self._fetch(query, (self.environment,))
+            ]
 
         except Exception as e:
             logger.error(f"Error loading all ETFs: {e}")
-            return []
+            return None
 
     def get_all_sectors(self) -> List[Dict]:
         """
@@ -708,32 +683,13 @@ class RelationshipCache:
         Returns:
             List of dicts with sector info (name, description, stock_count)
         """
-        with self._lock:
-            # Check cache
-            if self._all_sectors is not None:
-                sectors, timestamp = self._all_sectors
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    return [s.copy() for s in sectors]
-
-            # Cache miss
-            self._stats['misses'] += 1
-
-        # Load from database
-        sectors = self._load_all_sectors_from_db()
-
-        with self._lock:
-            self._all_sectors = (sectors, datetime.now())
-            self._stats['loads'] += 1
-
-        return [s.copy() for s in sectors]
+        return _copy_rows(
+            self._get_cached(self._catalogs, 'sectors', self._load_all_sectors_from_db) or []
+        )
 
-    def _load_all_sectors_from_db(self) -> List[Dict]:
+    def _load_all_sectors_from_db(self) -> Optional[List[Dict]]:
         """Load all sectors from database"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             query = """
                 SELECT dg.name, dg.description, COUNT(DISTINCT gm.symbol) as stock_count
                 FROM definition_groups dg
@@ -742,22 +698,14 @@ class RelationshipCache:
                 GROUP BY dg.id, dg.name, dg.description
                 ORDER BY stock_count DESC
             """
-            cursor.execute(query, (self.environment,))
-
-            sectors = []
-            for row in cursor.fetchall():
-                sectors.append({
-                    'key': row[0],
-                    'name': row[1],
-                    'stock_count': row[2]
-                })
-
-            conn.close()
-            return sectors
+            return [
+                {'key': row[0], 'name': row[1], 'stock_count': row[2]}
+                for row in self._fetch(query, (self.environment,))
+            ]
 
         except Exception as e:
             logger.error(f"Error loading all sectors: {e}")
-            return []
+            return None
 
     def get_all_themes(self) -> List[Dict]:
         """
@@ -766,56 +714,11 @@ class RelationshipCache:
         Returns:
             List of dicts with theme info (name, description, member_count)
         """
-        with self._lock:
-            # Check cache
-            if self._all_themes is not None:
-                themes, timestamp = self._all_themes
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    return [t.copy() for t in themes]
-
-            # Cache miss
-            self._stats['misses'] += 1
-
-        # Load from database
-        themes = self._load_all_themes_from_db()
-
-        with self._lock:
-            self._all_themes = (themes, datetime.now())
-            self._stats['loads'] += 1
-
-        return [t.copy() for t in themes]
-
-    def _load_all_themes_from_db(self) -> List[Dict]:
-        """Load all themes from database"""
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            query = """
-                SELECT dg.name, dg.description, COUNT(gm.symbol) as member_count
-                FROM definition_groups dg
-                LEFT JOIN group_memberships gm ON dg.id = gm.group_id
-                WHERE dg.type = 'THEME' AND dg.environment = %s
-                GROUP BY dg.id, dg.name, dg.description
-                ORDER BY dg.name
-            """
-            cursor.execute(query, (self.environment,))
-
-            themes = []
-            for row in cursor.fetchall():
-                themes.append({
-                    'key': row[0],
-                    'name': row[1],
-                    'member_count': row[2]
-                })
-
-            conn.close()
-            return themes
-
-        except Exception as e:
-            logger.error(f"Error loading all themes: {e}")
-            return []
+        return _copy_rows(
+            self._get_cached(
+                self._catalogs, 'themes', lambda: self._load_catalog_from_db('THEME')
+            ) or []
+        )
 
     def get_all_universes(self) -> List[Dict]:
         """
@@ -824,56 +727,31 @@ class RelationshipCache:
         Returns:
             List of dicts with universe info (name, description, member_count)
         """
-        with self._lock:
-            # Check cache
-            if self._all_universes is not None:
-                universes, timestamp = self._all_universes
-                if not self._is_expired(timestamp):
-                    self._stats['hits'] += 1
-                    return [u.copy() for u in universes]
-
-            # Cache miss
-            self._stats['misses'] += 1
-
-        # Load from database
-        universes = self._load_all_universes_from_db()
-
-        with self._lock:
-            self._all_universes = (universes, datetime.now())
-            self._stats['loads'] += 1
-
-        return [u.copy() for u in universes]
+        return _copy_rows(
+            self._get_cached(
+                self._catalogs, 'universes', lambda: self._load_catalog_from_db('UNIVERSE')
+            ) or []
+        )
 
-    def _load_all_universes_from_db(self) -> List[Dict]:
-        """Load all universes from database"""
+    def _load_catalog_from_db(self, group_type: str) -> Optional[List[Dict]]:
+        """Load all THEME or UNIVERSE groups with member counts from database"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
             query = """
                 SELECT dg.name, dg.description, COUNT(gm.symbol) as member_count
                 FROM definition_groups dg
                 LEFT JOIN group_memberships gm ON dg.id = gm.group_id
-                WHERE dg.type = 'UNIVERSE' AND dg.environment = %s
+                WHERE dg.type = %s AND dg.environment = %s
                 GROUP BY dg.id, dg.name, dg.description
                 ORDER BY dg.name
             """
-            cursor.execute(query, (self.environment,))
-
-            universes = []
-            for row in cursor.fetchall():
-                universes.append({
-                    'key': row[0],
-                    'name': row[1],
-                    'member_count': row[2]
-                })
-
-            conn.close()
-            return universes
+            return [
+                {'key': row[0], 'name': row[1], 'member_count': row[2]}
+                for row in self._fetch(query, (group_type, self.environment))
+            ]
 
         except Exception as e:
-            logger.error(f"Error loading all universes: {e}")
-            return []
+            logger.error(f"Error loading all {group_type.lower()} groups: {e}")
+            return None
 
     def invalidate(self, cache_type: Optional[str] = None, key: Optional[str] = None):
         """
@@ -894,10 +772,7 @@ class RelationshipCache:
                 self._universe_members.clear()
                 self._universe_symbols.clear()  # Sprint 61
                 self._universe_metadata_cache.clear()  # Sprint 62
-                self._all_etfs = None
-                self._all_sectors = None
-                self._all_themes = None
-                self._all_universes = None
+                self._catalogs.clear()
                 self._stats['evictions'] += 1
                 logger.info("Cache invalidated: all")
 
@@ -906,7 +781,7 @@ class RelationshipCache:
                     self._etf_holdings.pop(key.upper(), None)
                 else:
                     self._etf_holdings.clear()
-                    self._all_etfs = None
+                    self._catalogs.pop('etfs', None)
                 self._stats['evictions'] += 1
                 logger.info(f"Cache invalidated: etf/{key or 'all'}")
 
@@ -915,7 +790,7 @@ class RelationshipCache:
                     self._sector_stocks.pop(key.lower(), None)
                 else:
                     self._sector_stocks.clear()
-                    self._all_sectors = None
+                    self._catalogs.pop('sectors', None)
                 self._stats['evictions'] += 1
                 logger.info(f"Cache invalidated: sector/{key or 'all'}")
 
@@ -924,7 +799,7 @@ class RelationshipCache:
                     self._theme_members.pop(key.lower(), None)
                 else:
                     self._theme_members.clear()
-                    self._all_themes = None
+                    self._catalogs.pop('themes', None)
                 self._stats['evictions'] += 1
                 logger.info(f"Cache invalidated: theme/{key or 'all'}")
 
@@ -939,7 +814,7 @@ class RelationshipCache:
                     self._universe_members.clear()
                     self._universe_symbols.clear()  # Sprint 61
                     self._universe_metadata_cache.clear()  # Sprint 62
-                    self._all_universes = None
+                    self._catalogs.pop('universes', None)
                 self._stats['evictions'] += 1
                 logger.info(f"Cache invalidated: universe/{key or 'all'}")
 
@@ -958,6 +833,10 @@ class RelationshipCache:
                 'hits': self._stats['hits'],
                 'misses': self._stats['misses'],
                 'loads': self._stats['loads'],
+                'coalesced': self._stats['coalesced'],
+                'stale_hits': self._stats['stale_hits'],
+                'refreshes': self._stats['refreshes'],
+                'revalidations': self._stats['revalidations'],
                 'evictions': self._stats['evictions'],
                 'hit_rate': round(hit_rate, 2),
                 'total_requests': total_requests,
@@ -967,35 +846,132 @@ class RelationshipCache:
                     'stock_sector': len(self._stock_sector),
                     'sector_stocks': len(self._sector_stocks),
                     'theme_members': len(self._theme_members),
-                    'universe_members': len(self._universe_members)
+                    'universe_members': len(self._universe_members),
+                    'universe_symbols': len(self._universe_symbols),
+                    'catalogs': len(self._catalogs)
                 }
             }
 
     def warm_cache(self):
         """
-        Pre-populate cache with common queries
+        Pre-populate the cache with every group, membership and catalog.
+
+        Runs two set-based queries (all memberships, all group metadata)
+        instead of one query per group.
         """
         logger.info("Warming cache...")
         start_time = time.time()
 
-        # Load all metadata
-        self.get_all_etfs()
-        self.get_all_sectors()
-        self.get_all_themes()
-        self.get_all_universes()
-
-        # Load major ETFs
-        major_etfs = ['SPY', 'QQQ', 'DIA', 'VTI', 'IWM']
-        for etf in major_etfs:
-            self.get_etf_holdings(etf)
+        try:
+            membership_rows = self._fetch(
+                """
+                SELECT dg.type, dg.name, gm.symbol, gm.metadata->>'industry'
+                FROM definition_groups dg
+                JOIN group_memberships gm ON dg.id = gm.group_id
+                WHERE dg.type = ANY(%s) AND dg.environment = %s
+                ORDER BY dg.type, dg.name, gm.symbol
+                """,
+                (list(GROUP_TYPES), self.environment)
+            )
+            group_rows = self._fetch(
+                """
+                SELECT
+                    dg.name,
+                    dg.type,
+                    dg.description,
+                    COUNT(gm.symbol) as member_count,
+                    dg.environment,
+                    dg.created_at,
+                    dg.updated_at,
+                    COUNT(DISTINCT gm.symbol) as distinct_count
+                FROM definition_groups dg
+                LEFT JOIN group_memberships gm ON dg.id = gm.group_id
+                WHERE dg.type = ANY(%s) AND dg.environment = %s
+                GROUP BY dg.id, dg.name, dg.type, dg.description, dg.environment,
+                    dg.created_at, dg.updated_at
+                ORDER BY dg.type, dg.name
+                """,
+                (list(GROUP_TYPES), self.environment)
+            )
+        except Exception as e:
+            logger.error(f"Error warming cache: {e}")
+            return
+
+        members: Dict[tuple, List[str]] = defaultdict(list)
+        stock_etfs: Dict[str, List[str]] = defaultdict(list)
+        stock_sector: Dict[str, Dict[str, str]] = {}
+        for group_type, name, symbol, industry in membership_rows:
+            members[(group_type, name)].append(symbol)
+            if group_type == 'ETF':
+                stock_etfs[symbol.upper()].append(name)
+            elif group_type == 'SECTOR' and symbol.upper() not in stock_sector:
+                stock_sector[symbol.upper()] = {'sector': name, 'industry': industry or 'Unknown'}
+
+        catalogs: Dict[str, List[Dict]] = {'etfs': [], 'sectors': [], 'themes': [], 'universes': []}
+        available = []
+        for row in group_rows:
+            name, group_type, description, member_count = row[:4]
+            distinct_count = row[7]
+            if group_type == 'ETF':
+                catalogs['etfs'].append(
+                    {'symbol': name, 'name': description, 'holdings_count': member_count}
+                )
+            elif group_type == 'SECTOR':
+                catalogs['sectors'].append(
+                    {'key': name, 'name': description, 'stock_count': distinct_count}
+                )
+            elif group_type == 'THEME':
+                catalogs['themes'].append(
+                    {'key': name, 'name': description, 'member_count': member_count}
+                )
+            else:
+                catalogs['universes'].append(
+                    {'key': name, 'name': description, 'member_count': member_count}
+                )
+            if group_type in ('UNIVERSE', 'ETF'):
+                available.append(self._universe_metadata(row[:7]))
+        catalogs['sectors'].sort(key=lambda s: s['stock_count'], reverse=True)
 
-        # Load all sector stocks
-        sectors = self.get_all_sectors()
-        for sector in sectors:
-            self.get_sector_stocks(sector['key'])
+        with self._lock:
+            for (group_type, name), symbol_list in members.items():
+                symbols = tuple(symbol_list)
+                if group_type == 'ETF':
+                    self._etf_holdings[name.upper()] = (symbols, self._stamp())
+                elif group_type == 'SECTOR':
+                    self._sector_stocks[name.lower()] = (symbols, self._stamp())
+                elif group_type == 'THEME':
+                    self._theme_members[name.lower()] = (symbols, self._stamp())
+                else:
+                    self._universe_members[name.lower()] = (symbols, self._stamp())
+                if group_type in ('UNIVERSE', 'ETF'):
+                    self._universe_symbols[f"universe_symbols:{name}"] = (
+                        tuple(sorted(set(symbols))), self._stamp()
+                    )
+            for symbol, etfs in stock_etfs.items():
+                self._stock_etfs[symbol] = (tuple(etfs), self._stamp())
+            for symbol, sector_info in stock_sector.items():
+                self._stock_sector[symbol] = (sector_info, self._stamp())
+            for catalog, rows in catalogs.items():
+                self._catalogs[catalog] = (rows, self._stamp())
+            self._universe_metadata_cache[self._available_universes_key(['UNIVERSE', 'ETF'])] = (
+                available, self._stamp()
+            )
+            joinable = sum(1 for group_type, _ in members if group_type in ('UNIVERSE', 'ETF'))
+            self._stats['loads'] += (
+                len(members) + joinable
+                + len(stock_etfs) + len(stock_sector) + len(catalogs) + 1
+            )
 
         elapsed = time.time() - start_time
-        logger.info(f"Cache warmed in {elapsed:.2f}s")
+        logger.info(
+            f"Cache warmed in {elapsed:.2f}s ({len(members)} groups, "
+            f"{len(membership_rows)} memberships)"
+        )
+
+
+def _copy_rows(rows: List[Dict]) -> List[Dict]:
+    """Copy a list of metadata dicts"""
+    return [row.copy() for row in rows]
 
 
 # Singleton instance
@@ -13,7 +13,9 @@ from typing import Any, Literal
 import numpy as np
 import pandas as pd
 
+from src.core.services.breadth_kernels import day_change, pack_frame
 from src.core.services.relationship_cache import get_relationship_cache
+from src.core.services.universe_snapshot_cache import get_universe_snapshot_cache
 from src.infrastructure.database.tickstock_db import TickStockDatabase
 
 logger = logging.getLogger(__name__)
@@ -36,15 +38,17 @@ class ThresholdBarService:
     - Database query: <30ms for 500 symbols
     """
 
-    def __init__(self, relationship_cache=None, db=None, config=None):
+    def __init__(self, relationship_cache=None, db=None, config=None, snapshot_cache=None):
         """Initialize the threshold bar service.
 
         Args:
             relationship_cache: Optional RelationshipCache instance (for testing)
             db: Optional TickStockDatabase instance (for testing)
             config: Optional configuration dict for TickStockDatabase
+            snapshot_cache: Optional UniverseSnapshotCache instance (for testing)
         """
         self.relationship_cache = relationship_cache or get_relationship_cache()
+        self.snapshot_cache = snapshot_cache or get_universe_snapshot_cache()
 
         # Initialize database
         if db is not None:
@@ -136,31 +140,29 @@ class ThresholdBarService:
 
         logger.debug(f"Loaded {len(symbols)} symbols for {data_source}")
 
-        # Step 2: Query OHLCV data
-        ohlcv_data = self._query_ohlcv_data(symbols, timeframe, period_days)
-
-        if ohlcv_data.empty:
-            raise RuntimeError(
-                f"No OHLCV data available for {data_source} "
-                f"(timeframe={timeframe}, symbols={len(symbols)}, period_days={period_days}). "
-                f"Try increasing period_days or check if {timeframe} data exists for these symbols."
+        # Steps 2-3: Latest percentage change per symbol; daily bars come from
+        # the shared universe snapshot, other timeframes are queried
+        if timeframe == "daily":
+            percentage_changes = self._snapshot_percentage_changes(
+                data_source, symbols, period_days
             )
+        else:
+            ohlcv_data = self._query_ohlcv_data(symbols, timeframe, period_days)
+
+            if ohlcv_data.empty:
+                raise self._no_data_error(data_source, timeframe, symbols, period_days)
 
-        logger.debug(f"Queried {len(ohlcv_data)} OHLCV rows")
+            logger.debug(f"Queried {len(ohlcv_data)} OHLCV rows")
 
-        # Step 3: Calculate percentage changes
-        percentage_changes = self._calculate_percentage_changes(ohlcv_data, timeframe)
+            percentage_changes = self._calculate_percentage_changes(ohlcv_data, timeframe)
 
         if percentage_changes.empty:
             raise RuntimeError(f"Failed to calculate percentage changes for {data_source}")
 
         logger.debug(f"Calculated {len(percentage_changes)} percentage changes")
 
-        # Step 4: Bin into segments
-        binned_data = self._bin_into_segments(percentage_changes, bar_type, threshold)
-
-        # Step 5: Aggregate segment percentages
-        segments = self._aggregate_segment_percentages(binned_data, bar_type)
+        # Steps 4-5: Bin into segments and aggregate segment percentages
+        segments = self.calculate_segments(percentage_changes, bar_type, threshold)
 
         elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
         logger.info(
@@ -181,6 +183,22 @@ class ThresholdBarService:
             "segments": segments,
         }
 
+    def calculate_segments(
+        self, percentage_changes: pd.DataFrame, bar_type: BarType, threshold: float
+    ) -> dict[str, float]:
+        """Segment percentages of a set of per-symbol percentage changes.
+
+        Args:
+            percentage_changes: DataFrame with 'pct_change' column
+            bar_type: Type of bar to calculate
+            threshold: Sensitivity threshold (e.g., 0.10 for 10%)
+
+        Returns:
+            Dictionary mapping segment names to percentages (0-100)
+        """
+        binned_data = self._bin_into_segments(percentage_changes, bar_type, threshold)
+        return self._aggregate_segment_percentages(binned_data, bar_type)
+
     def _load_symbols_for_data_source(self, data_source: str) -> list[str]:
         """Load symbols from RelationshipCache for given data source.
 
@@ -208,7 +226,7 @@ class ThresholdBarService:
                     f"Loaded {len(symbols)} symbols from RelationshipCache "
                     f"for data_source: {data_source}"
                 )
-                return symbols
+                return list(symbols)
 
             # Fallback: treat as direct symbol
             logger.warning(f"No universe/ETF found for '{data_source}', treating as direct symbol")
@@ -297,12 +315,57 @@ class ThresholdBarService:
             logger.error(f"Database query failed for {table_name}: {e}")
             raise RuntimeError(f"Failed to query {table_name}") from e
 
+    def _no_data_error(
+        self, data_source: str, timeframe: Timeframe, symbols: list[str], period_days: int
+    ) -> RuntimeError:
+        return RuntimeError(
+            f"No OHLCV data available for {data_source} "
+            f"(timeframe={timeframe}, symbols={len(symbols)}, period_days={period_days}). "
+            f"Try increasing period_days or check if {timeframe} data exists for these symbols."
+        )
+
+    def _snapshot_percentage_changes(
+        self, data_source: str, symbols: list[str], period_days: int
+    ) -> pd.DataFrame:
+        """Latest daily percentage change per symbol from the universe snapshot.
+
+        Matches _query_ohlcv_data + _calculate_percentage_changes: only bars
+        dated within period_days count, so a symbol needs its latest two bars
+        inside the window.
+
+        Args:
+            data_source: Universe key the snapshot is cached under
+            symbols: Universe members
+            period_days: Number of days to look back
+
+        Returns:
+            DataFrame with columns: symbol, pct_change
+
+        Raises:
+            RuntimeError: If no bars fall inside the window
+        """
+        snapshot = self.snapshot_cache.get_snapshot(data_source, symbols)
+        columns = snapshot.columns
+
+        cutoff = np.datetime64((datetime.now() - timedelta(days=period_days)).date(), "ns")
+
+        if not (columns["time"] >= cutoff).any():
+            raise self._no_data_error(data_source, "daily", symbols, period_days)
+
+        in_window = (columns["prev_time"] >= cutoff) & ~np.isnan(columns["day_change"])
+
+        return pd.DataFrame({
+            "symbol": np.asarray(snapshot.symbols)[in_window],
+            "pct_change": columns["day_change"][in_window],
+        })
+
     def _calculate_percentage_changes(
         self, ohlcv_data: pd.DataFrame, timeframe: Timeframe
     ) -> pd.DataFrame:
         """Calculate percentage changes for each symbol.
 
-        Uses vectorized pandas operations for performance.
+        Sorts once and reshapes closes into a (symbols x bars) panel, so the
+        latest change of every symbol is one array operation.
         Calculates: (current_close - previous_close) / previous_close * 100
 
         Args:
@@ -313,21 +376,17 @@ class ThresholdBarService:
             DataFrame with columns: symbol, pct_change
             Only includes latest value per symbol
         """
-        # Group by symbol and calculate % change
-        ohlcv_data = ohlcv_data.sort_values(["symbol", "timestamp"])
-
-        # Calculate percentage change within each symbol group
-        ohlcv_data["pct_change"] = ohlcv_data.groupby("symbol")["close"].transform(
-            lambda x: x.pct_change() * 100
-        )
-
-        # Get only the latest value per symbol (most recent % change)
-        latest_changes = ohlcv_data.groupby("symbol").last().reset_index()[["symbol", "pct_change"]]
+        panel = pack_frame(ohlcv_data, time_column="timestamp")
+        changes = day_change(panel)
 
         # Drop NaN values (symbols with only 1 data point)
-        latest_changes = latest_changes.dropna(subset=["pct_change"])
+        has_change = ~np.isnan(changes)
+        latest_changes = pd.DataFrame({
+            "symbol": np.asarray(panel.symbols, dtype=object)[has_change],
+            "pct_change": changes[has_change],
+        })
 
-        dropped_count = len(ohlcv_data["symbol"].unique()) - len(latest_changes)
+        dropped_count = len(panel) - len(latest_changes)
         logger.debug(
             f"Calculated pct_change for {len(latest_changes)} symbols "
             f"(dropped {dropped_count} with insufficient data)"
@@ -0,0 +1,337 @@
+"""
+Universe Snapshot Cache
+
+In-memory columnar store of the last N daily bars for each universe, shared by
+BreadthMetricsService and ThresholdBarService so their endpoints stop querying
+ohlcv_daily on every request.
+
+- One OHLCVPanel (symbols x bars arrays) per universe, loaded with a single
+  OHLCVDataService.get_ohlcv_panel() query
+- Latest-bar values the endpoints need (period returns, EMA10/20, SMA50/200,
+  day and open change) are precomputed once per load/refresh
+- Every UNIVERSE_SNAPSHOT_REFRESH_SECONDS a read fetches only the trailing
+  bars of each symbol and merges new or revised daily bars into the panel
+- UNIVERSE_SNAPSHOT_BARS bars are kept per symbol (default 252, one trading
+  year); at most UNIVERSE_SNAPSHOT_MAX_UNIVERSES universes are held (LRU)
+
+Usage:
+    from src.core.services.universe_snapshot_cache import get_universe_snapshot_cache
+
+    snapshot = get_universe_snapshot_cache().get_snapshot('SPY', symbols)
+    above_sma50 = snapshot.columns['close'] > snapshot.columns['sma_50']
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+import numpy as np
+
+from src.analysis.data.ohlcv_panel import OHLCV_COLUMNS, OHLCVPanel
+from src.core.services.breadth_kernels import RETURN_PERIODS, SMA_PERIODS, latest_columns
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UniverseSnapshot:
+    """Daily bars of one universe plus precomputed latest-bar columns."""
+
+    universe: str
+    panel: OHLCVPanel
+    # Per-symbol arrays aligned with panel.symbols (NaN/NaT when the symbol
+    # has too few bars): time, prev_time, close, open, day_change,
+    # open_change, return_<n>, ema_<n>, sma_<n>
+    columns: dict[str, np.ndarray]
+    loaded_at: float
+    checked_at: float
+
+    @property
+    def symbols(self) -> list[str]:
+        return self.panel.symbols
+
+    @property
+    def as_of(self) -> np.datetime64:
+        """Date of the most recent bar in the universe (NaT when empty)."""
+        times = self.columns['time']
+        times = times[~np.isnat(times)]
+        return times.max() if len(times) else np.datetime64('NaT')
+
+
+def _trim(panel: OHLCVPanel, max_bars: int) -> OHLCVPanel:
+    """Keep the last `max_bars` columns of a panel."""
+    if panel.bars <= max_bars:
+        return panel
+    return OHLCVPanel(
+        symbols=panel.symbols,
+        times=panel.times[:, -max_bars:],
+        lengths=np.minimum(panel.lengths, max_bars),
+        **{col: panel.column(col)[:, -max_bars:] for col in OHLCV_COLUMNS}
+    )
+
+
+def _merge_tail(
+    panel: OHLCVPanel, tail: OHLCVPanel, tail_bars: int, max_bars: int
+) -> OHLCVPanel | None:
+    """
+    Merge freshly fetched trailing bars into a snapshot panel.
+
+    Bars newer than a symbol's latest stored bar are appended; a bar on the
+    latest stored date replaces it when its values changed (late corrections
+    of the current day).
+
+    Args:
+        panel: Snapshot panel
+        tail: Last `tail_bars` bars of the same symbols, in the same row order
+        tail_bars: Bars per symbol requested for `tail`
+        max_bars: Bars to keep per symbol
+
+    Returns:
+        The merged panel, `panel` itself when nothing changed, or None when a
+        symbol gained more bars than the tail covers (a full reload is needed)
+    """
+    if panel.bars:
+        last = panel.times[:, -1]
+    else:
+        last = np.full(len(panel), np.datetime64('NaT'), dtype='datetime64[ns]')
+
+    # A symbol without stored bars has NaT here, so every tail bar is new for it
+    tail_valid = tail.valid
+    seen = tail_valid & (tail.times <= last[:, None])
+    newer = tail_valid & ~seen
+    same_day = tail_valid & (tail.times == last[:, None])
+
+    # A full tail with nothing at or before the stored latest bar may have skipped bars
+    overlaps = seen.any(axis=1)
+    if ((tail.lengths >= tail_bars) & ~overlaps).any():
+        return None
+
+    revised = same_day
+    if panel.bars:
+        rows = np.arange(len(panel))
+        positions = same_day.argmax(axis=1)
+        changed = np.zeros(len(panel), dtype=bool)
+        for col in OHLCV_COLUMNS:
+            stored = panel.column(col)[:, -1]
+            fetched = tail.column(col)[rows, positions] if tail.bars else stored
+            changed |= (fetched != stored) & ~(np.isnan(fetched) & np.isnan(stored))
+        revised = same_day & changed[:, None]
+
+    incoming = newer | revised
+    if not incoming.any():
+        return panel
+
+    keep = panel.valid
+    if panel.bars:
+        keep[revised.any(axis=1), -1] = False
+
+    old_rows, old_cols = np.nonzero(keep)
+    new_rows, new_cols = np.nonzero(incoming)
+    merged = OHLCVPanel.from_flat(
+        panel.symbols,
+        np.concatenate([old_rows, new_rows]),
+        np.concatenate([panel.times[old_rows, old_cols], tail.times[new_rows, new_cols]]),
+        {
+            col: np.concatenate([
+                panel.column(col)[old_rows, old_cols], tail.column(col)[new_rows, new_cols]
+            ])
+            for col in OHLCV_COLUMNS
+        },
+    )
+    return _trim(merged, max_bars)
+
+
+class UniverseSnapshotCache:
+    """Thread-safe per-universe daily bar snapshots with incremental refresh."""
+
+    # Trailing bars per symbol fetched by an incremental refresh
+    TAIL_BARS = 5
+
+    def __init__(self, config: dict[str, Any] | None = None, data_service=None):
+        """
+        Initialize the snapshot cache.
+
+        Args:
+            config: Configuration dictionary with UNIVERSE_SNAPSHOT_* settings
+            data_service: Optional OHLCVDataService (for testing); created on
+                first load otherwise
+        """
+        config = config or {}
+        # Never fewer bars than the longest precomputed lookback
+        self.max_bars = max(
+            int(config.get('UNIVERSE_SNAPSHOT_BARS', 252)), *RETURN_PERIODS, *SMA_PERIODS
+        )
+        self.refresh_seconds = float(config.get('UNIVERSE_SNAPSHOT_REFRESH_SECONDS', 300))
+        self.max_universes = int(config.get('UNIVERSE_SNAPSHOT_MAX_UNIVERSES', 32))
+
+        self._data_service = data_service
+        self._snapshots: OrderedDict[str, UniverseSnapshot] = OrderedDict()
+        self._lock = Lock()
+        self._universe_locks: dict[str, Lock] = {}
+
+        self.stats = {
+            'hits': 0,
+            'loads': 0,
+            'refreshes': 0,
+            'refresh_failures': 0,
+        }
+
+    @property
+    def data_service(self):
+        if self._data_service is None:
+            from src.analysis.data.ohlcv_data_service import OHLCVDataService
+
+            self._data_service = OHLCVDataService()
+        return self._data_service
+
+    def get_snapshot(self, universe: str, symbols: list[str]) -> UniverseSnapshot:
+        """
+        Get the daily bar snapshot of a universe, loading or refreshing it if needed.
+
+        Args:
+            universe: Universe key the snapshot is cached under
+            symbols: Current universe members; a changed member list reloads
+                the snapshot
+
+        Returns:
+            UniverseSnapshot (treat as read-only; it is shared between callers)
+
+        Raises:
+            RuntimeError: If the initial load fails
+        """
+        members = list(dict.fromkeys(s.upper() for s in symbols))
+
+        snapshot = self._snapshots.get(universe)
+        if self._is_current(snapshot, members):
+            self.stats['hits'] += 1
+            return snapshot
+
+        # One loader per universe; concurrent readers wait for its result
+        with self._universe_lock(universe):
+            snapshot = self._snapshots.get(universe)
+            if self._is_current(snapshot, members):
+                self.stats['hits'] += 1
+                return snapshot
+
+            if snapshot is not None and snapshot.symbols == members:
+                snapshot = self._refresh(snapshot)
+            else:
+                snapshot = self._load(universe, members)
+
+            self._store(snapshot)
+            return snapshot
+
+    def mark_stale(self, universe: str | None = None):
+        """Make the next read of a universe (or of all universes) check for new bars."""
+        with self._lock:
+            targets = [universe] if universe else list(self._snapshots)
+            for key in targets:
+                if key in self._snapshots:
+                    self._snapshots[key].checked_at = 0.0
+
+    def invalidate(self, universe: str | None = None):
+        """Drop a universe's snapshot (or all snapshots)."""
+        with self._lock:
+            if universe:
+                self._snapshots.pop(universe, None)
+            else:
+                self._snapshots.clear()
+
+    def _is_current(self, snapshot: UniverseSnapshot | None, members: list[str]) -> bool:
+        return (
+            snapshot is not None
+            and time.time() - snapshot.checked_at < self.refresh_seconds
+            and snapshot.symbols == members
+        )
+
+    def _universe_lock(self, universe: str) -> Lock:
+        with self._lock:
+            return self._universe_locks.setdefault(universe, Lock())
+
+    def _store(self, snapshot: UniverseSnapshot):
+        with self._lock:
+            self._snapshots[snapshot.universe] = snapshot
+            self._snapshots.move_to_end(snapshot.universe)
+            while len(self._snapshots) > self.max_universes:
+                evicted, _ = self._snapshots.popitem(last=False)
+                self._universe_locks.pop(evicted, None)
+
+    def _load(self, universe: str, members: list[str]) -> UniverseSnapshot:
+        start_time = time.time()
+        try:
+            panel = self.data_service.get_ohlcv_panel(members, 'daily', limit=self.max_bars)
+        except Exception as e:
+            logger.error(f"UNIVERSE-SNAPSHOT: Failed to load {universe}: {e}")
+            raise RuntimeError(f"Failed to load daily snapshot for {universe}") from e
+
+        now = time.time()
+        snapshot = UniverseSnapshot(
+            universe, panel, latest_columns(panel), loaded_at=now, checked_at=now
+        )
+        self.stats['loads'] += 1
+        logger.info(
+            f"UNIVERSE-SNAPSHOT: Loaded {universe} ({len(panel)} symbols, {panel.bars} bars) "
+            f"in {(now - start_time) * 1000:.1f}ms"
+        )
+        return snapshot
+
+    def _refresh(self, snapshot: UniverseSnapshot) -> UniverseSnapshot:
+        try:
+            tail = self.data_service.get_ohlcv_panel(
+                snapshot.symbols, 'daily', limit=self.TAIL_BARS
+            )
+        except Exception as e:
+            # Keep serving the stale snapshot; retry after the next interval
+            self.stats['refresh_failures'] += 1
+            logger.warning(
+                f"UNIVERSE-SNAPSHOT: Refresh of {snapshot.universe} failed, "
+                f"serving stale data: {e}"
+            )
+            snapshot.checked_at = time.time()
+            return snapshot
+
+        panel = _merge_tail(snapshot.panel, tail, self.TAIL_BARS, self.max_bars)
+        if panel is None:
+            logger.info(
+                f"UNIVERSE-SNAPSHOT: {snapshot.universe} missed more than "
+                f"{self.TAIL_BARS} bars, reloading"
+            )
+            return self._load(snapshot.universe, snapshot.symbols)
+
+        self.stats['refreshes'] += 1
+        if panel is snapshot.panel:
+            snapshot.checked_at = time.time()
+            return snapshot
+
+        logger.info(f"UNIVERSE-SNAPSHOT: Merged new daily bars into {snapshot.universe}")
+        return UniverseSnapshot(
+            snapshot.universe, panel, latest_columns(panel),
+            loaded_at=snapshot.loaded_at, checked_at=time.time()
+        )
+
+
+# Singleton instance
+_snapshot_cache: UniverseSnapshotCache | None = None
+_snapshot_cache_lock = Lock()
+
+
+def get_universe_snapshot_cache() -> UniverseSnapshotCache:
+    """
+    Get singleton snapshot cache instance
+
+    Returns:
+        UniverseSnapshotCache configured from the application config
+    """
+    global _snapshot_cache
+
+    if _snapshot_cache is None:
+        with _snapshot_cache_lock:
+            if _snapshot_cache is None:
+                from src.core.services.config_manager import get_config
+
+                _snapshot_cache = UniverseSnapshotCache(get_config())
+
+    return _snapshot_cache
@@ -219,6 +219,9 @@ class EODProcessor:
                 'validation_status': validation_results.get('status', 'UNKNOWN')
             }
 
+            # Precompute breadth/threshold results from the completed daily bars
+            results['breadth_materialization'] = self.materialize_breadth()
+
             # Send notification
             self.send_eod_notification(results)
 
@@ -235,6 +238,23 @@ class EODProcessor:
             self.send_eod_notification(error_results)
             return error_results
 
+    def materialize_breadth(self) -> dict[str, Any]:
+        """Store breadth metrics and threshold bars of every universe for API reads."""
+        try:
+            from src.core.services.breadth_materialization import (
+                BreadthMaterializer,
+                BreadthStore,
+            )
+
+            self._connect_redis()
+            config = get_config()
+            store = BreadthStore(self.redis_client, config.get('BREADTH_HISTORY_DAYS', 400))
+            return BreadthMaterializer(store, config).materialize()
+
+        except Exception as e:
+            logger.error(f"EOD-PROCESSOR: Breadth materialization failed: {e}")
+            return {'status': 'ERROR', 'error': str(e)}
+
     def send_eod_notification(self, results: dict[str, Any]):
         """Send EOD completion notification via Redis."""
         try:
@@ -13,6 +13,8 @@ import json
 import logging
 import threading
 import time
+import uuid
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass
 from enum import Enum
 from typing import Any
@@ -21,6 +23,15 @@ import redis
 
 logger = logging.getLogger(__name__)
 
+# Python-side sort keys for scan results that are not ordered by an index
+SCAN_SORT_KEYS = {
+    'confidence': lambda p: p.confidence,
+    'detected_at': lambda p: p.detected_at,
+    'symbol': lambda p: p.symbol,
+    'rs': lambda p: p.indicators.get('relative_strength', 1.0),
+    'volume': lambda p: p.indicators.get('relative_volume', 1.0),
+}
+
 class PatternCacheEventType(Enum):
     """Pattern cache event types from TickStockPL."""
     PATTERN_DETECTED = "pattern_detected"
@@ -132,6 +143,7 @@ class RedisPatternCache:
         self.pattern_cache_ttl = config.get('pattern_cache_ttl', 3600)  # 1 hour
         self.api_response_cache_ttl = config.get('api_response_cache_ttl', 30)  # 30 seconds
         self.index_cache_ttl = config.get('index_cache_ttl', 3600)  # 1 hour
+        self.fetch_batch_size = max(int(config.get('pattern_fetch_batch_size', 500)), 1)  # IDs per pipelined round trip
 
         # Redis key prefixes
         self.pattern_key_prefix = "tickstock:patterns:"
@@ -143,6 +155,14 @@ class RedisPatternCache:
         self.symbol_index_key = f"{self.index_key_prefix}symbol"
         self.pattern_type_index_key = f"{self.index_key_prefix}pattern_type"
         self.time_index_key = f"{self.index_key_prefix}time"
+        self.expires_index_key = f"{self.index_key_prefix}expires"
+        # Per-value indexes (pattern_id -> detected_at) used for server-side intersections
+        self.symbol_set_prefix = f"{self.symbol_index_key}:"
+        self.pattern_type_set_prefix = f"{self.pattern_type_index_key}:"
+        self.temp_key_prefix = f"{self.index_key_prefix}tmp:"
+
+        # API response cache generations: 'global', 'symbol:<SYM>', 'pattern_type:<TYPE>'
+        self.api_cache_versions_key = f"{self.api_cache_key_prefix}versions"
 
         # Statistics
         self.stats = PatternCacheStats()
@@ -194,51 +214,38 @@ class RedisPatternCache:
     def _cleanup_expired_patterns(self):
         """Remove expired patterns from cache and indexes."""
         try:
-            current_time = time.time()
-            cleanup_count = 0
-
-            # Get all pattern keys
-            pattern_keys = self.redis_client.keys(f"{self.pattern_key_prefix}*")
+            # Expiry index holds pattern_id -> expires_at, so no KEYS scan or per-key reads
+            expired_ids = self.redis_client.zrangebyscore(self.expires_index_key, '-inf', time.time())
+            if not expired_ids:
+                return
 
             pipe = self.redis_client.pipeline()
+            symbols, pattern_types = set(), set()
+
+            for pattern_id in expired_ids:
+                # Pattern IDs are "<symbol>:<pattern_type>:<detected_at>"
+                symbol, _, rest = pattern_id.partition(':')
+                pattern_type = rest.rpartition(':')[0]
+                symbols.add(symbol)
+                pattern_types.add(pattern_type)
+
+                # Remove from main cache
+                pipe.delete(f"{self.pattern_key_prefix}{pattern_id}")
+
+                # Remove from sorted set indexes
+                pipe.zrem(self.confidence_index_key, pattern_id)
+                pipe.zrem(self.symbol_index_key, f"{symbol}:{pattern_id}")
+                pipe.zrem(self.pattern_type_index_key, f"{pattern_type}:{pattern_id}")
+                pipe.zrem(self.time_index_key, pattern_id)
+                pipe.zrem(self.expires_index_key, pattern_id)
+                pipe.zrem(f"{self.symbol_set_prefix}{symbol}", pattern_id)
+                pipe.zrem(f"{self.pattern_type_set_prefix}{pattern_type}", pattern_id)
 
-            for pattern_key in pattern_keys:
-                # Get pattern data
-                pattern_data = self.redis_client.hget(pattern_key, 'data')
-                if not pattern_data:
-                    continue
-
-                try:
-                    pattern = json.loads(pattern_data)
-                    expires_at = pattern.get('expires_at', 0)
-
-                    if expires_at <= current_time:
-                        # Pattern expired - remove from cache and indexes
-                        pattern_id = pattern_key.split(':')[-1]
-                        symbol = pattern.get('symbol', '')
-                        pattern_type = pattern.get('pattern_type', '')
-                        confidence = pattern.get('confidence', 0)
-                        detected_at = pattern.get('detected_at', 0)
-
-                        # Remove from main cache
-                        pipe.delete(pattern_key)
-
-                        # Remove from sorted set indexes
-                        pipe.zrem(self.confidence_index_key, pattern_id)
-                        pipe.zrem(self.symbol_index_key, f"{symbol}:{pattern_id}")
-                        pipe.zrem(self.pattern_type_index_key, f"{pattern_type}:{pattern_id}")
-                        pipe.zrem(self.time_index_key, pattern_id)
-
-                        cleanup_count += 1
-
-                except json.JSONDecodeError:
-                    continue
+            pipe.execute()
+            self._invalidate_api_cache(symbols, pattern_types)
 
-            # Execute cleanup pipeline
-            if cleanup_count > 0:
-                pipe.execute()
-                self.stats.expired_patterns_cleaned += cleanup_count
-                logger.debug("PATTERN-CACHE: Cleaned up %d expired patterns", cleanup_count)
+            self.stats.expired_patterns_cleaned += len(expired_ids)
+            logger.debug("PATTERN-CACHE: Cleaned up %d expired patterns", len(expired_ids))
 
         except Exception as e:
             logger.error("PATTERN-CACHE: Error during cleanup: %s", e)
@@ -297,12 +304,20 @@ class RedisPatternCache:
             pipe.zadd(self.symbol_index_key, {f"{pattern.symbol}:{pattern_id}": pattern.detected_at})
             pipe.zadd(self.pattern_type_index_key, {f"{pattern.pattern_type}:{pattern_id}": pattern.detected_at})
             pipe.zadd(self.time_index_key, {pattern_id: pattern.detected_at})
+            pipe.zadd(self.expires_index_key, {pattern_id: pattern.expires_at})
+            symbol_set_key = f"{self.symbol_set_prefix}{pattern.symbol}"
+            pattern_type_set_key = f"{self.pattern_type_set_prefix}{pattern.pattern_type}"
+            pipe.zadd(symbol_set_key, {pattern_id: pattern.detected_at})
+            pipe.zadd(pattern_type_set_key, {pattern_id: pattern.detected_at})
 
             # Set TTL on indexes
             pipe.expire(self.confidence_index_key, self.index_cache_ttl)
             pipe.expire(self.symbol_index_key, self.index_cache_ttl)
             pipe.expire(self.pattern_type_index_key, self.index_cache_ttl)
             pipe.expire(self.time_index_key, self.index_cache_ttl)
+            pipe.expire(self.expires_index_key, self.index_cache_ttl)
+            pipe.expire(symbol_set_key, self.index_cache_ttl)
+            pipe.expire(pattern_type_set_key, self.index_cache_ttl)
 
             # Execute pipeline
             pipe.execute()
@@ -313,8 +328,8 @@ class RedisPatternCache:
                 self.stats.events_processed += 1
                 self.stats.last_event_time = time.time()
 
-            # Clear API response cache (patterns changed)
-            self._invalidate_api_cache()
+            # Retire cached API responses that could include this pattern
+            self._invalidate_api_cache([pattern.symbol], [pattern.pattern_type])
 
             logger.debug("PATTERN-CACHE: Cached pattern %s on %s (conf: %.2f)",
                         pattern.pattern_type, pattern.symbol, pattern.confidence)
@@ -336,13 +351,25 @@ class RedisPatternCache:
         # For now, treat as new pattern (overwrite)
         return self._cache_new_pattern(pattern_data)
 
-    def _invalidate_api_cache(self):
-        """Invalidate API response cache when patterns change."""
+    def _invalidate_api_cache(self, symbols: Iterable[str] = (), pattern_types: Iterable[str] = ()):
+        """
+        Invalidate API response cache when patterns change.
+
+        Bumps the global generation and those of the affected symbol and
+        pattern type partitions. Responses cached under older generations are
+        never read again and expire through their TTL, so nothing is scanned
+        or deleted.
+        """
         try:
-            api_cache_keys = self.redis_client.keys(f"{self.api_cache_key_prefix}*")
-            if api_cache_keys:
-                self.redis_client.delete(*api_cache_keys)
-                logger.debug("PATTERN-CACHE: Invalidated %d API cache entries", len(api_cache_keys))
+            fields = ['global']
+            fields += [f"symbol:{symbol}" for symbol in symbols]
+            fields += [f"pattern_type:{pattern_type}" for pattern_type in pattern_types]
+
+            pipe = self.redis_client.pipeline()
+            for field in fields:
+                pipe.hincrby(self.api_cache_versions_key, field, 1)
+            pipe.execute()
+            logger.debug("PATTERN-CACHE: Bumped API cache generations %s", fields)
         except Exception as e:
             logger.error("PATTERN-CACHE: Error invalidating API cache: %s", e)
 
@@ -373,6 +400,8 @@ class RedisPatternCache:
             rsi_min, rsi_max = float(rsi_range[0]), float(rsi_range[1])
             confidence_min = float(filters.get('confidence_min', 0.5))
             symbols = filters.get('symbols', [])
+            detected_after = filters.get('detected_after')
+            detected_before = filters.get('detected_before')
             page = int(filters.get('page', 1))
             per_page = min(int(filters.get('per_page', 30)), 100)
             sort_by = filters.get('sort_by', 'confidence')
@@ -382,7 +411,8 @@ class RedisPatternCache:
             patterns = self._query_patterns_from_redis(
                 pattern_types, symbols, confidence_min,
                 rs_min, vol_min, rsi_min, rsi_max,
-                sort_by, sort_order
+                sort_by, sort_order,
+                detected_after=detected_after, detected_before=detected_before
             )
 
             # Apply pagination
@@ -432,97 +462,246 @@ class RedisPatternCache:
     def _query_patterns_from_redis(self, pattern_types: list[str], symbols: list[str],
                                   confidence_min: float, rs_min: float, vol_min: float,
                                   rsi_min: float, rsi_max: float,
-                                  sort_by: str, sort_order: str) -> list[CachedPattern]:
-        """Query patterns from Redis using sorted set indexes."""
+                                  sort_by: str, sort_order: str,
+                                  detected_after: float | None = None,
+                                  detected_before: float | None = None) -> list[CachedPattern]:
+        """
+        Query patterns from Redis using sorted set indexes.
+
+        Symbol, pattern type and time window filters are resolved by the query
+        planner so only matching IDs are loaded. Without them, candidate IDs
+        come from the index matching sort_by. Pattern hashes are fetched in
+        pipelined batches and filtered batch by batch.
+        """
         try:
-            # Start with confidence filtering (most selective)
-            if sort_by == 'confidence':
-                # Use confidence index directly
-                if sort_order == 'desc':
-                    pattern_ids = self.redis_client.zrevrangebyscore(
-                        self.confidence_index_key, '+inf', confidence_min
-                    )
-                else:
-                    pattern_ids = self.redis_client.zrangebyscore(
-                        self.confidence_index_key, confidence_min, '+inf'
-                    )
-            else:
-                # Get all patterns above confidence threshold
-                pattern_ids = self.redis_client.zrangebyscore(
-                    self.confidence_index_key, confidence_min, '+inf'
-                )
-
-            # Load pattern data and apply additional filters
+            pattern_ids = self._plan_candidate_ids(
+                symbols, pattern_types, confidence_min, detected_after, detected_before
+            )
+            presorted = pattern_ids is None
+            if presorted:
+                pattern_ids = self._ordered_pattern_ids(confidence_min, sort_by, sort_order)
+
+            # Load pattern data in batches and apply additional filters
             filtered_patterns = []
+            now = time.time()
 
-            for pattern_id in pattern_ids:
-                pattern_key = f"{self.pattern_key_prefix}{pattern_id}"
-                pattern_data = self.redis_client.hget(pattern_key, 'data')
+            for batch in self._fetch_pattern_batches(pattern_ids):
+                for pattern_id, pattern_data in batch:
+                    if not pattern_data:
+                        continue
 
-                if not pattern_data:
-                    continue
+                    try:
+                        pattern = CachedPattern(**json.loads(pattern_data))
+                    except (json.JSONDecodeError, TypeError) as e:
+                        logger.warning("PATTERN-CACHE: Invalid pattern data for %s: %s", pattern_id, e)
+                        continue
 
-                try:
-                    pattern_dict = json.loads(pattern_data)
-                    pattern = CachedPattern(**pattern_dict)
+                    if self._matches_filters(pattern, pattern_types, symbols, confidence_min,
+                                             rs_min, vol_min, rsi_min, rsi_max, now,
+                                             detected_after, detected_before):
+                        filtered_patterns.append(pattern)
 
-                    # Apply filters
-                    if pattern_types and pattern.pattern_type not in pattern_types:
-                        continue
+            # Planned results and indicator orderings are sorted after decoding
+            if not presorted or sort_by in ('rs', 'volume'):
+                sort_key = SCAN_SORT_KEYS.get(sort_by, SCAN_SORT_KEYS['confidence'])
+                filtered_patterns.sort(key=sort_key, reverse=(sort_order == 'desc'))
 
-                    if symbols and pattern.symbol not in symbols:
-                        continue
+            return filtered_patterns
 
-                    rs = pattern.indicators.get('relative_strength', 1.0)
-                    if rs < rs_min:
-                        continue
+        except Exception as e:
+            logger.error("PATTERN-CACHE: Error querying Redis patterns: %s", e)
+            return []
 
-                    vol = pattern.indicators.get('relative_volume', 1.0)
-                    if vol < vol_min:
-                        continue
+    def _plan_candidate_ids(self, symbols: list[str], pattern_types: list[str],
+                            confidence_min: float, detected_after: float | None,
+                            detected_before: float | None) -> list[str] | None:
+        """
+        Resolve symbol, pattern type and time window filters to pattern IDs.
+
+        Estimates each filter's cardinality in one round trip, then runs the
+        plan in a second: symbol and pattern type sets are unioned per filter
+        and intersected server-side with the confidence or time index,
+        whichever range is more selective. The other range is checked after
+        decoding.
+
+        Returns:
+            Matching pattern IDs (unordered), or None when no selective
+            filter applies and the caller should scan an index directly
+        """
+        has_window = detected_after is not None or detected_before is not None
+        if not symbols and not pattern_types and not has_window:
+            return None
+
+        time_min = '-inf' if detected_after is None else detected_after
+        time_max = '+inf' if detected_before is None else detected_before
+        symbol_keys = [f"{self.symbol_set_prefix}{symbol}" for symbol in symbols]
+        pattern_type_keys = [f"{self.pattern_type_set_prefix}{pattern_type}" for pattern_type in pattern_types]
+
+        # Round trip 1: cardinality estimates
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in symbol_keys + pattern_type_keys:
+            pipe.zcard(key)
+        pipe.zcount(self.confidence_index_key, confidence_min, '+inf')
+        pipe.zcount(self.time_index_key, time_min, time_max)
+        counts = pipe.execute()
+
+        symbol_count = sum(counts[:len(symbol_keys)])
+        pattern_type_count = sum(counts[len(symbol_keys):-2])
+        confidence_count, window_count = counts[-2], counts[-1]
+
+        # Range over whichever score index leaves fewer candidates
+        if has_window and window_count < confidence_count:
+            range_key, range_min, range_max = self.time_index_key, time_min, time_max
+        else:
+            range_key, range_min, range_max = self.confidence_index_key, confidence_min, '+inf'
+
+        estimates = {'range': window_count if range_key == self.time_index_key else confidence_count}
+        if symbol_keys:
+            estimates['symbols'] = symbol_count
+        if pattern_type_keys:
+            estimates['pattern_types'] = pattern_type_count
+        logger.debug("PATTERN-CACHE: Query plan - driver %s, estimates %s",
+                     min(estimates, key=estimates.get), estimates)
+
+        if min(estimates.values()) == 0:
+            return []
 
-                    rsi = pattern.indicators.get('rsi', 50.0)
-                    if rsi < rsi_min or rsi > rsi_max:
-                        continue
+        if not symbol_keys and not pattern_type_keys:
+            return self.redis_client.zrangebyscore(range_key, range_min, range_max)
+
+        # Round trip 2: unions per filter, intersection scored by the range index
+        temp_keys = []
+        intersect_keys = {range_key: 1}
+        pipe = self.redis_client.pipeline()
+        for keys in (symbol_keys, pattern_type_keys):
+            if len(keys) == 1:
+                intersect_keys[keys[0]] = 0
+            elif keys:
+                union_key = f"{self.temp_key_prefix}{uuid.uuid4().hex}"
+                pipe.zunionstore(union_key, keys)
+                temp_keys.append(union_key)
+                intersect_keys[union_key] = 0
+
+        result_key = f"{self.temp_key_prefix}{uuid.uuid4().hex}"
+        temp_keys.append(result_key)
+        pipe.zinterstore(result_key, intersect_keys)
+        pipe.zrangebyscore(result_key, range_min, range_max)
+        pipe.delete(*temp_keys)
+        return pipe.execute()[-2]
+
+    def _ordered_pattern_ids(self, confidence_min: float, sort_by: str, sort_order: str) -> list[str]:
+        """Candidate pattern IDs, ordered by the sorted set index for sort_by."""
+        desc = (sort_order == 'desc')
+
+        if sort_by in ('detected_at', 'symbol'):
+            return self._ordered_candidate_ids(confidence_min, sort_by, desc)
+
+        if sort_by == 'confidence' and desc:
+            return self.redis_client.zrevrangebyscore(
+                self.confidence_index_key, '+inf', confidence_min
+            )
 
-                    # Check if pattern is still valid (not expired)
-                    if pattern.expires_at <= time.time():
-                        continue
+        # Confidence ascending, and the base candidate set for unindexed orderings
+        return self.redis_client.zrangebyscore(
+            self.confidence_index_key, confidence_min, '+inf'
+        )
 
-                    filtered_patterns.append(pattern)
+    def _ordered_candidate_ids(self, confidence_min: float, sort_by: str, desc: bool) -> list[str]:
+        """
+        Pattern IDs above confidence_min in detected_at or symbol order, in one round trip.
+
+        The confidence range is cut server-side into a temporary set, which is
+        then rescored by the time index (detected_at) or sorted lexically
+        (pattern IDs start with "<symbol>:").
+        """
+        if confidence_min <= 0:
+            if sort_by == 'detected_at':
+                return self.redis_client.zrange(self.time_index_key, 0, -1, desc=desc)
+            return self.redis_client.sort(self.time_index_key, alpha=True, desc=desc)
+
+        candidates_key = f"{self.temp_key_prefix}{uuid.uuid4().hex}"
+        ordered_key = f"{self.temp_key_prefix}{uuid.uuid4().hex}"
+        pipe = self.redis_client.pipeline()
+        pipe.zunionstore(candidates_key, [self.confidence_index_key])
+        pipe.zremrangebyscore(candidates_key, '-inf', f"({confidence_min}")
+        if sort_by == 'detected_at':
+            pipe.zinterstore(ordered_key, {candidates_key: 0, self.time_index_key: 1})
+            pipe.zrange(ordered_key, 0, -1, desc=desc)
+        else:
+            pipe.sort(candidates_key, alpha=True, desc=desc)
+        pipe.delete(candidates_key, ordered_key)
+        return pipe.execute()[-2]
+
+    def _fetch_pattern_batches(self, pattern_ids: list[str]):
+        """Yield [(pattern_id, data)] batches, one pipelined round trip per batch."""
+        for start in range(0, len(pattern_ids), self.fetch_batch_size):
+            batch_ids = pattern_ids[start:start + self.fetch_batch_size]
+
+            pipe = self.redis_client.pipeline(transaction=False)
+            for pattern_id in batch_ids:
+                pipe.hget(f"{self.pattern_key_prefix}{pattern_id}", 'data')
+
+            yield list(zip(batch_ids, pipe.execute()))
+
+    @staticmethod
+    def _matches_filters(pattern: CachedPattern, pattern_types: list[str], symbols: list[str],
+                         confidence_min: float, rs_min: float, vol_min: float,
+                         rsi_min: float, rsi_max: float, now: float,
+                         detected_after: float | None = None,
+                         detected_before: float | None = None) -> bool:
+        """Check a decoded pattern against the scan filters."""
+        if pattern.confidence < confidence_min:
+            return False
 
-                except (json.JSONDecodeError, TypeError) as e:
-                    logger.warning("PATTERN-CACHE: Invalid pattern data for %s: %s", pattern_id, e)
-                    continue
+        if detected_after is not None and pattern.detected_at < detected_after:
+            return False
 
-            # Sort patterns if not already sorted by confidence
-            if sort_by != 'confidence':
-                reverse = (sort_order == 'desc')
+        if detected_before is not None and pattern.detected_at > detected_before:
+            return False
 
-                if sort_by == 'detected_at':
-                    filtered_patterns.sort(key=lambda p: p.detected_at, reverse=reverse)
-                elif sort_by == 'symbol':
-                    filtered_patterns.sort(key=lambda p: p.symbol, reverse=reverse)
-                elif sort_by == 'rs':
-                    filtered_patterns.sort(key=lambda p: p.indicators.get('relative_strength', 1.0), reverse=reverse)
-                elif sort_by == 'volume':
-                    filtered_patterns.sort(key=lambda p: p.indicators.get('relative_volume', 1.0), reverse=reverse)
+        if pattern_types and pattern.pattern_type not in pattern_types:
+            return False
 
-            return filtered_patterns
+        if symbols and pattern.symbol not in symbols:
+            return False
 
-        except Exception as e:
-            logger.error("PATTERN-CACHE: Error querying Redis patterns: %s", e)
-            return []
+        if pattern.indicators.get('relative_strength', 1.0) < rs_min:
+            return False
+
+        if pattern.indicators.get('relative_volume', 1.0) < vol_min:
+            return False
+
+        rsi = pattern.indicators.get('rsi', 50.0)
+        if rsi < rsi_min or rsi > rsi_max:
+            return False
+
+        # Check if pattern is still valid (not expired)
+        return pattern.expires_at > now
 
     def _generate_api_cache_key(self, filters: dict[str, Any]) -> str:
-        """Generate cache key for API response."""
+        """
+        Generate cache key for API response.
+
+        The key embeds the cache generation of the narrowest partition the
+        filters select: the requested symbols, else the requested pattern
+        types, else the global generation.
+        """
         import hashlib
 
+        if filters.get('symbols'):
+            fields = [f"symbol:{symbol}" for symbol in sorted(filters['symbols'])]
+        elif filters.get('pattern_types'):
+            fields = [f"pattern_type:{pattern_type}" for pattern_type in sorted(filters['pattern_types'])]
+        else:
+            fields = ['global']
+        versions = self.redis_client.hmget(self.api_cache_versions_key, fields)
+        generation = '.'.join(str(version or 0) for version in versions)
+
         # Create sorted filter string for consistent cache keys
         filter_str = json.dumps(filters, sort_keys=True)
         filter_hash = hashlib.md5(filter_str.encode()).hexdigest()
 
-        return f"{self.api_cache_key_prefix}scan:{filter_hash}"
+        return f"{self.api_cache_key_prefix}scan:{generation}:{filter_hash}"
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics and health metrics."""
@@ -562,8 +741,11 @@ class RedisPatternCache:
                 self.confidence_index_key,
                 self.symbol_index_key,
                 self.pattern_type_index_key,
-                self.time_index_key
+                self.time_index_key,
+                self.expires_index_key
             ]
+            index_keys += self.redis_client.keys(f"{self.symbol_set_prefix}*")
+            index_keys += self.redis_client.keys(f"{self.pattern_type_set_prefix}*")
 
             all_keys = pattern_keys + api_cache_keys + index_keys
 
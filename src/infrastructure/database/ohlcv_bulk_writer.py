@@ -0,0 +1,259 @@
+"""
+OHLCV Bulk Writer
+Buffers 1-minute OHLCV bars in memory and flushes them to TimescaleDB in batches.
+
+Replaces the one-upsert-per-tick write path used by MarketDataService:
+- Bars are coalesced by (symbol, timestamp) so repeated updates cost one row
+- A single background thread flushes every N ms or as soon as M rows are pending
+- Each flush is one transaction (staging table + merge) via TickStockDatabase
+- Pending rows are capped; new keys are rejected once the cap is reached
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class OHLCVBulkWriter:
+    """Background batched writer for the ohlcv_1min hypertable."""
+
+    def __init__(
+        self,
+        db,
+        config: dict[str, Any] | None = None,
+        on_flush: Callable[[list[dict[str, Any]]], None] | None = None
+    ):
+        """
+        Initialize bulk writer.
+
+        Args:
+            db: TickStockDatabase instance providing write_ohlcv_1min_batch()
+            config: Configuration dictionary with writer settings
+            on_flush: Optional callback receiving the bars of each successful flush
+        """
+        self.db = db
+        self.config = config or {}
+        self.on_flush = on_flush
+
+        # Flush configuration
+        self.flush_interval_ms = int(self.config.get('OHLCV_WRITER_FLUSH_INTERVAL_MS', 250))
+        self.max_batch_rows = int(self.config.get('OHLCV_WRITER_MAX_BATCH_ROWS', 1000))
+        self.max_pending_rows = int(self.config.get('OHLCV_WRITER_MAX_PENDING_ROWS', 20000))
+
+        # Pending bars keyed by (symbol, timestamp); dicts preserve arrival order
+        self._pending: dict[tuple[str, datetime], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake_event = threading.Event()
+
+        # Thread management
+        self._flush_thread = None
+        self.is_running = False
+
+        # Statistics
+        self.stats = {
+            'rows_submitted': 0,
+            'rows_coalesced': 0,
+            'rows_written': 0,
+            'rows_dropped': 0,
+            'rows_requeued': 0,
+            'flush_count': 0,
+            'flush_failures': 0,
+            'last_batch_size': 0,
+            'last_flush_ms': 0.0,
+            'max_flush_ms': 0.0,
+            'total_flush_ms': 0.0,
+            'last_flush_time': None,
+            'start_time': time.time()
+        }
+
+    def start(self):
+        """Start the background flush thread."""
+        if self.is_running:
+            logger.warning("OHLCV-WRITER: Already running")
+            return
+
+        self.is_running = True
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop,
+            name="OHLCVBulkWriter",
+            daemon=True
+        )
+        self._flush_thread.start()
+        logger.info(
+            f"OHLCV-WRITER: Started (interval={self.flush_interval_ms}ms, "
+            f"batch={self.max_batch_rows}, max_pending={self.max_pending_rows})"
+        )
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the flush thread and write any remaining bars."""
+        if not self.is_running:
+            return
+
+        logger.info("OHLCV-WRITER: Stopping...")
+        self.is_running = False
+        self._wake_event.set()
+
+        if self._flush_thread and self._flush_thread.is_alive():
+            self._flush_thread.join(timeout=timeout)
+
+        # Final flush of anything submitted after the last cycle
+        self.flush()
+        logger.info(f"OHLCV-WRITER: Stopped. Stats: {self.get_stats()}")
+
+    def submit(
+        self,
+        symbol: str,
+        timestamp: datetime,
+        open_price: Decimal,
+        high_price: Decimal,
+        low_price: Decimal,
+        close_price: Decimal,
+        volume: int
+    ) -> bool:
+        """
+        Queue a bar for the next flush.
+
+        A bar for an already pending (symbol, timestamp) replaces the pending
+        values, matching the ON CONFLICT DO UPDATE semantics of the table.
+
+        Returns:
+            bool: True if queued or coalesced, False if dropped due to backpressure
+        """
+        key = (symbol, timestamp)
+        bar = {
+            'symbol': symbol,
+            'timestamp': timestamp,
+            'open': open_price,
+            'high': high_price,
+            'low': low_price,
+            'close': close_price,
+            'volume': volume
+        }
+
+        with self._lock:
+            self.stats['rows_submitted'] += 1
+
+            if key in self._pending:
+                self._pending[key] = bar
+                self.stats['rows_coalesced'] += 1
+                return True
+
+            if len(self._pending) >= self.max_pending_rows:
+                self.stats['rows_dropped'] += 1
+                dropped = self.stats['rows_dropped']
+                self._wake_event.set()
+                if dropped == 1 or dropped % 1000 == 0:
+                    logger.warning(
+                        f"OHLCV-WRITER: Pending buffer full ({self.max_pending_rows} rows), "
+                        f"{dropped} bars dropped so far"
+                    )
+                return False
+
+            self._pending[key] = bar
+            pending_count = len(self._pending)
+
+        if pending_count >= self.max_batch_rows:
+            self._wake_event.set()
+
+        return True
+
+    def flush(self) -> int:
+        """
+        Write all pending bars in batches of max_batch_rows.
+
+        Returns:
+            int: Number of bars written
+        """
+        written = 0
+
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        break
+                    keys = list(self._pending.keys())[:self.max_batch_rows]
+                    batch = [self._pending.pop(key) for key in keys]
+
+                if not self._write_batch(batch):
+                    break
+                written += len(batch)
+
+        return written
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> bool:
+        """Write a single batch, re-queueing it on failure."""
+        start_time = time.time()
+
+        try:
+            self.db.write_ohlcv_1min_batch(batch)
+        except Exception as e:
+            self.stats['flush_failures'] += 1
+            logger.error(f"OHLCV-WRITER: Flush of {len(batch)} bars failed: {e}")
+            self._requeue(batch)
+            return False
+
+        flush_ms = (time.time() - start_time) * 1000
+        self.stats['flush_count'] += 1
+        self.stats['rows_written'] += len(batch)
+        self.stats['last_batch_size'] = len(batch)
+        self.stats['last_flush_ms'] = flush_ms
+        self.stats['max_flush_ms'] = max(self.stats['max_flush_ms'], flush_ms)
+        self.stats['total_flush_ms'] += flush_ms
+        self.stats['last_flush_time'] = time.time()
+
+        if self.on_flush:
+            try:
+                self.on_flush(batch)
+            except Exception as e:
+                logger.error(f"OHLCV-WRITER: on_flush callback failed: {e}")
+
+        return True
+
+    def _requeue(self, batch: list[dict[str, Any]]):
+        """Return a failed batch to the buffer without overwriting newer bars."""
+        with self._lock:
+            for bar in batch:
+                key = (bar['symbol'], bar['timestamp'])
+                if key in self._pending:
+                    continue
+                if len(self._pending) >= self.max_pending_rows:
+                    self.stats['rows_dropped'] += 1
+                    continue
+                self._pending[key] = bar
+                self.stats['rows_requeued'] += 1
+
+    def _flush_loop(self):
+        """Flush on interval or when a full batch is pending."""
+        interval = self.flush_interval_ms / 1000.0
+
+        while self.is_running:
+            try:
+                self._wake_event.wait(timeout=interval)
+                self._wake_event.clear()
+                self.flush()
+            except Exception as e:
+                logger.error(f"OHLCV-WRITER: Flush loop error: {e}")
+                time.sleep(interval)
+
+    def pending_count(self) -> int:
+        """Number of bars waiting to be written."""
+        with self._lock:
+            return len(self._pending)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get writer statistics for health reporting."""
+        stats = self.stats.copy()
+        flush_count = stats['flush_count']
+        stats['avg_flush_ms'] = stats['total_flush_ms'] / flush_count if flush_count else 0.0
+        stats['avg_batch_size'] = stats['rows_written'] / flush_count if flush_count else 0.0
+        stats['pending_rows'] = self.pending_count()
+        stats['max_pending_rows'] = self.max_pending_rows
+        stats['is_running'] = self.is_running
+        return stats
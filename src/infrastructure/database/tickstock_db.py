@@ -6,9 +6,16 @@ Sprint 10 Phase 1: Database Integration
 - Read-only connection pool to shared 'tickstock' database
 - Simple UI queries for dropdowns and basic stats
 - Connection health monitoring
+
+Engines are shared process-wide through EngineRegistry: one pool per
+(DSN, role), created and verified on first use, so constructing
+TickStockDatabase per request or per service is cheap.
 """
 
+import csv
+import io
 import logging
+import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime
@@ -16,6 +23,7 @@ from decimal import Decimal
 from typing import Any
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -23,12 +31,122 @@ from src.core.services.config_manager import get_config
 
 logger = logging.getLogger(__name__)
 
+# Pool sizing per workload, so admin jobs and analysis writes can't starve UI reads.
+# Sizes can be overridden with DB_POOL_<ROLE>_SIZE / DB_POOL_<ROLE>_MAX_OVERFLOW.
+POOL_ROLES = {
+    'ui': {'pool_size': 5, 'max_overflow': 2, 'pool_timeout': 10,
+           'application_name': 'TickStockAppV2_ReadOnly'},
+    'analysis': {'pool_size': 10, 'max_overflow': 5, 'pool_timeout': 30,
+                 'application_name': 'TickStockAppV2_Analysis'},
+    'admin': {'pool_size': 3, 'max_overflow': 2, 'pool_timeout': 60,
+              'application_name': 'TickStockAppV2_Admin'},
+    'cache': {'pool_size': 2, 'max_overflow': 2, 'pool_timeout': 10,
+              'application_name': 'TickStockAppV2_RelationshipCache'},
+}
+
+
+class EngineRegistry:
+    """Process-wide SQLAlchemy engines, one connection pool per (DSN, role)."""
+
+    def __init__(self):
+        self._engines: dict[tuple[str, str], Engine] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'engines_created': 0,
+            'engines_reused': 0,
+        }
+
+    def get_engine(self, url: str, role: str, factory) -> Engine:
+        """
+        Get the shared engine for a DSN and role, creating it on first use.
+
+        Args:
+            url: Database connection URL
+            role: Pool role (key of POOL_ROLES)
+            factory: Callable returning a new, verified engine; if it raises,
+                nothing is registered and the next caller retries
+
+        Returns:
+            Shared SQLAlchemy engine
+        """
+        key = (url, role)
+        engine = self._engines.get(key)
+        if engine is None:
+            with self._lock:
+                engine = self._engines.get(key)
+                if engine is None:
+                    engine = factory()
+                    self._engines[key] = engine
+                    self.stats['engines_created'] += 1
+                    logger.info(f"TICKSTOCK-DB: Created shared '{role}' connection pool")
+                    return engine
+
+        self.stats['engines_reused'] += 1
+        return engine
+
+    def owns(self, engine: Engine) -> bool:
+        return any(engine is registered for registered in self._engines.values())
+
+    def get_pool_stats(self) -> dict[str, dict[str, Any]]:
+        """Pool usage per role (engines for different DSNs are summed)."""
+        pools: dict[str, dict[str, Any]] = {}
+        for (_, role), engine in list(self._engines.items()):
+            pool = engine.pool
+            entry = pools.setdefault(
+                role, {'size': 0, 'checked_in': 0, 'checked_out': 0, 'overflow': 0}
+            )
+            entry['size'] += pool.size()
+            entry['checked_in'] += pool.checkedin()
+            entry['checked_out'] += pool.checkedout()
+            entry['overflow'] += max(pool.overflow(), 0)
+        return pools
+
+    def dispose_all(self):
+        """Dispose every shared engine (process shutdown)."""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+        logger.info("TICKSTOCK-DB: Shared connection pools disposed")
+
+
+_registry_instance: EngineRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_engine_registry() -> EngineRegistry:
+    """
+    Get singleton engine registry instance.
+
+    Returns:
+        EngineRegistry instance
+    """
+    global _registry_instance
+
+    if _registry_instance is None:
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = EngineRegistry()
+
+    return _registry_instance
+
+
 class TickStockDatabase:
     """Read-only database connection service for TickStockPL integration."""
 
-    def __init__(self, config: dict[str, Any]):
-        """Initialize database connection to shared 'tickstock' database."""
+    def __init__(self, config: dict[str, Any], role: str = 'ui'):
+        """
+        Initialize database connection to shared 'tickstock' database.
+
+        Args:
+            config: Application configuration
+            role: Pool role - 'ui' (reads), 'analysis' (analysis reads/writes),
+                'admin' (admin jobs) or 'cache' (RelationshipCache loads)
+        """
+        if role not in POOL_ROLES:
+            raise ValueError(f"Unknown database pool role: {role}")
         self.config = config
+        self.role = role
         self.engine = None
         self.connection_url = self._build_connection_url()
         self._initialize_engine()
@@ -40,7 +158,7 @@ class TickStockDatabase:
         # First try to use DATABASE_URI from config (matches .env file)
         database_uri = config.get('DATABASE_URI')
         if database_uri:
-            logger.info("TICKSTOCK-DB: Using DATABASE_URI from config")
+            logger.debug("TICKSTOCK-DB: Using DATABASE_URI from config")
             return database_uri
 
         # Fallback to individual config variables
@@ -51,40 +169,52 @@ class TickStockDatabase:
         db_password = config.get('TICKSTOCK_DB_PASSWORD', 'password')
 
         connection_url = f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-        logger.info(f"TICKSTOCK-DB: Using individual config vars - connecting to '{db_name}' at {db_host}:{db_port}")
+        logger.debug(
+            "TICKSTOCK-DB: Using individual config vars - "
+            f"connecting to '{db_name}' at {db_host}:{db_port}"
+        )
         return connection_url
 
     def _initialize_engine(self):
-        """Initialize SQLAlchemy engine with read-only connection pool."""
+        """Attach to the shared connection pool for this DSN and role."""
         try:
-            # Create read-only connection pool
-            self.engine = create_engine(
-                self.connection_url,
-                poolclass=QueuePool,
-                pool_size=5,           # Small pool for UI queries
-                max_overflow=2,        # Limited overflow for read-only operations
-                pool_timeout=10,       # Quick timeout for UI responsiveness
-                pool_recycle=3600,     # Recycle connections hourly
-                echo=False,            # Set to True for SQL debugging
-                connect_args={
-                    'connect_timeout': 5,
-                    'application_name': 'TickStockAppV2_ReadOnly'
-                }
+            self.engine = get_engine_registry().get_engine(
+                self.connection_url, self.role, self._create_engine
             )
-
-            # Test connection
-            self._test_connection()
-            logger.info("TICKSTOCK-DB: Read-only connection pool initialized successfully")
-
         except Exception as e:
             logger.error(f"TICKSTOCK-DB: Failed to initialize engine: {e}")
             self.engine = None
             raise
 
-    def _test_connection(self):
-        """Test database connection and basic query."""
+    def _create_engine(self) -> Engine:
+        """Create and verify a new engine sized for this role."""
+        sizing = POOL_ROLES[self.role]
+        config = get_config()
+        prefix = f"DB_POOL_{self.role.upper()}"
+
+        engine = create_engine(
+            self.connection_url,
+            poolclass=QueuePool,
+            pool_size=int(config.get(f'{prefix}_SIZE', sizing['pool_size'])),
+            max_overflow=int(config.get(f'{prefix}_MAX_OVERFLOW', sizing['max_overflow'])),
+            pool_timeout=sizing['pool_timeout'],
+            pool_recycle=3600,     # Recycle connections hourly
+            echo=False,            # Set to True for SQL debugging
+            connect_args={
+                'connect_timeout': 5,
+                'application_name': sizing['application_name']
+            }
+        )
+
+        # Verified once per shared pool, not once per TickStockDatabase instance
+        self._test_connection(engine)
+        logger.info(f"TICKSTOCK-DB: '{self.role}' connection pool initialized successfully")
+        return engine
+
+    def _test_connection(self, engine: Engine | None = None):
+        """Test database connection and basic query (on self.engine by default)."""
         try:
-            with self.engine.connect() as conn:
+            with (engine or self.engine).connect() as conn:
                 result = conn.execute(text("SELECT 1 as test"))
                 test_value = result.scalar()
                 if test_value != 1:
@@ -434,6 +564,188 @@ class TickStockDatabase:
             logger.error(f"TICKSTOCK-DB: Failed to write OHLCV for {symbol} at {timestamp}: {e}")
             return False
 
+    def write_ohlcv_1min_batch(self, bars: list[dict[str, Any]], chunk_size: int = 500) -> int:
+        """
+        Write many OHLCV 1-minute bars in a single transaction.
+
+        Bars are loaded into a transaction-scoped staging table with multi-row
+        VALUES statements, then merged into ohlcv_1min with one
+        INSERT ... SELECT ... ON CONFLICT. Callers should coalesce duplicate
+        (symbol, timestamp) keys beforehand; the merge keeps the last staged
+        row per key as a safeguard.
+
+        Args:
+            bars: Dicts with symbol, timestamp, open, high, low, close, volume
+            chunk_size: Rows per multi-row VALUES statement
+
+        Returns:
+            int: Number of bars merged into ohlcv_1min
+
+        Raises:
+            Exception: Propagates database errors so callers can retry or count failures
+        """
+        if not bars:
+            return 0
+
+        columns = ('symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+        with self.get_connection() as conn:
+            conn.execute(text("""
+                CREATE TEMP TABLE IF NOT EXISTS ohlcv_1min_staging (
+                    seq BIGSERIAL,
+                    symbol VARCHAR(20),
+                    timestamp TIMESTAMPTZ,
+                    open NUMERIC,
+                    high NUMERIC,
+                    low NUMERIC,
+                    close NUMERIC,
+                    volume BIGINT
+                ) ON COMMIT DELETE ROWS
+            """))
+
+            for start in range(0, len(bars), chunk_size):
+                chunk = bars[start:start + chunk_size]
+                params = {}
+                rows = []
+                for i, bar in enumerate(chunk):
+                    rows.append('(' + ', '.join(f':{col}_{i}' for col in columns) + ')')
+                    for col in columns:
+                        params[f'{col}_{i}'] = bar[col]
+
+                conn.execute(text(
+                    f"INSERT INTO ohlcv_1min_staging ({', '.join(columns)}) "
+                    f"VALUES {', '.join(rows)}"
+                ), params)
+
+            result = conn.execute(text("""
+                INSERT INTO ohlcv_1min (symbol, timestamp, open, high, low, close, volume)
+                SELECT DISTINCT ON (symbol, timestamp)
+                    symbol, timestamp, open, high, low, close, volume
+                FROM ohlcv_1min_staging
+                ORDER BY symbol, timestamp, seq DESC
+                ON CONFLICT (symbol, timestamp) DO UPDATE SET
+                    open = EXCLUDED.open,
+                    high = EXCLUDED.high,
+                    low = EXCLUDED.low,
+                    close = EXCLUDED.close,
+                    volume = EXCLUDED.volume
+            """))
+            conn.commit()  # Single commit for the whole batch; staging rows are cleared
+
+            written = (
+                result.rowcount
+                if result.rowcount is not None and result.rowcount >= 0
+                else len(bars)
+            )
+            logger.debug(f"TICKSTOCK-DB: Bulk wrote {written} OHLCV 1min bars")
+            return written
+
+    @staticmethod
+    def _copy_rows(conn, table: str, columns: tuple[str, ...], rows: list[dict[str, Any]]) -> None:
+        """
+        Stream rows into a table with COPY ... FROM STDIN (CSV) on the
+        connection's current transaction.
+
+        None values are written as NULL; other values use their str() form.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([row[col] for col in columns])
+        buffer.seek(0)
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+            )
+        finally:
+            cursor.close()
+
+    def replace_daily_analysis_results(
+        self,
+        patterns: list[dict[str, Any]],
+        indicators: list[dict[str, Any]],
+    ) -> tuple[int, int]:
+        """
+        Replace daily_patterns / daily_indicators entries for many symbols in
+        a single transaction.
+
+        Rows are COPY'd into transaction-scoped staging tables (typed like the
+        target columns), then each table gets one set-based DELETE of the
+        existing (symbol, type, timeframe) entries and one INSERT ... SELECT.
+        TimescaleDB hypertables can't use unique constraints without the time
+        column, so this stands in for ON CONFLICT.
+
+        Args:
+            patterns: Dicts with symbol, pattern_type, confidence, pattern_data,
+                expiration_date, timeframe, metadata
+            indicators: Dicts with symbol, indicator_type, value_data,
+                expiration_date, timeframe, metadata
+
+        Returns:
+            tuple: (patterns written, indicators written)
+
+        Raises:
+            Exception: Propagates database errors; nothing is written on failure
+        """
+        if not patterns and not indicators:
+            return 0, 0
+
+        with self.get_connection() as conn:
+            if patterns:
+                self._replace_from_staging(
+                    conn, 'daily_patterns', 'pattern_type',
+                    ('symbol', 'pattern_type', 'confidence', 'pattern_data',
+                     'expiration_date', 'timeframe', 'metadata'),
+                    'detection_timestamp', patterns
+                )
+            if indicators:
+                self._replace_from_staging(
+                    conn, 'daily_indicators', 'indicator_type',
+                    ('symbol', 'indicator_type', 'value_data',
+                     'expiration_date', 'timeframe', 'metadata'),
+                    'calculation_timestamp', indicators
+                )
+            conn.commit()  # Single commit for both tables; staging rows are cleared
+
+        logger.debug(
+            f"TICKSTOCK-DB: Bulk replaced {len(patterns)} daily patterns, "
+            f"{len(indicators)} daily indicators"
+        )
+        return len(patterns), len(indicators)
+
+    def _replace_from_staging(
+        self,
+        conn,
+        table: str,
+        type_column: str,
+        columns: tuple[str, ...],
+        timestamp_column: str,
+        rows: list[dict[str, Any]],
+    ) -> None:
+        """COPY rows into <table>_staging, then delete + insert set-based."""
+        staging = f"{table}_staging"
+        column_list = ', '.join(columns)
+
+        conn.execute(text(f"""
+            CREATE TEMP TABLE IF NOT EXISTS {staging} ON COMMIT DELETE ROWS
+            AS SELECT {column_list} FROM {table} WITH NO DATA
+        """))
+        self._copy_rows(conn, staging, columns, rows)
+
+        conn.execute(text(f"""
+            DELETE FROM {table} t
+            USING (SELECT DISTINCT symbol, {type_column}, timeframe FROM {staging}) s
+            WHERE t.symbol = s.symbol
+                AND t.{type_column} = s.{type_column}
+                AND t.timeframe = s.timeframe
+        """))
+        conn.execute(text(f"""
+            INSERT INTO {table} ({column_list}, {timestamp_column})
+            SELECT {column_list}, NOW() FROM {staging}
+        """))
+
     def health_check(self) -> dict[str, Any]:
         """Comprehensive health check for database connection."""
         health_data = {
@@ -458,6 +770,9 @@ class TickStockDatabase:
                 'checked_out': self.engine.pool.checkedout(),
                 'status': 'active'
             }
+            registry = get_engine_registry()
+            health_data['shared_pools'] = registry.get_pool_stats()
+            health_data['engine_registry'] = dict(registry.stats)
 
             # Test query performance
             start_time = time.time()
@@ -497,8 +812,14 @@ class TickStockDatabase:
             return health_data
 
     def close(self):
-        """Close database connections and cleanup."""
+        """
+        Close database connections and cleanup.
+
+        Shared pools stay open for other users and are only released here;
+        use get_engine_registry().dispose_all() at process shutdown.
+        """
         if self.engine:
-            self.engine.dispose()
+            if not get_engine_registry().owns(self.engine):
+                self.engine.dispose()
+                logger.info("TICKSTOCK-DB: Database connections closed")
             self.engine = None
-            logger.info("TICKSTOCK-DB: Database connections closed")
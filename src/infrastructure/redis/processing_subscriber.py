@@ -13,6 +13,7 @@ import redis
 import requests
 
 from src.core.services.config_manager import get_config
+from src.core.services.relationship_cache import get_relationship_cache
 
 logger = logging.getLogger(__name__)
 
@@ -261,6 +262,9 @@ class ProcessingEventSubscriber:
 
         logger.info(f"Cache sync completed - Job ID: {job_id}, Status: {status}, Changes: {total_changes}")
 
+        # Group memberships may have changed - refresh relationships in the background
+        self._revalidate_relationship_cache()
+
         # Store event for admin dashboard
         cache_event = {
             'event': 'cache_sync_completed',
@@ -279,8 +283,14 @@ class ProcessingEventSubscriber:
 
         logger.debug(f"Universe updated: {universe} - Action: {action}")
 
-        # Could trigger cache refresh in the app
-        # For now, just log it
+        self._revalidate_relationship_cache()
+
+    def _revalidate_relationship_cache(self):
+        """Serve current relationships as stale while they reload in the background"""
+        try:
+            get_relationship_cache().revalidate()
+        except Exception as e:
+            logger.error(f"Failed to revalidate relationship cache: {e}")
 
     def _handle_ipo_assignment(self, event: dict[str, Any]):
         """Handle IPO assignment events"""
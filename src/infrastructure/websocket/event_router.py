@@ -15,9 +15,11 @@ for enterprise-grade event distribution supporting 500+ concurrent users.
 
 import hashlib
 import logging
+import re
 import threading
 import time
-from collections import defaultdict, deque
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
@@ -76,19 +78,40 @@ class RoutingRule:
     messages_routed: int = 0
     last_used: float = field(default_factory=time.time)
 
-    def matches_event(self, event_type: str, event_data: dict[str, Any]) -> bool:
-        """Check if routing rule matches the event."""
-        try:
-            if not self.enabled:
-                return False
+    # Compiled event_type_patterns (None for an invalid pattern)
+    _compiled_patterns: list[re.Pattern | None] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.compile_patterns()
+
+    def compile_patterns(self):
+        """Compile event type patterns once instead of on every match."""
+        compiled = []
+        for pattern in self.event_type_patterns:
+            try:
+                compiled.append(re.compile(pattern))
+            except re.error as e:
+                logger.error(
+                    f"EVENT-ROUTER: Invalid event type pattern {pattern!r} "
+                    f"in rule {self.rule_id}: {e}"
+                )
+                compiled.append(None)
+        self._compiled_patterns = compiled
 
-            # Check event type patterns
-            import re
-            type_match = any(re.match(pattern, event_type) for pattern in self.event_type_patterns)
-            if not type_match:
+    def matches_event_type(self, event_type: str) -> bool:
+        """Check if any event type pattern matches (an invalid pattern never matches)."""
+        for pattern in self._compiled_patterns:
+            if pattern is None:
                 return False
+            if pattern.match(event_type):
+                return True
+        return False
 
-            # Check content filters
+    def matches_content(self, event_data: dict[str, Any]) -> bool:
+        """Check content filters against the event payload."""
+        try:
             for key, expected_value in self.content_filters.items():
                 if key not in event_data:
                     return False
@@ -114,11 +137,134 @@ class RoutingRule:
             logger.error(f"EVENT-ROUTER: Error matching rule {self.rule_id}: {e}")
             return False
 
+    def matches_event(self, event_type: str, event_data: dict[str, Any]) -> bool:
+        """Check if routing rule matches the event."""
+        try:
+            if not self.enabled:
+                return False
+
+            return self.matches_event_type(event_type) and self.matches_content(event_data)
+
+        except Exception as e:
+            logger.error(f"EVENT-ROUTER: Error matching rule {self.rule_id}: {e}")
+            return False
+
     def record_usage(self):
         """Record usage statistics."""
         self.messages_routed += 1
         self.last_used = time.time()
 
+# Payload fields CONTENT_BASED destinations are derived from; always part of the route key
+CONTENT_ROUTING_FIELDS = ('pattern_type', 'symbol', 'tier')
+
+# Route key marker for a field absent from the payload
+_MISSING = object()
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a user context value."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+@dataclass
+class RuleCandidates:
+    """
+    Rules whose event type patterns match one event type, and the payload
+    fields their routing depends on.
+
+    Two events of that type route identically when they agree on every
+    value field and fall in the same threshold bucket for every range field.
+    """
+    rules: list[RoutingRule]
+    value_fields: tuple[str, ...]                # compared by value
+    # (field, sorted mins, sorted maxes)
+    range_fields: tuple[tuple[str, list[Any], list[Any]], ...]
+    content_based: bool                          # a CONTENT_BASED rule is a candidate
+    cacheable: bool = True
+
+    @classmethod
+    def build(cls, rules: list[RoutingRule]) -> 'RuleCandidates':
+        """Derive the route key fields from the candidate rules' content filters."""
+        value_fields = set(CONTENT_ROUTING_FIELDS)
+        thresholds: dict[str, tuple[set, set]] = {}
+        content_based = False
+        cacheable = True
+
+        for rule in rules:
+            if rule.strategy == RoutingStrategy.CONTENT_BASED:
+                content_based = True
+                # Destinations are computed from the transformed payload
+                if rule.content_transformer:
+                    cacheable = False
+            cls._collect_filter_fields(rule, value_fields, thresholds)
+
+        range_fields = cls._range_fields(thresholds, value_fields)
+
+        return cls(
+            rules=rules,
+            value_fields=tuple(sorted(value_fields)),
+            range_fields=tuple(sorted(range_fields, key=lambda f: f[0])),
+            content_based=content_based,
+            cacheable=cacheable
+        )
+
+    @staticmethod
+    def _collect_filter_fields(rule: RoutingRule, value_fields: set[str],
+                               thresholds: dict[str, tuple[set, set]]):
+        """Add a rule's content filter keys to the value fields or range thresholds."""
+        for key, expected in rule.content_filters.items():
+            is_range = (
+                isinstance(expected, dict)
+                and 'equals' not in expected and 'contains' not in expected
+            )
+            if not is_range:
+                value_fields.add(key)
+                continue
+            mins, maxes = thresholds.setdefault(key, (set(), set()))
+            if 'min' in expected:
+                mins.add(expected['min'])
+            if 'max' in expected:
+                maxes.add(expected['max'])
+
+    @staticmethod
+    def _range_fields(thresholds: dict[str, tuple[set, set]],
+                      value_fields: set[str]) -> list[tuple[str, list[Any], list[Any]]]:
+        """Sorted thresholds per range field; unorderable ones become value fields."""
+        range_fields = []
+        for key, (mins, maxes) in thresholds.items():
+            if key in value_fields:
+                continue
+            try:
+                range_fields.append((key, sorted(mins), sorted(maxes)))
+            except TypeError:
+                # Thresholds that cannot be ordered: key on the exact value
+                value_fields.add(key)
+        return range_fields
+
+    def route_key(self, event_data: dict[str, Any]) -> tuple | None:
+        """Routing-relevant projection of the payload, or None if its route cannot be cached."""
+        # CONTENT_BASED fallback destinations hash the whole payload
+        if (self.content_based and 'tier' not in event_data
+                and not ('symbol' in event_data and 'pattern_type' in event_data)):
+            return None
+
+        values = tuple(event_data.get(key, _MISSING) for key in self.value_fields)
+
+        buckets = []
+        for key, mins, maxes in self.range_fields:
+            value = event_data.get(key, _MISSING)
+            if value is _MISSING:
+                buckets.append(_MISSING)
+            else:
+                # Same (min filters passed, max filters failed) counts -> same matches
+                buckets.append((bisect_right(mins, value), bisect_left(maxes, value)))
+
+        return values, tuple(buckets)
+
 @dataclass
 class RoutingResult:
     """Result of event routing operation."""
@@ -130,6 +276,13 @@ class RoutingResult:
     total_users: int                         # Total users routed to
     cache_hit: bool = False                  # Whether route was cached
 
+    def cached_copy(self) -> 'RoutingResult':
+        """Copy returned for a cache hit (dataclasses.replace is several times slower)."""
+        return RoutingResult(
+            self.event_id, self.matched_rules, self.destinations,
+            self.transformations_applied, self.routing_time_ms, self.total_users, True
+        )
+
 @dataclass
 class RouterStats:
     """Performance statistics for event routing."""
@@ -194,8 +347,15 @@ class EventRouter:
     
     Integrates with ScalableBroadcaster for efficient delivery and SubscriptionIndexManager
     for high-performance user filtering.
+
+    Routes are cached under the routing-relevant projection of the event
+    (event type, the fields candidate rules filter on, range filters
+    bucketed by their thresholds), so events differing only in
+    timestamp/price share one cache entry.
     """
 
+    ROUTE_CACHE_TTL_SECONDS = 300
+
     def __init__(self, scalable_broadcaster: ScalableBroadcaster,
                  cache_size: int = 1000, enable_caching: bool = True):
         """Initialize Event Router."""
@@ -208,9 +368,12 @@ class EventRouter:
         self.routing_rules: dict[str, RoutingRule] = {}
         self.rule_categories: dict[EventCategory, list[str]] = defaultdict(list)
 
-        # Route caching system
-        self.route_cache: dict[str, tuple[RoutingResult, float]] = {}  # cache_key -> (result, timestamp)
-        self.cache_access_order: deque = deque()  # LRU tracking
+        # Candidate rules per event type (rebuilt lazily after rule changes)
+        self.rules_by_event_type: dict[str, RuleCandidates] = {}
+
+        # Route caching system: cache_key -> (result, timestamp), LRU order is the
+        # OrderedDict order
+        self.route_cache: OrderedDict[tuple, tuple[RoutingResult, float]] = OrderedDict()
 
         # Performance optimization
         self.routing_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="event-router")
@@ -232,11 +395,15 @@ class EventRouter:
         """Add routing rule to the router."""
         try:
             with self.routing_lock:
+                rule.compile_patterns()
                 self.routing_rules[rule.rule_id] = rule
 
                 # Categorize rule for optimization
                 self._categorize_rule(rule)
 
+                # New rule may change the route of cached events
+                self._invalidate_routes()
+
                 logger.info(f"EVENT-ROUTER: Added routing rule {rule.rule_id}: {rule.name}")
                 return True
 
@@ -256,7 +423,7 @@ class EventRouter:
                     self._remove_from_categories(rule_id)
 
                     # Clear related cache entries
-                    self._clear_cache_for_rule(rule_id)
+                    self._invalidate_routes()
 
                     logger.info(f"EVENT-ROUTER: Removed routing rule {rule_id}")
                     return True
@@ -284,27 +451,38 @@ class EventRouter:
             start_time = time.time()
             event_id = f"{event_type}_{int(time.time() * 1000)}"
 
+            candidates = self._get_candidates(event_type)
+
             # Check route cache first
-            cache_key = self._generate_cache_key(event_type, event_data, user_context)
-            cached_result = self._get_cached_route(cache_key)
+            cache_key = None
+            if self.enable_caching:
+                cache_key = self._route_key(candidates, event_type, event_data, user_context)
+            cached_result = self._get_cached_route(cache_key) if cache_key is not None else None
 
             if cached_result:
                 # Use cached routing result
+                for rule_id in cached_result.matched_rules:
+                    rule = self.routing_rules.get(rule_id)
+                    if rule:
+                        rule.record_usage()
+
                 routing_time_ms = (time.time() - start_time) * 1000
                 self.stats.record_routing(routing_time_ms, len(cached_result.matched_rules), True)
 
                 # Execute cached routing
                 self._execute_routing(cached_result, event_type, event_data)
 
+                cached_result.event_id = event_id
+                cached_result.routing_time_ms = routing_time_ms
                 return cached_result
 
             # Perform intelligent routing
             routing_result = self._perform_intelligent_routing(
-                event_id, event_type, event_data, user_context
+                event_id, event_type, event_data, user_context, candidates
             )
 
-            # Cache routing result if beneficial
-            if self.enable_caching and routing_result.total_users > 5:
+            # Cache routing result (including "no rule matched")
+            if cache_key is not None:
                 self._cache_routing_result(cache_key, routing_result)
 
             # Execute routing
@@ -337,7 +515,8 @@ class EventRouter:
 
     def _perform_intelligent_routing(self, event_id: str, event_type: str,
                                    event_data: dict[str, Any],
-                                   user_context: dict[str, Any]) -> RoutingResult:
+                                   user_context: dict[str, Any],
+                                   candidates: RuleCandidates | None = None) -> RoutingResult:
         """Perform intelligent routing analysis."""
         try:
             with self.routing_lock:
@@ -345,9 +524,13 @@ class EventRouter:
                 destinations = defaultdict(set)
                 transformations_applied = []
 
-                # Find matching routing rules
-                for rule_id, rule in self.routing_rules.items():
-                    if rule.matches_event(event_type, event_data):
+                if candidates is None:
+                    candidates = self._get_candidates(event_type)
+
+                # Find matching routing rules (event type already matched)
+                for rule in candidates.rules:
+                    rule_id = rule.rule_id
+                    if rule.enabled and rule.matches_content(event_data):
                         matched_rules.append(rule_id)
                         rule.record_usage()
 
@@ -511,59 +694,87 @@ class EventRouter:
         except Exception as e:
             logger.error(f"EVENT-ROUTER: Error executing routing: {e}")
 
+    def _get_candidates(self, event_type: str) -> RuleCandidates:
+        """Rules that can match an event type, indexed on first use."""
+        candidates = self.rules_by_event_type.get(event_type)
+        if candidates is None:
+            with self.routing_lock:
+                rules = []
+                for rule in self.routing_rules.values():
+                    try:
+                        if rule.matches_event_type(event_type):
+                            rules.append(rule)
+                    except Exception as e:
+                        logger.error(f"EVENT-ROUTER: Error matching rule {rule.rule_id}: {e}")
+
+                candidates = RuleCandidates.build(rules)
+
+                # Event types are few; bound the index against unexpected cardinality
+                if len(self.rules_by_event_type) >= self.cache_size:
+                    self.rules_by_event_type.clear()
+                self.rules_by_event_type[event_type] = candidates
+
+        return candidates
+
+    def _route_key(self, candidates: RuleCandidates, event_type: str,
+                   event_data: dict[str, Any], user_context: dict[str, Any]) -> tuple | None:
+        """Route cache key for an event, or None if its route cannot be cached."""
+        if not candidates.cacheable:
+            return None
+
+        try:
+            content_key = candidates.route_key(event_data)
+            if content_key is None:
+                return None
+
+            context_key = _freeze(user_context) if user_context else None
+            key = ('route', event_type, content_key, context_key)
+            hash(key)
+            return key
+
+        except TypeError:
+            # Unhashable or unorderable field values: route without caching
+            return None
+
     def _generate_cache_key(self, event_type: str, event_data: dict[str, Any],
-                           user_context: dict[str, Any]) -> str:
+                           user_context: dict[str, Any]) -> tuple | None:
         """Generate cache key for routing result."""
-        # Create deterministic cache key
-        key_data = {
-            'event_type': event_type,
-            'content_hash': hashlib.md5(str(sorted(event_data.items())).encode()).hexdigest()[:16],
-            'context_hash': hashlib.md5(str(sorted((user_context or {}).items())).encode()).hexdigest()[:8]
-        }
+        candidates = self._get_candidates(event_type)
+        return self._route_key(candidates, event_type, event_data, user_context)
 
-        return f"route_{key_data['event_type']}_{key_data['content_hash']}_{key_data['context_hash']}"
-
-    def _get_cached_route(self, cache_key: str) -> RoutingResult | None:
-        """Get cached routing result if available and valid."""
+    def _get_cached_route(self, cache_key: tuple) -> RoutingResult | None:
+        """Get a copy of the cached routing result if available and valid."""
         try:
             with self.cache_lock:
-                if cache_key in self.route_cache:
-                    result, timestamp = self.route_cache[cache_key]
-
-                    # Check if cache entry is still valid
-                    if time.time() - timestamp < 300:  # 5 minute TTL
-                        # Update LRU order
-                        if cache_key in self.cache_access_order:
-                            self.cache_access_order.remove(cache_key)
-                        self.cache_access_order.append(cache_key)
-
-                        # Mark as cache hit
-                        result.cache_hit = True
-                        return result
-                    # Remove expired entry
-                    del self.route_cache[cache_key]
-                    if cache_key in self.cache_access_order:
-                        self.cache_access_order.remove(cache_key)
+                entry = self.route_cache.get(cache_key)
+                if entry is None:
+                    return None
+
+                result, timestamp = entry
 
+                # Check if cache entry is still valid
+                if time.time() - timestamp < self.ROUTE_CACHE_TTL_SECONDS:
+                    self.route_cache.move_to_end(cache_key)
+                    return result.cached_copy()
+
+                # Remove expired entry
+                del self.route_cache[cache_key]
                 return None
 
         except Exception as e:
             logger.error(f"EVENT-ROUTER: Error getting cached route: {e}")
             return None
 
-    def _cache_routing_result(self, cache_key: str, routing_result: RoutingResult):
+    def _cache_routing_result(self, cache_key: tuple, routing_result: RoutingResult):
         """Cache routing result for future use."""
         try:
             with self.cache_lock:
-                # Implement LRU cache with size limit
-                while len(self.route_cache) >= self.cache_size:
-                    oldest_key = self.cache_access_order.popleft()
-                    if oldest_key in self.route_cache:
-                        del self.route_cache[oldest_key]
-
-                # Cache the result
                 self.route_cache[cache_key] = (routing_result, time.time())
-                self.cache_access_order.append(cache_key)
+                self.route_cache.move_to_end(cache_key)
+
+                # Evict least recently used entries beyond the size limit
+                while len(self.route_cache) > self.cache_size:
+                    self.route_cache.popitem(last=False)
 
         except Exception as e:
             logger.error(f"EVENT-ROUTER: Error caching routing result: {e}")
@@ -587,12 +798,12 @@ class EventRouter:
             if rule_id in category_rules:
                 category_rules.remove(rule_id)
 
-    def _clear_cache_for_rule(self, rule_id: str):
-        """Clear cache entries that might be affected by rule removal."""
-        # For simplicity, clear entire cache when rules change
+    def _invalidate_routes(self):
+        """Drop the event type index and cached routes after a rule change."""
+        with self.routing_lock:
+            self.rules_by_event_type = {}
         with self.cache_lock:
             self.route_cache.clear()
-            self.cache_access_order.clear()
 
     def _register_built_in_transformers(self):
         """Register built-in content transformers."""
@@ -635,6 +846,7 @@ class EventRouter:
                     'rule_usage': rule_usage,
 
                     # Cache metrics
+                    'indexed_event_types': len(self.rules_by_event_type),
                     'cache_size': len(self.route_cache),
                     'cache_capacity': self.cache_size,
                     'cache_utilization_percent': round((len(self.route_cache) / self.cache_size) * 100, 1),
@@ -709,13 +921,11 @@ class EventRouter:
             with self.cache_lock:
                 expired_keys = []
                 for cache_key, (result, timestamp) in self.route_cache.items():
-                    if current_time - timestamp > 300:  # 5 minutes
+                    if current_time - timestamp > self.ROUTE_CACHE_TTL_SECONDS:
                         expired_keys.append(cache_key)
 
                 for key in expired_keys:
                     del self.route_cache[key]
-                    if key in self.cache_access_order:
-                        self.cache_access_order.remove(key)
 
                 optimization_results['cache_cleaned'] = len(expired_keys)
 
@@ -732,6 +942,7 @@ class EventRouter:
                     optimized_rules[rule_id] = rule
 
                 self.routing_rules = optimized_rules
+                self.rules_by_event_type = {}  # Candidate lists follow rule order
                 optimization_results['rules_optimized'] = len(optimized_rules)
 
             logger.info(f"EVENT-ROUTER: Performance optimization complete - "
@@ -750,12 +961,12 @@ class EventRouter:
             logger.info("EVENT-ROUTER: Starting graceful shutdown...")
 
             # Shutdown routing executor
-            self.routing_executor.shutdown(wait=True, timeout=5)
+            self.routing_executor.shutdown(wait=True)
 
-            # Clear caches
+            # Clear caches; routes handled after shutdown are not cached
+            self.enable_caching = False
             with self.cache_lock:
                 self.route_cache.clear()
-                self.cache_access_order.clear()
 
             logger.info("EVENT-ROUTER: Graceful shutdown complete")
 
@@ -171,7 +171,7 @@ class MultiConnectionManager:
                         f"from universe '{universe_key}': "
                         f"{', '.join(universe_tickers[:5])}{'...' if len(universe_tickers) > 5 else ''}"
                     )
-                    return universe_tickers
+                    return list(universe_tickers)
                 logger.warning(
                     f"MULTI-CONNECTION: Universe '{universe_key}' not found or empty "
                     f"for connection {connection_num}, trying direct symbols"
@@ -0,0 +1,139 @@
+"""
+Pattern Alert Fan-out
+Delivers one pattern alert to many users with as few SocketIO emits as possible.
+
+A pattern on a popular symbol can match thousands of users. Instead of one
+emit per user room (each encoding the payload again and, with a Redis
+message queue, publishing it again), the alert is emitted once per chunk of
+rooms: `to=[room, room, ...]`. SocketIO encodes the packet once per emit and
+delivers it to every client in any of the rooms exactly once.
+
+Every alert is also sent to the shared topic room `pattern:{pattern}:{symbol}`.
+Clients that join a topic room receive every alert for that pattern/symbol
+without per-user filtering; a client in both a topic room and a matched user
+room in a later chunk can receive an alert twice.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from flask_socketio import SocketIO
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FanoutResult:
+    """Outcome of one alert fan-out."""
+    recipients: int
+    emits: int
+    latency_ms: float
+
+
+class PatternAlertFanout:
+    """
+    Batched SocketIO fan-out of pattern alerts to user and topic rooms.
+
+    Tracks per-event fan-out latency over a window of recent events.
+    """
+
+    USER_ROOM = "user_{user_id}"
+    TOPIC_ROOM = "pattern:{pattern}:{symbol}"
+
+    def __init__(self, socketio: SocketIO, rooms_per_emit: int = 1000,
+                 namespace: str = '/', latency_window: int = 1000):
+        """
+        Initialize fan-out stage.
+
+        Args:
+            socketio: SocketIO instance to emit on
+            rooms_per_emit: Max rooms per emit call
+            namespace: SocketIO namespace
+            latency_window: Number of recent events latency percentiles cover
+        """
+        self.socketio = socketio
+        self.rooms_per_emit = max(1, rooms_per_emit)
+        self.namespace = namespace
+
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self.stats = {
+            'events': 0,
+            'recipients': 0,
+            'emits': 0,
+            'errors': 0,
+            'max_latency_ms': 0.0,
+        }
+
+    @classmethod
+    def topic_room(cls, pattern: str, symbol: str) -> str:
+        """Shared room for every alert of a pattern on a symbol."""
+        return cls.TOPIC_ROOM.format(pattern=pattern, symbol=symbol.upper())
+
+    def publish(self, event_name: str, payload: dict[str, Any], pattern: str, symbol: str,
+                user_ids: list[str]) -> FanoutResult:
+        """
+        Emit an alert to the matched users' rooms and the topic room.
+
+        Args:
+            event_name: SocketIO event name (e.g. 'pattern_alert')
+            payload: Event payload, emitted unchanged
+            pattern: Pattern name (topic room)
+            symbol: Symbol (topic room)
+            user_ids: Users that passed alert filtering
+
+        Returns:
+            FanoutResult with user recipients, emit calls and latency
+        """
+        start = time.perf_counter()
+        rooms = [self.topic_room(pattern, symbol)]
+        rooms.extend(self.USER_ROOM.format(user_id=user_id) for user_id in user_ids)
+
+        emits = 0
+        try:
+            for offset in range(0, len(rooms), self.rooms_per_emit):
+                self.socketio.emit(
+                    event_name, payload,
+                    to=rooms[offset:offset + self.rooms_per_emit],
+                    namespace=self.namespace
+                )
+                emits += 1
+        except Exception:
+            with self._lock:
+                self.stats['errors'] += 1
+            raise
+        finally:
+            latency_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self.stats['events'] += 1
+                self.stats['recipients'] += len(user_ids)
+                self.stats['emits'] += emits
+                self.stats['max_latency_ms'] = max(self.stats['max_latency_ms'], latency_ms)
+                self._latencies.append(latency_ms)
+
+        logger.debug(
+            f"PATTERN-FANOUT: {pattern}@{symbol} to {len(user_ids)} users "
+            f"in {emits} emits ({latency_ms:.2f}ms)"
+        )
+        return FanoutResult(recipients=len(user_ids), emits=emits, latency_ms=latency_ms)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Fan-out counters and latency percentiles over recent events."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = dict(self.stats)
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))], 3)
+
+        stats['max_latency_ms'] = round(stats['max_latency_ms'], 3)
+        stats['p50_latency_ms'] = percentile(0.50)
+        stats['p95_latency_ms'] = percentile(0.95)
+        stats['avg_recipients'] = round(stats['recipients'] / max(stats['events'], 1), 1)
+        return stats
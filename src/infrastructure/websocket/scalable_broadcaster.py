@@ -7,6 +7,8 @@ Implements industry-standard patterns used by professional trading platforms (Bl
 for sub-100ms message delivery with batching optimization and user-level rate limiting.
 """
 
+import heapq
+import itertools
 import logging
 import threading
 import time
@@ -51,9 +53,20 @@ class EventBatch:
     created_at: float
     priority: DeliveryPriority
 
+    # Running payload size, maintained by add_event()
+    total_size: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        self.total_size = sum(len(str(event.event_data)) for event in self.events)
+
+    def add_event(self, event: EventMessage, event_size: int | None = None):
+        """Append event, adding its payload size (computed if not given)."""
+        self.events.append(event)
+        self.total_size += len(str(event.event_data)) if event_size is None else event_size
+
     def get_total_size(self) -> int:
         """Get total size of batch for memory management."""
-        return sum(len(str(event.event_data)) for event in self.events)
+        return self.total_size
 
 @dataclass
 class RateLimiter:
@@ -115,10 +128,21 @@ class BroadcastStats:
     rate_limit_violations: int = 0
     users_rate_limited: int = 0
 
+    # Flush scheduling metrics (time from batch due to flush)
+    avg_flush_lag_ms: float = 0.0
+    max_flush_lag_ms: float = 0.0
+    batches_flushed_on_schedule: int = 0
+
     # Error tracking
     delivery_errors: int = 0
     batch_errors: int = 0
 
+    def record_flush_lag(self, lag_ms: float):
+        """Record how late a scheduled batch flush ran."""
+        self.batches_flushed_on_schedule += 1
+        self.avg_flush_lag_ms += (lag_ms - self.avg_flush_lag_ms) / self.batches_flushed_on_schedule
+        self.max_flush_lag_ms = max(self.max_flush_lag_ms, lag_ms)
+
     def record_delivery(self, batch_size: int, latency_ms: float):
         """Record successful delivery metrics."""
         self.events_delivered += batch_size
@@ -143,7 +167,8 @@ class ScalableBroadcaster:
     High-performance WebSocket broadcasting system with batching and rate limiting.
     
     Implements scalable real-time communication patterns for financial data delivery:
-    - Event batching with configurable time windows (100ms default)
+    - Event batching with configurable time windows (100ms default), flushed by
+      one scheduler thread for all rooms
     - Per-user rate limiting (100 events/sec default)
     - Priority-based delivery queuing
     - Efficient room-based broadcasting
@@ -166,7 +191,9 @@ class ScalableBroadcaster:
 
         # Event batching system
         self.pending_batches: dict[str, EventBatch] = {}  # room -> batch
-        self.batch_timers: dict[str, threading.Timer] = {}  # room -> timer
+        # heap of (due, seq, room, batch)
+        self.flush_schedule: list[tuple[float, int, str, EventBatch]] = []
+        self._flush_sequence = itertools.count()
         self.event_queue: dict[DeliveryPriority, deque] = {
             priority: deque() for priority in DeliveryPriority
         }
@@ -186,6 +213,11 @@ class ScalableBroadcaster:
         # Thread safety
         self.broadcast_lock = threading.RLock()
 
+        # Single flusher thread (green thread under eventlet) owns all batch deadlines
+        self.flush_condition = threading.Condition(self.broadcast_lock)
+        self.flusher_thread: threading.Thread | None = None
+        self.flusher_running = False
+
         # Configuration
         self.enable_batching = True
         self.enable_rate_limiting = True
@@ -328,6 +360,9 @@ class ScalableBroadcaster:
             with self.broadcast_lock:
                 queued_count = 0
 
+                # Payload is shared by every room event; size it once
+                event_size = len(str(event_message.event_data))
+
                 # Group users by rooms for efficient delivery
                 user_rooms = {}
                 for user_id in event_message.target_users:
@@ -355,7 +390,7 @@ class ScalableBroadcaster:
                         # Check if batch can accommodate new event
                         if (len(batch.events) < self.max_batch_size and
                             batch.get_total_size() < 64 * 1024):  # 64KB max batch size
-                            batch.events.append(room_event)
+                            batch.add_event(room_event, event_size)
                         else:
                             # Flush current batch and start new one
                             self._flush_batch(room_name)
@@ -383,7 +418,7 @@ class ScalableBroadcaster:
                     # Check batch capacity
                     if (len(batch.events) < self.max_batch_size and
                         batch.get_total_size() < 64 * 1024):
-                        batch.events.append(event_message)
+                        batch.add_event(event_message)
                     else:
                         # Flush and create new batch
                         self._flush_batch(room_name)
@@ -399,7 +434,7 @@ class ScalableBroadcaster:
             return False
 
     def _create_new_batch(self, room_name: str, event_message: EventMessage):
-        """Create new batch for room."""
+        """Create new batch for room and schedule its flush (caller holds broadcast_lock)."""
         try:
             batch_id = f"{room_name}_{int(time.time() * 1000)}"
 
@@ -415,37 +450,76 @@ class ScalableBroadcaster:
             self.stats.batches_created += 1
 
             # Schedule batch delivery
-            timer = threading.Timer(
-                self.batch_window_ms / 1000.0,  # Convert to seconds
-                lambda: self._flush_batch(room_name)
-            )
-
-            self.batch_timers[room_name] = timer
-            timer.start()
+            due = time.monotonic() + self.batch_window_ms / 1000.0
+            heapq.heappush(self.flush_schedule, (due, next(self._flush_sequence), room_name, batch))
+            self._ensure_flusher()
+            if self.flush_schedule[0][3] is batch:
+                # New earliest deadline: wake the flusher to re-arm its wait
+                self.flush_condition.notify()
 
             logger.debug(f"SCALABLE-BROADCASTER: Created batch {batch_id} for room {room_name}")
 
         except Exception as e:
             logger.error(f"SCALABLE-BROADCASTER: Error creating batch for room {room_name}: {e}")
 
+    def _ensure_flusher(self):
+        """Start the flusher thread on first use (caller holds broadcast_lock)."""
+        if self.flusher_thread is None:
+            self.flusher_running = True
+            self.flusher_thread = threading.Thread(
+                target=self._run_flusher, name="broadcast-flusher", daemon=True
+            )
+            self.flusher_thread.start()
+
+    def _run_flusher(self):
+        """Flush batches as they come due; sleeps until the earliest deadline."""
+        while True:
+            try:
+                with self.flush_condition:
+                    if not self.flusher_running:
+                        return
+
+                    now = time.monotonic()
+                    due_batches = []
+                    while self.flush_schedule and self.flush_schedule[0][0] <= now:
+                        due, _, room_name, batch = heapq.heappop(self.flush_schedule)
+
+                        # Skip entries for batches already flushed early (size limit, flush_all)
+                        if self.pending_batches.get(room_name) is batch:
+                            del self.pending_batches[room_name]
+                            due_batches.append(batch)
+                            self.stats.record_flush_lag((now - due) * 1000)
+
+                    if not due_batches:
+                        timeout = self.flush_schedule[0][0] - now if self.flush_schedule else None
+                        self.flush_condition.wait(timeout)
+                        continue
+
+                for batch in due_batches:
+                    self._submit_delivery(batch)
+
+            except Exception as e:
+                logger.error(f"SCALABLE-BROADCASTER: Error in batch flusher: {e}")
+                self.stats.batch_errors += 1
+
+    def _submit_delivery(self, batch: EventBatch):
+        """Hand a flushed batch to the delivery pool."""
+        try:
+            self.delivery_executor.submit(self._deliver_batch, batch)
+        except Exception as e:
+            logger.error(f"SCALABLE-BROADCASTER: Error submitting batch {batch.batch_id}: {e}")
+            self.stats.batch_errors += 1
+
     def _flush_batch(self, room_name: str):
         """Flush and deliver batch for room."""
         try:
             with self.broadcast_lock:
-                if room_name not in self.pending_batches:
+                batch = self.pending_batches.pop(room_name, None)
+                if batch is None:
                     return
 
-                batch = self.pending_batches[room_name]
-                del self.pending_batches[room_name]
-
-                # Cancel timer if exists
-                if room_name in self.batch_timers:
-                    timer = self.batch_timers[room_name]
-                    timer.cancel()
-                    del self.batch_timers[room_name]
-
-            # Deliver batch asynchronously
-            self.delivery_executor.submit(self._deliver_batch, batch)
+            # Deliver batch asynchronously (its schedule entry is skipped when due)
+            self._submit_delivery(batch)
 
         except Exception as e:
             logger.error(f"SCALABLE-BROADCASTER: Error flushing batch for room {room_name}: {e}")
@@ -504,12 +578,14 @@ class ScalableBroadcaster:
         """Flush all pending batches immediately."""
         try:
             with self.broadcast_lock:
-                rooms_to_flush = list(self.pending_batches.keys())
+                batches = list(self.pending_batches.values())
+                self.pending_batches.clear()
+                self.flush_schedule.clear()
 
-            for room_name in rooms_to_flush:
-                self._flush_batch(room_name)
+            for batch in batches:
+                self._submit_delivery(batch)
 
-            logger.info(f"SCALABLE-BROADCASTER: Flushed {len(rooms_to_flush)} pending batches")
+            logger.info(f"SCALABLE-BROADCASTER: Flushed {len(batches)} pending batches")
 
         except Exception as e:
             logger.error(f"SCALABLE-BROADCASTER: Error flushing all batches: {e}")
@@ -569,7 +645,11 @@ class ScalableBroadcaster:
                     'batches_created': self.stats.batches_created,
                     'batches_delivered': self.stats.batches_delivered,
                     'pending_batches': len(self.pending_batches),
+                    'scheduled_flushes': len(self.flush_schedule),
                     'batch_efficiency': round(self.stats.batch_efficiency, 1),
+                    'avg_flush_lag_ms': round(self.stats.avg_flush_lag_ms, 2),
+                    'max_flush_lag_ms': round(self.stats.max_flush_lag_ms, 2),
+                    'flusher_alive': bool(self.flusher_thread and self.flusher_thread.is_alive()),
 
                     # Rate limiting metrics
                     'rate_limit_violations': self.stats.rate_limit_violations,
@@ -685,15 +765,16 @@ class ScalableBroadcaster:
             # Flush all pending batches
             self.flush_all_batches()
 
-            # Shutdown thread pools
-            self.batch_executor.shutdown(wait=True, timeout=5)
-            self.delivery_executor.shutdown(wait=True, timeout=5)
+            # Stop the flusher
+            with self.flush_condition:
+                self.flusher_running = False
+                self.flush_condition.notify_all()
+            if self.flusher_thread:
+                self.flusher_thread.join(timeout=5)
 
-            # Cancel all timers
-            with self.broadcast_lock:
-                for timer in self.batch_timers.values():
-                    timer.cancel()
-                self.batch_timers.clear()
+            # Shutdown thread pools
+            self.batch_executor.shutdown(wait=True)
+            self.delivery_executor.shutdown(wait=True)
 
             logger.info("SCALABLE-BROADCASTER: Graceful shutdown complete")
 
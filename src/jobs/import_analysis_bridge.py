@@ -271,7 +271,7 @@ class ImportAnalysisBridge:
                                 # Load symbols from universe using RelationshipCache
                                 from src.core.services.relationship_cache import get_relationship_cache
                                 cache = get_relationship_cache()
-                                symbols = cache.get_universe_symbols(universe_key)
+                                symbols = list(cache.get_universe_symbols(universe_key))
                     except Exception as e:
                         logger.error(f"ImportAnalysisBridge: Error loading symbols from metadata: {e}")
 
@@ -0,0 +1,126 @@
+"""
+Pattern Retention Job
+
+Sprint 74 retention policy for daily_patterns: pattern rows are detection
+events, so recent history is kept for analysis and older rows are deleted to
+prevent unbounded growth.
+
+The cleanup used to run after every admin analysis job and after every
+real-time bar analysis. It now runs on a fixed schedule from one background
+thread:
+- PATTERN_RETENTION_HOURS: age after which detections are deleted (48)
+- PATTERN_RETENTION_INTERVAL_SECONDS: time between cleanup runs (3600)
+"""
+
+import logging
+import threading
+from typing import Any
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+
+def cleanup_old_patterns(retention_hours: float = 48) -> int:
+    """
+    Delete daily_patterns detections older than the retention window.
+
+    Args:
+        retention_hours: Detections older than this many hours are deleted
+
+    Returns:
+        Number of patterns deleted (0 on failure)
+    """
+    try:
+        from src.core.services.config_manager import get_config
+        from src.infrastructure.database.tickstock_db import TickStockDatabase
+
+        db = TickStockDatabase(get_config(), role="admin")
+
+        with db.get_connection() as conn:
+            result = conn.execute(text("""
+                DELETE FROM daily_patterns
+                WHERE detection_timestamp < NOW() - make_interval(hours => :hours)
+            """), {'hours': float(retention_hours)})
+
+            deleted_count = result.rowcount
+            conn.commit()
+
+            if deleted_count > 0:
+                logger.info(
+                    f"PATTERN-RETENTION: Cleaned up {deleted_count} old pattern detections "
+                    f"(>{retention_hours:g}h)"
+                )
+
+            return deleted_count
+
+    except Exception as e:
+        logger.error(f"PATTERN-RETENTION: Pattern cleanup failed: {e}")
+        return 0
+
+
+class PatternRetentionJob:
+    """Background thread running cleanup_old_patterns() on an interval."""
+
+    def __init__(self, config: dict[str, Any] | None = None):
+        """
+        Initialize the retention job.
+
+        Args:
+            config: Configuration dictionary with retention settings
+        """
+        config = config or {}
+        self.retention_hours = float(config.get('PATTERN_RETENTION_HOURS', 48))
+        self.interval_seconds = float(config.get('PATTERN_RETENTION_INTERVAL_SECONDS', 3600))
+
+        self.running = False
+        self._thread = None
+        self._stop_event = threading.Event()
+
+        self.stats = {
+            'runs': 0,
+            'patterns_deleted': 0,
+            'last_run_deleted': 0,
+        }
+
+    def start(self):
+        """Start the cleanup thread (first run happens immediately)."""
+        if self.running:
+            logger.warning("PATTERN-RETENTION: Already running")
+            return
+
+        self.running = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run_loop, daemon=True, name="PatternRetentionJob"
+        )
+        self._thread.start()
+        logger.info(
+            f"PATTERN-RETENTION: Started (retention={self.retention_hours:g}h, "
+            f"interval={self.interval_seconds:g}s)"
+        )
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the cleanup thread."""
+        if not self.running:
+            return
+
+        self.running = False
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        logger.info("PATTERN-RETENTION: Stopped")
+
+    def run_once(self) -> int:
+        """Run one cleanup pass."""
+        deleted = cleanup_old_patterns(self.retention_hours)
+        self.stats['runs'] += 1
+        self.stats['patterns_deleted'] += deleted
+        self.stats['last_run_deleted'] = deleted
+        return deleted
+
+    def _run_loop(self):
+        while self.running:
+            self.run_once()
+            if self._stop_event.wait(self.interval_seconds):
+                break
@@ -0,0 +1 @@
+"""Analysis data access tests."""
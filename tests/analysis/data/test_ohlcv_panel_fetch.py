@@ -0,0 +1,140 @@
+"""
+Unit tests for bulk OHLCV panel loading.
+
+OHLCVPanel.from_flat packing and OHLCVDataService.get_ohlcv_panel streaming.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.data.ohlcv_data_service import OHLCVDataService
+from src.analysis.data.ohlcv_panel import OHLCV_COLUMNS, OHLCVPanel
+
+
+def _daily_frame(days, start='2025-01-02', base=100.0):
+    closes = base + np.arange(days, dtype=float)
+    return pd.DataFrame({
+        'open': closes - 0.5,
+        'high': closes + 1.0,
+        'low': closes - 1.0,
+        'close': closes,
+        'volume': np.full(days, 1000.0),
+    }, index=pd.date_range(start, periods=days, freq='D', name='date'))
+
+
+def _records(frames):
+    """
+    Query rows (symbol, bar_time, open, high, low, close, volume) ordered by
+    symbol, time; daily bar times come back as datetime.date.
+    """
+    return [
+        (symbol, ts.date(), *row)
+        for symbol in sorted(frames)
+        for ts, row in zip(
+            frames[symbol].index,
+            frames[symbol][list(OHLCV_COLUMNS)].itertuples(index=False),
+            strict=True,
+        )
+    ]
+
+
+def _assert_panels_equal(actual, expected):
+    assert actual.symbols == expected.symbols
+    np.testing.assert_array_equal(actual.lengths, expected.lengths)
+    np.testing.assert_array_equal(actual.times, expected.times)
+    for col in OHLCV_COLUMNS:
+        np.testing.assert_array_equal(actual.column(col), expected.column(col))
+
+
+class TestFromFlat:
+    """Test packing flat per-bar arrays."""
+
+    def test_matches_from_frames(self):
+        frames = {
+            'MSFT': _daily_frame(3, base=50.0), 'AAPL': _daily_frame(5), 'EMPTY': _daily_frame(0)
+        }
+        bars = [
+            (symbol, ts, row)
+            for symbol, df in frames.items()
+            for ts, row in zip(df.index, df.itertuples(index=False), strict=True)
+        ]
+        positions = {symbol: i for i, symbol in enumerate(frames)}
+        # Interleave symbols; each symbol's bars stay in time order
+        bars.sort(key=lambda bar: (bar[1], bar[0]))
+
+        panel = OHLCVPanel.from_flat(
+            list(frames),
+            np.array([positions[symbol] for symbol, _, _ in bars]),
+            np.array([ts for _, ts, _ in bars], dtype='datetime64[ns]'),
+            {col: np.array([getattr(row, col) for _, _, row in bars]) for col in OHLCV_COLUMNS},
+        )
+
+        _assert_panels_equal(panel, OHLCVPanel.from_frames(frames))
+        assert panel.frame('EMPTY').empty
+
+    def test_empty(self):
+        panel = OHLCVPanel.from_flat(
+            [], np.empty(0), np.empty(0), {col: np.empty(0) for col in OHLCV_COLUMNS}
+        )
+
+        assert len(panel) == 0
+        assert panel.bars == 0
+
+
+class TestGetOHLCVPanel:
+    """Test the streamed bulk panel query."""
+
+    @pytest.fixture
+    def service(self):
+        with patch('src.analysis.data.ohlcv_data_service.TickStockDatabase'), \
+                patch('src.analysis.data.ohlcv_data_service.get_config', return_value={}):
+            service = OHLCVDataService()
+        service.PANEL_FETCH_ROWS = 4
+        return service
+
+    def _stream(self, service, records):
+        conn = MagicMock()
+        service.db.get_connection.return_value.__enter__.return_value = conn
+        result = conn.execution_options.return_value.execute.return_value
+        result.partitions.side_effect = lambda size: (
+            records[i:i + size] for i in range(0, len(records), size)
+        )
+        return conn
+
+    def test_streams_one_windowed_query_into_panel(self, service):
+        frames = {'AAPL': _daily_frame(5), 'MSFT': _daily_frame(3, base=50.0)}
+        conn = self._stream(service, _records(frames))
+
+        panel = service.get_ohlcv_panel(['msft', 'AAPL', 'MSFT', 'NONE'], 'daily', limit=5)
+
+        conn.execution_options.assert_called_once_with(stream_results=True)
+        query, params = conn.execution_options.return_value.execute.call_args.args
+        assert 'ROW_NUMBER() OVER (PARTITION BY symbol' in str(query)
+        assert params == {'symbols': ['MSFT', 'AAPL', 'NONE'], 'limit': 5}
+
+        expected = OHLCVPanel.from_frames(
+            {**{s: frames[s] for s in ('MSFT', 'AAPL')}, 'NONE': _daily_frame(0)}
+        )
+        _assert_panels_equal(panel, expected)
+
+    def test_invalid_timeframe(self, service):
+        with pytest.raises(ValueError, match="Invalid timeframe"):
+            service.get_ohlcv_panel(['AAPL'], 'yearly')
+
+    def test_query_failure(self, service):
+        conn = self._stream(service, [])
+        conn.execution_options.return_value.execute.side_effect = Exception("timeout")
+
+        with pytest.raises(RuntimeError, match="Failed to fetch OHLCV panel"):
+            service.get_ohlcv_panel(['AAPL'])
+
+    def test_no_rows(self, service):
+        self._stream(service, [])
+
+        panel = service.get_ohlcv_panel(['AAPL'])
+
+        assert panel.symbols == ['AAPL']
+        assert panel.lengths.tolist() == [0]
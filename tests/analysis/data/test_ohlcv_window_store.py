@@ -0,0 +1,196 @@
+"""
+Unit tests for OHLCVWindowStore.
+
+Rolling in-memory OHLCV windows used by real-time bar analysis.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.data.ohlcv_window_store import OHLCVWindowStore
+
+
+def _daily_frame(days=5, start='2025-01-02'):
+    dates = pd.date_range(start, periods=days, freq='D').date
+    closes = np.arange(100.0, 100.0 + days)
+    return pd.DataFrame({
+        'date': dates,
+        'open': closes - 0.5,
+        'high': closes + 1.0,
+        'low': closes - 1.0,
+        'close': closes,
+        'volume': np.full(days, 1000.0),
+    }).set_index('date')
+
+
+class TestWindowLoading:
+    """Test loading windows from DataFrames and bulk queries."""
+
+    def test_load_frame_and_read_snapshot(self):
+        store = OHLCVWindowStore()
+        store.load_frame('aapl', 'daily', _daily_frame())
+
+        frame = store.get_frame('AAPL', 'daily')
+
+        assert list(frame.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        assert len(frame) == 5
+        assert frame['close'].tolist() == [100.0, 101.0, 102.0, 103.0, 104.0]
+        assert frame['timestamp'].is_monotonic_increasing
+
+    def test_load_frame_keeps_last_capacity_bars(self):
+        store = OHLCVWindowStore({'OHLCV_WINDOW_BARS': 3})
+        store.load_frame('AAPL', 'daily', _daily_frame(days=10))
+
+        assert store.get_frame('AAPL', 'daily')['close'].tolist() == [107.0, 108.0, 109.0]
+
+    def test_bulk_load_uses_batched_query(self):
+        ohlcv_service = Mock()
+        ohlcv_service.get_universe_ohlcv_data.return_value = {
+            'AAPL': _daily_frame(),
+            'MSFT': _daily_frame(),
+            'EMPTY': pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume']),
+        }
+        store = OHLCVWindowStore({'OHLCV_WINDOW_LOAD_CHUNK_SIZE': 10})
+
+        loaded = store.bulk_load(['AAPL', 'MSFT', 'EMPTY'], 'daily', ohlcv_service=ohlcv_service)
+
+        assert loaded == 2
+        ohlcv_service.get_universe_ohlcv_data.assert_called_once()
+        assert store.has_window('MSFT', 'daily')
+        assert not store.has_window('EMPTY', 'daily')
+
+    def test_missing_window_returns_none(self):
+        store = OHLCVWindowStore()
+
+        assert store.get_frame('AAPL', 'daily') is None
+        assert store.get_stats()['misses'] == 1
+
+
+class TestWindowUpdates:
+    """Test live bar updates."""
+
+    def test_update_bar_appends_and_rolls(self):
+        store = OHLCVWindowStore({'OHLCV_WINDOW_BARS': 3})
+        store.load_frame('AAPL', 'daily', _daily_frame(days=3))
+
+        # Append many bars to exercise buffer compaction
+        for day in range(10):
+            ts = datetime(2025, 2, 1 + day, 15, 0, tzinfo=UTC)
+            assert store.update_bar('AAPL', 'daily', ts, 1.0, 2.0, 0.5, float(day), 10.0)
+
+        frame = store.get_frame('AAPL', 'daily')
+        assert frame['close'].tolist() == [7.0, 8.0, 9.0]
+
+    def test_update_bar_replaces_same_timestamp(self):
+        store = OHLCVWindowStore()
+        store.load_frame('AAPL', 'daily', _daily_frame(days=2))
+        last_session = datetime(2025, 1, 3, 16, 0, tzinfo=UTC)
+
+        store.update_bar('AAPL', 'daily', last_session, 1.0, 5.0, 0.5, 4.0, 99.0)
+
+        frame = store.get_frame('AAPL', 'daily')
+        assert len(frame) == 2
+        assert frame['close'].iloc[-1] == 4.0
+        assert store.get_stats()['bars_updated'] == 1
+
+    def test_fold_into_daily_extends_current_session(self):
+        store = OHLCVWindowStore()
+        store.load_frame('AAPL', 'daily', _daily_frame(days=2))
+        # 2025-01-03 15:30 UTC is still the 2025-01-03 US session
+        minute = datetime(2025, 1, 3, 15, 30, tzinfo=UTC)
+
+        store.fold_into_daily('AAPL', minute, 101.0, 110.0, 90.0, 105.0, 500.0)
+
+        last = store.get_frame('AAPL', 'daily').iloc[-1]
+        assert last['open'] == 100.5
+        assert last['high'] == 110.0
+        assert last['low'] == 90.0
+        assert last['close'] == 105.0
+        assert last['volume'] == 1500.0
+
+    def test_fold_into_daily_starts_new_session(self):
+        store = OHLCVWindowStore()
+        store.load_frame('AAPL', 'daily', _daily_frame(days=2))
+        minute = datetime(2025, 1, 6, 14, 31, tzinfo=UTC)
+
+        store.fold_into_daily('AAPL', minute, 101.0, 102.0, 100.0, 101.5, 50.0)
+
+        frame = store.get_frame('AAPL', 'daily')
+        assert len(frame) == 3
+        assert frame['timestamp'].iloc[-1] == pd.Timestamp('2025-01-06')
+
+    def test_stale_and_unloaded_updates_are_ignored(self):
+        store = OHLCVWindowStore()
+        store.load_frame('AAPL', 'daily', _daily_frame(days=2))
+
+        old = datetime(2024, 12, 1, 15, 0, tzinfo=UTC)
+        assert store.update_bar('AAPL', 'daily', old, 1.0, 1.0, 1.0, 1.0, 1.0) is False
+        assert store.update_bar('MSFT', 'daily', old, 1.0, 1.0, 1.0, 1.0, 1.0) is False
+        assert store.get_stats()['stale_bars_ignored'] == 1
+
+    def test_array_views_are_zero_copy(self):
+        store = OHLCVWindowStore()
+        store.load_frame('AAPL', 'daily', _daily_frame())
+
+        times, values = store.get_arrays('AAPL', 'daily')
+
+        assert values.shape == (5, 5)
+        assert values.base is not None
+        assert len(times) == 5
+
+
+class TestWindowMemory:
+    """Test memory accounting and eviction."""
+
+    def test_memory_accounting(self):
+        store = OHLCVWindowStore({'OHLCV_WINDOW_BARS': 100})
+        store.load_frame('AAPL', 'daily', _daily_frame())
+
+        # 2x capacity buffer: 8-byte times + 5 float64 columns
+        assert store.memory_bytes() == 200 * 8 * 6
+        assert store.get_stats()['memory_bytes'] == store.memory_bytes()
+
+    def test_evict_inactive_windows(self):
+        store = OHLCVWindowStore({'OHLCV_WINDOW_IDLE_TTL_SECONDS': 60})
+        store.load_frame('AAPL', 'daily', _daily_frame())
+        store.load_frame('MSFT', 'daily', _daily_frame())
+        store._windows[('MSFT', 'daily')].last_access -= 120
+
+        assert store.evict_inactive() == 1
+        assert store.has_window('AAPL', 'daily')
+        assert not store.has_window('MSFT', 'daily')
+
+    def test_lru_eviction_over_window_budget(self):
+        store = OHLCVWindowStore({'OHLCV_WINDOW_MAX_WINDOWS': 2})
+        store.load_frame('AAPL', 'daily', _daily_frame())
+        store.load_frame('MSFT', 'daily', _daily_frame())
+        store.get_frame('AAPL', 'daily')
+        store.load_frame('NVDA', 'daily', _daily_frame())
+
+        assert store.has_window('AAPL', 'daily')
+        assert not store.has_window('MSFT', 'daily')
+        assert store.get_stats()['windows_evicted'] == 1
+
+
+class TestAnalysisServiceWindowRead:
+    """Test AnalysisService reading from the window store."""
+
+    @patch('src.analysis.services.analysis_service.IndicatorLoader')
+    @patch('src.analysis.services.analysis_service.PatternDetectionService')
+    def test_analyze_symbol_without_data_reads_window(self, mock_patterns, mock_indicators):
+        from src.analysis.exceptions import DataValidationError
+        from src.analysis.services.analysis_service import AnalysisService
+
+        store = OHLCVWindowStore()
+        service = AnalysisService(window_store=store)
+
+        with pytest.raises(DataValidationError, match="No OHLCV window loaded"):
+            service.analyze_symbol('AAPL', timeframe='daily')
+
+        store.load_frame('AAPL', 'daily', _daily_frame())
+        result = service.analyze_symbol('AAPL', timeframe='daily')
+        assert result == {'indicators': {}, 'patterns': {}}
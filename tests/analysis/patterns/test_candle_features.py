@@ -0,0 +1,125 @@
+"""
+Unit tests for shared candle geometry.
+
+Covers CandleFeatures arrays, the shared feature scope used by
+AnalysisService, and confidence dict mapping.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.patterns.candle_features import (
+    CandleFeatures,
+    get_candle_features,
+    scores_for_indices,
+    shared_candle_features,
+)
+from src.analysis.patterns.candlestick.doji import Doji
+from src.analysis.patterns.candlestick.engulfing import Engulfing
+from src.analysis.patterns.candlestick.hammer import Hammer
+
+
+@pytest.fixture
+def candles():
+    """Bearish bar, bullish engulfing bar, then a flat bar with no range."""
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=3, freq="D"),
+        "open": [101.0, 99.5, 100.0],
+        "high": [102.0, 103.0, 100.0],
+        "low": [99.0, 98.0, 100.0],
+        "close": [100.0, 102.5, 100.0],
+        "volume": [1000, 2000, 1500],
+    })
+
+
+class TestCandleFeatures:
+    """Test per-bar geometry arrays."""
+
+    def test_geometry(self, candles):
+        features = CandleFeatures.from_frame(candles)
+
+        np.testing.assert_allclose(features.body, [1.0, 3.0, 0.0])
+        np.testing.assert_allclose(features.range, [3.0, 5.0, 0.0])
+        np.testing.assert_allclose(features.body_top, [101.0, 102.5, 100.0])
+        np.testing.assert_allclose(features.body_bottom, [100.0, 99.5, 100.0])
+        np.testing.assert_allclose(features.upper_shadow, [1.0, 0.5, 0.0])
+        np.testing.assert_allclose(features.lower_shadow, [1.0, 1.5, 0.0])
+        assert features.direction.tolist() == [-1, 1, 0]
+        assert features.bullish.tolist() == [False, True, False]
+        assert features.bearish.tolist() == [True, False, False]
+
+    def test_gaps(self):
+        data = pd.DataFrame({
+            "open": [10.0, 12.5, 9.0],
+            "high": [11.0, 13.0, 9.5],
+            "low": [9.5, 12.0, 8.5],
+            "close": [10.5, 12.8, 9.2],
+        })
+        features = CandleFeatures.from_frame(data)
+
+        assert features.gap_up.tolist() == [False, True, False]
+        assert features.gap_down.tolist() == [False, False, True]
+        assert np.isnan(features.volume).all()
+
+    def test_prev_pads_floats_with_nan_and_bools_with_false(self):
+        values = np.array([1.0, 2.0, 3.0])
+
+        shifted = CandleFeatures.prev(values, 2)
+        assert np.isnan(shifted[:2]).all()
+        assert shifted[2] == 1.0
+
+        assert CandleFeatures.prev(np.array([True, True])).tolist() == [False, True]
+        assert np.isnan(CandleFeatures.prev(values, 5)).all()
+
+    def test_ratio_is_zero_where_masked(self):
+        ratio = CandleFeatures.ratio(
+            np.array([1.0, 1.0]), np.array([4.0, 0.0]), np.array([True, False])
+        )
+        assert ratio.tolist() == [0.25, 0.0]
+
+
+class TestSharedCandleFeatures:
+    """Test one feature pass shared across patterns."""
+
+    def test_patterns_reuse_shared_features(self, candles):
+        patterns = [Doji(), Hammer(), Engulfing()]
+
+        with patch.object(
+            CandleFeatures, "from_frame", wraps=CandleFeatures.from_frame
+        ) as from_frame:
+            with shared_candle_features(candles) as features:
+                assert get_candle_features(candles) is features
+                for pattern in patterns:
+                    pattern.detect(candles)
+                    pattern.calculate_confidence(candles, candles.index)
+
+        from_frame.assert_called_once()
+
+    def test_scope_only_applies_to_its_frame(self, candles):
+        other = candles.copy()
+
+        with shared_candle_features(candles) as features:
+            assert get_candle_features(other) is not features
+
+        assert get_candle_features(candles) is not features
+
+
+class TestScoresForIndices:
+    """Test mapping confidence arrays to calculate_confidence() dicts."""
+
+    def test_skips_nan_and_unknown_indices(self, candles):
+        scores = np.array([np.nan, 0.8504, 1.2])
+
+        result = scores_for_indices(candles, pd.Index([0, 1, 2, 99]), scores)
+
+        assert result == {1: 0.85, 2: 1.0}
+
+    def test_engulfing_confidence_from_arrays(self, candles):
+        detections = Engulfing().detect(candles)
+
+        assert detections.tolist() == [False, True, False]
+        # 0.6 base + body ratio 3.0 + range engulfment + volume + color contrast
+        assert Engulfing().calculate_confidence(candles, detections[detections].index) == {1: 1.0}
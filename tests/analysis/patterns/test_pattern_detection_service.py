@@ -0,0 +1,113 @@
+"""
+Unit tests for PatternDetectionService.
+
+Covers real confidence scores, registry threshold filtering and the
+batched detect_patterns() API.
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pandas as pd
+import pytest
+
+from src.analysis.exceptions import AnalysisError, InvalidPatternError, PatternDetectionError
+from src.analysis.patterns.candle_features import CandleFeatures
+from src.analysis.patterns.candlestick.doji import Doji
+from src.analysis.patterns.candlestick.hammer import Hammer
+from src.analysis.patterns.pattern_detection_service import PatternDetectionService
+from src.analysis.services.analysis_service import AnalysisService
+
+
+@pytest.fixture
+def data():
+    """Strong doji, weak doji (asymmetric shadows, larger body), regular candle."""
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=3, freq="D"),
+        "open": [100.0, 100.0, 100.0],
+        "high": [101.0, 100.9, 102.0],
+        "low": [99.0, 99.0, 99.5],
+        "close": [100.0, 100.15, 101.5],
+        "volume": [1000, 1000, 1000],
+    })
+
+
+@pytest.fixture
+def registry():
+    """Dynamic loader stub serving pattern_definitions metadata."""
+    patterns = {
+        "doji": {"instance": Doji(), "min_bars_required": 1, "confidence_threshold": 0.7},
+        "hammer": {"instance": Hammer(), "min_bars_required": 1, "confidence_threshold": None},
+    }
+    loader = MagicMock()
+    loader.get_pattern.side_effect = lambda timeframe, name: patterns.get(name.lower())
+
+    with patch("src.analysis.patterns.loader.get_dynamic_loader", return_value=loader), \
+            patch("src.analysis.dynamic_loader.get_dynamic_loader", return_value=loader):
+        yield patterns
+
+
+class TestDetectPattern:
+    """Test single-pattern detection results."""
+
+    def test_confidence_is_real_and_zero_without_detection(self, data, registry):
+        result = PatternDetectionService().detect_pattern("doji", data, apply_threshold=False)
+
+        assert result["detected"].tolist() == [True, True, False]
+        expected = Doji().calculate_confidence(data, data.index[:2])
+        assert result["confidence"].tolist() == [expected[0], expected[1], 0.0]
+        assert expected[0] > 0.7 > expected[1]
+
+    def test_threshold_filters_at_source(self, data, registry):
+        result = PatternDetectionService().detect_pattern("doji", data)
+
+        assert result["detected"].tolist() == [True, False, False]
+        assert result["confidence"].iloc[0] >= 0.7
+        assert result["confidence"].iloc[1:].tolist() == [0.0, 0.0]
+
+    def test_unknown_pattern(self, data, registry):
+        with pytest.raises(InvalidPatternError):
+            PatternDetectionService().detect_pattern("unknown", data)
+
+    def test_insufficient_bars(self, data, registry):
+        registry["doji"]["min_bars_required"] = 5
+
+        with pytest.raises(PatternDetectionError, match="Insufficient data"):
+            PatternDetectionService().detect_pattern("doji", data)
+
+
+class TestDetectPatterns:
+    """Test the batched detection API."""
+
+    def test_batch_matches_single_detection(self, data, registry):
+        service = PatternDetectionService()
+
+        batch = service.detect_patterns(["doji", "hammer"], data)
+
+        assert list(batch) == ["doji", "hammer"]
+        for name, result in batch.items():
+            single = service.detect_pattern(name, data)
+            pd.testing.assert_series_equal(result["detected"], single["detected"])
+            pd.testing.assert_series_equal(result["confidence"], single["confidence"])
+
+    def test_batch_computes_candle_features_once(self, data, registry):
+        with patch.object(
+            CandleFeatures, "from_frame", wraps=CandleFeatures.from_frame
+        ) as from_frame:
+            PatternDetectionService().detect_patterns(["doji", "hammer"], data)
+
+        from_frame.assert_called_once()
+
+    def test_batch_rejects_invalid_data(self, registry):
+        bad = pd.DataFrame({"close": [1.0, 2.0]})
+
+        with pytest.raises(PatternDetectionError, match="Missing required columns"):
+            PatternDetectionService().detect_patterns(["doji"], bad)
+
+    def test_analysis_error_keeps_detector_message_without_context(self, data):
+        error = PatternDetectionError("detector blew up")
+        error.context = None
+        service = AnalysisService.__new__(AnalysisService)
+        service.pattern_service = Mock(detect_patterns=Mock(side_effect=error))
+
+        with pytest.raises(AnalysisError, match="detector blew up"):
+            service._detect_patterns(data, ["doji"], "daily")
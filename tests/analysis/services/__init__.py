@@ -0,0 +1 @@
+"""Analysis service tests."""
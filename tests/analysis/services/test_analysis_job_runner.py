@@ -0,0 +1,181 @@
+"""
+Unit tests for AnalysisJobRunner.
+
+Chunked prefetching, per-chunk results, cancellation and progress reporting,
+run inline and on a spawn process pool.
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.data.ohlcv_panel import OHLCVPanel
+from src.analysis.indicators.rsi import RSI
+from src.analysis.indicators.sma import SMA
+from src.analysis.patterns.candlestick.doji import Doji
+from src.analysis.patterns.candlestick.engulfing import Engulfing
+from src.analysis.services.analysis_job_runner import (
+    AnalysisJobRunner,
+    AnalysisSpec,
+    JobProgress,
+    analyze_chunk,
+)
+
+
+def _frame(bars, seed):
+    rng = np.random.default_rng(seed)
+    close = 50 + seed + np.cumsum(rng.normal(0, 1.0, bars))
+    open_ = close + rng.normal(0, 0.3, bars)
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.uniform(0.05, 1.0, bars),
+            "low": np.minimum(open_, close) - rng.uniform(0.05, 1.0, bars),
+            "close": close,
+            "volume": rng.integers(1_000, 5_000, bars).astype(float),
+        },
+        index=pd.date_range(end="2025-06-30", periods=bars, freq="D", name="date"),
+    )
+
+
+FRAMES = {"AAPL": _frame(60, 1), "MSFT": _frame(30, 2), "NVDA": _frame(60, 3), "TSLA": _frame(10, 4)}
+
+
+def _panel(*symbols):
+    return OHLCVPanel.from_frames({symbol: FRAMES.get(symbol, _frame(0, 0)) for symbol in symbols})
+
+
+@pytest.fixture
+def spec():
+    return AnalysisSpec(
+        analysis_type="both",
+        timeframe="daily",
+        indicators={"sma": (SMA({"period": 20}), 20), "rsi": (RSI({"period": 14}), 15)},
+        patterns={
+            "doji": {"instance": Doji(), "min_bars_required": 1, "confidence_threshold": None},
+            "engulfing": {"instance": Engulfing(), "min_bars_required": 2, "confidence_threshold": None},
+        },
+    )
+
+
+@pytest.fixture
+def data_service():
+    service = Mock()
+    service.get_ohlcv_panel.side_effect = lambda symbols, timeframe, limit: _panel(*symbols)
+    return service
+
+
+def _run(runner, symbols, **kwargs):
+    chunks = []
+    progress = runner.run(symbols, lambda chunk, result, progress: chunks.append((chunk, result)), **kwargs)
+    return chunks, progress
+
+
+class TestAnalyzeChunk:
+    """Test per-chunk computation."""
+
+    def test_indicators_match_per_symbol_calculation(self, spec):
+        result = analyze_chunk(_panel("AAPL"), spec)
+
+        sma, _ = spec.indicators["sma"]
+        expected = sma.calculate(FRAMES["AAPL"].reset_index().rename(columns={"date": "timestamp"}), "AAPL")
+        assert result.results["AAPL"]["indicators"]["sma"]["value"] == pytest.approx(expected["value"])
+        assert set(result.results["AAPL"]["patterns"]) == {"doji", "engulfing"}
+
+    def test_min_bars_filters_indicators(self, spec):
+        result = analyze_chunk(_panel("TSLA"), spec)
+
+        assert result.results["TSLA"]["indicators"] == {}
+        assert result.compute_seconds > 0
+
+    def test_symbol_failure_is_isolated(self, spec):
+        spec.patterns["engulfing"]["min_bars_required"] = 50
+
+        result = analyze_chunk(_panel("AAPL", "MSFT"), spec)
+
+        assert "AAPL" in result.results
+        assert "Insufficient data" in result.errors["MSFT"]
+
+
+class TestAnalysisJobRunner:
+    """Test chunked job execution."""
+
+    def test_inline_run_prefetches_per_chunk(self, spec, data_service):
+        runner = AnalysisJobRunner(data_service, spec, workers=0, chunk_size=2)
+
+        chunks, progress = _run(runner, ["AAPL", "MSFT", "NVDA", "MISSING"])
+
+        assert data_service.get_ohlcv_panel.call_count == 2
+        assert [chunk for chunk, _ in chunks] == [["AAPL", "MSFT"], ["NVDA", "MISSING"]]
+        assert chunks[1][1].errors == {"MISSING": "No OHLCV data available"}
+        assert progress.symbols_completed == 4
+        assert progress.stage_seconds["fetch"] > 0
+        assert progress.stage_seconds["compute"] > 0
+
+    def test_fetch_failure_fails_only_that_chunk(self, spec, data_service):
+        def get_ohlcv_panel(symbols, timeframe, limit):
+            if "NVDA" in symbols:
+                raise ConnectionResetError("db down")
+            return _panel(*symbols)
+
+        data_service.get_ohlcv_panel.side_effect = get_ohlcv_panel
+        runner = AnalysisJobRunner(data_service, spec, workers=0, chunk_size=2)
+
+        chunks, progress = _run(runner, ["AAPL", "MSFT", "NVDA", "TSLA"])
+
+        assert set(chunks[0][1].results) == {"AAPL", "MSFT"}
+        assert chunks[1][1].results == {}
+        assert chunks[1][1].errors == {
+            "NVDA": "Failed to fetch data: db down",
+            "TSLA": "Failed to fetch data: db down",
+        }
+        assert progress.symbols_completed == 4
+
+    def test_cancellation_stops_between_chunks(self, spec, data_service):
+        runner = AnalysisJobRunner(data_service, spec, workers=0, chunk_size=1)
+        chunks = []
+
+        progress = runner.run(
+            ["AAPL", "MSFT", "NVDA"],
+            lambda chunk, result, progress: chunks.append(chunk),
+            is_cancelled=lambda: len(chunks) > 0,
+        )
+
+        # The second chunk was already computed, but is dropped once cancelled
+        assert chunks == [["AAPL"]]
+        assert progress.symbols_completed == 1
+
+    def test_process_pool_matches_inline(self, spec, data_service):
+        symbols = ["AAPL", "MSFT", "NVDA", "TSLA"]
+        inline, _ = _run(AnalysisJobRunner(data_service, spec, workers=0, chunk_size=2), symbols)
+        pooled, progress = _run(AnalysisJobRunner(data_service, spec, workers=2, chunk_size=2), symbols)
+
+        assert progress.symbols_completed == 4
+        inline_results = {s: r for _, chunk in inline for s, r in chunk.results.items()}
+        pooled_results = {s: r for _, chunk in pooled for s, r in chunk.results.items()}
+        assert pooled_results.keys() == inline_results.keys()
+        for symbol, result in pooled_results.items():
+            assert result["patterns"] == inline_results[symbol]["patterns"]
+            assert {
+                name: r["value"] for name, r in result["indicators"].items()
+            } == {name: r["value"] for name, r in inline_results[symbol]["indicators"].items()}
+
+
+class TestJobProgress:
+    """Test throughput and ETA reporting."""
+
+    def test_throughput_and_eta(self):
+        progress = JobProgress(symbols_total=100, symbols_completed=25)
+        progress.started_at -= 10
+
+        assert progress.throughput == pytest.approx(2.5, rel=0.01)
+        assert progress.eta_seconds == pytest.approx(30.0, rel=0.01)
+
+        report = progress.to_dict()
+        assert set(report) == {"throughput", "eta_seconds", "elapsed_seconds", "stage_timings"}
+        assert set(report["stage_timings"]) == {"fetch", "compute", "persist"}
+
+    def test_eta_unknown_before_first_chunk(self):
+        assert JobProgress(symbols_total=10).eta_seconds is None
@@ -0,0 +1,194 @@
+"""
+Unit tests for UniverseJobManager.
+
+Chunked background analysis, reading and following partial results,
+cancellation, fetch failures and job expiry.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.analysis.services.universe_jobs import (
+    UniverseJobManager,
+    UniverseJobStatus,
+    UniverseSummary,
+)
+
+SYMBOLS = [f"S{i:02d}" for i in range(12)]
+
+
+class FakeDataService:
+    """get_universe_ohlcv_data stand-in; records the chunks it was asked for."""
+
+    def __init__(self, missing=(), fail=False):
+        self.missing = set(missing)
+        self.fail = fail
+        self.chunks = []
+
+    def get_universe_ohlcv_data(self, symbols, timeframe, limit):
+        self.chunks.append(list(symbols))
+        if self.fail:
+            # A driver error, not the RuntimeError OHLCVDataService wraps most failures in
+            raise ConnectionResetError("db down")
+        return {symbol: Mock(empty=False) for symbol in symbols if symbol not in self.missing}
+
+
+class FakeAnalysisService:
+    def __init__(self, gate=None, failing=()):
+        self.gate = gate
+        self.failing = set(failing)
+
+    def analyze_symbol(self, data, symbol, timeframe, indicators, patterns):
+        if self.gate is not None:
+            self.gate.wait(5)
+        if symbol in self.failing:
+            raise ValueError(f"bad data for {symbol}")
+        return {
+            'indicators': {'rsi': {'value': 50.0}},
+            'patterns': {'doji': {'detected': True, 'confidence': 0.8}},
+        }
+
+
+@pytest.fixture
+def manager():
+    manager = UniverseJobManager(workers=2, chunk_size=4, first_chunk_size=2)
+    yield manager
+    manager.shutdown()
+
+
+def _submit(manager, symbols=SYMBOLS, analysis_service=None, data_service=None):
+    return manager.submit(
+        universe_key='test_universe',
+        timeframe='daily',
+        symbols=symbols,
+        indicators=['rsi'],
+        patterns=['doji'],
+        analysis_service=analysis_service or FakeAnalysisService(),
+        data_service=data_service or FakeDataService(),
+    )
+
+
+def _wait_finished(job, timeout=5):
+    deadline = time.time() + timeout
+    while not job.finished and time.time() < deadline:
+        job.read(len(job.records), timeout=0.05)
+    assert job.finished
+
+
+class TestChunkedRun:
+    """Test chunking and results."""
+
+    def test_small_first_chunk_then_full_chunks(self, manager):
+        data_service = FakeDataService()
+        job = _submit(manager, data_service=data_service)
+        _wait_finished(job)
+
+        assert [len(chunk) for chunk in data_service.chunks] == [2, 4, 4, 2]
+        assert [record['symbol'] for record in job.records] == SYMBOLS
+        assert job.status is UniverseJobStatus.COMPLETED
+
+        status = job.to_dict()
+        assert status['symbols_completed'] == 12
+        assert status['summary'] == {
+            'total_patterns_detected': 12, 'symbols_with_errors': 0, 'avg_rsi': 50.0
+        }
+        assert status['metadata']['chunks_completed'] == 4
+        assert status['metadata']['time_to_first_result_ms'] is not None
+
+    def test_symbol_errors_and_missing_data(self, manager):
+        job = _submit(
+            manager,
+            analysis_service=FakeAnalysisService(failing={'S01'}),
+            data_service=FakeDataService(missing={'S02'}),
+        )
+        _wait_finished(job)
+
+        by_symbol = {record['symbol']: record for record in job.records}
+        assert 'S02' not in by_symbol
+        assert by_symbol['S01']['error'] == 'bad data for S01'
+        assert job.symbols_completed == 12
+        assert job.summary.symbols_with_errors == 1
+
+    def test_fetch_failure_marks_chunk_and_continues(self, manager):
+        job = _submit(manager, data_service=FakeDataService(fail=True))
+        _wait_finished(job)
+
+        assert job.status is UniverseJobStatus.COMPLETED
+        assert len(job.records) == 12
+        assert all(record['error'] == 'Failed to fetch data: db down' for record in job.records)
+
+    def test_follow_yields_partial_results_while_running(self, manager):
+        gate = threading.Event()
+        job = _submit(manager, analysis_service=FakeAnalysisService(gate=gate))
+
+        records, finished = job.read(0, timeout=0.05)
+        assert (records, finished) == ([], False)
+
+        gate.set()
+        followed = [record['symbol'] for record in job.follow(0, poll_seconds=0.05)]
+        assert followed == SYMBOLS
+        assert job.finished
+
+    def test_read_from_offset(self, manager):
+        job = _submit(manager)
+        _wait_finished(job)
+
+        records, finished = job.read(10)
+        assert [record['symbol'] for record in records] == ['S10', 'S11']
+        assert finished
+
+
+class TestCancellation:
+    """Test cancelling running jobs."""
+
+    def test_cancel_stops_job_and_keeps_results(self, manager):
+        gate = threading.Event()
+        job = _submit(manager, analysis_service=FakeAnalysisService(gate=gate))
+
+        assert manager.cancel_job(job.job_id) is job
+        gate.set()
+        time.sleep(0.1)
+
+        assert job.status is UniverseJobStatus.CANCELLED
+        assert job.symbols_completed < len(SYMBOLS)
+        assert list(job.follow(0)) == job.records
+        assert manager.get_stats()['cancelled'] == 1
+
+    def test_cancel_finished_job_is_noop(self, manager):
+        job = _submit(manager)
+        _wait_finished(job)
+
+        manager.cancel_job(job.job_id)
+        assert job.status is UniverseJobStatus.COMPLETED
+        assert manager.cancel_job('unknown') is None
+
+
+class TestExpiry:
+    """Test cleanup of finished jobs."""
+
+    def test_finished_jobs_expire(self, manager):
+        job = _submit(manager)
+        _wait_finished(job)
+
+        assert manager.cleanup_expired_jobs() == 0
+        job.finished_at -= manager.ttl_seconds + 1
+        assert manager.cleanup_expired_jobs() == 1
+        assert manager.get_job(job.job_id) is None
+
+
+def test_summary_matches_synchronous_aggregation():
+    summary = UniverseSummary()
+    summary.add({
+        'indicators': {'sma': {'value': 10.0}, 'rsi': {'value': None}},
+        'patterns': {'doji': {}},
+    })
+    summary.add({'indicators': {'sma': {'value': 11.0}}, 'patterns': {}})
+    summary.add({'error': 'boom', 'indicators': {}, 'patterns': {}})
+
+    assert summary.to_dict() == {
+        'total_patterns_detected': 1, 'symbols_with_errors': 1, 'avg_sma': 10.5
+    }
+    assert summary.symbols_ok == 2
@@ -13,9 +13,12 @@ Sprint 66: Market Breadth Metrics
 
 import pytest
 import json
+from datetime import datetime
 from unittest.mock import Mock, patch
+from fakeredis import FakeRedis
 from flask import Flask
 from src.api.rest.breadth_metrics import breadth_metrics_bp
+from src.core.services.breadth_materialization import BreadthStore
 
 
 class TestBreadthMetricsAPI:
@@ -286,5 +289,79 @@ class TestBreadthMetricsAPI:
         assert response.status_code == 405  # Method Not Allowed
 
 
+class TestMaterializedBreadthMetrics:
+    """Test reads of EOD-materialized breadth records."""
+
+    @pytest.fixture
+    def client(self):
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        app.register_blueprint(breadth_metrics_bp)
+        return app.test_client()
+
+    @pytest.fixture
+    def store(self):
+        store = BreadthStore(FakeRedis(decode_responses=True))
+        with patch('src.api.rest.breadth_metrics.get_breadth_store', return_value=store):
+            yield store
+
+    @staticmethod
+    def _record(date, pct_up):
+        metric = {'up': 1, 'down': 1, 'unchanged': 0, 'pct_up': pct_up}
+        return {
+            'date': date,
+            'symbol_count': 2,
+            'metrics': {name: metric for name in (
+                'day_change', 'open_change', 'week', 'month', 'quarter', 'half_year',
+                'year', 'price_to_ema10', 'price_to_ema20', 'price_to_sma50', 'price_to_sma200'
+            )},
+            'threshold_bars': {},
+            'calculated_at': datetime.now().isoformat(),
+        }
+
+    def test_serves_materialized_record(self, client, store):
+        store.save('SPY', self._record('2026-02-06', 50.0))
+
+        with patch('src.api.rest.breadth_metrics.BreadthMetricsService') as mock_service:
+            response = client.get('/api/breadth-metrics?universe=spy')
+
+            mock_service.assert_not_called()
+
+        data = json.loads(response.data)
+        assert response.status_code == 200
+        assert data['metadata']['as_of'] == '2026-02-06'
+        assert data['metadata']['universe'] == 'SPY'
+        assert data['metrics']['week']['pct_up'] == 50.0
+
+    def test_missing_record_falls_back_to_service(self, client, store):
+        with patch('src.api.rest.breadth_metrics.BreadthMetricsService') as mock_service:
+            mock_service.return_value.calculate_breadth_metrics.side_effect = RuntimeError("no data")
+
+            response = client.get('/api/breadth-metrics?universe=QQQ')
+
+            mock_service.return_value.calculate_breadth_metrics.assert_called_once_with(
+                universe='QQQ'
+            )
+        assert response.status_code == 500
+
+    def test_history(self, client, store):
+        for day, pct in (('2026-02-04', 40.0), ('2026-02-06', 60.0), ('2026-02-05', 50.0)):
+            store.save('SPY', self._record(day, pct))
+
+        response = client.get('/api/breadth-metrics/history?universe=spy&days=2')
+
+        data = json.loads(response.data)
+        assert response.status_code == 200
+        assert data['universe'] == 'SPY'
+        assert [p['date'] for p in data['history']] == ['2026-02-05', '2026-02-06']
+        assert data['history'][1]['metrics']['day_change']['pct_up'] == 60.0
+
+    def test_history_invalid_days(self, client, store):
+        response = client.get('/api/breadth-metrics/history?days=0')
+
+        assert response.status_code == 400
+        assert json.loads(response.data)['error'] == 'ValidationError'
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
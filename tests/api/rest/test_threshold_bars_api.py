@@ -10,12 +10,15 @@ Test coverage for /api/threshold-bars endpoint including:
 """
 
 import json
+from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
+from fakeredis import FakeRedis
 from flask import Flask
 
 from src.api.rest.threshold_bars import threshold_bars_bp
+from src.core.services.breadth_materialization import BreadthStore
 
 
 class TestThresholdBarsAPIRegistration:
@@ -338,3 +341,67 @@ class TestThresholdBarsAPIEndpoint:
             assert "segments" in data
             segments = data["segments"]
             assert sum(segments.values()) == pytest.approx(100.0, abs=0.01)
+
+
+class TestMaterializedThresholdBars:
+    """Test reads of EOD-materialized daily threshold bars."""
+
+    @pytest.fixture
+    def client(self):
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        app.register_blueprint(threshold_bars_bp)
+        return app.test_client()
+
+    @pytest.fixture
+    def store(self):
+        store = BreadthStore(FakeRedis(decode_responses=True))
+        store.save("sp500", {
+            "date": "2026-02-06",
+            "symbol_count": 503,
+            "metrics": {},
+            "threshold_bars": {
+                "SimpleDivergingBar": {"decline": 40.0, "advance": 60.0},
+                "DivergingThresholdBar:0.05": {
+                    "significant_decline": 10.0,
+                    "minor_decline": 30.0,
+                    "minor_advance": 45.0,
+                    "significant_advance": 15.0,
+                },
+            },
+            "calculated_at": datetime.now().isoformat(),
+        })
+        with patch("src.api.rest.threshold_bars.get_breadth_store", return_value=store):
+            yield store
+
+    @pytest.mark.parametrize("query,advance_key,advance", [
+        ("bar_type=DivergingThresholdBar&threshold=0.05", "significant_advance", 15.0),
+        ("bar_type=SimpleDivergingBar&threshold=0.3", "advance", 60.0),
+    ])
+    def test_serves_materialized_bar(self, client, store, query, advance_key, advance):
+        with patch("src.api.rest.threshold_bars.ThresholdBarService") as mock_service_class:
+            response = client.get(f"/api/threshold-bars?data_source=sp500&{query}")
+
+            mock_service_class.assert_not_called()
+
+        data = json.loads(response.data)
+        assert response.status_code == 200
+        assert data["segments"][advance_key] == advance
+        assert data["metadata"]["as_of"] == "2026-02-06"
+        assert data["metadata"]["symbol_count"] == 503
+
+    @pytest.mark.parametrize("query", [
+        "threshold=0.2",
+        "threshold=0.05&period_days=5",
+        "threshold=0.05&timeframe=hourly",
+    ])
+    def test_unmaterialized_request_uses_service(self, client, store, query):
+        with patch("src.api.rest.threshold_bars.ThresholdBarService") as mock_service_class:
+            mock_service_class.return_value.calculate_threshold_bars.side_effect = (
+                RuntimeError("no data")
+            )
+
+            response = client.get(f"/api/threshold-bars?data_source=sp500&{query}")
+
+            mock_service_class.return_value.calculate_threshold_bars.assert_called_once()
+        assert response.status_code == 500
@@ -514,6 +514,16 @@ def setup_test_environment(test_config):
         os.environ.pop(key, None)
 
 
+@pytest.fixture(autouse=True)
+def reset_engine_registry():
+    """Keep shared database engines (often mocks) from leaking between tests"""
+    yield
+
+    tickstock_db = sys.modules.get('src.infrastructure.database.tickstock_db')
+    if tickstock_db is not None:
+        tickstock_db._registry_instance = None
+
+
 # Performance testing utilities
 @pytest.fixture
 def performance_timer():
@@ -0,0 +1,137 @@
+"""Bar Analysis Scheduler Unit Tests
+
+Test coverage for BarAnalysisScheduler including:
+- Per-symbol coalescing of pending requests
+- Overflow policies at max queue depth
+- Bounded worker pool execution
+- No concurrent analysis of the same symbol
+- Queue lag and throughput metrics
+"""
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.services.bar_analysis_scheduler import BarAnalysisScheduler
+
+BAR_TIME = datetime(2025, 1, 2, 14, 0, tzinfo=UTC)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestBarAnalysisSchedulerQueue:
+    """Test queueing behavior without running workers."""
+
+    def test_pending_symbol_is_merged_with_latest_timestamp(self):
+        handler = Mock()
+        scheduler = BarAnalysisScheduler(handler)
+
+        scheduler.submit('AAPL', BAR_TIME)
+        scheduler.submit('AAPL', BAR_TIME + timedelta(minutes=1))
+        scheduler.submit('MSFT', BAR_TIME)
+
+        assert scheduler.queue_depth() == 2
+        stats = scheduler.get_stats()
+        assert stats['coalesced'] == 1
+
+        scheduler.start()
+        try:
+            assert _wait_for(lambda: handler.call_count == 2)
+        finally:
+            scheduler.stop()
+
+        handler.assert_any_call('AAPL', BAR_TIME + timedelta(minutes=1))
+
+    def test_drop_oldest_policy_evicts_head(self):
+        scheduler = BarAnalysisScheduler(Mock(), {'BAR_ANALYSIS_MAX_QUEUE_DEPTH': 2})
+
+        scheduler.submit('AAPL', BAR_TIME)
+        scheduler.submit('MSFT', BAR_TIME)
+        assert scheduler.submit('NVDA', BAR_TIME) is True
+
+        assert list(scheduler._pending) == ['MSFT', 'NVDA']
+        assert scheduler.get_stats()['dropped'] == 1
+
+    def test_drop_new_policy_rejects_request(self):
+        scheduler = BarAnalysisScheduler(
+            Mock(), {'BAR_ANALYSIS_MAX_QUEUE_DEPTH': 1, 'BAR_ANALYSIS_OVERFLOW_POLICY': 'drop_new'}
+        )
+
+        scheduler.submit('AAPL', BAR_TIME)
+        assert scheduler.submit('MSFT', BAR_TIME) is False
+        # Merging into an existing entry is still allowed when full
+        assert scheduler.submit('AAPL', BAR_TIME) is True
+        assert scheduler.get_stats()['dropped'] == 1
+
+    def test_invalid_policy_raises(self):
+        with pytest.raises(ValueError):
+            BarAnalysisScheduler(Mock(), {'BAR_ANALYSIS_OVERFLOW_POLICY': 'block'})
+
+
+class TestBarAnalysisSchedulerWorkers:
+    """Test worker pool execution."""
+
+    def test_worker_pool_is_bounded(self):
+        scheduler = BarAnalysisScheduler(Mock(), {'BAR_ANALYSIS_WORKERS': 3})
+        before = threading.active_count()
+        scheduler.start()
+        try:
+            for i in range(200):
+                scheduler.submit(f'SYM{i}', BAR_TIME)
+            assert threading.active_count() - before == 3
+            assert _wait_for(lambda: scheduler.get_stats()['completed'] == 200)
+        finally:
+            scheduler.stop()
+
+    def test_same_symbol_never_runs_concurrently(self):
+        running = set()
+        overlaps = []
+        release = threading.Event()
+
+        def handler(symbol, timestamp):
+            if symbol in running:
+                overlaps.append(symbol)
+            running.add(symbol)
+            release.wait(timeout=1.0)
+            running.discard(symbol)
+
+        scheduler = BarAnalysisScheduler(handler, {'BAR_ANALYSIS_WORKERS': 4})
+        scheduler.start()
+        try:
+            scheduler.submit('AAPL', BAR_TIME)
+            assert _wait_for(lambda: 'AAPL' in running)
+            # Re-queued while in flight; must wait for the first run to finish
+            scheduler.submit('AAPL', BAR_TIME + timedelta(minutes=1))
+            time.sleep(0.05)
+            assert scheduler.get_stats()['in_flight'] == 1
+            release.set()
+            assert _wait_for(lambda: scheduler.get_stats()['completed'] == 2)
+        finally:
+            scheduler.stop()
+
+        assert overlaps == []
+
+    def test_failures_are_counted_and_metrics_reported(self):
+        handler = Mock(side_effect=[Exception("db down"), None])
+        scheduler = BarAnalysisScheduler(handler, {'BAR_ANALYSIS_WORKERS': 1})
+        scheduler.start()
+        try:
+            scheduler.submit('AAPL', BAR_TIME)
+            scheduler.submit('MSFT', BAR_TIME)
+            assert _wait_for(lambda: scheduler.get_stats()['completed'] == 1)
+        finally:
+            scheduler.stop()
+
+        stats = scheduler.get_stats()
+        assert stats['failed'] == 1
+        assert stats['avg_queue_lag_ms'] >= 0.0
+        assert stats['throughput_per_sec'] > 0
+        assert stats['queue_depth'] == 0
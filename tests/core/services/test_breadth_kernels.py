@@ -0,0 +1,139 @@
+"""
+Unit tests and benchmark for the vectorized breadth kernels.
+
+The kernels replace per-metric groupby().transform(lambda ...) calculations;
+the lambda versions are kept here as the reference implementation.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.services.breadth_kernels import (
+    breadth_metrics,
+    ema_last,
+    latest_columns,
+    pack_frame,
+)
+
+
+def _counts(changes: pd.Series) -> dict:
+    up, down, unchanged = int((changes > 0).sum()), int((changes < 0).sum()), int((changes == 0).sum())
+    total = up + down + unchanged
+    return {"up": up, "down": down, "unchanged": unchanged,
+            "pct_up": round(up / total * 100, 2) if total else 0.0}
+
+
+def reference_metrics(df: pd.DataFrame) -> dict:
+    """Lambda-based per-metric calculation (previous BreadthMetricsService)."""
+
+    def latest(column_name, transform):
+        df_sorted = df.sort_values(["symbol", "date"])
+        df_sorted[column_name] = df_sorted.groupby("symbol")["close"].transform(transform)
+        return df_sorted.groupby("symbol").last().reset_index().dropna(subset=[column_name])
+
+    def period(days):
+        def calc(x):
+            return (x.iloc[-1] - x.iloc[-days]) / x.iloc[-days] * 100 if len(x) >= days else np.nan
+        return _counts(latest("pct", calc)["pct"])
+
+    day = latest("pct", lambda x: x.pct_change() * 100)
+    last = df.groupby("symbol").last().reset_index()
+    metrics = {
+        "day_change": _counts(day["pct"]),
+        "open_change": _counts(((last["close"] - last["open"]) / last["open"] * 100).dropna()),
+        "week": period(5),
+        "month": period(21),
+        "quarter": period(63),
+        "half_year": period(126),
+        "year": period(252),
+    }
+    for p in (10, 20):
+        rows = latest("ema", lambda x: x.ewm(span=p, adjust=False, min_periods=p).mean())
+        metrics[f"price_to_ema{p}"] = _counts(rows["close"] - rows["ema"])
+    for p in (50, 200):
+        rows = latest("sma", lambda x: x.rolling(window=p, min_periods=p).mean())
+        metrics[f"price_to_sma{p}"] = _counts(rows["close"] - rows["sma"])
+    return metrics
+
+
+def _universe(symbols: int, days: int = 260, seed: int = 0) -> pd.DataFrame:
+    """Random-walk daily bars; symbol i has between 1 and `days` bars."""
+    rng = np.random.default_rng(seed)
+    lengths = np.where(np.arange(symbols) % 7 == 0, rng.integers(1, days, symbols), days)
+    dates = pd.date_range(end="2026-06-30", periods=days, freq="B")
+
+    symbol_col = np.repeat([f"S{i:05d}" for i in range(symbols)], lengths)
+    date_col = np.concatenate([dates[days - n:] for n in lengths])
+    close = 100 + np.cumsum(rng.normal(0, 1, len(symbol_col)))
+    return pd.DataFrame({
+        "symbol": symbol_col,
+        "date": date_col,
+        "open": close + rng.normal(0, 0.5, len(close)),
+        "close": close,
+    })
+
+
+class TestBreadthKernels:
+    """Test kernel results against the lambda reference."""
+
+    def test_metrics_match_reference(self):
+        df = _universe(60, seed=1)
+        # Flat closes must count as unchanged, not as tiny moves
+        df.loc[df["symbol"] == "S00001", "close"] = 50.0
+
+        shuffled = df.sample(frac=1.0, random_state=3)
+
+        assert breadth_metrics(latest_columns(pack_frame(shuffled))) == reference_metrics(df)
+
+    def test_ema_bit_identical_with_gaps(self):
+        close = np.random.default_rng(2).normal(100, 5, (4, 40))
+        close[1, 10:13] = np.nan
+        close[2, :25] = np.nan
+
+        for period in (10, 20):
+            expected = [
+                pd.Series(row).ewm(span=period, adjust=False, min_periods=period).mean().iloc[-1]
+                for row in close
+            ]
+            np.testing.assert_array_equal(ema_last(close, period), expected)
+
+    def test_pack_frame_empty(self):
+        panel = pack_frame(pd.DataFrame(columns=["symbol", "date", "close"]))
+
+        assert len(panel) == 0
+        assert breadth_metrics(latest_columns(panel))["week"] == {
+            "up": 0, "down": 0, "unchanged": 0, "pct_up": 0.0
+        }
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestBreadthKernelBenchmark:
+    """Kernel vs lambda reference at SPY, Russell 3000 and full-market sizes."""
+
+    @pytest.mark.parametrize("universe,symbols", [
+        ("SPY", 504),
+        ("Russell 3000", 3000),
+        ("full market", 8000),
+    ])
+    def test_benchmark(self, universe, symbols):
+        df = _universe(symbols, days=252)
+
+        start = time.perf_counter()
+        expected = reference_metrics(df)
+        reference_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        result = breadth_metrics(latest_columns(pack_frame(df)))
+        kernel_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"\n{universe} ({symbols} symbols x 252 days): "
+            f"lambda groupby {reference_ms:.0f}ms, kernel {kernel_ms:.1f}ms "
+            f"({reference_ms / kernel_ms:.0f}x)"
+        )
+        assert result == expected
+        assert kernel_ms < reference_ms
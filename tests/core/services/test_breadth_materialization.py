@@ -0,0 +1,181 @@
+"""
+Unit tests for breadth materialization.
+
+BreadthStore records in Redis hashes and BreadthMaterializer results against
+the on-demand breadth/threshold calculations.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from fakeredis import FakeRedis
+
+from src.analysis.data.ohlcv_panel import OHLCVPanel
+from src.core.services.breadth_materialization import (
+    BreadthMaterializer,
+    BreadthStore,
+    threshold_bar_key,
+)
+from src.core.services.breadth_metrics_service import BreadthMetricsService
+from src.core.services.threshold_bar_service import ThresholdBarService
+from src.core.services.universe_snapshot_cache import UniverseSnapshotCache
+
+
+def _record(date, calculated_at=None):
+    return {
+        'date': date,
+        'symbol_count': 2,
+        'metrics': {'day_change': {'up': 1, 'down': 1, 'unchanged': 0, 'pct_up': 50.0}},
+        'threshold_bars': {'SimpleDivergingBar': {'decline': 50.0, 'advance': 50.0}},
+        'calculated_at': (calculated_at or datetime.now()).isoformat(),
+    }
+
+
+def _frame(bars, seed, end):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1.0, bars))
+    return pd.DataFrame(
+        {'open': close - 0.5, 'high': close + 1, 'low': close - 1, 'close': close,
+         'volume': np.full(bars, 1000.0)},
+        index=pd.date_range(end=end, periods=bars, freq='B', name='date'),
+    )
+
+
+class FakeDataService:
+    def __init__(self, frames):
+        self.frames = frames
+
+    def get_ohlcv_panel(self, symbols, timeframe='daily', limit=200):
+        return OHLCVPanel.from_frames({s: self.frames[s] for s in symbols}, limit=limit)
+
+
+@pytest.fixture
+def store():
+    return BreadthStore(FakeRedis(decode_responses=True), history_days=3)
+
+
+@pytest.fixture
+def members():
+    return {
+        'SPY': ['AAPL', 'MSFT', 'NVDA', 'OLD'],
+        'dow30': ['AAPL', 'MSFT'],
+        'empty': [],
+    }
+
+
+@pytest.fixture
+def relationship_cache(members):
+    cache = Mock()
+    cache.get_available_universes.return_value = [{'name': name} for name in members]
+    cache.get_universe_symbols.side_effect = lambda universe: members[universe]
+    return cache
+
+
+@pytest.fixture
+def snapshot_cache():
+    frames = {
+        'AAPL': _frame(260, 1, '2026-02-06'),
+        'MSFT': _frame(60, 2, '2026-02-06'),
+        'NVDA': _frame(1, 3, '2026-02-06'),
+        # Delisted: its last change must not count for 2026-02-06
+        'OLD': _frame(30, 4, '2026-01-02'),
+    }
+    return UniverseSnapshotCache(data_service=FakeDataService(frames))
+
+
+@pytest.fixture
+def materializer(store, relationship_cache, snapshot_cache):
+    return BreadthMaterializer(
+        store,
+        {'BREADTH_MATERIALIZED_THRESHOLDS': ['0.05', '0.1']},
+        relationship_cache=relationship_cache,
+        snapshot_cache=snapshot_cache,
+        threshold_service=ThresholdBarService(
+            relationship_cache=relationship_cache, db=Mock(), snapshot_cache=snapshot_cache
+        ),
+    )
+
+
+class TestBreadthStore:
+    """Test the Redis hash layout."""
+
+    def test_latest_and_history(self, store):
+        for day in ('2026-02-03', '2026-02-05', '2026-02-04'):
+            store.save('spy', _record(day))
+
+        assert store.latest('SPY')['date'] == '2026-02-04'
+        assert [r['date'] for r in store.history('spy', 2)] == ['2026-02-04', '2026-02-05']
+
+    def test_history_retention(self, store):
+        for day in range(2, 7):
+            store.save('SPY', _record(f'2026-02-0{day}'))
+
+        assert store.redis_client.hkeys('tickstock:breadth:daily:SPY') == [
+            '2026-02-04', '2026-02-05', '2026-02-06'
+        ]
+
+    def test_latest_ignores_old_records(self, store):
+        store.save('SPY', _record('2026-02-06', datetime.now() - timedelta(hours=100)))
+
+        assert store.latest('SPY', max_age_hours=96) is None
+        assert store.latest('SPY') is not None
+        assert store.latest('QQQ') is None
+
+    def test_unavailable_redis_backs_off(self):
+        client = Mock()
+        client.hget.side_effect = ConnectionError("refused")
+        store = BreadthStore(client)
+
+        assert store.latest('SPY') is None
+        assert store.latest('SPY') is None
+        assert client.hget.call_count == 1
+
+
+class TestBreadthMaterializer:
+    """Test materialized records against on-demand calculations."""
+
+    def test_materialize_all_universes(self, materializer, store, snapshot_cache):
+        snapshot_cache.mark_stale = Mock()
+
+        summary = materializer.materialize()
+
+        assert summary['universes'] == 2
+        assert summary['failed'] == []
+        snapshot_cache.mark_stale.assert_called_once_with()
+        assert store.latest('DOW30')['symbol_count'] == 2
+        assert store.latest('empty') is None
+
+    def test_record_matches_services(self, materializer, relationship_cache, snapshot_cache):
+        record = materializer.materialize_universe('SPY')
+
+        breadth = BreadthMetricsService(
+            relationship_cache=relationship_cache, db=Mock(), snapshot_cache=snapshot_cache
+        ).calculate_breadth_metrics('SPY')
+        assert record['date'] == '2026-02-06'
+        assert record['metrics'] == breadth['metrics']
+
+        # AAPL and MSFT traded on 2026-02-06 with a prior bar; NVDA has one bar, OLD is stale
+        service = ThresholdBarService(
+            relationship_cache=relationship_cache, db=Mock(), snapshot_cache=snapshot_cache
+        )
+        columns = snapshot_cache.get_snapshot('SPY', ['AAPL', 'MSFT', 'NVDA', 'OLD']).columns
+        changes = pd.DataFrame({'pct_change': columns['day_change'][:2]})
+        assert set(record['threshold_bars']) == {
+            'SimpleDivergingBar', 'DivergingThresholdBar:0.05', 'DivergingThresholdBar:0.1'
+        }
+        assert record['threshold_bars'][threshold_bar_key('DivergingThresholdBar', 0.10)] == (
+            service.calculate_segments(changes, 'DivergingThresholdBar', 0.10)
+        )
+
+    def test_failing_universe_is_skipped(self, materializer, relationship_cache, store):
+        symbols = {'SPY': ['MISSING'], 'dow30': ['AAPL']}
+        relationship_cache.get_universe_symbols.side_effect = lambda u: symbols.get(u, [])
+
+        summary = materializer.materialize()
+
+        assert summary['universes'] == 1
+        assert summary['failed'] == ['SPY']
+        assert store.latest('dow30') is not None
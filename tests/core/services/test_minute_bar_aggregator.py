@@ -0,0 +1,126 @@
+"""Minute Bar Aggregator Unit Tests
+
+Test coverage for MinuteBarAggregator including:
+- Folding per-second ticks into a single OHLCV bar
+- Emitting the previous bar on a minute boundary
+- Watermark-based closing of quiet symbols
+- Late tick handling and capacity growth
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.core.domain.market.tick import TickData
+from src.core.services.minute_bar_aggregator import MinuteBarAggregator
+
+MINUTE = 1_735_826_400  # 2025-01-02 14:00:00 UTC
+
+
+def _tick(symbol, second, open_=100.0, high=101.0, low=99.0, close=100.5, volume=10, vwap=None):
+    return TickData(
+        ticker=symbol,
+        price=close,
+        volume=volume,
+        timestamp=float(second + 1),
+        source='massive',
+        tick_open=open_,
+        tick_high=high,
+        tick_low=low,
+        tick_close=close,
+        tick_volume=volume,
+        tick_vwap=vwap or close,
+        tick_start_timestamp=float(second),
+        tick_end_timestamp=float(second + 1)
+    )
+
+
+class TestMinuteBarAggregation:
+    """Test tick folding and minute boundary emission."""
+
+    def test_ticks_within_minute_produce_no_bars(self):
+        aggregator = MinuteBarAggregator()
+
+        for offset in range(30):
+            assert aggregator.add_tick(_tick('AAPL', MINUTE + offset)) == []
+
+        assert aggregator.open_bar_count() == 1
+
+    def test_minute_boundary_emits_folded_bar(self):
+        aggregator = MinuteBarAggregator()
+
+        aggregator.add_tick(_tick('AAPL', MINUTE, open_=100.0, high=101.0, low=99.5, close=100.5,
+                                  volume=10, vwap=100.0))
+        aggregator.add_tick(_tick('AAPL', MINUTE + 20, open_=100.5, high=103.0, low=100.0, close=102.0,
+                                  volume=30, vwap=102.0))
+        aggregator.add_tick(_tick('AAPL', MINUTE + 59, open_=102.0, high=102.5, low=98.0, close=99.0,
+                                  volume=10, vwap=99.0))
+
+        closed = aggregator.add_tick(_tick('AAPL', MINUTE + 60))
+
+        assert len(closed) == 1
+        bar = closed[0]
+        assert bar.symbol == 'AAPL'
+        assert bar.timestamp == datetime.fromtimestamp(MINUTE, tz=UTC)
+        assert bar.open == 100.0
+        assert bar.high == 103.0
+        assert bar.low == 98.0
+        assert bar.close == 99.0
+        assert bar.volume == 50
+        assert bar.vwap == pytest.approx((100.0 * 10 + 102.0 * 30 + 99.0 * 10) / 50)
+        assert bar.tick_count == 3
+
+    def test_symbols_are_independent(self):
+        aggregator = MinuteBarAggregator()
+
+        aggregator.add_tick(_tick('AAPL', MINUTE))
+        aggregator.add_tick(_tick('MSFT', MINUTE))
+        closed = aggregator.add_tick(_tick('AAPL', MINUTE + 61))
+
+        assert [bar.symbol for bar in closed] == ['AAPL']
+        assert aggregator.open_bar_count() == 2
+
+    def test_late_tick_for_emitted_minute_is_dropped(self):
+        aggregator = MinuteBarAggregator()
+
+        aggregator.add_tick(_tick('AAPL', MINUTE))
+        aggregator.add_tick(_tick('AAPL', MINUTE + 60))
+        closed = aggregator.add_tick(_tick('AAPL', MINUTE + 30))
+
+        assert closed == []
+        assert aggregator.get_stats()['late_ticks_dropped'] == 1
+
+    def test_capacity_grows_past_initial_allocation(self):
+        aggregator = MinuteBarAggregator(initial_capacity=2)
+
+        for i in range(10):
+            aggregator.add_tick(_tick(f'SYM{i}', MINUTE))
+
+        assert aggregator.get_stats()['symbols_tracked'] == 10
+        assert len(aggregator.flush_all()) == 10
+
+
+class TestMinuteBarWatermark:
+    """Test watermark and shutdown flushing."""
+
+    def test_flush_due_respects_watermark(self):
+        aggregator = MinuteBarAggregator({'MINUTE_BAR_WATERMARK_SECONDS': 5})
+        aggregator.add_tick(_tick('AAPL', MINUTE))
+
+        # Minute ends at MINUTE + 60; watermark not yet past it
+        assert aggregator.flush_due(now=MINUTE + 63) == []
+
+        closed = aggregator.flush_due(now=MINUTE + 66)
+        assert len(closed) == 1
+        assert aggregator.open_bar_count() == 0
+        assert aggregator.get_stats()['bars_emitted_by_watermark'] == 1
+
+    def test_flush_all_emits_open_bars(self):
+        aggregator = MinuteBarAggregator()
+        aggregator.add_tick(_tick('AAPL', MINUTE))
+        aggregator.add_tick(_tick('MSFT', MINUTE + 5))
+
+        closed = aggregator.flush_all()
+
+        assert sorted(bar.symbol for bar in closed) == ['AAPL', 'MSFT']
+        assert aggregator.flush_all() == []
@@ -0,0 +1,125 @@
+"""
+Unit tests for PatternAlertManager alert matching.
+
+Inverted subscription index maintenance, its Redis mirror and the bulk
+preference/rate-limit checks in get_users_for_alert().
+"""
+
+import json
+
+import pytest
+from fakeredis import FakeRedis
+
+from src.core.services.pattern_alert_manager import (
+    PatternAlertManager,
+    PatternSubscriptionIndex,
+)
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def manager(redis_client):
+    return PatternAlertManager(redis_client)
+
+
+class TestSubscriptionIndex:
+    """Test the in-memory index."""
+
+    def test_match_applies_threshold_and_symbol_filter(self):
+        index = PatternSubscriptionIndex()
+        index.set_user('u1', [('Doji', '*', 0.5)])
+        index.set_user('u2', [('Doji', 'AAPL', 0.7)])
+        index.set_user('u3', [('Doji', 'MSFT', 0.3)])
+
+        assert index.match('Doji', 'AAPL', 0.6) == {'u1'}
+        assert index.match('Doji', 'AAPL', 0.7) == {'u1', 'u2'}
+        assert index.match('Doji', 'MSFT', 0.4) == {'u3'}
+        assert index.match('Hammer', 'AAPL', 1.0) == set()
+
+    def test_set_user_replaces_entries(self):
+        index = PatternSubscriptionIndex()
+        index.set_user('u1', [('Doji', '*', 0.5)])
+        index.set_user('u1', [('Hammer', '*', 0.5)])
+
+        assert index.match('Doji', 'AAPL', 0.9) == set()
+        assert index.match('Hammer', 'AAPL', 0.9) == {'u1'}
+
+        index.remove_user('u1')
+        assert len(index) == 0
+
+
+class TestGetUsersForAlert:
+    """Test alert matching through the manager."""
+
+    def test_subscribe_and_unsubscribe(self, manager):
+        manager.subscribe_to_pattern('u1', 'Doji', confidence_threshold=0.6, symbols={'AAPL'})
+        manager.update_user_subscriptions('u2', {})
+        manager.subscribe_to_pattern('u2', 'Doji', confidence_threshold=0.8)
+
+        assert manager.get_users_for_alert('Doji', 'AAPL', 0.7) == ['u1']
+        assert manager.get_users_for_alert('Doji', 'AAPL', 85) == ['u1', 'u2']
+        assert manager.get_users_for_alert('Doji', 'MSFT', 0.9) == ['u2']
+
+        manager.unsubscribe_from_pattern('u1', 'Doji')
+        assert manager.get_users_for_alert('Doji', 'AAPL', 0.9) == ['u2']
+
+    def test_preferences_filter_candidates(self, manager):
+        manager.subscribe_to_pattern('u1', 'Doji', confidence_threshold=0.5)
+        manager.subscribe_to_pattern('u2', 'Doji', confidence_threshold=0.5)
+
+        prefs = manager.get_user_preferences('u2')
+        prefs.global_enabled = False
+        manager.update_user_preferences('u2', prefs)
+
+        assert manager.get_users_for_alert('Doji', 'AAPL', 0.9) == ['u1']
+
+    def test_rate_limit(self, manager):
+        manager.subscribe_to_pattern('u1', 'Doji', confidence_threshold=0.5)
+        prefs = manager.get_user_preferences('u1')
+        prefs.max_alerts_per_hour = 2
+        manager.update_user_preferences('u1', prefs)
+
+        results = [manager.get_users_for_alert('Doji', 'AAPL', 0.9) for _ in range(3)]
+
+        assert results == [['u1'], ['u1'], []]
+        assert manager.stats['rate_limited'] == 1
+
+    def test_index_mirrored_in_redis(self, manager, redis_client):
+        manager.subscribe_to_pattern('u1', 'Doji', confidence_threshold=0.6, symbols={'AAPL'})
+
+        assert redis_client.zscore('tickstock:alerts:index:Doji:AAPL', 'u1') == 0.6
+        assert redis_client.sismember('tickstock:alerts:index:users', 'u1')
+        assert manager.get_subscribed_users_count() == 1
+
+    def test_other_instance_picks_up_changes(self, manager, redis_client):
+        other = PatternAlertManager(redis_client)
+        manager.subscribe_to_pattern('u1', 'Hammer', confidence_threshold=0.5)
+
+        other._index_checked_at = 0.0
+        assert other.get_users_for_alert('Hammer', 'AAPL', 0.9) == ['u1']
+        assert other.stats['index_reloads'] >= 1
+
+    def test_index_rebuilt_from_stored_subscriptions(self, redis_client):
+        subscription = {
+            'pattern': 'Doji', 'enabled': True, 'confidence_threshold': 0.5,
+            'notification_types': ['in_app'], 'symbols': None,
+        }
+        redis_client.set('tickstock:alerts:subscriptions:u9', json.dumps({'Doji': subscription}))
+
+        manager = PatternAlertManager(redis_client)
+
+        assert manager.get_users_for_alert('Doji', 'TSLA', 0.9) == ['u9']
+
+    def test_cleanup_drops_expired_users(self, manager, redis_client):
+        manager.subscribe_to_pattern('u1', 'Doji', confidence_threshold=0.5)
+        redis_client.delete('tickstock:alerts:subscriptions:u1')
+
+        manager.cleanup_expired_data()
+
+        assert manager.get_users_for_alert('Doji', 'AAPL', 0.9) == []
+        assert redis_client.zscore('tickstock:alerts:index:Doji:*', 'u1') is None
+        assert manager.get_subscribed_users_count() == 0
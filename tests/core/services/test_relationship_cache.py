@@ -0,0 +1,246 @@
+"""
+Unit tests for RelationshipCache loading.
+
+Pooled connections, single-flight loads of concurrent misses, the
+set-based warm_cache() and stale-while-revalidate expiry.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.core.services.relationship_cache import RelationshipCache
+
+MEMBERSHIPS = [
+    ('ETF', 'QQQ', 'AAPL', None),
+    ('ETF', 'QQQ', 'MSFT', None),
+    ('ETF', 'SPY', 'AAPL', None),
+    ('SECTOR', 'information_technology', 'AAPL', 'Consumer Electronics'),
+    ('SECTOR', 'information_technology', 'MSFT', 'Software'),
+    ('THEME', 'ai', 'MSFT', None),
+    ('UNIVERSE', 'dow30', 'AAPL', None),
+]
+
+CREATED = datetime(2025, 12, 20)
+
+GROUPS = [
+    ('QQQ', 'ETF', 'Invesco QQQ', 2, 'DEFAULT', CREATED, CREATED, 2),
+    ('SPY', 'ETF', 'SPDR S&P 500', 1, 'DEFAULT', CREATED, CREATED, 1),
+    ('information_technology', 'SECTOR', 'Information Technology', 2, 'DEFAULT', CREATED, CREATED, 2),
+    ('ai', 'THEME', 'Artificial Intelligence', 1, 'DEFAULT', CREATED, CREATED, 1),
+    ('dow30', 'UNIVERSE', 'Dow Jones 30', 1, 'DEFAULT', CREATED, CREATED, 1),
+]
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+
+    def execute(self, query, params):
+        self.db.queries.append((' '.join(query.split()), params))
+        if self.db.delay:
+            time.sleep(self.db.delay)
+        if 'gm.metadata->>\'industry\'' in query and 'ANY' in query:
+            self.rows = MEMBERSHIPS
+        elif 'distinct_count' in query:
+            self.rows = GROUPS
+        else:
+            self.rows = [(symbol,) for _, name, symbol, _ in MEMBERSHIPS if name == params[0]]
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def close(self):
+        self.db.returned += 1
+
+
+class FakeEngine:
+    def __init__(self, db):
+        self.db = db
+
+    def raw_connection(self):
+        self.db.checked_out += 1
+        return FakeConnection(self.db)
+
+
+class FakeDatabase:
+    """Stands in for a TickStockDatabase on the 'cache' pool."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.queries = []
+        self.checked_out = 0
+        self.returned = 0
+        self.engine = FakeEngine(self)
+
+
+@pytest.fixture
+def db():
+    return FakeDatabase()
+
+
+@pytest.fixture
+def cache(db):
+    with patch('src.core.services.relationship_cache.get_config', return_value={}):
+        return RelationshipCache(ttl_seconds=3600, db=db)
+
+
+class TestPooledLoads:
+    """Test loads on pooled connections."""
+
+    def test_connection_returned_to_pool(self, cache, db):
+        assert cache.get_etf_holdings('qqq') == ('AAPL', 'MSFT')
+        assert db.checked_out == db.returned == 1
+
+    def test_hit_does_not_query(self, cache, db):
+        cache.get_etf_holdings('QQQ')
+        cache.get_etf_holdings('QQQ')
+        assert len(db.queries) == 1
+        assert cache.get_stats()['hits'] == 1
+
+    def test_failed_load_is_not_cached(self, cache, db):
+        with patch.object(FakeCursor, 'execute', side_effect=RuntimeError('db down')):
+            assert cache.get_etf_holdings('QQQ') == ()
+            assert cache.get_stock_sector('AAPL') == {'sector': 'unknown', 'industry': 'Unknown'}
+        assert cache.get_etf_holdings('QQQ') == ('AAPL', 'MSFT')
+        assert db.returned == db.checked_out
+
+    def test_jittered_timestamps_stay_within_ttl(self, cache):
+        cache.get_etf_holdings('QQQ')
+        _, stamp = cache._etf_holdings['QQQ']
+        age = (datetime.now() - stamp).total_seconds()
+        assert 0 <= age <= cache.ttl_seconds * cache.TTL_JITTER + 1
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent misses."""
+
+    def test_concurrent_misses_share_one_load(self, cache, db):
+        db.delay = 0.05
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_universe_members('dow30')))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [('AAPL',)] * 8
+        assert len(db.queries) == 1
+        assert cache.get_stats()['coalesced'] == 7
+        assert cache._load_locks == {}
+
+
+class TestWarmCache:
+    """Test the set-based warm-up."""
+
+    def test_two_queries_populate_everything(self, cache, db):
+        cache.warm_cache()
+        assert len(db.queries) == 2
+
+        assert cache.get_etf_holdings('QQQ') == ('AAPL', 'MSFT')
+        assert cache.get_stock_etfs('AAPL') == ('QQQ', 'SPY')
+        assert cache.get_stock_sector('MSFT') == {'sector': 'information_technology', 'industry': 'Software'}
+        assert cache.get_sector_stocks('information_technology') == ('AAPL', 'MSFT')
+        assert cache.get_theme_members('ai') == ('MSFT',)
+        assert cache.get_universe_members('dow30') == ('AAPL',)
+        assert cache.get_universe_symbols('SPY') == ('AAPL',)
+        assert [e['symbol'] for e in cache.get_all_etfs()] == ['QQQ', 'SPY']
+        assert cache.get_all_sectors()[0]['stock_count'] == 2
+        assert cache.get_all_themes() == [{'key': 'ai', 'name': 'Artificial Intelligence', 'member_count': 1}]
+        assert [u['name'] for u in cache.get_available_universes()] == ['QQQ', 'SPY', 'dow30']
+        assert len(db.queries) == 2
+
+    def test_warm_failure_leaves_cache_empty(self, cache, db):
+        with patch.object(FakeCursor, 'execute', side_effect=RuntimeError('db down')):
+            cache.warm_cache()
+        assert cache.get_stats()['cache_sizes']['etf_holdings'] == 0
+
+
+def _age_entries(cache, seconds):
+    """Backdate every cache entry by the given number of seconds."""
+    for store in cache._stores():
+        for key, (value, timestamp) in store.items():
+            store[key] = (value, timestamp - timedelta(seconds=seconds))
+
+
+def _drain(cache):
+    """Wait for queued background refreshes (every worker reaches a barrier)."""
+    barrier = threading.Barrier(cache.REFRESH_WORKERS)
+    futures = [cache._refresher.submit(barrier.wait, 5) for _ in range(cache.REFRESH_WORKERS)]
+    for future in futures:
+        future.result(timeout=5)
+
+
+class TestStaleWhileRevalidate:
+    """Test soft/hard TTL expiry and push revalidation."""
+
+    def test_symbol_getters_share_immutable_tuples(self, cache):
+        first = cache.get_etf_holdings('QQQ')
+        assert isinstance(first, tuple)
+        assert cache.get_etf_holdings('QQQ') is first
+
+    def test_stale_entry_served_then_refreshed(self, cache, db):
+        cache.get_etf_holdings('QQQ')
+        _age_entries(cache, cache.ttl_seconds + 60)
+
+        assert cache.get_etf_holdings('QQQ') == ('AAPL', 'MSFT')
+        _drain(cache)
+
+        stats = cache.get_stats()
+        assert stats['stale_hits'] == 1
+        assert stats['refreshes'] == 1
+        assert len(db.queries) == 2
+        assert not cache._is_expired(cache._etf_holdings['QQQ'][1])
+
+    def test_failed_refresh_keeps_stale_value(self, cache):
+        cache.get_etf_holdings('QQQ')
+        _age_entries(cache, cache.ttl_seconds + 60)
+
+        with patch.object(FakeCursor, 'execute', side_effect=RuntimeError('db down')):
+            assert cache.get_etf_holdings('QQQ') == ('AAPL', 'MSFT')
+            _drain(cache)
+        assert cache._etf_holdings['QQQ'][0] == ('AAPL', 'MSFT')
+        assert cache._refreshing == set()
+
+    def test_hard_expired_entry_loads_on_request_path(self, cache, db):
+        cache.get_etf_holdings('QQQ')
+        _age_entries(cache, cache.hard_ttl_seconds + 60)
+
+        assert cache.get_etf_holdings('QQQ') == ('AAPL', 'MSFT')
+        stats = cache.get_stats()
+        assert stats['stale_hits'] == 0
+        assert stats['misses'] == 2
+
+    def test_revalidate_rewarms_in_background(self, cache, db):
+        cache.get_etf_holdings('QQQ')
+
+        # Keep the workers busy so both revalidations queue behind them
+        release = threading.Event()
+        for _ in range(cache.REFRESH_WORKERS):
+            cache._refresher.submit(release.wait, 5)
+        cache.revalidate()
+        cache.revalidate()
+        assert cache._is_expired(cache._etf_holdings['QQQ'][1])
+        release.set()
+        _drain(cache)
+
+        # One warm_cache (two queries) for both revalidations
+        assert len(db.queries) == 3
+        assert cache.get_stats()['revalidations'] == 2
+        assert not cache._is_expired(cache._etf_holdings['QQQ'][1])
+
@@ -0,0 +1,215 @@
+"""
+Unit tests for UniverseSnapshotCache.
+
+Snapshot loading, incremental refresh of new/revised daily bars, and the
+breadth/threshold endpoints reading from snapshots.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.data.ohlcv_panel import OHLCVPanel
+from src.core.services.breadth_metrics_service import BreadthMetricsService
+from src.core.services.threshold_bar_service import ThresholdBarService
+from src.core.services.universe_snapshot_cache import UniverseSnapshotCache
+
+
+def _frame(bars, seed, end=None):
+    rng = np.random.default_rng(seed)
+    close = 100 + seed + np.cumsum(rng.normal(0, 1.0, bars))
+    return pd.DataFrame(
+        {
+            'open': close + rng.normal(0, 0.5, bars),
+            'high': close + 1.0,
+            'low': close - 1.0,
+            'close': close,
+            'volume': np.full(bars, 1000.0),
+        },
+        index=pd.date_range(end=end or datetime.now().date(), periods=bars, freq='D', name='date'),
+    )
+
+
+def _long_frame(frames):
+    """Concatenate per-symbol frames into the DataFrame the query paths return."""
+    return pd.concat(
+        [df.reset_index().assign(symbol=symbol) for symbol, df in frames.items()],
+        ignore_index=True,
+    )
+
+
+class FakeDataService:
+    """Serves get_ohlcv_panel() from an editable dict of frames."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.calls = []
+
+    def get_ohlcv_panel(self, symbols, timeframe='daily', limit=200):
+        self.calls.append((list(symbols), limit))
+        return OHLCVPanel.from_frames(
+            {s: self.frames.get(s, _frame(0, 0)) for s in symbols}, limit=limit
+        )
+
+
+@pytest.fixture
+def frames():
+    return {
+        'AAPL': _frame(300, 1),
+        'MSFT': _frame(120, 2),
+        'NVDA': _frame(30, 3),
+        'TSLA': _frame(1, 4),
+    }
+
+
+@pytest.fixture
+def data_service(frames):
+    return FakeDataService(frames)
+
+
+@pytest.fixture
+def cache(data_service):
+    return UniverseSnapshotCache({'UNIVERSE_SNAPSHOT_REFRESH_SECONDS': 300}, data_service=data_service)
+
+
+class TestSnapshotLoading:
+    """Test loading and reuse of snapshots."""
+
+    def test_loads_once_and_serves_hits(self, cache, data_service):
+        first = cache.get_snapshot('SPY', ['AAPL', 'MSFT'])
+        second = cache.get_snapshot('SPY', ['aapl', 'MSFT'])
+
+        assert first is second
+        assert data_service.calls == [(['AAPL', 'MSFT'], 252)]
+        assert cache.stats['hits'] == 1
+        assert first.panel.lengths.tolist() == [252, 120]
+
+    def test_member_change_reloads(self, cache, data_service):
+        cache.get_snapshot('SPY', ['AAPL', 'MSFT'])
+        snapshot = cache.get_snapshot('SPY', ['AAPL', 'NVDA'])
+
+        assert snapshot.symbols == ['AAPL', 'NVDA']
+        assert len(data_service.calls) == 2
+
+    def test_load_failure(self, cache, data_service):
+        data_service.get_ohlcv_panel = Mock(side_effect=Exception("timeout"))
+
+        with pytest.raises(RuntimeError, match="Failed to load daily snapshot for SPY"):
+            cache.get_snapshot('SPY', ['AAPL'])
+
+    def test_lru_eviction(self, data_service):
+        cache = UniverseSnapshotCache({'UNIVERSE_SNAPSHOT_MAX_UNIVERSES': 1}, data_service=data_service)
+
+        cache.get_snapshot('SPY', ['AAPL'])
+        cache.get_snapshot('QQQ', ['MSFT'])
+        cache.get_snapshot('SPY', ['AAPL'])
+
+        assert len(data_service.calls) == 3
+
+
+class TestIncrementalRefresh:
+    """Test merging trailing bars into a stale snapshot."""
+
+    def test_new_and_revised_bars_are_merged(self, cache, data_service, frames):
+        snapshot = cache.get_snapshot('SPY', ['AAPL', 'MSFT'])
+
+        # AAPL gains a bar; MSFT's latest bar is corrected in place
+        next_day = frames['AAPL'].index[-1] + pd.Timedelta(days=1)
+        frames['AAPL'].loc[next_day] = [150.0, 151.0, 149.0, 150.5, 1000.0]
+        frames['MSFT'].iloc[-1, frames['MSFT'].columns.get_loc('close')] += 2.0
+
+        cache.mark_stale('SPY')
+        refreshed = cache.get_snapshot('SPY', ['AAPL', 'MSFT'])
+
+        assert data_service.calls[-1] == (['AAPL', 'MSFT'], cache.TAIL_BARS)
+        assert refreshed is not snapshot
+        assert refreshed.loaded_at == snapshot.loaded_at
+        assert refreshed.panel.lengths.tolist() == [252, 120]
+        assert refreshed.columns['close'].tolist() == [150.5, frames['MSFT']['close'].iloc[-1]]
+
+        reloaded = UniverseSnapshotCache(data_service=data_service).get_snapshot('SPY', ['AAPL', 'MSFT'])
+        for name, values in reloaded.columns.items():
+            np.testing.assert_array_equal(refreshed.columns[name], values, err_msg=name)
+
+    def test_unchanged_tail_keeps_snapshot(self, cache, data_service):
+        snapshot = cache.get_snapshot('SPY', ['AAPL', 'TSLA'])
+
+        cache.mark_stale()
+        assert cache.get_snapshot('SPY', ['AAPL', 'TSLA']) is snapshot
+        assert cache.stats['refreshes'] == 1
+
+    def test_gap_larger_than_tail_reloads(self, cache, data_service, frames):
+        cache.get_snapshot('SPY', ['MSFT'])
+        frames['MSFT'] = _frame(130, 2, end=frames['MSFT'].index[-1] + pd.Timedelta(days=10))
+
+        cache.mark_stale()
+        snapshot = cache.get_snapshot('SPY', ['MSFT'])
+
+        assert [limit for _, limit in data_service.calls] == [252, cache.TAIL_BARS, 252]
+        assert snapshot.panel.lengths.tolist() == [130]
+
+    def test_refresh_failure_serves_stale(self, cache, data_service):
+        snapshot = cache.get_snapshot('SPY', ['AAPL'])
+        data_service.get_ohlcv_panel = Mock(side_effect=Exception("timeout"))
+
+        cache.mark_stale()
+
+        assert cache.get_snapshot('SPY', ['AAPL']) is snapshot
+        assert cache.stats['refresh_failures'] == 1
+
+
+class TestSnapshotConsumers:
+    """Test endpoint services against their DataFrame calculations."""
+
+    def test_breadth_metrics_match_dataframe_methods(self, cache, frames):
+        cache_frames = {s: df.iloc[-252:] for s, df in frames.items()}
+        df = _long_frame(cache_frames)
+        service = BreadthMetricsService(
+            relationship_cache=Mock(get_universe_symbols=Mock(return_value=list(frames))),
+            db=Mock(),
+            snapshot_cache=cache,
+        )
+
+        result = service.calculate_breadth_metrics('SPY')
+
+        metrics = result['metrics']
+        assert metrics['day_change'] == service._calculate_day_change(df)
+        assert metrics['open_change'] == service._calculate_open_change(df)
+        for name, days in (('week', 5), ('month', 21), ('quarter', 63), ('year', 252)):
+            assert metrics[name] == service._calculate_period_change(df, days), name
+        assert metrics['price_to_ema20'] == service._calculate_ema_comparison(df, 20)
+        assert metrics['price_to_sma200'] == service._calculate_sma_comparison(df, 200)
+        assert metrics['price_to_sma200']['up'] + metrics['price_to_sma200']['down'] == 1
+        assert result['metadata']['symbol_count'] == 4
+
+    def test_threshold_bars_match_dataframe_path(self, cache, frames):
+        service = ThresholdBarService(
+            relationship_cache=Mock(get_universe_symbols=Mock(return_value=list(frames))),
+            db=Mock(),
+            snapshot_cache=cache,
+        )
+        df = _long_frame(frames).rename(columns={'date': 'timestamp'})
+        df = df[df['timestamp'] >= pd.Timestamp(datetime.now().date()) - pd.Timedelta(days=3)]
+
+        changes = service._snapshot_percentage_changes('SPY', list(frames), period_days=3)
+        expected = service._calculate_percentage_changes(df, 'daily')
+
+        assert changes['symbol'].tolist() == expected['symbol'].tolist()
+        assert changes['pct_change'].tolist() == expected['pct_change'].tolist()
+
+        result = service.calculate_threshold_bars('SPY', 'SimpleDivergingBar', 'daily', period_days=3)
+        assert sum(result['segments'].values()) == pytest.approx(100.0)
+
+    def test_threshold_bars_no_data_in_window(self, data_service, frames):
+        frames['AAPL'] = _frame(10, 1, end='2020-01-31')
+        service = ThresholdBarService(
+            relationship_cache=Mock(get_universe_symbols=Mock(return_value=['AAPL'])),
+            db=Mock(),
+            snapshot_cache=UniverseSnapshotCache(data_service=data_service),
+        )
+
+        with pytest.raises(RuntimeError, match="No OHLCV data available"):
+            service.calculate_threshold_bars('AAPL', 'SimpleDivergingBar', 'daily')
@@ -0,0 +1,130 @@
+"""
+Daily Analysis Bulk Write Tests
+Tests for set-based daily_patterns / daily_indicators persistence.
+
+Test Coverage:
+- COPY into staging tables, one DELETE + INSERT per table, one commit
+- CSV encoding of JSON payloads and NULLs
+- Chunk persistence builds rows for every symbol in one call
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infrastructure.database.tickstock_db import TickStockDatabase
+
+
+@pytest.fixture
+def db():
+    with patch('src.infrastructure.database.tickstock_db.create_engine') as create_engine:
+        create_engine.side_effect = lambda *args, **kwargs: MagicMock()
+        with patch.object(TickStockDatabase, '_test_connection'):
+            yield TickStockDatabase({}, role='admin')
+
+
+@pytest.fixture
+def conn(db):
+    conn = db.engine.connect.return_value
+    conn.copied = []
+
+    def copy_expert(sql, buffer):
+        conn.copied.append((sql, list(csv.reader(io.StringIO(buffer.read())))))
+
+    conn.connection.cursor.return_value.copy_expert.side_effect = copy_expert
+    return conn
+
+
+def _pattern_row(symbol, pattern_type):
+    return {
+        'symbol': symbol,
+        'pattern_type': pattern_type,
+        'confidence': 0.85,
+        'pattern_data': json.dumps({'pattern_name': pattern_type, 'detected': True}),
+        'expiration_date': datetime(2025, 1, 3, 16, 0),
+        'timeframe': 'daily',
+        'metadata': json.dumps({'source': 'admin_process_analysis'}),
+    }
+
+
+def _indicator_row(symbol, indicator_type):
+    return {
+        'symbol': symbol,
+        'indicator_type': indicator_type,
+        'value_data': json.dumps({'value': 101.5, 'signal': None}),
+        'expiration_date': None,
+        'timeframe': 'daily',
+        'metadata': json.dumps({'indicator_type': indicator_type}),
+    }
+
+
+class TestReplaceDailyAnalysisResults:
+    """Test the staging table + set-based replace path."""
+
+    def test_one_transaction_with_set_based_statements(self, db, conn):
+        patterns = [_pattern_row('AAPL', 'Doji'), _pattern_row('MSFT', 'Hammer')]
+        indicators = [_indicator_row('AAPL', 'sma'), _indicator_row('MSFT', 'rsi')]
+
+        assert db.replace_daily_analysis_results(patterns, indicators) == (2, 2)
+
+        statements = [' '.join(str(call.args[0]).split()) for call in conn.execute.call_args_list]
+        assert len(statements) == 6
+        for table, offset in (('daily_patterns', 0), ('daily_indicators', 3)):
+            create, delete, insert = statements[offset:offset + 3]
+            assert create.startswith(f'CREATE TEMP TABLE IF NOT EXISTS {table}_staging')
+            assert delete.startswith(f'DELETE FROM {table} t USING')
+            assert insert.startswith(f'INSERT INTO {table} (')
+        conn.commit.assert_called_once()
+
+    def test_rows_are_copied_as_csv(self, db, conn):
+        db.replace_daily_analysis_results([], [_indicator_row('AAPL', 'sma')])
+
+        (sql, rows), = conn.copied
+        assert sql.startswith('COPY daily_indicators_staging (symbol, indicator_type, value_data')
+        assert rows == [[
+            'AAPL', 'sma', '{"value": 101.5, "signal": null}', '', 'daily',
+            '{"indicator_type": "sma"}',
+        ]]
+
+    def test_nothing_to_write(self, db, conn):
+        assert db.replace_daily_analysis_results([], []) == (0, 0)
+        db.engine.connect.assert_not_called()
+
+    def test_failure_propagates_without_commit(self, db, conn):
+        conn.connection.cursor.return_value.copy_expert.side_effect = Exception("copy failed")
+
+        with pytest.raises(Exception, match="copy failed"):
+            db.replace_daily_analysis_results([_pattern_row('AAPL', 'Doji')], [])
+
+        conn.commit.assert_not_called()
+        conn.rollback.assert_called_once()
+
+
+class TestPersistChunkResults:
+    """Test admin chunk persistence through the bulk writer."""
+
+    def test_chunk_written_with_one_call(self):
+        from src.api.rest.admin_process_analysis import _persist_chunk_results
+
+        results = {
+            'AAPL': {
+                'patterns': {'Doji': {'detected': True, 'confidence': 0.9},
+                             'Hammer': {'detected': False, 'confidence': 0.0}},
+                'indicators': {'sma': {'indicator_type': 'sma', 'value': 1.0}},
+            },
+            'MSFT': {'patterns': {'Doji': {'detected': True, 'confidence': 0.7}}, 'indicators': {}},
+        }
+
+        with patch('src.api.rest.admin_process_analysis.TickStockDatabase') as database:
+            database.return_value.replace_daily_analysis_results.side_effect = (
+                lambda patterns, indicators: (len(patterns), len(indicators))
+            )
+            assert _persist_chunk_results(results, 'daily') == (2, 1)
+
+        patterns, indicators = database.return_value.replace_daily_analysis_results.call_args.args
+        assert [(row['symbol'], row['pattern_type']) for row in patterns] == [('AAPL', 'Doji'), ('MSFT', 'Doji')]
+        assert [row['indicator_type'] for row in indicators] == ['sma']
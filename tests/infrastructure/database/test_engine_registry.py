@@ -0,0 +1,97 @@
+"""
+Engine Registry Tests
+Tests for process-wide shared TickStockDatabase connection pools.
+
+Test Coverage:
+- One engine per (DSN, role), verified once
+- Per-role pool sizing
+- Failed verification is not cached
+- close() keeps shared pools open
+- Pool stats in health_check
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.infrastructure.database.tickstock_db import (
+    POOL_ROLES,
+    TickStockDatabase,
+    get_engine_registry,
+)
+
+
+@pytest.fixture
+def mock_create_engine():
+    with patch('src.infrastructure.database.tickstock_db.create_engine') as create_engine:
+        create_engine.side_effect = lambda *args, **kwargs: MagicMock()
+        with patch.object(TickStockDatabase, '_test_connection') as test_connection:
+            create_engine.test_connection = test_connection
+            yield create_engine
+
+
+class TestEngineRegistry:
+    """Test shared engine creation and reuse."""
+
+    def test_instances_share_one_engine_per_role(self, mock_create_engine):
+        first = TickStockDatabase({})
+        second = TickStockDatabase({})
+
+        assert first.engine is second.engine
+        mock_create_engine.assert_called_once()
+        mock_create_engine.test_connection.assert_called_once()
+        assert get_engine_registry().stats == {'engines_created': 1, 'engines_reused': 1}
+
+    def test_roles_get_separately_sized_pools(self, mock_create_engine):
+        ui = TickStockDatabase({})
+        admin = TickStockDatabase({}, role='admin')
+
+        assert ui.engine is not admin.engine
+        sizes = [call.kwargs['pool_size'] for call in mock_create_engine.call_args_list]
+        assert sizes == [POOL_ROLES['ui']['pool_size'], POOL_ROLES['admin']['pool_size']]
+
+    def test_unknown_role_rejected(self):
+        with pytest.raises(ValueError, match="Unknown database pool role"):
+            TickStockDatabase({}, role='reporting')
+
+    def test_failed_verification_is_retried(self, mock_create_engine):
+        mock_create_engine.test_connection.side_effect = [
+            OperationalError("SELECT 1", {}, Exception("refused")), None
+        ]
+
+        with pytest.raises(OperationalError):
+            TickStockDatabase({})
+        db = TickStockDatabase({})
+
+        assert db.engine is not None
+        assert mock_create_engine.call_count == 2
+
+    def test_close_keeps_shared_pool_open(self, mock_create_engine):
+        first = TickStockDatabase({})
+        second = TickStockDatabase({})
+        engine = second.engine
+
+        first.close()
+
+        assert first.engine is None
+        engine.dispose.assert_not_called()
+        assert second.engine is engine
+
+        get_engine_registry().dispose_all()
+        engine.dispose.assert_called_once()
+
+    def test_health_check_reports_shared_pools(self, mock_create_engine):
+        db = TickStockDatabase({}, role='analysis')
+        pool = db.engine.pool
+        pool.size.return_value = 10
+        pool.checkedin.return_value = 7
+        pool.checkedout.return_value = 3
+        pool.overflow.return_value = -7
+
+        health = db.health_check()
+
+        assert health['shared_pools'] == {
+            'analysis': {'size': 10, 'checked_in': 7, 'checked_out': 3, 'overflow': 0}
+        }
+        assert health['engine_registry']['engines_created'] == 1
@@ -0,0 +1,126 @@
+"""
+OHLCV Bulk Writer Tests
+Tests for batched ohlcv_1min persistence used by MarketDataService.
+
+Test Coverage:
+- Coalescing of repeated (symbol, timestamp) keys
+- Size-based and interval-based flushing
+- Backpressure when the pending buffer is full
+- Re-queue on failed flush and flush metrics
+"""
+
+import time
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from src.infrastructure.database.ohlcv_bulk_writer import OHLCVBulkWriter
+
+
+def _submit(writer, symbol='AAPL', minute=0, close='150.00'):
+    return writer.submit(
+        symbol=symbol,
+        timestamp=datetime(2025, 1, 2, 14, minute, tzinfo=UTC),
+        open_price=Decimal('150.00'),
+        high_price=Decimal('151.00'),
+        low_price=Decimal('149.00'),
+        close_price=Decimal(close),
+        volume=1000
+    )
+
+
+class TestOHLCVBulkWriter:
+    """Test OHLCVBulkWriter buffering and flush behavior."""
+
+    @pytest.fixture
+    def mock_db(self):
+        db = Mock()
+        db.write_ohlcv_1min_batch.side_effect = lambda bars: len(bars)
+        return db
+
+    def test_coalesces_repeated_keys(self, mock_db):
+        """Repeated bars for the same key keep only the latest values."""
+        writer = OHLCVBulkWriter(mock_db)
+
+        _submit(writer, close='150.00')
+        _submit(writer, close='150.50')
+        _submit(writer, symbol='MSFT')
+
+        assert writer.pending_count() == 2
+        assert writer.flush() == 2
+
+        batch = mock_db.write_ohlcv_1min_batch.call_args[0][0]
+        aapl = next(bar for bar in batch if bar['symbol'] == 'AAPL')
+        assert aapl['close'] == Decimal('150.50')
+        assert writer.get_stats()['rows_coalesced'] == 1
+
+    def test_flush_splits_into_max_batch_rows(self, mock_db):
+        """Flush writes pending bars in chunks of max_batch_rows."""
+        writer = OHLCVBulkWriter(mock_db, {'OHLCV_WRITER_MAX_BATCH_ROWS': 2})
+
+        for minute in range(5):
+            _submit(writer, minute=minute)
+
+        assert writer.flush() == 5
+        assert mock_db.write_ohlcv_1min_batch.call_count == 3
+        assert writer.get_stats()['flush_count'] == 3
+
+    def test_backpressure_drops_new_keys_when_full(self, mock_db):
+        """New keys are rejected once max pending rows is reached."""
+        writer = OHLCVBulkWriter(mock_db, {'OHLCV_WRITER_MAX_PENDING_ROWS': 2})
+
+        assert _submit(writer, minute=0) is True
+        assert _submit(writer, minute=1) is True
+        assert _submit(writer, minute=2) is False
+        # Existing keys still coalesce while full
+        assert _submit(writer, minute=1, close='151.00') is True
+
+        stats = writer.get_stats()
+        assert stats['rows_dropped'] == 1
+        assert stats['pending_rows'] == 2
+
+    def test_failed_flush_requeues_batch(self, mock_db):
+        """A failed flush keeps bars pending for the next attempt."""
+        mock_db.write_ohlcv_1min_batch.side_effect = Exception("connection lost")
+        writer = OHLCVBulkWriter(mock_db)
+
+        _submit(writer, minute=0)
+        _submit(writer, minute=1)
+
+        assert writer.flush() == 0
+        assert writer.pending_count() == 2
+        assert writer.get_stats()['flush_failures'] == 1
+
+        mock_db.write_ohlcv_1min_batch.side_effect = lambda bars: len(bars)
+        assert writer.flush() == 2
+        assert writer.pending_count() == 0
+
+    def test_on_flush_receives_written_bars(self, mock_db):
+        """The on_flush callback is invoked with each successful batch."""
+        on_flush = Mock()
+        writer = OHLCVBulkWriter(mock_db, on_flush=on_flush)
+
+        _submit(writer)
+        writer.flush()
+
+        on_flush.assert_called_once()
+        assert on_flush.call_args[0][0][0]['symbol'] == 'AAPL'
+
+    def test_background_thread_flushes_on_interval(self, mock_db):
+        """The flush thread writes pending bars without an explicit flush call."""
+        writer = OHLCVBulkWriter(mock_db, {'OHLCV_WRITER_FLUSH_INTERVAL_MS': 20})
+        writer.start()
+        try:
+            _submit(writer)
+            deadline = time.time() + 2.0
+            while writer.get_stats()['rows_written'] == 0 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            writer.stop()
+
+        stats = writer.get_stats()
+        assert stats['rows_written'] == 1
+        assert stats['pending_rows'] == 0
+        assert stats['is_running'] is False
@@ -0,0 +1 @@
+"""WebSocket infrastructure tests package."""
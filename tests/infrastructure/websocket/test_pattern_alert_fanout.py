@@ -0,0 +1,111 @@
+"""
+Pattern Alert Fan-out Tests
+Tests for batched multi-room delivery of pattern alerts.
+
+Test Coverage:
+- Topic room plus user rooms in one emit
+- Chunking by rooms_per_emit
+- Emit errors counted and re-raised
+- Latency stats
+- Subscriber publishes to the topic room with no matched users
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.services.redis_event_subscriber import (
+    EventType,
+    RedisEventSubscriber,
+    TickStockEvent,
+)
+from src.infrastructure.websocket.pattern_alert_fanout import PatternAlertFanout
+
+
+@pytest.fixture
+def socketio():
+    return MagicMock()
+
+
+class TestPatternAlertFanout:
+    """Test PatternAlertFanout.publish()."""
+
+    def test_single_emit_for_topic_and_users(self, socketio):
+        fanout = PatternAlertFanout(socketio)
+
+        result = fanout.publish('pattern_alert', {'x': 1}, 'Doji', 'aapl', ['1', '2'])
+
+        socketio.emit.assert_called_once_with(
+            'pattern_alert', {'x': 1},
+            to=['pattern:Doji:AAPL', 'user_1', 'user_2'],
+            namespace='/'
+        )
+        assert result.recipients == 2
+        assert result.emits == 1
+
+    def test_rooms_chunked(self, socketio):
+        fanout = PatternAlertFanout(socketio, rooms_per_emit=2)
+
+        result = fanout.publish('pattern_alert', {}, 'Doji', 'AAPL', [str(i) for i in range(5)])
+
+        rooms = [call.kwargs['to'] for call in socketio.emit.call_args_list]
+        assert result.emits == 3
+        assert [len(chunk) for chunk in rooms] == [2, 2, 2]
+        assert sum(rooms, [])[0] == 'pattern:Doji:AAPL'
+
+    def test_topic_room_only_without_users(self, socketio):
+        fanout = PatternAlertFanout(socketio)
+
+        result = fanout.publish('pattern_alert', {}, 'Hammer', 'MSFT', [])
+
+        assert socketio.emit.call_args.kwargs['to'] == ['pattern:Hammer:MSFT']
+        assert result.recipients == 0
+
+    def test_emit_error_counted(self, socketio):
+        socketio.emit.side_effect = RuntimeError('queue down')
+        fanout = PatternAlertFanout(socketio)
+
+        with pytest.raises(RuntimeError):
+            fanout.publish('pattern_alert', {}, 'Doji', 'AAPL', ['1'])
+
+        stats = fanout.get_stats()
+        assert stats['errors'] == 1
+        assert stats['events'] == 1
+        assert stats['emits'] == 0
+
+    def test_stats(self, socketio):
+        fanout = PatternAlertFanout(socketio, rooms_per_emit=2)
+        fanout.publish('pattern_alert', {}, 'Doji', 'AAPL', ['1', '2', '3'])
+        fanout.publish('pattern_alert', {}, 'Doji', 'AAPL', ['1'])
+
+        stats = fanout.get_stats()
+        assert stats['events'] == 2
+        assert stats['recipients'] == 4
+        assert stats['emits'] == 3
+        assert stats['avg_recipients'] == 2.0
+        assert 0 <= stats['p50_latency_ms'] <= stats['max_latency_ms']
+
+
+class TestSubscriberFanout:
+    """Test pattern events reaching the fan-out from RedisEventSubscriber."""
+
+    def _pattern_event(self):
+        return TickStockEvent(
+            event_type=EventType.PATTERN_DETECTED,
+            source='pattern_detector',
+            timestamp=time.time(),
+            data={'pattern': 'Doji', 'symbol': 'AAPL', 'confidence': 0.9},
+            channel='tickstock.events.patterns',
+        )
+
+    def test_topic_room_without_matched_users(self, socketio):
+        flask_app = MagicMock()
+        flask_app.pattern_alert_manager.get_users_for_alert.return_value = []
+        subscriber = RedisEventSubscriber(MagicMock(), socketio, {}, flask_app=flask_app)
+
+        subscriber._handle_pattern_event(self._pattern_event())
+
+        socketio.emit.assert_called_once()
+        assert socketio.emit.call_args.kwargs['to'] == ['pattern:Doji:AAPL']
+        assert subscriber.stats['events_forwarded'] == 0
@@ -208,7 +208,7 @@ class TestPatternEventDelivery:
                 targeted_emissions.append({
                     'args': args,
                     'kwargs': kwargs,
-                    'room': kwargs.get('room'),
+                    'rooms': kwargs.get('to') or [kwargs.get('room')],
                     'timestamp': time.time()
                 })
                 return original_emit(*args, **kwargs)
@@ -237,14 +237,14 @@ class TestPatternEventDelivery:
             event_subscriber.stop()
 
             # Verify user targeting
-            user_targeted_alerts = [emission for emission in targeted_emissions
-                                  if emission.get('room') and emission['room'].startswith('user_')]
+            target_rooms = [room for emission in targeted_emissions
+                            for room in emission['rooms'] if room and room.startswith('user_')]
 
             return {
                 'pattern_manager_called': mock_pattern_manager.get_users_for_alert.called,
-                'targeted_alerts_sent': len(user_targeted_alerts),
-                'target_users': [emission['room'] for emission in user_targeted_alerts],
-                'filtering_working': len(user_targeted_alerts) > 0
+                'targeted_alerts_sent': len(target_rooms),
+                'target_users': target_rooms,
+                'filtering_working': len(target_rooms) > 0
             }
 
     def test_pattern_delivery_performance(self, redis_client, pattern_cache, event_subscriber):
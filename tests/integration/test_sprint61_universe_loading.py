@@ -25,10 +25,10 @@ class TestRelationshipCacheUniverseLoading:
         symbols = cache.get_universe_symbols('nasdaq100')
 
         # Verify result
-        assert isinstance(symbols, list), "Should return a list"
+        assert isinstance(symbols, tuple), "Should return a tuple"
         assert len(symbols) > 0, "NASDAQ-100 should have symbols"
         assert 'AAPL' in symbols, "AAPL should be in NASDAQ-100"
-        assert symbols == sorted(symbols), "Symbols should be sorted"
+        assert list(symbols) == sorted(symbols), "Symbols should be sorted"
 
         print(f"[OK] NASDAQ-100: {len(symbols)} symbols loaded")
 
@@ -38,10 +38,10 @@ class TestRelationshipCacheUniverseLoading:
         symbols = cache.get_universe_symbols('VOO')
 
         # Verify result
-        assert isinstance(symbols, list), "Should return a list"
+        assert isinstance(symbols, tuple), "Should return a tuple"
         assert len(symbols) >= 500, f"VOO should have ~500+ symbols, got {len(symbols)}"
         assert 'AAPL' in symbols, "AAPL should be in VOO"
-        assert symbols == sorted(symbols), "Symbols should be sorted"
+        assert list(symbols) == sorted(symbols), "Symbols should be sorted"
 
         print(f"[OK] VOO ETF (S&P 500): {len(symbols)} symbols loaded")
 
@@ -51,10 +51,10 @@ class TestRelationshipCacheUniverseLoading:
         symbols = cache.get_universe_symbols('dow30')
 
         # Verify result
-        assert isinstance(symbols, list), "Should return a list"
+        assert isinstance(symbols, tuple), "Should return a tuple"
         assert len(symbols) == 30, f"Dow 30 should have exactly 30 symbols, got {len(symbols)}"
         assert 'AAPL' in symbols, "AAPL should be in Dow 30"
-        assert symbols == sorted(symbols), "Symbols should be sorted"
+        assert list(symbols) == sorted(symbols), "Symbols should be sorted"
 
         print(f"[OK] Dow 30: {len(symbols)} symbols loaded")
 
@@ -73,7 +73,7 @@ class TestRelationshipCacheUniverseLoading:
         expected_union = spy_symbols | nasdaq100_symbols
         assert len(joined_symbols) == len(expected_union), "Should be distinct union"
         assert set(joined_symbols) == expected_union, "Should match union of both universes"
-        assert joined_symbols == sorted(joined_symbols), "Symbols should be sorted"
+        assert list(joined_symbols) == sorted(joined_symbols), "Symbols should be sorted"
 
         # Verify it's less than sum (due to overlaps)
         total_if_no_overlap = len(spy_symbols) + len(nasdaq100_symbols)
@@ -98,7 +98,7 @@ class TestRelationshipCacheUniverseLoading:
         expected_union = spy | qqq | dow30
         assert len(joined) == len(expected_union), "Should be distinct union of all 3"
         assert set(joined) == expected_union, "Should match union of all universes"
-        assert joined == sorted(joined), "Symbols should be sorted"
+        assert list(joined) == sorted(joined), "Symbols should be sorted"
 
         print(f"[OK] SPY:QQQ:dow30: {len(joined)} distinct symbols "
               f"(SPY={len(spy)}, QQQ={len(qqq)}, dow30={len(dow30)})")
@@ -109,10 +109,10 @@ class TestRelationshipCacheUniverseLoading:
         symbols = cache.get_universe_symbols('SPY')
 
         # Verify result
-        assert isinstance(symbols, list), "Should return a list"
+        assert isinstance(symbols, tuple), "Should return a tuple"
         assert len(symbols) > 0, "SPY should have holdings"
         assert 'AAPL' in symbols, "AAPL should be in SPY"
-        assert symbols == sorted(symbols), "Symbols should be sorted"
+        assert list(symbols) == sorted(symbols), "Symbols should be sorted"
 
         print(f"[OK] SPY ETF: {len(symbols)} holdings loaded")
 
@@ -122,10 +122,10 @@ class TestRelationshipCacheUniverseLoading:
         symbols = cache.get_universe_symbols('QQQ')
 
         # Verify result
-        assert isinstance(symbols, list), "Should return a list"
+        assert isinstance(symbols, tuple), "Should return a tuple"
         assert len(symbols) > 0, "QQQ should have holdings"
         assert 'AAPL' in symbols, "AAPL should be in QQQ"
-        assert symbols == sorted(symbols), "Symbols should be sorted"
+        assert list(symbols) == sorted(symbols), "Symbols should be sorted"
 
         print(f"[OK] QQQ ETF: {len(symbols)} holdings loaded")
 
@@ -174,19 +174,19 @@ class TestRelationshipCacheUniverseLoading:
         print(f"[OK] Cache stats: {stats_after}")
 
     def test_empty_universe_key(self):
-        """Test: Empty universe key returns empty list"""
+        """Test: Empty universe key returns empty tuple"""
         cache = get_relationship_cache()
         symbols = cache.get_universe_symbols('')
 
-        assert symbols == [], "Empty key should return empty list"
+        assert symbols == (), "Empty key should return empty tuple"
         print("[OK] Empty universe key handled correctly")
 
     def test_nonexistent_universe(self):
-        """Test: Non-existent universe returns empty list"""
+        """Test: Non-existent universe returns empty tuple"""
         cache = get_relationship_cache()
         symbols = cache.get_universe_symbols('nonexistent_universe_xyz')
 
-        assert symbols == [], "Non-existent universe should return empty list"
+        assert symbols == (), "Non-existent universe should return empty tuple"
         print("[OK] Non-existent universe handled correctly")
 
     def test_universe_symbols_distinct(self):
@@ -799,6 +799,72 @@ class TestPerformanceRegression:
                 f"Excessive memory growth: {memory_growth[-1]:.2f} MB"
 
 
+@pytest.mark.performance
+class TestPatternScanScaling:
+    """Latency of /api/patterns/scan cache misses as the pattern cache grows."""
+
+    @staticmethod
+    def _seed_patterns(cache, pattern_data_generator, count):
+        """Write patterns in the RedisPatternCache layout with pipelined batches."""
+        import json
+
+        now = time.time()
+        pipe = cache.redis_client.pipeline(transaction=False)
+        for i, data in enumerate(pattern_data_generator.generate_patterns(count)):
+            detected_at = now - i  # Unique pattern IDs
+            pattern = {
+                'symbol': data['symbol'], 'pattern_type': data['pattern'],
+                'confidence': data['confidence'], 'current_price': data['current_price'],
+                'price_change': data['price_change'], 'detected_at': detected_at,
+                'expires_at': data['expires_at'], 'indicators': data['indicators'],
+                'source_tier': data['source'],
+            }
+            pattern_id = f"{data['symbol']}:{data['pattern']}:{int(detected_at)}"
+            pipe.hset(f"{cache.pattern_key_prefix}{pattern_id}", mapping={'data': json.dumps(pattern)})
+            pipe.zadd(cache.confidence_index_key, {pattern_id: data['confidence']})
+            pipe.zadd(cache.symbol_index_key, {f"{data['symbol']}:{pattern_id}": detected_at})
+            pipe.zadd(cache.time_index_key, {pattern_id: detected_at})
+            if i % 1000 == 999:
+                pipe.execute()
+        pipe.execute()
+
+    @pytest.mark.parametrize('cached_patterns', [
+        1_000, 10_000, pytest.param(50_000, marks=pytest.mark.slow)
+    ])
+    def test_scan_latency_percentiles(self, app, redis_pattern_cache, pattern_data_generator,
+                                      cached_patterns):
+        """Report p50/p99 scan latency at 1k/10k/50k cached patterns."""
+        self._seed_patterns(redis_pattern_cache, pattern_data_generator, cached_patterns)
+        app.pattern_cache = redis_pattern_cache
+        client = app.test_client()
+
+        queries = [
+            'confidence_min=0.6&per_page=30',
+            'confidence_min=0.6&sort_by=detected_at&per_page=30',
+            'confidence_min=0.6&sort_by=symbol&sort_order=asc&per_page=30',
+            'confidence_min=0.6&sort_by=rs&rs_min=1.2&per_page=30',
+        ]
+
+        latencies = []
+        for i in range(20):
+            # Distinct page per request so every scan misses the API response cache
+            url = f"/api/patterns/scan?{queries[i % len(queries)]}&page={i + 1}"
+            start_time = time.perf_counter()
+            response = client.get(url)
+            latencies.append((time.perf_counter() - start_time) * 1000)
+
+            assert response.status_code == 200
+            assert response.get_json()['pagination']['total'] > 0
+
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)]
+
+        print(f"\nPattern scan @ {cached_patterns} cached patterns:")
+        print(f"  P50: {p50:.2f}ms")
+        print(f"  P99: {p99:.2f}ms")
+
+
 if __name__ == "__main__":
     # Allow running performance tests directly
     pytest.main([__file__, "-v", "-m", "performance", "--tb=short"])
@@ -350,6 +350,28 @@ class TestRedisPatternCache:
         # Note: API response caching depends on implementation details
         # The cache key generation should be consistent for same filters
 
+    def test_new_pattern_invalidates_by_generation(self, redis_pattern_cache, mock_redis, sample_pattern_data):
+        """Test pattern events bump cache generations instead of scanning and deleting keys."""
+        redis_pattern_cache.process_pattern_event({'event_type': 'pattern_detected', 'data': sample_pattern_data})
+        all_filters = {'confidence_min': 0.5}
+        msft_filters = {'confidence_min': 0.5, 'symbols': ['MSFT']}
+        redis_pattern_cache.scan_patterns(all_filters)
+        redis_pattern_cache.scan_patterns(msft_filters)
+        all_key = redis_pattern_cache._generate_api_cache_key(all_filters)
+        msft_key = redis_pattern_cache._generate_api_cache_key(msft_filters)
+
+        mock_redis.keys = Mock(side_effect=AssertionError("KEYS on the hot path"))
+        redis_pattern_cache.process_pattern_event({
+            'event_type': 'pattern_detected',
+            'data': {**sample_pattern_data, 'timestamp': time.time() + 1}
+        })
+
+        # Unfiltered and AAPL responses move to a new generation; MSFT responses stay valid
+        assert redis_pattern_cache._generate_api_cache_key(all_filters) != all_key
+        assert redis_pattern_cache._generate_api_cache_key(msft_filters) == msft_key
+        assert redis_pattern_cache.scan_patterns(all_filters)['pagination']['total'] == 2
+        assert mock_redis.get(msft_key) is not None
+
     def test_cache_hit_ratio_tracking(self, redis_pattern_cache, multiple_pattern_events):
         """Test cache hit ratio tracking and target achievement."""
         # Cache patterns
@@ -409,6 +431,28 @@ class TestRedisPatternCache:
                 pattern = json.loads(pattern_data)
                 assert pattern['expires_at'] > time.time()  # Should not be expired
 
+    def test_cleanup_uses_expiry_index(self, redis_pattern_cache, mock_redis, sample_pattern_data):
+        """Test cleanup removes expired patterns from every index without KEYS scans."""
+        now = time.time()
+        redis_pattern_cache.process_pattern_event({'event_type': 'pattern_detected', 'data': sample_pattern_data})
+        redis_pattern_cache.process_pattern_event({
+            'event_type': 'pattern_detected',
+            'data': {**sample_pattern_data, 'timestamp': now - 600, 'expires_at': now - 1}
+        })
+        expired_id = f"AAPL:Weekly_Breakout:{int(now - 600)}"
+
+        mock_redis.keys = Mock(side_effect=AssertionError("KEYS during cleanup"))
+        mock_redis.hget = Mock(side_effect=AssertionError("per-key HGET during cleanup"))
+        redis_pattern_cache._cleanup_expired_patterns()
+
+        assert not mock_redis.exists(f"{redis_pattern_cache.pattern_key_prefix}{expired_id}")
+        for index_key in (redis_pattern_cache.confidence_index_key, redis_pattern_cache.time_index_key,
+                          redis_pattern_cache.expires_index_key,
+                          f"{redis_pattern_cache.symbol_set_prefix}AAPL"):
+            assert mock_redis.zscore(index_key, expired_id) is None
+        assert mock_redis.zcard(redis_pattern_cache.time_index_key) == 1
+        assert redis_pattern_cache.stats.expired_patterns_cleaned == 1
+
     def test_background_cleanup_thread(self, redis_pattern_cache):
         """Test background cleanup thread management."""
         # Start background cleanup
@@ -602,6 +646,160 @@ class TestPatternCacheIntegration:
 
         assert len(recent_patterns) >= 0
 
+    def test_scan_fetches_patterns_in_pipelined_batches(self, mock_redis, pattern_data_generator):
+        """Test scan loads pattern hashes with one pipeline per batch, not one HGET per ID."""
+        cache = RedisPatternCache(mock_redis, {'pattern_fetch_batch_size': 4})
+        for i, data in enumerate(pattern_data_generator.generate_patterns(10, confidence=0.8)):
+            data['timestamp'] = time.time() - i
+            cache.process_pattern_event({'event_type': 'pattern_detected', 'data': data})
+
+        executes = []
+        real_pipeline = mock_redis.pipeline
+
+        def counting_pipeline(*args, **kwargs):
+            pipe = real_pipeline(*args, **kwargs)
+            real_execute = pipe.execute
+            pipe.execute = lambda: executes.append(1) or real_execute()
+            return pipe
+
+        mock_redis.pipeline = counting_pipeline
+        mock_redis.hget = Mock(side_effect=AssertionError("per-ID HGET round trip"))
+
+        result = cache.scan_patterns({'confidence_min': 0.5, 'per_page': 100})
+
+        assert result['pagination']['total'] == 10
+        assert len(executes) == 3  # ceil(10 / 4)
+
+    @pytest.mark.parametrize('sort_by, sort_order, key', [
+        ('detected_at', 'desc', lambda p: -p['detected_at']),
+        ('detected_at', 'asc', lambda p: p['detected_at']),
+        ('symbol', 'asc', lambda p: p['symbol']),
+        ('symbol', 'desc', lambda p: p['symbol']),
+    ])
+    def test_scan_orders_by_index(self, redis_pattern_cache, sort_by, sort_order, key):
+        """Test detected_at and symbol orderings read from their sorted set indexes."""
+        now = time.time()
+        for i, (symbol, confidence) in enumerate([('MSFT', 0.9), ('AAPL', 0.6), ('NVDA', 0.75), ('AMD', 0.4)]):
+            redis_pattern_cache.process_pattern_event({
+                'event_type': 'pattern_detected',
+                'data': {'symbol': symbol, 'pattern': 'Doji', 'confidence': confidence,
+                         'timestamp': now - i * 60, 'expires_at': now + 3600}
+            })
+
+        result = redis_pattern_cache.scan_patterns({
+            'confidence_min': 0.5, 'sort_by': sort_by, 'sort_order': sort_order
+        })
+
+        expected = sorted(
+            [{'symbol': 'MSFT', 'detected_at': now}, {'symbol': 'AAPL', 'detected_at': now - 60},
+             {'symbol': 'NVDA', 'detected_at': now - 120}],
+            key=key, reverse=(sort_by == 'symbol' and sort_order == 'desc')
+        )
+        # AMD is below confidence_min and never reaches the pattern hash fetch
+        assert [p['symbol'] for p in result['patterns']] == [p['symbol'] for p in expected]
+
+    @pytest.mark.parametrize('sort_by', ['detected_at', 'symbol'])
+    def test_ordered_scan_applies_confidence_before_fetch(self, redis_pattern_cache, sort_by):
+        """Test indexed orderings cut the confidence range in Redis, not after decoding."""
+        now = time.time()
+        for i, confidence in enumerate([0.9, 0.3, 0.8, 0.2]):
+            redis_pattern_cache.process_pattern_event({
+                'event_type': 'pattern_detected',
+                'data': {'symbol': f"SYM{i}", 'pattern': 'Doji', 'confidence': confidence,
+                         'timestamp': now - i * 60, 'expires_at': now + 3600}
+            })
+
+        fetched = []
+        real_fetch = redis_pattern_cache._fetch_pattern_batches
+
+        def spy(pattern_ids):
+            fetched.extend(pattern_ids)
+            return real_fetch(pattern_ids)
+
+        redis_pattern_cache._fetch_pattern_batches = spy
+        result = redis_pattern_cache.scan_patterns({
+            'confidence_min': 0.5, 'sort_by': sort_by, 'sort_order': 'asc'
+        })
+
+        assert [p['symbol'] for p in result['patterns']] == (
+            ['SYM2', 'SYM0'] if sort_by == 'detected_at' else ['SYM0', 'SYM2']
+        )
+        assert sorted(fetched) == sorted(
+            f"SYM{i}:Doji:{int(now - i * 60)}" for i in (0, 2)
+        )
+        assert not redis_pattern_cache.redis_client.keys(f"{redis_pattern_cache.temp_key_prefix}*")
+
+
+class TestQueryPlanner:
+    """Test index intersection planning for selective scan filters."""
+
+    @pytest.fixture
+    def populated_cache(self, redis_pattern_cache, pattern_data_generator):
+        now = time.time()
+        patterns = pattern_data_generator.generate_patterns(200)
+        for i, data in enumerate(patterns):
+            data['timestamp'] = now - i * 10
+            data['expires_at'] = now + 3600
+            redis_pattern_cache.process_pattern_event({'event_type': 'pattern_detected', 'data': data})
+        return redis_pattern_cache, patterns, now
+
+    @staticmethod
+    def _spy_fetches(cache):
+        fetched = []
+        real_fetch = cache._fetch_pattern_batches
+
+        def spy(pattern_ids):
+            fetched.extend(pattern_ids)
+            return real_fetch(pattern_ids)
+
+        cache._fetch_pattern_batches = spy
+        return fetched
+
+    def test_symbol_and_type_filters_load_only_matches(self, populated_cache):
+        cache, patterns, _ = populated_cache
+        fetched = self._spy_fetches(cache)
+
+        result = cache.scan_patterns({
+            'symbols': ['AAPL', 'MSFT'], 'pattern_types': ['Doji', 'Hammer', 'Bull_Flag'],
+            'confidence_min': 0.6, 'per_page': 100
+        })
+
+        expected = [
+            p for p in patterns
+            if p['symbol'] in ('AAPL', 'MSFT') and p['pattern'] in ('Doji', 'Hammer', 'Bull_Flag')
+            and p['confidence'] >= 0.6
+        ]
+        assert result['pagination']['total'] == len(expected)
+        assert len(fetched) == len(expected)
+
+        confidences = [p['conf'] for p in result['patterns']]
+        assert confidences == sorted(confidences, reverse=True)
+
+        # Temporary union/intersection keys are removed
+        assert not cache.redis_client.keys(f"{cache.temp_key_prefix}*")
+
+    def test_time_window_uses_time_index(self, populated_cache):
+        cache, patterns, now = populated_cache
+        fetched = self._spy_fetches(cache)
+
+        result = cache.scan_patterns({
+            'detected_after': now - 95, 'confidence_min': 0.5,
+            'sort_by': 'detected_at', 'per_page': 100
+        })
+
+        # Ten newest patterns fall in the window; confidence is checked after decoding
+        assert len(fetched) == 10
+        assert result['pagination']['total'] == 10
+
+    def test_unknown_symbol_short_circuits(self, populated_cache):
+        cache, _, _ = populated_cache
+        fetched = self._spy_fetches(cache)
+
+        result = cache.scan_patterns({'symbols': ['ZZZZ'], 'confidence_min': 0.5})
+
+        assert result['pagination']['total'] == 0
+        assert fetched == []
+
     @pytest.mark.performance
     def test_concurrent_access(self, redis_pattern_cache, pattern_data_generator, concurrent_load_tester):
         """Test concurrent access to pattern cache."""
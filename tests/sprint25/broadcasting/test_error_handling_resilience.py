@@ -308,44 +308,48 @@ class TestBatchCreationErrorHandling:
             stats = broadcaster_with_batch_errors.get_broadcast_stats()
             assert isinstance(stats, dict)  # Should still provide stats
 
-    def test_batch_timer_creation_failures(self, broadcaster_with_batch_errors):
-        """Test handling of timer creation failures."""
+    def test_batch_flush_submission_failures(self, broadcaster_with_batch_errors):
+        """Test the shared flusher survives delivery submission failures."""
 
-        # Patch threading.Timer to occasionally fail
-        original_timer = threading.Timer
+        # Patch delivery submission to occasionally fail
+        original_submit = broadcaster_with_batch_errors.delivery_executor.submit
 
-        def unreliable_timer(*args, **kwargs):
-            """Simulate timer creation failures."""
+        def unreliable_submit(*args, **kwargs):
+            """Simulate delivery pool failures."""
             if random.random() < 0.2:  # 20% failure rate
-                raise RuntimeError("Timer creation failed")
-            return original_timer(*args, **kwargs)
+                raise RuntimeError("Delivery submission failed")
+            return original_submit(*args, **kwargs)
 
-        with patch('threading.Timer', side_effect=unreliable_timer):
+        with patch.object(broadcaster_with_batch_errors.delivery_executor, 'submit',
+                          side_effect=unreliable_submit):
 
-            timer_successes = 0
-            timer_failures = 0
+            flush_successes = 0
+            flush_failures = 0
 
-            # Attempt to create batches that require timers
+            # Create batches that are flushed by the shared flusher
             for i in range(30):
                 try:
                     result = broadcaster_with_batch_errors.broadcast_to_room(
-                        room_name=f'timer_test_room_{i}',
-                        event_type=f'timer_test_event_{i}',
-                        event_data={'sequence': i, 'timer_test': True},
+                        room_name=f'flush_test_room_{i}',
+                        event_type=f'flush_test_event_{i}',
+                        event_data={'sequence': i, 'flush_test': True},
                         priority=DeliveryPriority.MEDIUM
                     )
 
                     if result:
-                        timer_successes += 1
+                        flush_successes += 1
                     else:
-                        timer_failures += 1
+                        flush_failures += 1
 
                 except Exception as e:
-                    pytest.fail(f"Timer creation error propagated: {e}")
+                    pytest.fail(f"Flush submission error propagated: {e}")
 
-            # Timer failure handling assertions
-            assert timer_successes + timer_failures == 30
-            assert timer_successes > timer_failures  # Most should succeed despite timer issues
+            time.sleep(0.3)  # Let scheduled flushes run
+
+            # Submission failure handling assertions
+            assert flush_successes == 30
+            assert len(broadcaster_with_batch_errors.pending_batches) == 0
+            assert broadcaster_with_batch_errors.flusher_thread.is_alive()
 
             # System should remain stable
             health = broadcaster_with_batch_errors.get_health_status()
@@ -797,15 +801,16 @@ class TestResourceCleanupAndMemoryLeaks:
             resource_broadcaster.flush_all_batches()
             time.sleep(0.001)  # Brief pause
 
-        # Check timer cleanup
-        active_timers = len(resource_broadcaster.batch_timers)
+        # Check schedule cleanup
+        scheduled_flushes = len(resource_broadcaster.flush_schedule)
 
-        # Timer leak prevention assertions
-        assert active_timers < 10  # Should have very few active timers after flushing
+        # Schedule leak prevention assertions
+        assert scheduled_flushes < 10  # Flushed batches should leave few schedule entries
 
         # Final cleanup
         resource_broadcaster.shutdown()
-        assert len(resource_broadcaster.batch_timers) == 0  # All timers should be cleaned up
+        assert len(resource_broadcaster.flush_schedule) == 0  # All scheduled flushes cleaned up
+        assert not resource_broadcaster.flusher_thread.is_alive()
 
 
 class TestNetworkFailureRecovery:
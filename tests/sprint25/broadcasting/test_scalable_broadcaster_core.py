@@ -111,6 +111,23 @@ class TestEventBatch:
         assert len(batch.events) == 3
         assert batch.priority == DeliveryPriority.HIGH
 
+    def test_event_batch_size_incremental(self):
+        """Test add_event keeps the batch size current without recomputing."""
+        batch = EventBatch(
+            room_name='test_room',
+            events=[self.create_test_event('first', {'data': 'abc'})],
+            batch_id='incremental_test',
+            created_at=time.time(),
+            priority=DeliveryPriority.MEDIUM
+        )
+        initial_size = batch.get_total_size()
+
+        batch.add_event(self.create_test_event('second', {'data': 'x' * 50}))
+        batch.add_event(self.create_test_event('third', {'data': 'shared'}), event_size=40)
+
+        assert batch.get_total_size() == initial_size + len(str({'data': 'x' * 50})) + 40
+        assert len(batch.events) == 3
+
     def test_event_batch_size_calculation(self):
         """Test EventBatch size calculation for memory management."""
         # Create events with known data sizes
@@ -316,7 +333,7 @@ class TestScalableBroadcasterCore:
 
         # Check internal structures
         assert len(broadcaster.pending_batches) == 0
-        assert len(broadcaster.batch_timers) == 0
+        assert len(broadcaster.flush_schedule) == 0
         assert len(broadcaster.event_queue) == 4  # One for each priority level
         assert len(broadcaster.user_rate_limiters) == 0
 
@@ -400,24 +417,70 @@ class TestScalableBroadcasterCore:
         assert result == 0  # No users after rate limiting
         assert broadcaster.stats.events_rate_limited > 0
 
-    def test_batch_creation_and_timer(self, broadcaster):
-        """Test batch creation and timer scheduling."""
-        with patch('threading.Timer') as mock_timer:
-            mock_timer_instance = Mock()
-            mock_timer.return_value = mock_timer_instance
+    def test_batch_creation_and_flush_schedule(self, broadcaster):
+        """Test batch creation schedules a flush on the shared flusher."""
+        before = time.monotonic()
+        broadcaster.broadcast_to_users(
+            event_type='test_event',
+            event_data={'test': 'data'},
+            user_ids={'user1'},
+            priority=DeliveryPriority.MEDIUM
+        )
 
-            broadcaster.broadcast_to_users(
-                event_type='test_event',
-                event_data={'test': 'data'},
-                user_ids={'user1'},
+        # Verify flush was scheduled one batch window out
+        due, _, room_name, batch = broadcaster.flush_schedule[0]
+        assert room_name == 'user_user1'
+        assert batch is broadcaster.pending_batches['user_user1']
+        assert before + 0.1 <= due <= time.monotonic() + 0.1
+        assert broadcaster.flusher_thread.is_alive()
+
+    def test_single_flusher_for_all_rooms(self, broadcaster, mock_socketio):
+        """Test thousands of room batches share one flusher thread."""
+        threads_before = set(threading.enumerate())
+
+        broadcaster.broadcast_to_users(
+            event_type='test_event',
+            event_data={'test': 'data'},
+            user_ids={f'user{i}' for i in range(2000)},
+            priority=DeliveryPriority.MEDIUM
+        )
+        assert len(broadcaster.pending_batches) == 2000
+
+        # Scheduled flush delivers every batch shortly after the window
+        deadline = time.time() + 2.0
+        while mock_socketio.emit.call_count < 2000 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert mock_socketio.emit.call_count == 2000
+
+        # One flusher plus delivery pool workers, not a timer thread per room
+        new_threads = set(threading.enumerate()) - threads_before
+        assert [t.name for t in new_threads if not t.name.startswith('broadcast-delivery')] == ['broadcast-flusher']
+        assert len(broadcaster.pending_batches) == 0
+        stats = broadcaster.get_broadcast_stats()
+        assert stats['scheduled_flushes'] == 0
+        assert stats['max_flush_lag_ms'] < 100
+        broadcaster.shutdown()
+        assert not broadcaster.flusher_thread.is_alive()
+
+    def test_early_flush_skips_scheduled_entry(self, broadcaster, mock_socketio):
+        """Test a batch flushed at max size is not flushed again when due."""
+        broadcaster.max_batch_size = 2
+
+        for i in range(3):
+            broadcaster.broadcast_to_room(
+                room_name='size_room',
+                event_type=f'event_{i}',
+                event_data={'index': i},
                 priority=DeliveryPriority.MEDIUM
             )
 
-            # Verify timer was created and started
-            mock_timer.assert_called_once()
-            args, kwargs = mock_timer.call_args
-            assert args[0] == 0.1  # 100ms converted to seconds
-            mock_timer_instance.start.assert_called_once()
+        time.sleep(0.3)
+
+        # One full batch of 2 flushed early, then the remaining event on schedule
+        assert mock_socketio.emit.call_count == 2
+        assert broadcaster.stats.batches_flushed_on_schedule == 1
+        assert broadcaster.stats.events_delivered == 3
 
     def test_max_batch_size_enforcement(self, broadcaster):
         """Test maximum batch size enforcement."""
@@ -638,7 +701,7 @@ class TestScalableBroadcasterErrorHandling:
 
         # All batches should be flushed
         assert len(broadcaster.pending_batches) == 0
-        assert len(broadcaster.batch_timers) == 0
+        assert len(broadcaster.flush_schedule) == 0
 
     def test_optimize_performance(self, broadcaster):
         """Test performance optimization."""
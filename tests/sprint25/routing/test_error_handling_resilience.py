@@ -891,7 +891,6 @@ class TestSystemRecoveryAndResilience:
         # Verify system is properly shut down
         with self.router.cache_lock:
             assert len(self.router.route_cache) == 0
-            assert len(self.router.cache_access_order) == 0
 
 
 if __name__ == '__main__':
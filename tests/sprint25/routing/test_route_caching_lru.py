@@ -98,7 +98,6 @@ class TestRouteCaching:
         cache_key = self.router._generate_cache_key(event_type, event_data, None)
         with self.router.cache_lock:
             self.router.route_cache[cache_key] = (cached_result, time.time())
-            self.router.cache_access_order.append(cache_key)
 
         # Act
         result = self.router.route_event(event_type, event_data)
@@ -130,7 +129,6 @@ class TestRouteCaching:
 
         with self.router.cache_lock:
             self.router.route_cache[cache_key] = (expired_result, expired_timestamp)
-            self.router.cache_access_order.append(cache_key)
 
         # Act
         result = self.router.route_event(event_type, event_data)
@@ -139,10 +137,11 @@ class TestRouteCaching:
         assert result is not None
         assert result.cache_hit is False  # Should be cache miss due to TTL expiration
 
-        # Expired entry should be removed from cache
+        # Expired entry should be replaced by the freshly computed route
         with self.router.cache_lock:
-            assert cache_key not in self.router.route_cache
-            assert cache_key not in self.router.cache_access_order
+            cached_result, timestamp = self.router.route_cache[cache_key]
+            assert cached_result is not expired_result
+            assert timestamp > expired_timestamp
 
     def test_cache_key_generation_consistency(self):
         """Test cache key generation is consistent for identical inputs."""
@@ -157,18 +156,17 @@ class TestRouteCaching:
 
         # Assert
         assert key1 == key2
-        assert key1.startswith('route_')
-        assert event_type in key1
+        assert key1[:2] == ('route', event_type)
 
     def test_cache_key_generation_uniqueness(self):
         """Test cache key generation produces different keys for different inputs."""
         # Arrange
         base_event_type = 'unique_test_event'
-        base_event_data = {'base': 'data'}
+        base_event_data = {'symbol': 'AAPL'}
 
         # Act
         key1 = self.router._generate_cache_key(base_event_type, base_event_data, None)
-        key2 = self.router._generate_cache_key(base_event_type, {'different': 'data'}, None)
+        key2 = self.router._generate_cache_key(base_event_type, {'symbol': 'MSFT'}, None)
         key3 = self.router._generate_cache_key('different_event', base_event_data, None)
         key4 = self.router._generate_cache_key(base_event_type, base_event_data, {'user': 'context'})
 
@@ -180,6 +178,13 @@ class TestRouteCaching:
         assert key2 != key4
         assert key3 != key4
 
+    def test_cache_key_ignores_fields_rules_do_not_use(self):
+        """Test events differing only in non-routing fields share a cache key."""
+        key1 = self.router._generate_cache_key('agnostic_event', {'symbol': 'AAPL', 'price': 101.5}, None)
+        key2 = self.router._generate_cache_key('agnostic_event', {'symbol': 'AAPL', 'price': 99.0}, None)
+
+        assert key1 == key2
+
     def test_cache_disabled_behavior(self):
         """Test behavior when caching is disabled."""
         # Arrange
@@ -272,12 +277,10 @@ class TestLRUEviction:
             # Cache size should not exceed limit
             assert len(self.router.route_cache) <= self.router.cache_size
 
-            # LRU order should be maintained
-            assert len(self.router.cache_access_order) == len(self.router.route_cache)
-
             # Oldest entries should have been evicted
             first_key = cache_entries[0][0]
             last_key = cache_entries[-1][0]
+            assert first_key not in self.router.route_cache
 
             # Last added key should still be in cache
             assert last_key in self.router.route_cache
@@ -304,13 +307,7 @@ class TestLRUEviction:
             self.router._cache_routing_result(cache_key, result)
 
         # Access first item (should move to end of LRU order)
-        with self.router.cache_lock:
-            if keys[0] in self.router.route_cache:
-                # Simulate cache access
-                result, timestamp = self.router.route_cache[keys[0]]
-                if keys[0] in self.router.cache_access_order:
-                    self.router.cache_access_order.remove(keys[0])
-                self.router.cache_access_order.append(keys[0])
+        assert self.router._get_cached_route(keys[0]) is not None
 
         # Add more items to trigger eviction
         for i in range(3, 6):
@@ -335,6 +332,8 @@ class TestLRUEviction:
             # due to LRU protection
             cache_size = len(self.router.route_cache)
             assert cache_size <= self.router.cache_size
+            assert keys[0] in self.router.route_cache
+            assert keys[1] not in self.router.route_cache
 
     def test_lru_eviction_preserves_most_recent(self):
         """Test that LRU eviction preserves most recently used items."""
@@ -522,6 +521,132 @@ class TestCachePerformance:
         assert cache_size > 0, "No cache entries found"
 
 
+class TestContentAgnosticRouting:
+    """Test route caching keyed on routing-relevant fields only."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_broadcaster = Mock(spec=ScalableBroadcaster)
+        self.router = EventRouter(
+            scalable_broadcaster=self.mock_broadcaster,
+            cache_size=100,
+            enable_caching=True
+        )
+
+        # Mock broadcast methods
+        self.mock_broadcaster.broadcast_to_users = Mock()
+        self.mock_broadcaster.broadcast_to_room = Mock()
+
+        self.rule = RoutingRule(
+            rule_id='confident_breakouts',
+            name='Confident Breakouts',
+            description='BreakoutBO patterns above 0.7 confidence',
+            event_type_patterns=[r'.*pattern.*'],
+            content_filters={'pattern_type': 'BreakoutBO', 'confidence': {'min': 0.7}},
+            user_criteria={},
+            strategy=RoutingStrategy.CONTENT_BASED,
+            destinations=[],
+            priority=DeliveryPriority.HIGH
+        )
+        self.router.add_routing_rule(self.rule)
+
+    def _event(self, **overrides):
+        event_data = {
+            'pattern_type': 'BreakoutBO', 'symbol': 'AAPL', 'confidence': 0.8,
+            'price': 187.25, 'timestamp': time.time(),
+        }
+        event_data.update(overrides)
+        return event_data
+
+    def test_unique_timestamps_and_prices_hit_cache(self):
+        """Test events differing in timestamp/price reuse the cached route."""
+        first = self.router.route_event('tier_pattern', self._event(price=187.25))
+        second = self.router.route_event('tier_pattern', self._event(price=188.10))
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.matched_rules == ['confident_breakouts']
+        assert second.destinations == {'pattern_BreakoutBO_AAPL': set()}
+        assert self.rule.messages_routed == 2
+        assert self.mock_broadcaster.broadcast_to_room.call_count == 2
+
+    def test_confidence_bucketed_by_rule_thresholds(self):
+        """Test confidences on the same side of every threshold share a route."""
+        key_high = self.router._generate_cache_key('tier_pattern', self._event(confidence=0.75), None)
+        key_higher = self.router._generate_cache_key('tier_pattern', self._event(confidence=0.95), None)
+        key_at_min = self.router._generate_cache_key('tier_pattern', self._event(confidence=0.7), None)
+        key_low = self.router._generate_cache_key('tier_pattern', self._event(confidence=0.65), None)
+
+        assert key_high == key_higher == key_at_min
+        assert key_low != key_high
+
+        self.router.route_event('tier_pattern', self._event(confidence=0.9))
+        low_result = self.router.route_event('tier_pattern', self._event(confidence=0.65))
+        assert low_result.cache_hit is False
+        assert low_result.matched_rules == []
+
+    def test_symbol_is_part_of_route_key(self):
+        """Test CONTENT_BASED destinations are not shared across symbols."""
+        self.router.route_event('tier_pattern', self._event(symbol='AAPL'))
+        result = self.router.route_event('tier_pattern', self._event(symbol='MSFT'))
+
+        assert result.cache_hit is False
+        assert result.destinations == {'pattern_BreakoutBO_MSFT': set()}
+
+    def test_content_hash_fallback_not_cached(self):
+        """Test CONTENT_BASED routes derived from the whole payload are not cached."""
+        assert self.router._generate_cache_key('tier_pattern', {'confidence': 0.9}, None) is None
+
+    def test_unhashable_values_route_without_caching(self):
+        """Test events with unhashable routing fields still route."""
+        event_data = self._event(symbol=['AAPL'])
+
+        assert self.router._generate_cache_key('tier_pattern', event_data, None) is None
+        assert self.router.route_event('tier_pattern', event_data).cache_hit is False
+
+    def test_rules_indexed_by_event_type(self):
+        """Test only rules whose event type patterns match are candidates."""
+        market_rule = RoutingRule(
+            rule_id='market_rule',
+            name='Market Rule',
+            description='Market data only',
+            event_type_patterns=[r'market_.*'],
+            content_filters={},
+            user_criteria={},
+            strategy=RoutingStrategy.BROADCAST_ALL,
+            destinations=['room_market'],
+            priority=DeliveryPriority.MEDIUM
+        )
+        self.router.add_routing_rule(market_rule)
+
+        self.router.route_event('tier_pattern', self._event())
+        self.router.route_event('market_update', {'symbol': 'AAPL'})
+
+        candidates = self.router.rules_by_event_type
+        assert [r.rule_id for r in candidates['tier_pattern'].rules] == ['confident_breakouts']
+        assert [r.rule_id for r in candidates['market_update'].rules] == ['market_rule']
+
+    def test_rule_addition_invalidates_routes(self):
+        """Test cached routes are dropped when a rule is added."""
+        self.router.route_event('tier_pattern', self._event())
+
+        self.router.add_routing_rule(RoutingRule(
+            rule_id='all_patterns',
+            name='All Patterns',
+            description='Every pattern event',
+            event_type_patterns=[r'.*pattern.*'],
+            content_filters={},
+            user_criteria={},
+            strategy=RoutingStrategy.BROADCAST_ALL,
+            destinations=['room_patterns'],
+            priority=DeliveryPriority.MEDIUM
+        ))
+        result = self.router.route_event('tier_pattern', self._event())
+
+        assert result.cache_hit is False
+        assert result.matched_rules == ['confident_breakouts', 'all_patterns']
+
+
 class TestCacheInvalidation:
     """Test cache invalidation when routing rules change."""
 
@@ -707,14 +832,7 @@ class TestCacheConcurrency:
 
         # Cache should be in consistent state
         with self.router.cache_lock:
-            cache_size = len(self.router.route_cache)
-            access_order_size = len(self.router.cache_access_order)
-
-            # Access order should match cache size
-            assert access_order_size == cache_size
-
-            # No duplicate keys in access order
-            assert len(set(self.router.cache_access_order)) == access_order_size
+            assert len(self.router.route_cache) <= self.router.cache_size
 
     def test_concurrent_cache_eviction_stability(self):
         """Test cache eviction remains stable under concurrent load."""
@@ -782,10 +900,8 @@ class TestCacheConcurrency:
         # Cache should be in stable state
         with small_cache_router.cache_lock:
             cache_size = len(small_cache_router.route_cache)
-            access_order_size = len(small_cache_router.cache_access_order)
 
             assert cache_size <= small_cache_router.cache_size
-            assert access_order_size == cache_size
             assert cache_size >= 0
 
 
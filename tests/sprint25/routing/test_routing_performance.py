@@ -637,23 +637,14 @@ class TestConcurrentRoutingPerformance:
 
     def test_concurrent_cache_access_performance(self):
         """Test cache performance under concurrent access."""
-        # Arrange - Pre-populate cache with common patterns
+        # Arrange - Pre-populate cache by routing common events that match a rule,
+        # so cached routes are the router's own results
         common_events = []
         for i in range(20):
-            event_type = f'cache_concurrent_{i % 5}'
-            event_data = {'cache_concurrent': True, 'pattern_id': i % 5}
+            event_type = f'cache_concurrent_{i % 4}'
+            event_data = {'thread_test': True, 'rule_index': i % 8, 'pattern_id': i}
 
-            result = RoutingResult(
-                event_id=f'cache_concurrent_{i}',
-                matched_rules=['concurrent_rule_0'],
-                destinations={'concurrent_room_0': set()},
-                transformations_applied=[],
-                routing_time_ms=5.0,
-                total_users=10
-            )
-
-            cache_key = self.router._generate_cache_key(event_type, event_data, None)
-            self.router._cache_routing_result(cache_key, result)
+            self.router.route_event(event_type, event_data)
             common_events.append((event_type, event_data))
 
         # Test data - mix of cached and new events
@@ -670,9 +661,14 @@ class TestConcurrentRoutingPerformance:
                         # Use cached event (should be fast)
                         event_type, event_data = common_events[i % len(common_events)]
                     else:
-                        # New event (cache miss)
-                        event_type = f'cache_miss_{thread_id}_{i}'
-                        event_data = {'cache_concurrent': True, 'thread_id': thread_id, 'iteration': i}
+                        # New event (cache miss); matches a rule like the cached
+                        # events, so hits and misses route to the same work
+                        rule_index = i % 8
+                        event_type = f'cache_concurrent_{rule_index % 4}_miss_{thread_id}_{i}'
+                        event_data = {
+                            'thread_test': True, 'rule_index': rule_index,
+                            'thread_id': thread_id, 'iteration': i
+                        }
 
                     start_time = time.time()
                     result = self.router.route_event(event_type, event_data)
@@ -926,5 +922,93 @@ class TestPerformanceDegradationAnalysis:
         assert pressure_avg < 100, f"Performance under memory pressure {pressure_avg:.2f}ms too high"
 
 
+
+@pytest.mark.performance
+class TestRoutingBenchmark100Rules:
+    """Benchmark routing with 100 rules against a 10k events/sec target."""
+
+    PATTERNS = [f'Pattern{p}' for p in range(10)]
+    SYMBOLS = [f'SYM{s}' for s in range(20)]
+
+    def setup_method(self):
+        """Set up 100 rules: 10 confidence thresholds for each of 10 patterns."""
+        self.mock_broadcaster = Mock(spec=ScalableBroadcaster)
+        self.mock_broadcaster.broadcast_to_users = Mock()
+        self.mock_broadcaster.broadcast_to_room = Mock()
+        self.router = EventRouter(
+            scalable_broadcaster=self.mock_broadcaster,
+            cache_size=1000,
+            enable_caching=True
+        )
+
+        for p, pattern in enumerate(self.PATTERNS):
+            for t in range(10):
+                self.router.add_routing_rule(RoutingRule(
+                    rule_id=f'bench_{p}_{t}',
+                    name=f'Benchmark {pattern} >= 0.{t}5',
+                    description='Benchmark pattern rule',
+                    event_type_patterns=[r'tier_pattern', r'pattern_.*'],
+                    content_filters={'pattern_type': pattern, 'confidence': {'min': t / 10 + 0.05}},
+                    user_criteria={},
+                    strategy=RoutingStrategy.CONTENT_BASED,
+                    destinations=[],
+                    priority=DeliveryPriority.HIGH
+                ))
+
+    def _events(self, count):
+        """Pattern events with unique timestamps and prices."""
+        return [
+            {
+                'pattern_type': self.PATTERNS[i % len(self.PATTERNS)],
+                'symbol': self.SYMBOLS[(i // len(self.PATTERNS)) % len(self.SYMBOLS)],
+                'confidence': 0.5 + (i % 50) / 100,
+                'price': 100 + i * 0.01,
+                'timestamp': time.time() + i,
+            }
+            for i in range(count)
+        ]
+
+    def test_throughput_10k_events_per_second(self):
+        """Test 100-rule routing sustains 10k events/sec on realistic pattern traffic."""
+        events = self._events(10000)
+
+        start_time = time.perf_counter()
+        for event_data in events:
+            self.router.route_event('tier_pattern', event_data)
+        elapsed_time = time.perf_counter() - start_time
+
+        events_per_second = len(events) / elapsed_time
+        stats = self.router.get_routing_stats()
+
+        assert events_per_second >= 10000, f"Throughput {events_per_second:.0f} events/sec below 10000 target"
+        assert stats['cache_hit_rate_percent'] > 90, f"Cache hit rate {stats['cache_hit_rate_percent']}% too low"
+        assert stats['routing_errors'] == 0
+
+    def test_uncached_routing_evaluates_candidate_rules_only(self):
+        """Test cache-miss routing with 100 rules stays well under 1ms per event."""
+        self.router.enable_caching = False
+        self.router.add_routing_rule(RoutingRule(
+            rule_id='market_only',
+            name='Market only',
+            description='Never a candidate for pattern events',
+            event_type_patterns=[r'market_.*'],
+            content_filters={},
+            user_criteria={},
+            strategy=RoutingStrategy.BROADCAST_ALL,
+            destinations=['room_market'],
+            priority=DeliveryPriority.MEDIUM
+        ))
+        events = self._events(2000)
+
+        start_time = time.perf_counter()
+        for event_data in events:
+            result = self.router.route_event('tier_pattern', event_data)
+            assert 'market_only' not in result.matched_rules
+        avg_ms = (time.perf_counter() - start_time) * 1000 / len(events)
+
+        assert len(self.router.rules_by_event_type['tier_pattern'].rules) == 100
+        assert avg_ms < 1.0, f"Uncached routing {avg_ms:.3f}ms per event with 100 rules"
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -77,7 +77,7 @@ class TestEventRouterLayer:
 
         # Verify route caching system
         assert len(event_router.route_cache) == 0
-        assert len(event_router.cache_access_order) == 0
+        assert len(event_router.rules_by_event_type) == 0
 
         # Verify thread pool executor
         assert event_router.routing_executor is not None
@@ -534,7 +534,6 @@ class TestEventRouterLayer:
 
         # Verify cleanup occurred
         assert len(event_router.route_cache) == 0
-        assert len(event_router.cache_access_order) == 0
 
     def test_convenience_routing_rule_creators(self):
         """Test convenience functions for creating common routing rules."""
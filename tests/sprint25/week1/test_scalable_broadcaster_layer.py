@@ -56,7 +56,7 @@ class TestScalableBroadcasterLayer:
 
         # Verify batching system components
         assert len(scalable_broadcaster.pending_batches) == 0
-        assert len(scalable_broadcaster.batch_timers) == 0
+        assert len(scalable_broadcaster.flush_schedule) == 0
         assert DeliveryPriority.LOW in scalable_broadcaster.event_queue
         assert DeliveryPriority.HIGH in scalable_broadcaster.event_queue
 
@@ -202,8 +202,8 @@ class TestScalableBroadcasterLayer:
         assert len(batch.events) == 5
         assert batch.room_name == room_name
 
-        # Verify timer was set for automatic flushing
-        assert room_name in scalable_broadcaster.batch_timers
+        # Verify flush was scheduled for automatic flushing
+        assert any(entry[2] == room_name for entry in scalable_broadcaster.flush_schedule)
 
         # Force flush to test manual flushing
         scalable_broadcaster.flush_all_batches()
@@ -466,7 +466,7 @@ class TestScalableBroadcasterLayer:
         scalable_broadcaster.shutdown()
 
         # Verify cleanup occurred
-        assert len(scalable_broadcaster.batch_timers) == 0
+        assert len(scalable_broadcaster.flush_schedule) == 0
 
     def test_thread_safety_concurrent_broadcasting(self, scalable_broadcaster):
         """Test thread safety with concurrent broadcasting operations."""
@@ -0,0 +1,163 @@
+"""
+Unit tests for the vectorized multi-symbol indicator engine.
+
+Every vectorized result is compared with calculate() on the same symbol's
+DataFrame; symbols of different lengths exercise padding and warm-up edges.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.data.ohlcv_panel import OHLCVPanel
+from src.analysis.indicators.adx import ADX
+from src.analysis.indicators.atr import ATR
+from src.analysis.indicators.base_indicator import BaseIndicator
+from src.analysis.indicators.batch_engine import BatchIndicatorEngine
+from src.analysis.indicators.bollinger_bands import BollingerBands
+from src.analysis.indicators.ema import EMA
+from src.analysis.indicators.macd import MACD
+from src.analysis.indicators.rsi import RSI
+from src.analysis.indicators.sma import SMA
+from src.analysis.indicators.stochastic import Stochastic
+
+
+def _frame(bars, seed):
+    rng = np.random.default_rng(seed)
+    close = 50 + seed + np.cumsum(rng.normal(0, 1.0, bars))
+    open_ = close + rng.normal(0, 0.3, bars)
+    high = np.maximum(open_, close) + rng.uniform(0.05, 1.0, bars)
+    low = np.minimum(open_, close) - rng.uniform(0.05, 1.0, bars)
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": rng.integers(1_000, 5_000, bars).astype(float),
+        },
+        index=pd.date_range(end="2025-06-30", periods=bars, freq="D", name="date"),
+    )
+
+
+def _universe():
+    # Lengths straddle the warm-up thresholds of the default indicators
+    lengths = [250, 250, 220, 120, 60, 50, 35, 29, 28, 27, 20, 15, 14, 3, 1]
+    frames = {f"SYM{i}": _frame(n, i) for i, n in enumerate(lengths)}
+    flat = _frame(80, 99)
+    flat.iloc[-30:] = 42.0
+    frames["FLAT"] = flat
+    return frames
+
+
+INDICATORS = {
+    "sma": SMA({"period": 20, "periods": [20, 50, 200]}),
+    "ema": EMA({"period": 12, "periods": [12, 26]}),
+    "rsi": RSI({"period": 14}),
+    "rsi_sma": RSI({"period": 14, "use_sma": True}),
+    "macd": MACD(),
+    "atr": ATR({"period": 14}),
+    "atr_sma": ATR({"period": 14, "use_sma": True}),
+    "adx": ADX({"period": 14}),
+    "adx_sma": ADX({"period": 14, "use_sma": True}),
+    "stochastic": Stochastic(),
+    "bollinger_bands": BollingerBands({"period": 20}),
+}
+
+
+class TestOHLCVPanel(unittest.TestCase):
+    """Test panel packing and per-symbol frame rebuild."""
+
+    def test_from_frames_right_aligns_and_pads(self):
+        frames = {"aapl": _frame(5, 1), "msft": _frame(3, 2)}
+
+        panel = OHLCVPanel.from_frames(frames)
+
+        self.assertEqual(panel.symbols, ["AAPL", "MSFT"])
+        self.assertEqual(panel.close.shape, (2, 5))
+        self.assertTrue(np.isnan(panel.close[1, :2]).all())
+        self.assertEqual(panel.close[1, -1], frames["msft"]["close"].iloc[-1])
+        self.assertEqual(panel.valid.sum(axis=1).tolist(), [5, 3])
+
+    def test_frame_round_trip(self):
+        source = _frame(10, 3)
+        panel = OHLCVPanel.from_frames({"AAPL": source, "MSFT": _frame(4, 4)}, limit=8)
+
+        frame = panel.frame("aapl")
+
+        self.assertEqual(list(frame.columns), ["timestamp", "open", "high", "low", "close", "volume"])
+        self.assertEqual(frame["close"].tolist(), source["close"].iloc[-8:].tolist())
+        self.assertEqual(frame["timestamp"].iloc[-1], source.index[-1])
+        self.assertTrue(panel.frame("UNKNOWN").empty)
+
+
+class TestBatchIndicatorParity(unittest.TestCase):
+    """Vectorized results must match per-symbol calculate()."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.panel = OHLCVPanel.from_frames(_universe())
+        cls.engine = BatchIndicatorEngine()
+        cls.results = cls.engine.calculate(cls.panel, INDICATORS, "daily")
+
+    def assert_close(self, actual, expected, context):
+        if isinstance(expected, dict):
+            self.assertEqual(set(actual), set(expected), context)
+            for key in expected:
+                self.assert_close(actual[key], expected[key], f"{context}.{key}")
+        elif isinstance(expected, float) and not isinstance(actual, bool):
+            # Rounded fields may land on either side of a rounding boundary
+            self.assertAlmostEqual(actual, expected, delta=1e-4, msg=context)
+        else:
+            self.assertEqual(actual, expected, context)
+
+    def test_all_results_match_calculate(self):
+        for symbol in self.panel.symbols:
+            frame = self.panel.frame(symbol)
+            for name, indicator in INDICATORS.items():
+                expected = indicator.calculate(frame, symbol, "daily")
+                actual = self.results[symbol][name]
+                self.assert_close(actual, expected, f"{symbol}/{name}")
+
+    def test_most_results_are_vectorized(self):
+        stats = self.engine.get_stats()
+
+        self.assertGreater(stats["vectorized_results"], stats["fallback_results"])
+        self.assertEqual(stats["symbols_processed"], len(self.panel))
+
+
+class TestBatchIndicatorFallback(unittest.TestCase):
+    """Test symbols and indicators the vectorized path does not cover."""
+
+    def test_gap_in_history_falls_back(self):
+        gappy = _frame(60, 5)
+        gappy.iloc[30, gappy.columns.get_loc("close")] = np.nan
+        panel = OHLCVPanel.from_frames({"GAP": gappy, "OK": _frame(60, 6)})
+        engine = BatchIndicatorEngine()
+
+        results = engine.calculate(panel, {"sma": SMA({"period": 20})})
+
+        expected = SMA({"period": 20}).calculate(panel.frame("GAP"), "GAP", "daily")
+        self.assertEqual(results["GAP"]["sma"], expected)
+        self.assertEqual(engine.get_stats()["fallback_results"], 1)
+
+    def test_unsupported_indicator_uses_calculate(self):
+        class Constant(BaseIndicator):
+            def calculate(self, data, symbol=None, timeframe="daily"):
+                return {"indicator_type": "constant", "symbol": symbol, "value": 1.0}
+
+            def _validate_params(self, params):
+                return params
+
+        panel = OHLCVPanel.from_frames({"AAPL": _frame(10, 1)})
+        engine = BatchIndicatorEngine()
+
+        results = engine.calculate(panel, {"constant": Constant({})})
+
+        self.assertFalse(engine.supports(Constant({})))
+        self.assertEqual(results["AAPL"]["constant"]["value"], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
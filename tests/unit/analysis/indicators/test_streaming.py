@@ -0,0 +1,196 @@
+"""
+Unit tests for streaming indicator updates.
+
+Checks that update() on every bar matches calculate()['value_data'] over the
+same bars, for each indicator that keeps incremental state.
+"""
+
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.exceptions import IndicatorError
+from src.analysis.indicators.adx import ADX
+from src.analysis.indicators.atr import ATR
+from src.analysis.indicators.base_indicator import BaseIndicator
+from src.analysis.indicators.bollinger_bands import BollingerBands
+from src.analysis.indicators.ema import EMA
+from src.analysis.indicators.macd import MACD
+from src.analysis.indicators.rsi import RSI
+from src.analysis.indicators.sma import SMA
+from src.analysis.indicators.stochastic import Stochastic
+from src.analysis.indicators.streaming import EWMState, RollingExtreme, RollingStats
+
+
+def _ohlcv(bars=120, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1.5, bars))
+    open_ = close + rng.normal(0, 0.5, bars)
+    high = np.maximum(open_, close) + rng.uniform(0.1, 1.5, bars)
+    low = np.minimum(open_, close) - rng.uniform(0.1, 1.5, bars)
+    # A flat stretch exercises zero-variance and zero-range handling
+    if bars > 50:
+        close[40:50] = open_[40:50] = high[40:50] = low[40:50] = close[39]
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-01-01", periods=bars, freq="1D"),
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": rng.integers(1_000, 10_000, bars).astype(float),
+        }
+    )
+
+
+class StreamingParityMixin:
+    """Stream bars one at a time and compare against calculate() after each bar."""
+
+    def assert_parity(self, make_indicator, data, primary_key):
+        streaming = make_indicator()
+        batch = make_indicator()
+
+        for end in range(1, len(data) + 1):
+            bar = data.iloc[end - 1]
+            streamed = streaming.update(bar)
+            expected = batch.calculate(data.iloc[:end], symbol="TEST")["value_data"]
+
+            if not expected or expected.get(primary_key) is None:
+                self.assertIsNone(streamed[primary_key], f"bar {end}: expected no value yet")
+                continue
+
+            for key, value in streamed.items():
+                self.assertIn(key, expected)
+                if isinstance(value, float):
+                    # Rounded fields may land on either side of a rounding boundary
+                    self.assertAlmostEqual(value, expected[key], delta=1e-4, msg=f"bar {end}: {key}")
+                else:
+                    self.assertEqual(value, expected[key], f"bar {end}: {key}")
+
+
+class TestStreamingParity(StreamingParityMixin, unittest.TestCase):
+    """Streaming results must match batch calculate() on every bar."""
+
+    def setUp(self):
+        self.data = _ohlcv()
+
+    def test_sma_parity(self):
+        self.assert_parity(lambda: SMA({"period": 10, "periods": [10, 30]}), self.data, "sma_10")
+
+    def test_ema_parity(self):
+        self.assert_parity(lambda: EMA({"period": 12, "periods": [12, 26]}), self.data, "ema_12")
+
+    def test_rsi_parity(self):
+        self.assert_parity(lambda: RSI({"period": 14}), self.data, "rsi_14")
+
+    def test_rsi_sma_parity(self):
+        self.assert_parity(lambda: RSI({"period": 14, "use_sma": True}), self.data, "rsi_14")
+
+    def test_macd_parity(self):
+        self.assert_parity(lambda: MACD(), self.data, "macd")
+
+    def test_atr_parity(self):
+        self.assert_parity(lambda: ATR({"period": 14}), self.data, "atr_14")
+
+    def test_atr_sma_parity(self):
+        self.assert_parity(lambda: ATR({"period": 14, "use_sma": True}), self.data, "atr_14")
+
+    def test_adx_parity(self):
+        self.assert_parity(lambda: ADX({"period": 14}), self.data, "adx_14")
+
+    def test_adx_sma_parity(self):
+        self.assert_parity(lambda: ADX({"period": 14, "use_sma": True}), self.data, "adx_14")
+
+    def test_stochastic_parity(self):
+        self.assert_parity(lambda: Stochastic(), self.data, "percent_k")
+
+    def test_bollinger_bands_parity(self):
+        self.assert_parity(lambda: BollingerBands({"period": 20}), self.data, "middle_band")
+
+
+class TestStreamingLifecycle(unittest.TestCase):
+    """Test warm_up/reset and unsupported indicators."""
+
+    def test_warm_up_matches_full_stream(self):
+        data = _ohlcv()
+        indicator = RSI({"period": 14})
+
+        warmed = indicator.warm_up(data)
+        expected = RSI({"period": 14}).calculate(data)["value_data"]
+
+        self.assertEqual(indicator.bars_seen, len(data))
+        self.assertAlmostEqual(warmed["rsi_14"], expected["rsi_14"], places=9)
+
+    def test_reset_clears_state(self):
+        indicator = SMA({"period": 3})
+        indicator.warm_up(_ohlcv(bars=10))
+
+        indicator.reset()
+
+        self.assertEqual(indicator.bars_seen, 0)
+        self.assertIsNone(indicator.update({"close": 1.0})["sma_3"])
+
+    def test_unsupported_indicator_raises(self):
+        class NoStreaming(BaseIndicator):
+            def calculate(self, data, symbol=None, timeframe="daily"):
+                return {}
+
+            def _validate_params(self, params):
+                return params
+
+        with self.assertRaises(IndicatorError):
+            NoStreaming({}).update({"close": 1.0})
+
+
+class TestStreamingPrimitives(unittest.TestCase):
+    """Test streaming state primitives against pandas directly."""
+
+    def setUp(self):
+        values = np.random.default_rng(3).normal(50, 5, 200)
+        values[[20, 21, 90]] = np.nan
+        self.series = pd.Series(values)
+
+    def test_rolling_stats_with_nan(self):
+        expected_mean = self.series.rolling(10, min_periods=8).mean()
+        expected_std = self.series.rolling(10, min_periods=8).std()
+        stats = RollingStats(10, min_periods=8)
+
+        for i, value in enumerate(self.series):
+            stats.push(value)
+            for actual, expected in ((stats.mean, expected_mean[i]), (stats.std, expected_std[i])):
+                if math.isnan(expected):
+                    self.assertIsNone(actual)
+                else:
+                    self.assertAlmostEqual(actual, expected, places=9)
+
+    def test_ewm_state_matches_pandas_exactly(self):
+        series = self.series.fillna(50.0)
+        expected = series.ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+        ewm = EWMState(alpha=1 / 14, min_periods=14)
+
+        for i, value in enumerate(series):
+            ewm.push(value)
+            if math.isnan(expected[i]):
+                self.assertIsNone(ewm.value)
+            else:
+                self.assertEqual(ewm.value, expected[i])
+
+    def test_rolling_extreme_with_nan(self):
+        expected_max = self.series.rolling(5, min_periods=5).max()
+        expected_min = self.series.rolling(5, min_periods=5).min()
+        highest, lowest = RollingExtreme(5, "max"), RollingExtreme(5, "min")
+
+        for i, value in enumerate(self.series):
+            highest.push(value)
+            lowest.push(value)
+            for actual, expected in ((highest.value, expected_max[i]), (lowest.value, expected_min[i])):
+                if math.isnan(expected):
+                    self.assertIsNone(actual)
+                else:
+                    self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
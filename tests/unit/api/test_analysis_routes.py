@@ -5,6 +5,7 @@ Sprint 71: REST API Endpoints - Analysis route tests
 """
 
 import json
+import threading
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -13,6 +14,7 @@ from datetime import datetime
 
 from src.api.routes.analysis_routes import analysis_bp
 from src.api.models.analysis_models import SymbolAnalysisResponse
+from src.analysis.services.universe_jobs import UniverseJobManager
 
 
 class TestAnalysisRoutes(unittest.TestCase):
@@ -273,5 +275,160 @@ class TestAnalysisRoutes(unittest.TestCase):
         self.assertEqual(response.status_code, 400)
 
 
+
+class TestUniverseJobRoutes(unittest.TestCase):
+    """Test async universe analysis job routes."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        from flask import Flask
+        self.app = Flask(__name__)
+        self.app.register_blueprint(analysis_bp)
+        self.client = self.app.test_client()
+
+        self.manager = UniverseJobManager(workers=2, chunk_size=2, first_chunk_size=1)
+        self.symbols = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA']
+
+        mock_ohlcv_data = pd.DataFrame({
+            'open': [100] * 200,
+            'high': [102] * 200,
+            'low': [99] * 200,
+            'close': [101] * 200,
+            'volume': [1000000] * 200
+        })
+        self.data_service = MagicMock()
+        self.data_service.get_universe_ohlcv_data.side_effect = lambda symbols, timeframe, limit: {
+            symbol: mock_ohlcv_data.copy() for symbol in symbols
+        }
+        self.analysis_service = MagicMock()
+        self.analysis_service.analyze_symbol.return_value = {
+            'indicators': {'sma': {'value': 150.5}},
+            'patterns': {}
+        }
+
+        cache = MagicMock()
+        cache.get_universe_symbols.return_value = tuple(self.symbols)
+
+        routes = 'src.api.routes.analysis_routes'
+        patches = [
+            patch(f'{routes}.get_universe_job_manager', return_value=self.manager),
+            patch(f'{routes}.get_relationship_cache', return_value=cache),
+            patch(f'{routes}.OHLCVDataService', return_value=self.data_service),
+            patch(f'{routes}.AnalysisService', return_value=self.analysis_service),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self.manager.shutdown)
+
+    def _submit(self, **overrides):
+        request_data = {
+            'universe_key': 'test_universe', 'timeframe': 'daily', 'indicators': ['sma']
+        }
+        request_data.update(overrides)
+        return self.client.post(
+            '/api/analysis/universe/jobs',
+            data=json.dumps(request_data),
+            content_type='application/json'
+        )
+
+    def _read_lines(self, response):
+        return [json.loads(line) for line in response.data.decode().splitlines()]
+
+    def test_submit_returns_job(self):
+        """Test job submission returns 202 with job ID and links."""
+        response = self._submit(max_symbols=3)
+
+        self.assertEqual(response.status_code, 202)
+        data = json.loads(response.data)
+        self.assertIn(data['status'], ('queued', 'running', 'completed'))
+        self.assertEqual(data['symbols_total'], 3)
+        self.assertEqual(
+            data['links']['results'], f"/api/analysis/universe/jobs/{data['job_id']}/results"
+        )
+
+    def test_results_stream_as_ndjson(self):
+        """Test results stream one line per symbol then a summary line."""
+        job_id = json.loads(self._submit().data)['job_id']
+
+        response = self.client.get(f'/api/analysis/universe/jobs/{job_id}/results')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = self._read_lines(response)
+        self.assertEqual([line['symbol'] for line in lines[:-1]], self.symbols)
+        self.assertEqual(lines[0]['indicators'], {'sma': {'value': 150.5}})
+        self.assertEqual(lines[-1]['type'], 'summary')
+        self.assertEqual(lines[-1]['status'], 'completed')
+        self.assertEqual(lines[-1]['summary']['avg_sma'], 150.5)
+
+        # Symbols are fetched chunk by chunk, smallest chunk first
+        fetched = [
+            call.kwargs['symbols']
+            for call in self.data_service.get_universe_ohlcv_data.call_args_list
+        ]
+        self.assertEqual([len(chunk) for chunk in fetched], [1, 2, 2])
+
+    def test_results_from_offset(self):
+        """Test resuming the stream from an offset."""
+        job_id = json.loads(self._submit().data)['job_id']
+
+        response = self.client.get(f'/api/analysis/universe/jobs/{job_id}/results?offset=3')
+
+        lines = self._read_lines(response)
+        self.assertEqual([line['symbol'] for line in lines[:-1]], ['AMZN', 'NVDA'])
+
+    def test_job_status(self):
+        """Test job status endpoint."""
+        job_id = json.loads(self._submit().data)['job_id']
+        # Reading the followed stream to the end waits for the job to finish
+        self._read_lines(self.client.get(f'/api/analysis/universe/jobs/{job_id}/results'))
+
+        response = self.client.get(f'/api/analysis/universe/jobs/{job_id}')
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data)
+        self.assertEqual(data['status'], 'completed')
+        self.assertEqual(data['symbols_completed'], 5)
+        self.assertEqual(data['results_available'], 5)
+
+    def test_cancel_job(self):
+        """Test cancellation keeps partial results and ends the stream."""
+        gate = threading.Event()
+
+        def analyze(**kwargs):
+            gate.wait(5)
+            return {'indicators': {}, 'patterns': {}}
+
+        self.analysis_service.analyze_symbol.side_effect = analyze
+        job_id = json.loads(self._submit().data)['job_id']
+
+        response = self.client.delete(f'/api/analysis/universe/jobs/{job_id}')
+        gate.set()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data)['status'], 'cancelled')
+
+        lines = self._read_lines(self.client.get(f'/api/analysis/universe/jobs/{job_id}/results'))
+        self.assertEqual(lines[-1]['status'], 'cancelled')
+        self.assertLess(len(lines) - 1, len(self.symbols))
+
+    def test_unknown_job(self):
+        """Test unknown job IDs return 404."""
+        for response in (
+            self.client.get('/api/analysis/universe/jobs/missing'),
+            self.client.get('/api/analysis/universe/jobs/missing/results'),
+            self.client.delete('/api/analysis/universe/jobs/missing'),
+        ):
+            self.assertEqual(response.status_code, 404)
+            self.assertEqual(json.loads(response.data)['error'], 'NotFoundError')
+
+    def test_submit_invalid_request(self):
+        """Test job submission validates the request."""
+        response = self._submit(timeframe='invalid')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.data)['error'], 'ValidationError')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,41 @@
+"""
+Unit tests for the scheduled daily_patterns retention cleanup.
+"""
+
+import time
+from unittest.mock import patch
+
+from src.jobs.pattern_retention_job import PatternRetentionJob
+
+
+class TestPatternRetentionJob:
+    """Test PatternRetentionJob scheduling."""
+
+    def test_config(self):
+        job = PatternRetentionJob({'PATTERN_RETENTION_HOURS': 24, 'PATTERN_RETENTION_INTERVAL_SECONDS': 600})
+
+        assert job.retention_hours == 24
+        assert job.interval_seconds == 600
+
+    def test_run_once_records_stats(self):
+        job = PatternRetentionJob()
+
+        with patch('src.jobs.pattern_retention_job.cleanup_old_patterns', return_value=7) as cleanup:
+            assert job.run_once() == 7
+
+        cleanup.assert_called_once_with(48.0)
+        assert job.stats == {'runs': 1, 'patterns_deleted': 7, 'last_run_deleted': 7}
+
+    def test_runs_on_start_and_stops(self):
+        job = PatternRetentionJob({'PATTERN_RETENTION_INTERVAL_SECONDS': 60})
+
+        with patch('src.jobs.pattern_retention_job.cleanup_old_patterns', return_value=0) as cleanup:
+            job.start()
+            deadline = time.time() + 2
+            while cleanup.call_count == 0 and time.time() < deadline:
+                time.sleep(0.01)
+            job.stop(timeout=2)
+
+        assert cleanup.call_count == 1
+        assert not job.running
+        assert not job._thread.is_alive()
@@ -58,23 +58,20 @@ class TestRealTimeAnalysis:
             'volume': [1000] * 200,
         })
 
-    def test_trigger_bar_analysis_spawns_thread(self, market_data_service):
-        """Test that _trigger_bar_analysis_async spawns a background thread."""
+    def test_trigger_bar_analysis_queues_on_scheduler(self, market_data_service):
+        """Test that _trigger_bar_analysis_async queues work instead of spawning a thread."""
         symbol = 'AAPL'
         timestamp = datetime.now(UTC)
 
-        # Mock threading to capture thread creation
+        mock_scheduler = Mock()
+        market_data_service._analysis_scheduler = mock_scheduler
+
         with patch('src.core.services.market_data_service.threading.Thread') as mock_thread:
             market_data_service._trigger_bar_analysis_async(symbol, timestamp)
 
-            # Verify thread was created
-            mock_thread.assert_called_once()
-            call_kwargs = mock_thread.call_args[1]
-            assert call_kwargs['daemon'] is True
-            assert 'BarAnalysis' in call_kwargs['name']
-
-            # Verify thread was started
-            mock_thread.return_value.start.assert_called_once()
+            # No per-bar thread; request goes to the shared worker pool
+            mock_thread.assert_not_called()
+            mock_scheduler.submit.assert_called_once_with(symbol, timestamp)
 
     def test_bar_analysis_fetches_ohlcv_data(self, market_data_service, sample_ohlcv_data):
         """Test that analysis fetches OHLCV data from database."""